@@ -8,6 +8,16 @@ load_dotenv()
 
 STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY")
 STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
+# Keep a compressed copy of each webhook request body alongside the pruned payload.
+STRIPE_WEBHOOK_STORE_RAW_BODY = os.getenv("STRIPE_WEBHOOK_STORE_RAW_BODY") == "True"
+# Stripe API client: seconds before a request times out, retries on network
+# errors, and how long PaymentIntent state is cached locally between webhooks.
+STRIPE_TIMEOUT = 10
+STRIPE_MAX_NETWORK_RETRIES = 2
+STRIPE_INTENT_CACHE_TIMEOUT = 60 * 30
+# Override to send Stripe API calls elsewhere, e.g. the local stand-in from
+# the run_standin_servers command.
+STRIPE_API_BASE = os.getenv("STRIPE_API_BASE")
 BASE_DIR = Path(__file__).resolve().parent.parent
 STRIPE_PUBLISHABLE_KEY = "pk_test_51RRCzbPH0oVkn2F1ZCB43p08cHzPiROnrVDvRbggNjvm4WAsDHhNy8gzd00qhxCItqk5Y8yhtRi9BJSIlt8dr8x100D0oG7sKC"
 
@@ -46,7 +56,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "core.middleware.CoalescingSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -56,6 +66,41 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "SCOOTER_SHOP.urls"
 
+# A file-based cache is shared by every worker process on the host, so version
+# stamps bumped by one process are seen by the others. Once the default cache
+# holds MAX_ENTRIES files, a third of them are dropped at random, so anything
+# that must not be lost lives in "versions" instead.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / ".django_cache",
+        "OPTIONS": {
+            "MAX_ENTRIES": 20000,
+            "CULL_FREQUENCY": 3,
+        },
+    },
+    # Cache version stamps, stored without a timeout. There are only a few of
+    # them, so this cache never reaches MAX_ENTRIES and is never culled.
+    "versions": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / ".django_cache_versions",
+        "OPTIONS": {
+            "MAX_ENTRIES": 1000000,
+        },
+    },
+    # In-progress bookings (see core/booking_drafts.py), kept out of the
+    # database until a Payment is created for them. This cache deletes
+    # expired drafts before it culls anything, and the limit is far above the
+    # number of customers mid-booking, so a live draft is never evicted.
+    "booking_drafts": {
+        "BACKEND": "core.cache_backends.ExpiringFileBasedCache",
+        "LOCATION": BASE_DIR / ".django_cache_drafts",
+        "OPTIONS": {
+            "MAX_ENTRIES": 100000,
+        },
+    },
+}
+
 if "test" in sys.argv:
     LOGGING = {
         "version": 1,
@@ -72,6 +117,25 @@ if "test" in sys.argv:
             },
         },
     }
+    # Cached payloads would otherwise leak between tests, as the cache is not
+    # rolled back with each test's transaction. Cache tests opt back in with
+    # override_settings.
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        },
+        "versions": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        },
+        # Drafts are keyed by a fresh session_uuid, so they cannot leak
+        # between tests, and the booking flows are tested with drafts kept
+        # in the cache, as in production.
+        "booking_drafts": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "booking-drafts-tests",
+            "OPTIONS": {"MAX_ENTRIES": 100000},
+        },
+    }
 
 TEMPLATES = [
     {
@@ -85,6 +149,7 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
                 "dashboard.context_processors.site_settings",
+                "dashboard.context_processors.notification_badge",
             ],
         },
     },
@@ -141,10 +206,29 @@ LOGOUT_REDIRECT_URL = reverse_lazy("core:index")
 SITE_BASE_URL = "http://localhost:8000"
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+# The client the sync_google_reviews command fetches reviews with. Point it
+# at dashboard.utils.StubPlacesClient to sync canned reviews offline.
+GOOGLE_PLACES_CLIENT = os.getenv(
+    "GOOGLE_PLACES_CLIENT", "dashboard.utils.GooglePlacesClient"
+)
+GOOGLE_PLACES_TIMEOUT = 10
 
 SESSION_COOKIE_AGE = 10000
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
-SESSION_SAVE_EVERY_REQUEST = True
+SESSION_SAVE_EVERY_REQUEST = False
+# Unchanged sessions are re-saved, extending their expiry, at most this often.
+SESSION_REFRESH_INTERVAL = 300
+
+# In-progress temporary bookings live in the booking_drafts cache until a
+# Payment is created for them or they are submitted (see
+# core/booking_drafts.py). Set to "database" to save every step to the
+# temporary booking tables instead.
+BOOKING_DRAFT_STORAGE = os.getenv("BOOKING_DRAFT_STORAGE", "cache")
+BOOKING_DRAFT_TIMEOUT = SESSION_COOKIE_AGE
+
+# How long a confirmation page's status request waits for the webhook worker
+# before answering "processing" (see payments/utils/payment_status_channel.py).
+PAYMENT_STATUS_LONG_POLL_TIMEOUT = 20
 
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 DEFAULT_FROM_EMAIL = "admin@scootershop.com.au"
@@ -157,4 +241,19 @@ EMAIL_USE_TLS = True
 EMAIL_HOST_USER = "admin@scootershop.com.au"
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 
+# send_templated_email queues emails for the process_email_queue worker.
+# Set EMAIL_QUEUE_ENABLED=False to send them inside the request instead.
+EMAIL_QUEUE_ENABLED = os.getenv("EMAIL_QUEUE_ENABLED", "True") == "True"
+
+# Days to keep email logs per status before prune_email_logs deletes them.
+# Queued and sending emails are never pruned.
+EMAIL_LOG_RETENTION_DAYS = {
+    "SENT": 90,
+    "FAILED": 90,
+}
+
 MECHANICDESK_BOOKING_TOKEN = os.getenv("MECHANICDESK_BOOKING_TOKEN")
+MECHANICDESK_BOOKING_URL = os.getenv(
+    "MECHANICDESK_BOOKING_URL",
+    "https://www.mechanicdesk.com.au/booking_requests/create_booking",
+)
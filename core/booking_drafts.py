@@ -0,0 +1,80 @@
+import copy
+from django.conf import settings
+from django.core.cache import caches
+
+DRAFT_CACHE_ALIAS = "booking_drafts"
+
+
+class DraftBookingStore:
+    """
+    Holds in-progress temporary bookings for the multi-step booking flows.
+
+    With BOOKING_DRAFT_STORAGE = "cache" a new draft lives only in the
+    booking_drafts cache, keyed by its session_uuid, until materialise()
+    writes it to the database (when a Payment is about to be created for it). Drafts that are converted
+    straight into a permanent booking never get a temporary row at all.
+
+    With BOOKING_DRAFT_STORAGE = "database" every change is saved to the
+    temporary booking model immediately, as the flows originally did.
+
+    Rows that already exist are always read from and saved to the database.
+    """
+
+    def __init__(self, model):
+        self.model = model
+
+    def _uses_cache(self):
+        return getattr(settings, "BOOKING_DRAFT_STORAGE", "database") == "cache"
+
+    def _cache_key(self, session_uuid):
+        return f"booking_draft:{self.model._meta.label_lower}:{session_uuid}"
+
+    def _cache(self):
+        return caches[DRAFT_CACHE_ALIAS]
+
+    def _timeout(self):
+        return getattr(settings, "BOOKING_DRAFT_TIMEOUT", settings.SESSION_COOKIE_AGE)
+
+    def _write_draft(self, instance):
+        # Drop cached related objects so later steps see current rows, not a
+        # stale copy of the profile or motorcycle pickled with the draft.
+        snapshot = copy.copy(instance)
+        snapshot._state.fields_cache = {}
+        self._cache().set(self._cache_key(instance.session_uuid), snapshot, self._timeout())
+
+    def load(self, session_uuid, select_related=()):
+        if self._uses_cache():
+            draft = self._cache().get(self._cache_key(session_uuid))
+            if draft is not None:
+                return draft
+
+        if select_related:
+            return self.model.objects.select_related(*select_related).get(
+                session_uuid=session_uuid
+            )
+        return self.model.objects.get(session_uuid=session_uuid)
+
+    def create(self, **fields):
+        instance = self.model(**fields)
+        if self._uses_cache():
+            self._write_draft(instance)
+        else:
+            instance.save()
+        return instance
+
+    def save(self, instance, update_fields=None):
+        if instance.pk is None:
+            self._write_draft(instance)
+        else:
+            instance.save(update_fields=update_fields)
+
+    def materialise(self, instance):
+        if instance.pk is None:
+            instance.save()
+            self._cache().delete(self._cache_key(instance.session_uuid))
+        return instance
+
+    def discard(self, instance):
+        self._cache().delete(self._cache_key(instance.session_uuid))
+        if instance.pk is not None:
+            instance.delete()
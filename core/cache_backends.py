@@ -0,0 +1,21 @@
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+class ExpiringFileBasedCache(FileBasedCache):
+    """
+    A FileBasedCache that deletes its expired entries before culling, so a
+    live entry is only culled once the cache is full of live entries.
+    FileBasedCache itself culls at random, expired or not.
+    """
+
+    def _cull(self):
+        filelist = self._list_cache_files()
+        if len(filelist) < self._max_entries:
+            return
+        for fname in filelist:
+            try:
+                with open(fname, "rb") as f:
+                    self._is_expired(f)
+            except FileNotFoundError:
+                pass
+        super()._cull()
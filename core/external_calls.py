@@ -0,0 +1,38 @@
+import threading
+import time
+from contextlib import contextmanager
+
+_local = threading.local()
+
+
+@contextmanager
+def track_external_calls():
+    """
+    Adds up the time spent inside external_call() blocks on this thread for
+    the duration of the block. Yields a dict with "calls" and "seconds".
+    """
+    previous = getattr(_local, "totals", None)
+    totals = {"calls": 0, "seconds": 0.0}
+    _local.totals = totals
+    try:
+        yield totals
+    finally:
+        _local.totals = previous
+
+
+@contextmanager
+def external_call():
+    """
+    Marks a call to a service outside the app (SMTP, Stripe, MechanicDesk).
+    Does nothing unless a track_external_calls() block is active.
+    """
+    totals = getattr(_local, "totals", None)
+    if totals is None:
+        yield
+        return
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        totals["calls"] += 1
+        totals["seconds"] += time.monotonic() - started
@@ -0,0 +1,88 @@
+import time
+from django.core.management.base import BaseCommand
+
+from core.standin_servers import (
+    StandInConfig,
+    start_standin_servers,
+    stop_standin_servers,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs local stand-ins for the Stripe and MechanicDesk APIs so the booking "
+        "and refund flows can be exercised offline and under load."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--stripe-port", type=int, default=12111)
+        parser.add_argument("--mechanicdesk-port", type=int, default=12112)
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.0,
+            help="Seconds added to every response (default: 0).",
+        )
+        parser.add_argument(
+            "--jitter",
+            type=float,
+            default=0.0,
+            help="Up to this many extra random seconds per response (default: 0).",
+        )
+        parser.add_argument(
+            "--failure-rate",
+            type=float,
+            default=0.0,
+            help="Share of requests, 0 to 1, answered with a server error (default: 0).",
+        )
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument(
+            "--webhook-url",
+            default="http://127.0.0.1:8000/payments/stripe-webhook/",
+            help="Where signed Stripe events are delivered. Pass an empty string to disable.",
+        )
+        parser.add_argument(
+            "--webhook-secret",
+            default="whsec_standin",
+            help="Secret used to sign events. Run the site with the same STRIPE_WEBHOOK_SECRET.",
+        )
+
+    def handle(self, *args, **options):
+        config = StandInConfig(
+            latency=options["latency"],
+            jitter=options["jitter"],
+            failure_rate=options["failure_rate"],
+            seed=options["seed"],
+        )
+        servers = start_standin_servers(
+            stripe_config=config,
+            mechanicdesk_config=config,
+            webhook_url=options["webhook_url"] or None,
+            webhook_secret=options["webhook_secret"],
+            host=options["host"],
+            stripe_port=options["stripe_port"],
+            mechanicdesk_port=options["mechanicdesk_port"],
+        )
+
+        self.stdout.write(self.style.SUCCESS("Stand-in servers running. Start the site with:"))
+        self.stdout.write(f"  STRIPE_API_BASE={servers.stripe_url}")
+        self.stdout.write(f"  STRIPE_WEBHOOK_SECRET={options['webhook_secret']}")
+        self.stdout.write(f"  MECHANICDESK_BOOKING_URL={servers.mechanicdesk_booking_url}")
+        self.stdout.write("Press Ctrl+C to stop.")
+
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop_standin_servers(servers)
+            stripe_app = servers.stripe
+            self.stdout.write(
+                f"Stripe: {stripe_app.request_count} requests, "
+                f"{stripe_app.failure_count} injected failures, "
+                f"{stripe_app.webhooks_sent} webhooks delivered. "
+                f"MechanicDesk: {servers.mechanicdesk.request_count} requests, "
+                f"{len(servers.mechanicdesk.bookings)} bookings."
+            )
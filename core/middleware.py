@@ -0,0 +1,32 @@
+import time
+from django.conf import settings
+from django.contrib.sessions.middleware import SessionMiddleware
+
+SESSION_REFRESHED_AT_KEY = "_session_refreshed_at"
+
+
+class CoalescingSessionMiddleware(SessionMiddleware):
+    """
+    Session middleware that only writes a session when its data changed, or
+    when the stored expiry is older than SESSION_REFRESH_INTERVAL seconds.
+
+    Use with SESSION_SAVE_EVERY_REQUEST = False. Visitors who never write to
+    their session are never given one, so browsing does not create rows.
+    """
+
+    def process_response(self, request, response):
+        session = getattr(request, "session", None)
+        if session is not None:
+            if session.modified:
+                if not session.is_empty():
+                    session[SESSION_REFRESHED_AT_KEY] = int(time.time())
+            elif session.accessed and session.session_key and self._refresh_due(
+                session
+            ):
+                session[SESSION_REFRESHED_AT_KEY] = int(time.time())
+        return super().process_response(request, response)
+
+    def _refresh_due(self, session):
+        interval = getattr(settings, "SESSION_REFRESH_INTERVAL", 300)
+        refreshed_at = session.get(SESSION_REFRESHED_AT_KEY, 0)
+        return time.time() - refreshed_at >= interval
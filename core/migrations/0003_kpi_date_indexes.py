@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+        ('inventory', '0010_remove_motorcycle_warranty_years_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enquiry',
+            index=models.Index(fields=['created_at'], name='enquiry_created_idx'),
+        ),
+    ]
@@ -14,6 +14,9 @@ class Enquiry(models.Model):
 
     class Meta:
         verbose_name_plural = "Enquiries"
+        indexes = [
+            models.Index(fields=["created_at"], name="enquiry_created_idx"),
+        ]
 
     def __str__(self):
         return f"Enquiry from {self.name} ({self.email})"
@@ -0,0 +1,31 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from inventory.models import FeaturedMotorcycle, Motorcycle
+from service.models import (
+    ServiceSettings,
+    ServiceType,
+    BlockedServiceDate,
+    ServiceBooking,
+)
+from dashboard.models import Review
+from core.utils import invalidate_homepage_payload
+
+HOMEPAGE_SOURCE_MODELS = (
+    FeaturedMotorcycle,
+    Motorcycle,
+    Review,
+    ServiceSettings,
+    ServiceType,
+    BlockedServiceDate,
+    ServiceBooking,
+)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_homepage_on_change(sender, **kwargs):
+    # Invalidated once the change commits, so a homepage request in between
+    # cannot rebuild and cache the payload from the old rows.
+    if sender in HOMEPAGE_SOURCE_MODELS:
+        transaction.on_commit(invalidate_homepage_payload)
@@ -0,0 +1,491 @@
+"""
+Local stand-ins for the Stripe and MechanicDesk HTTP APIs.
+
+They implement just the parts of those APIs the shop uses: PaymentIntents,
+Charges, Refunds, signed webhook delivery, and MechanicDesk's
+create_booking endpoint. Point the site at them with STRIPE_API_BASE and
+MECHANICDESK_BOOKING_URL to drive the booking and refund flows with no
+network access. Every response can be slowed down and a share of them can
+be failed on purpose, for load and resilience testing.
+
+Start them with the run_standin_servers management command, or in a test
+with the running_standin_servers() context manager.
+"""
+import hashlib
+import hmac
+import itertools
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+
+@dataclass
+class StandInConfig:
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    seed: int = None
+
+
+def _parse_form(body):
+    """Turns Stripe's form encoding (metadata[key]=value) into nested dicts."""
+    params = {}
+    for raw_key, value in parse_qsl(body, keep_blank_values=True):
+        parts = re.findall(r"[^\[\]]+", raw_key)
+        target = params
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+    return params
+
+
+def _as_int(value, default=None):
+    return int(value) if value not in (None, "") else default
+
+
+class StandInApp:
+    """Shared plumbing: latency, failure injection and thread-safe state."""
+
+    def __init__(self, config=None):
+        self.config = config or StandInConfig()
+        self.random = random.Random(self.config.seed)
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.failure_count = 0
+
+    def delay_and_maybe_fail(self):
+        with self.lock:
+            self.request_count += 1
+            delay = self.config.latency + self.random.uniform(0, self.config.jitter)
+            fail = self.random.random() < self.config.failure_rate
+            if fail:
+                self.failure_count += 1
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def injected_failure(self):
+        return 500, {"error": "Injected failure from the stand-in."}
+
+    def handle(self, method, path, query, form, headers):
+        return 404, {"error": f"Unknown path {path}"}
+
+
+class StripeStandIn(StandInApp):
+    def __init__(self, config=None, webhook_url=None, webhook_secret="whsec_standin"):
+        super().__init__(config)
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.payment_intents = {}
+        self.charges = {}
+        self.refunds = {}
+        self.idempotent_responses = {}
+        self.webhooks_sent = 0
+        self._ids = itertools.count(1)
+
+    def _new_id(self, prefix):
+        return f"{prefix}_standin{next(self._ids):08d}{secrets.token_hex(4)}"
+
+    def injected_failure(self):
+        return 500, {
+            "error": {"type": "api_error", "message": "Injected failure from the Stripe stand-in."}
+        }
+
+    @staticmethod
+    def _not_found(object_id):
+        return 404, {
+            "error": {
+                "type": "invalid_request_error",
+                "code": "resource_missing",
+                "message": f"No such object: '{object_id}'",
+            }
+        }
+
+    @staticmethod
+    def _unexpected_state(intent):
+        return 400, {
+            "error": {
+                "type": "invalid_request_error",
+                "code": "payment_intent_unexpected_state",
+                "message": f"This PaymentIntent's status is {intent['status']}.",
+            }
+        }
+
+    def handle(self, method, path, query, form, headers):
+        idempotency_key = headers.get("Idempotency-Key")
+        if method == "POST" and idempotency_key:
+            with self.lock:
+                cached = self.idempotent_responses.get((path, idempotency_key))
+            if cached:
+                return cached
+
+        response = self._route(method, path, query, form)
+
+        if method == "POST" and idempotency_key and response[0] < 500:
+            with self.lock:
+                self.idempotent_responses[(path, idempotency_key)] = response
+        return response
+
+    def _route(self, method, path, query, form):
+        parts = path.strip("/").split("/")
+        if parts[:1] != ["v1"]:
+            return self._not_found(path)
+        parts = parts[1:]
+
+        if parts == ["payment_intents"]:
+            if method == "POST":
+                return self.create_payment_intent(form)
+            return self.list_objects(self.payment_intents, query, "/v1/payment_intents")
+        if len(parts) >= 2 and parts[0] == "payment_intents":
+            intent_id = parts[1]
+            action = parts[2] if len(parts) > 2 else None
+            with self.lock:
+                intent = self.payment_intents.get(intent_id)
+            if intent is None:
+                return self._not_found(intent_id)
+            if method == "GET" and action is None:
+                return 200, intent
+            if action is None:
+                return self.modify_payment_intent(intent, form)
+            if action == "confirm":
+                return self.confirm_payment_intent(intent)
+            if action == "cancel":
+                return self.cancel_payment_intent(intent)
+        if parts == ["refunds"]:
+            if method == "POST":
+                return self.create_refund(form)
+            return self.list_objects(self.refunds, query, "/v1/refunds")
+        if len(parts) == 2 and parts[0] in ("refunds", "charges"):
+            store = self.refunds if parts[0] == "refunds" else self.charges
+            with self.lock:
+                obj = store.get(parts[1])
+            return (200, obj) if obj else self._not_found(parts[1])
+        return self._not_found(path)
+
+    def create_payment_intent(self, form):
+        intent_id = self._new_id("pi")
+        intent = {
+            "id": intent_id,
+            "object": "payment_intent",
+            "amount": _as_int(form.get("amount"), 0),
+            "amount_received": 0,
+            "currency": form.get("currency", "aud").lower(),
+            "status": "requires_payment_method",
+            "client_secret": f"{intent_id}_secret_{secrets.token_hex(8)}",
+            "description": form.get("description"),
+            "metadata": form.get("metadata", {}),
+            "latest_charge": None,
+            "created": int(time.time()),
+            "livemode": False,
+        }
+        with self.lock:
+            self.payment_intents[intent_id] = intent
+        return 200, intent
+
+    def modify_payment_intent(self, intent, form):
+        if intent["status"] in ("succeeded", "canceled"):
+            return self._unexpected_state(intent)
+        with self.lock:
+            if "amount" in form:
+                intent["amount"] = _as_int(form["amount"])
+            for key in ("currency", "description"):
+                if key in form:
+                    intent[key] = form[key].lower() if key == "currency" else form[key]
+            if "metadata" in form:
+                intent["metadata"] = {**intent["metadata"], **form["metadata"]}
+        return 200, intent
+
+    def confirm_payment_intent(self, intent):
+        """Completes the payment the way Stripe.js would after card entry."""
+        if intent["status"] in ("succeeded", "canceled"):
+            return self._unexpected_state(intent)
+        charge_id = self._new_id("ch")
+        charge = {
+            "id": charge_id,
+            "object": "charge",
+            "amount": intent["amount"],
+            "amount_refunded": 0,
+            "currency": intent["currency"],
+            "payment_intent": intent["id"],
+            "status": "succeeded",
+            "refunded": False,
+            "metadata": intent["metadata"],
+            "refunds": {"object": "list", "data": []},
+            "created": int(time.time()),
+        }
+        with self.lock:
+            self.charges[charge_id] = charge
+            intent.update(
+                status="succeeded",
+                amount_received=intent["amount"],
+                latest_charge=charge_id,
+            )
+        self.send_webhook("payment_intent.succeeded", intent)
+        return 200, intent
+
+    def cancel_payment_intent(self, intent):
+        if intent["status"] in ("succeeded", "canceled"):
+            return self._unexpected_state(intent)
+        with self.lock:
+            intent["status"] = "canceled"
+        self.send_webhook("payment_intent.canceled", intent)
+        return 200, intent
+
+    def create_refund(self, form):
+        with self.lock:
+            if "charge" in form:
+                charge = self.charges.get(form["charge"])
+            else:
+                intent = self.payment_intents.get(form.get("payment_intent"))
+                charge = self.charges.get(intent["latest_charge"]) if intent else None
+        if charge is None:
+            return self._not_found(form.get("charge") or form.get("payment_intent"))
+
+        remaining = charge["amount"] - charge["amount_refunded"]
+        amount = _as_int(form.get("amount"), remaining)
+        if amount <= 0 or amount > remaining:
+            return 400, {
+                "error": {
+                    "type": "invalid_request_error",
+                    "code": "amount_too_large",
+                    "message": "Refund amount is greater than the unrefunded amount.",
+                }
+            }
+
+        refund = {
+            "id": self._new_id("re"),
+            "object": "refund",
+            "amount": amount,
+            "charge": charge["id"],
+            "payment_intent": charge["payment_intent"],
+            "currency": charge["currency"],
+            "status": "succeeded",
+            "reason": form.get("reason"),
+            "metadata": form.get("metadata", {}),
+            "created": int(time.time()),
+        }
+        with self.lock:
+            self.refunds[refund["id"]] = refund
+            charge["amount_refunded"] += amount
+            charge["refunded"] = charge["amount_refunded"] >= charge["amount"]
+            charge["refunds"]["data"].insert(0, refund)
+        self.send_webhook("charge.refunded", charge)
+        return 200, refund
+
+    def list_objects(self, store, query, url):
+        """Newest-first paging with created[gte]/[lte], limit and starting_after."""
+        created = query.get("created", {})
+        gte = _as_int(created.get("gte"))
+        lte = _as_int(created.get("lte"))
+        limit = min(_as_int(query.get("limit"), 10), 100)
+
+        with self.lock:
+            objects = sorted(
+                store.values(), key=lambda obj: (obj["created"], obj["id"]), reverse=True
+            )
+        objects = [
+            obj
+            for obj in objects
+            if (gte is None or obj["created"] >= gte) and (lte is None or obj["created"] <= lte)
+        ]
+        starting_after = query.get("starting_after")
+        if starting_after:
+            ids = [obj["id"] for obj in objects]
+            if starting_after in ids:
+                objects = objects[ids.index(starting_after) + 1 :]
+
+        return 200, {
+            "object": "list",
+            "url": url,
+            "data": objects[:limit],
+            "has_more": len(objects) > limit,
+        }
+
+    def sign_payload(self, payload, timestamp=None):
+        timestamp = timestamp or int(time.time())
+        signature = hmac.new(
+            self.webhook_secret.encode("utf-8"),
+            f"{timestamp}.{payload}".encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"t={timestamp},v1={signature}"
+
+    def build_event(self, event_type, obj):
+        return {
+            "id": self._new_id("evt"),
+            "object": "event",
+            "type": event_type,
+            "api_version": "2020-08-27",
+            "created": int(time.time()),
+            "livemode": False,
+            "data": {"object": json.loads(json.dumps(obj))},
+        }
+
+    def send_webhook(self, event_type, obj):
+        """Delivers a signed event to webhook_url in the background, like Stripe."""
+        if not self.webhook_url:
+            return
+        payload = json.dumps(self.build_event(event_type, obj))
+
+        def deliver():
+            try:
+                requests.post(
+                    self.webhook_url,
+                    data=payload,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Stripe-Signature": self.sign_payload(payload),
+                    },
+                    timeout=10,
+                )
+            except requests.exceptions.RequestException:
+                return
+            with self.lock:
+                self.webhooks_sent += 1
+
+        threading.Thread(target=deliver, daemon=True).start()
+
+
+class MechanicDeskStandIn(StandInApp):
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.bookings = []
+
+    def injected_failure(self):
+        return 503, {"error": "Injected failure from the MechanicDesk stand-in."}
+
+    def handle(self, method, path, query, form, headers):
+        if method == "POST" and path.rstrip("/") == "/booking_requests/create_booking":
+            if not form.get("token"):
+                return 401, {"error": "Missing token."}
+            with self.lock:
+                self.bookings.append(form)
+            return 200, {"status": "ok"}
+        return 404, {"error": f"Unknown path {path}"}
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _dispatch(self, method):
+        app = self.server.app
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+
+        if app.delay_and_maybe_fail():
+            status, payload = app.injected_failure()
+        else:
+            status, payload = app.handle(
+                method, url.path, _parse_form(url.query), _parse_form(body), self.headers
+            )
+
+        encoded = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.send_header("Request-Id", f"req_standin_{secrets.token_hex(6)}")
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, app, host="127.0.0.1", port=0):
+        self.app = app
+        super().__init__((host, port), _StandInRequestHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+@dataclass
+class StandInServers:
+    stripe_server: StandInServer
+    mechanicdesk_server: StandInServer
+    threads: list = field(default_factory=list)
+
+    @property
+    def stripe(self):
+        return self.stripe_server.app
+
+    @property
+    def mechanicdesk(self):
+        return self.mechanicdesk_server.app
+
+    @property
+    def stripe_url(self):
+        return self.stripe_server.url
+
+    @property
+    def mechanicdesk_booking_url(self):
+        return f"{self.mechanicdesk_server.url}/booking_requests/create_booking"
+
+
+def start_standin_servers(
+    stripe_config=None,
+    mechanicdesk_config=None,
+    webhook_url=None,
+    webhook_secret="whsec_standin",
+    host="127.0.0.1",
+    stripe_port=0,
+    mechanicdesk_port=0,
+):
+    stripe_server = StandInServer(
+        StripeStandIn(stripe_config, webhook_url, webhook_secret), host, stripe_port
+    )
+    mechanicdesk_server = StandInServer(
+        MechanicDeskStandIn(mechanicdesk_config), host, mechanicdesk_port
+    )
+    servers = StandInServers(stripe_server, mechanicdesk_server)
+    servers.threads = [stripe_server.start(), mechanicdesk_server.start()]
+    return servers
+
+
+def stop_standin_servers(servers):
+    servers.stripe_server.stop()
+    servers.mechanicdesk_server.stop()
+
+
+@contextmanager
+def running_standin_servers(**kwargs):
+    """Runs both stand-ins on free ports for the duration of the block."""
+    servers = start_standin_servers(**kwargs)
+    try:
+        yield servers
+    finally:
+        stop_standin_servers(servers)
@@ -0,0 +1,135 @@
+import datetime
+import uuid
+from decimal import Decimal
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from inventory.models import TempSalesBooking
+from inventory.tests.test_helpers.model_factories import (
+    InventorySettingsFactory,
+    MotorcycleFactory,
+    SalesProfileFactory,
+)
+from inventory.utils import temp_sales_booking_store
+from service.models import TempServiceBooking, ServiceBooking
+from service.tests.test_helpers.model_factories import (
+    ServiceProfileFactory,
+    ServiceSettingsFactory,
+    ServiceTypeFactory,
+)
+from service.utils import convert_temp_service_booking, temp_service_booking_store
+
+@override_settings(BOOKING_DRAFT_STORAGE="cache")
+class CacheDraftBookingStoreTest(TestCase):
+    def setUp(self):
+        self.service_type = ServiceTypeFactory()
+
+    def _create_service_draft(self):
+        return temp_service_booking_store.create(
+            session_uuid=uuid.uuid4(),
+            service_type=self.service_type,
+            service_date=datetime.date.today() + datetime.timedelta(days=7),
+        )
+
+    def test_create_keeps_draft_out_of_database(self):
+        draft = self._create_service_draft()
+        self.assertIsNone(draft.pk)
+        self.assertFalse(TempServiceBooking.objects.exists())
+
+        loaded = temp_service_booking_store.load(draft.session_uuid)
+        self.assertEqual(loaded.service_type, self.service_type)
+
+    def test_draft_is_kept_in_the_booking_drafts_cache(self):
+        draft = self._create_service_draft()
+        key = temp_service_booking_store._cache_key(draft.session_uuid)
+
+        self.assertIsNotNone(caches["booking_drafts"].get(key))
+
+    def test_steps_do_not_touch_the_database_until_materialised(self):
+        draft = self._create_service_draft()
+
+        with self.assertNumQueries(0):
+            draft.customer_notes = "Rattling noise"
+            temp_service_booking_store.save(draft, update_fields=["customer_notes"])
+            temp_service_booking_store.load(draft.session_uuid)
+
+    def test_save_updates_cached_draft(self):
+        draft = self._create_service_draft()
+        draft.customer_notes = "Rattling noise"
+        temp_service_booking_store.save(draft, update_fields=["customer_notes"])
+
+        loaded = temp_service_booking_store.load(draft.session_uuid)
+        self.assertEqual(loaded.customer_notes, "Rattling noise")
+        self.assertFalse(TempServiceBooking.objects.exists())
+
+    def test_materialise_writes_row_and_drops_cache_entry(self):
+        draft = self._create_service_draft()
+        temp_service_booking_store.materialise(draft)
+
+        self.assertIsNotNone(draft.pk)
+        row = TempServiceBooking.objects.get(session_uuid=draft.session_uuid)
+        self.assertEqual(temp_service_booking_store.load(draft.session_uuid), row)
+
+    def test_load_missing_draft_raises_does_not_exist(self):
+        with self.assertRaises(TempServiceBooking.DoesNotExist):
+            temp_service_booking_store.load(uuid.uuid4())
+
+    def test_submitted_draft_is_converted_without_temp_row(self):
+        ServiceSettingsFactory()
+        draft = self._create_service_draft()
+        draft.service_profile = ServiceProfileFactory()
+        draft.dropoff_date = draft.service_date
+        temp_service_booking_store.save(draft)
+
+        service_booking = convert_temp_service_booking(
+            temp_booking=temp_service_booking_store.load(draft.session_uuid),
+            payment_method="in_store_full",
+            booking_payment_status="unpaid",
+            amount_paid_on_booking=Decimal("0.00"),
+            calculated_total_on_booking=Decimal("100.00"),
+            booking_status="pending",
+        )
+
+        self.assertTrue(ServiceBooking.objects.filter(pk=service_booking.pk).exists())
+        self.assertFalse(TempServiceBooking.objects.exists())
+        with self.assertRaises(TempServiceBooking.DoesNotExist):
+            temp_service_booking_store.load(draft.session_uuid)
+
+    def test_related_objects_are_not_pickled_with_draft(self):
+        profile = SalesProfileFactory(name="Before")
+        draft = temp_sales_booking_store.create(
+            motorcycle=MotorcycleFactory(), sales_profile=profile
+        )
+        profile.name = "After"
+        profile.save()
+
+        loaded = temp_sales_booking_store.load(draft.session_uuid)
+        self.assertEqual(loaded.sales_profile.name, "After")
+
+    def test_initiate_sales_booking_creates_no_temp_row(self):
+        InventorySettingsFactory()
+        motorcycle = MotorcycleFactory(is_available=True)
+
+        response = self.client.post(
+            reverse("inventory:initiate_booking", kwargs={"pk": motorcycle.pk}),
+            {"deposit_required_for_flow": "true"},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(TempSalesBooking.objects.exists())
+        session_uuid = self.client.session["temp_sales_booking_uuid"]
+        draft = temp_sales_booking_store.load(session_uuid)
+        self.assertTrue(draft.deposit_required_for_flow)
+        self.assertEqual(draft.motorcycle, motorcycle)
+
+
+@override_settings(BOOKING_DRAFT_STORAGE="database")
+class DatabaseDraftBookingStoreTest(TestCase):
+    def test_create_saves_row_immediately(self):
+        draft = temp_service_booking_store.create(
+            session_uuid=uuid.uuid4(),
+            service_type=ServiceTypeFactory(),
+            service_date=datetime.date.today(),
+        )
+        self.assertIsNotNone(draft.pk)
+        self.assertEqual(temp_service_booking_store.load(draft.session_uuid), draft)
@@ -0,0 +1,38 @@
+import tempfile
+import time
+
+from django.test import SimpleTestCase
+
+from core.cache_backends import ExpiringFileBasedCache
+
+
+class ExpiringFileBasedCacheTest(SimpleTestCase):
+    def make_cache(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return ExpiringFileBasedCache(
+            directory.name, {"OPTIONS": {"MAX_ENTRIES": 3, "CULL_FREQUENCY": 1}}
+        )
+
+    def test_expired_entries_are_deleted_before_live_ones_are_culled(self):
+        cache = self.make_cache()
+        cache.set("expired-1", "a", 1)
+        cache.set("expired-2", "b", 1)
+        cache.set("live", "c", 60)
+        time.sleep(1.1)
+
+        cache.set("new", "d", 60)
+
+        self.assertEqual(cache.get("live"), "c")
+        self.assertEqual(cache.get("new"), "d")
+        self.assertEqual(len(cache._list_cache_files()), 2)
+
+    def test_a_cache_full_of_live_entries_is_still_culled(self):
+        cache = self.make_cache()
+        for key in ("a", "b", "c"):
+            cache.set(key, key, 60)
+
+        cache.set("d", "d", 60)
+
+        self.assertLessEqual(len(cache._list_cache_files()), 3)
+        self.assertEqual(cache.get("d"), "d")
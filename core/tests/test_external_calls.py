@@ -0,0 +1,35 @@
+from django.test import SimpleTestCase
+
+from core.external_calls import external_call, track_external_calls
+
+
+class ExternalCallsTest(SimpleTestCase):
+    def test_counts_calls_inside_a_tracking_block(self):
+        with track_external_calls() as totals:
+            with external_call():
+                pass
+            with external_call():
+                pass
+
+        self.assertEqual(totals["calls"], 2)
+        self.assertGreaterEqual(totals["seconds"], 0)
+
+    def test_call_outside_a_tracking_block_is_ignored(self):
+        with external_call():
+            pass
+
+        with track_external_calls() as totals:
+            pass
+
+        self.assertEqual(totals["calls"], 0)
+
+    def test_nested_tracking_restores_the_outer_totals(self):
+        with track_external_calls() as outer:
+            with track_external_calls() as inner:
+                with external_call():
+                    pass
+            with external_call():
+                pass
+
+        self.assertEqual(inner["calls"], 1)
+        self.assertEqual(outer["calls"], 1)
@@ -0,0 +1,64 @@
+import time
+from django.contrib.sessions.models import Session
+from django.http import HttpResponse
+from django.test import TestCase, RequestFactory, override_settings
+from django.urls import reverse
+from core.middleware import CoalescingSessionMiddleware, SESSION_REFRESHED_AT_KEY
+
+
+@override_settings(SESSION_SAVE_EVERY_REQUEST=False, SESSION_REFRESH_INTERVAL=300)
+class CoalescingSessionMiddlewareTest(TestCase):
+    def setUp(self):
+        self.url = reverse("core:index")
+
+    def _start_session(self, **data):
+        session = self.client.session
+        session.update(data)
+        session.save()
+        self.client.cookies["sessionid"] = session.session_key
+        return session.session_key
+
+    def test_anonymous_browsing_creates_no_session(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("sessionid", response.cookies)
+        self.assertFalse(Session.objects.exists())
+
+    def test_unchanged_session_is_not_rewritten_within_interval(self):
+        session_key = self._start_session(
+            **{"booking_note": "x", SESSION_REFRESHED_AT_KEY: int(time.time())}
+        )
+        expire_date = Session.objects.get(session_key=session_key).expire_date
+
+        self.client.get(self.url)
+
+        self.assertEqual(
+            Session.objects.get(session_key=session_key).expire_date, expire_date
+        )
+
+    def test_unchanged_session_is_refreshed_after_interval(self):
+        session_key = self._start_session(
+            **{"booking_note": "x", SESSION_REFRESHED_AT_KEY: int(time.time()) - 301}
+        )
+        expire_date = Session.objects.get(session_key=session_key).expire_date
+
+        response = self.client.get(self.url)
+
+        self.assertIn("sessionid", response.cookies)
+        session = Session.objects.get(session_key=session_key)
+        self.assertGreater(session.expire_date, expire_date)
+        self.assertGreater(
+            session.get_decoded()[SESSION_REFRESHED_AT_KEY], int(time.time()) - 5
+        )
+
+    def test_modified_session_is_saved_with_refresh_stamp(self):
+        request = RequestFactory().get(self.url)
+        middleware = CoalescingSessionMiddleware(lambda r: HttpResponse())
+        middleware.process_request(request)
+        request.session["temp_service_booking_uuid"] = "abc"
+
+        middleware.process_response(request, HttpResponse())
+
+        session = Session.objects.get(session_key=request.session.session_key)
+        self.assertEqual(session.get_decoded()["temp_service_booking_uuid"], "abc")
+        self.assertIn(SESSION_REFRESHED_AT_KEY, session.get_decoded())
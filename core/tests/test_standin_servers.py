@@ -0,0 +1,168 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import stripe
+from django.test import SimpleTestCase, override_settings
+
+from core.standin_servers import (
+    StandInApp,
+    StandInConfig,
+    StandInServer,
+    running_standin_servers,
+)
+from payments.utils.stripe_gateway import configure_stripe
+
+
+class RecordingApp(StandInApp):
+    def __init__(self):
+        super().__init__()
+        self.received = []
+
+    def handle(self, method, path, query, form, headers):
+        self.received.append(headers.get("Stripe-Signature"))
+        return 200, {}
+
+
+class StandInServersTest(SimpleTestCase):
+    def use_stripe_standin(self, servers, **extra_settings):
+        overrides = override_settings(
+            STRIPE_API_BASE=servers.stripe_url,
+            STRIPE_SECRET_KEY="sk_test_standin",
+            STRIPE_MAX_NETWORK_RETRIES=0,
+            **extra_settings,
+        )
+        overrides.enable()
+        self.addCleanup(configure_stripe)
+        self.addCleanup(overrides.disable)
+        configure_stripe()
+
+    def test_payment_intent_lifecycle_and_refund(self):
+        with running_standin_servers() as servers:
+            self.use_stripe_standin(servers)
+
+            intent = stripe.PaymentIntent.create(
+                amount=5000, currency="aud", metadata={"booking_type": "service_booking"}
+            )
+            self.assertEqual(intent.status, "requires_payment_method")
+            self.assertEqual(intent.metadata["booking_type"], "service_booking")
+
+            intent = stripe.PaymentIntent.modify(intent.id, amount=6000)
+            self.assertEqual(stripe.PaymentIntent.retrieve(intent.id).amount, 6000)
+
+            intent = stripe.PaymentIntent.confirm(intent.id)
+            self.assertEqual(intent.status, "succeeded")
+
+            refund = stripe.Refund.create(payment_intent=intent.id, amount=2500)
+            self.assertEqual(refund.status, "succeeded")
+            charge = stripe.Charge.retrieve(refund.charge)
+            self.assertEqual(charge.amount_refunded, 2500)
+
+            with self.assertRaises(stripe.error.InvalidRequestError) as raised:
+                stripe.PaymentIntent.cancel(intent.id)
+            self.assertEqual(raised.exception.code, "payment_intent_unexpected_state")
+
+    def test_idempotent_create_returns_the_same_intent(self):
+        with running_standin_servers() as servers:
+            self.use_stripe_standin(servers)
+
+            first = stripe.PaymentIntent.create(amount=100, currency="aud", idempotency_key="k1")
+            second = stripe.PaymentIntent.create(amount=100, currency="aud", idempotency_key="k1")
+
+            self.assertEqual(first.id, second.id)
+            self.assertEqual(len(servers.stripe.payment_intents), 1)
+
+    def test_list_pages_through_intents(self):
+        with running_standin_servers() as servers:
+            self.use_stripe_standin(servers)
+            created = {stripe.PaymentIntent.create(amount=100, currency="aud").id for _ in range(5)}
+
+            listed = {
+                intent.id
+                for intent in stripe.PaymentIntent.list(limit=2).auto_paging_iter()
+            }
+
+            self.assertEqual(listed, created)
+
+    def test_failure_injection(self):
+        config = StandInConfig(failure_rate=1.0, seed=1)
+        with running_standin_servers(stripe_config=config) as servers:
+            self.use_stripe_standin(servers)
+
+            with self.assertRaises(stripe.error.APIError):
+                stripe.PaymentIntent.create(amount=100, currency="aud")
+            self.assertEqual(servers.stripe.failure_count, 1)
+
+    def test_concurrent_creates_get_distinct_intents(self):
+        config = StandInConfig(latency=0.01)
+        with running_standin_servers(stripe_config=config) as servers:
+            self.use_stripe_standin(servers)
+
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                ids = list(
+                    pool.map(
+                        lambda _: stripe.PaymentIntent.create(amount=100, currency="aud").id,
+                        range(48),
+                    )
+                )
+
+            self.assertEqual(len(set(ids)), 48)
+
+    def test_confirm_delivers_signed_webhook(self):
+        receiver = StandInServer(RecordingApp())
+        receiver.start()
+        self.addCleanup(receiver.stop)
+
+        with running_standin_servers(
+            webhook_url=f"{receiver.url}/payments/stripe-webhook/",
+            webhook_secret="whsec_test",
+        ) as servers:
+            self.use_stripe_standin(servers)
+            intent = stripe.PaymentIntent.create(amount=100, currency="aud")
+            stripe.PaymentIntent.confirm(intent.id)
+
+            deadline = time.monotonic() + 5
+            while not receiver.app.received and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+        self.assertEqual(len(receiver.app.received), 1)
+        self.assertTrue(receiver.app.received[0].startswith("t="))
+
+    def test_signature_is_accepted_by_stripe_library(self):
+        with running_standin_servers(webhook_secret="whsec_test") as servers:
+            event = servers.stripe.build_event("payment_intent.succeeded", {"id": "pi_1"})
+            payload = json.dumps(event)
+
+            constructed = stripe.Webhook.construct_event(
+                payload, servers.stripe.sign_payload(payload), "whsec_test"
+            )
+
+        self.assertEqual(constructed["type"], "payment_intent.succeeded")
+
+    def test_mechanicdesk_records_bookings_and_injects_failures(self):
+        with running_standin_servers() as servers:
+            response = requests.post(
+                servers.mechanicdesk_booking_url, data={"token": "t", "name": "A"}, timeout=5
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(servers.mechanicdesk.bookings[0]["name"], "A")
+
+        config = StandInConfig(failure_rate=1.0)
+        with running_standin_servers(mechanicdesk_config=config) as servers:
+            response = requests.post(
+                servers.mechanicdesk_booking_url, data={"token": "t"}, timeout=5
+            )
+            self.assertEqual(response.status_code, 503)
+
+    def test_base_app_answers_404_and_injects_a_plain_failure(self):
+        server = StandInServer(StandInApp())
+        server.start()
+        self.addCleanup(server.stop)
+
+        response = requests.get(f"{server.url}/anything", timeout=5)
+        self.assertEqual(response.status_code, 404)
+
+        server.app.config = StandInConfig(failure_rate=1.0)
+        response = requests.get(f"{server.url}/anything", timeout=5)
+        self.assertEqual(response.status_code, 500)
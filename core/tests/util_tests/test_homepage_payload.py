@@ -0,0 +1,114 @@
+from django.core.cache import cache, caches
+from django.test import TestCase, RequestFactory, override_settings
+from django.contrib.sessions.middleware import SessionMiddleware
+from core.utils import (
+    get_homepage_payload,
+    get_homepage_session_overlay,
+    invalidate_homepage_payload,
+)
+from dashboard.tests.test_helpers.model_factories import ReviewFactory
+from inventory.tests.test_helpers.model_factories import FeaturedMotorcycleFactory
+from service.tests.test_helpers.model_factories import (
+    ServiceSettingsFactory,
+    ServiceTypeFactory,
+    TempServiceBookingFactory,
+)
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "homepage-payload-tests",
+    },
+    "versions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "homepage-payload-tests-versions",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class HomepagePayloadTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["versions"].clear()
+        ServiceSettingsFactory()
+        ServiceTypeFactory(name="Full Service")
+        ReviewFactory(is_active=True)
+
+    def test_warm_payload_issues_no_queries(self):
+        get_homepage_payload()
+        with self.assertNumQueries(0):
+            payload = get_homepage_payload()
+        self.assertEqual(len(payload["reviews"]), 1)
+        self.assertIn("Full Service", [name for _, name in payload["service_type_choices"]])
+
+    def test_saving_a_source_model_invalidates_payload(self):
+        get_homepage_payload()
+        with self.captureOnCommitCallbacks(execute=True):
+            ReviewFactory(is_active=True)
+        self.assertEqual(len(get_homepage_payload()["reviews"]), 2)
+
+    def test_payload_is_invalidated_only_on_commit(self):
+        get_homepage_payload()
+        with self.captureOnCommitCallbacks() as callbacks:
+            ReviewFactory(is_active=True)
+            self.assertEqual(len(get_homepage_payload()["reviews"]), 1)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(len(get_homepage_payload()["reviews"]), 2)
+
+    def test_featured_items_are_materialised(self):
+        FeaturedMotorcycleFactory(category="new")
+        payload = get_homepage_payload()
+        self.assertIsInstance(payload["featured_new_items"], list)
+        self.assertEqual(len(payload["featured_new_items"]), 1)
+        self.assertEqual(payload["featured_used_items"], [])
+
+    def test_invalidate_without_version_key(self):
+        cache.clear()
+        caches["versions"].clear()
+        invalidate_homepage_payload()
+        self.assertEqual(len(get_homepage_payload()["reviews"]), 1)
+
+    def test_culling_the_default_cache_keeps_the_version(self):
+        get_homepage_payload()
+        with self.captureOnCommitCallbacks(execute=True):
+            ReviewFactory(is_active=True)
+        get_homepage_payload()
+
+        # Anything in the default cache may be culled; the version stamp is
+        # not kept there, so no payload from an older version comes back.
+        cache.clear()
+
+        self.assertEqual(len(get_homepage_payload()["reviews"]), 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            ReviewFactory(is_active=True)
+        self.assertEqual(len(get_homepage_payload()["reviews"]), 3)
+
+
+class HomepageSessionOverlayTest(TestCase):
+    def _request_with_session(self, **session_data):
+        request = RequestFactory().get("/")
+        SessionMiddleware(lambda r: None).process_request(request)
+        request.session.update(session_data)
+        return request
+
+    def test_no_booking_in_session_issues_no_queries(self):
+        request = self._request_with_session()
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_homepage_session_overlay(request))
+
+    def test_returns_temp_booking_for_session(self):
+        temp_booking = TempServiceBookingFactory()
+        request = self._request_with_session(
+            temp_service_booking_uuid=str(temp_booking.session_uuid)
+        )
+        self.assertEqual(get_homepage_session_overlay(request), temp_booking)
+
+    def test_stale_uuid_is_removed_from_session(self):
+        request = self._request_with_session(
+            temp_service_booking_uuid="00000000-0000-0000-0000-000000000000"
+        )
+        self.assertIsNone(get_homepage_session_overlay(request))
+        self.assertNotIn("temp_service_booking_uuid", request.session)
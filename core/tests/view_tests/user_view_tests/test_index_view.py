@@ -35,7 +35,7 @@ class IndexViewTest(TestCase):
         self.addCleanup(patch_service_settings.stop)
 
         self.mock_get_service_date_availability_patch = patch(
-            "core.views.user_views.index.get_service_date_availability"
+            "core.utils.homepage_payload.get_service_date_availability"
         )
         self.mock_get_service_date_availability = (
             self.mock_get_service_date_availability_patch.start()
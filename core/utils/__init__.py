@@ -0,0 +1 @@
+from .homepage_payload import *
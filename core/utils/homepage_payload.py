@@ -0,0 +1,68 @@
+from django.core.cache import cache, caches
+from django.utils import timezone
+from service.models import ServiceType, TempServiceBooking
+from service.utils import get_service_date_availability, temp_service_booking_store
+from inventory.utils import get_featured_motorcycles
+from dashboard.utils import get_reviews
+from dashboard.utils import get_service_settings
+
+HOMEPAGE_CACHE_VERSION_KEY = "core:homepage:version"
+HOMEPAGE_CACHE_TIMEOUT = 60 * 15
+
+
+def _homepage_cache_key():
+    versions = caches["versions"]
+    version = versions.get(HOMEPAGE_CACHE_VERSION_KEY)
+    if version is None:
+        version = 1
+        versions.add(HOMEPAGE_CACHE_VERSION_KEY, version, None)
+    # Availability is relative to today, so the payload rolls over at midnight.
+    today = timezone.localdate().isoformat()
+    return f"core:homepage:payload:{version}:{today}"
+
+
+def build_homepage_payload():
+    min_date_for_flatpickr, disabled_dates_json = get_service_date_availability()
+
+    return {
+        "service_settings": get_service_settings(),
+        "blocked_service_dates_json": disabled_dates_json,
+        "min_service_date_flatpickr": min_date_for_flatpickr.strftime("%Y-%m-%d"),
+        "featured_new_items": list(get_featured_motorcycles("new")),
+        "featured_used_items": list(get_featured_motorcycles("used")),
+        "reviews": list(get_reviews()),
+        "service_type_choices": list(
+            ServiceType.objects.filter(is_active=True).values_list("pk", "name")
+        ),
+    }
+
+
+def get_homepage_payload():
+    key = _homepage_cache_key()
+    payload = cache.get(key)
+    if payload is None:
+        payload = build_homepage_payload()
+        cache.set(key, payload, HOMEPAGE_CACHE_TIMEOUT)
+    return payload
+
+
+def invalidate_homepage_payload():
+    versions = caches["versions"]
+    try:
+        versions.incr(HOMEPAGE_CACHE_VERSION_KEY)
+    except ValueError:
+        versions.set(HOMEPAGE_CACHE_VERSION_KEY, 2, None)
+
+
+def get_homepage_session_overlay(request):
+    temp_service_booking_uuid = request.session.get("temp_service_booking_uuid")
+    if not temp_service_booking_uuid:
+        return None
+
+    try:
+        return temp_service_booking_store.load(
+            temp_service_booking_uuid, select_related=("service_type",)
+        )
+    except TempServiceBooking.DoesNotExist:
+        del request.session["temp_service_booking_uuid"]
+        return None
@@ -1,10 +1,10 @@
 from django.views.generic import TemplateView
 from django.shortcuts import redirect
 from django.conf import settings
-from dashboard.models import SiteSettings
 from django.contrib import messages
 from core.forms.enquiry_form import EnquiryForm
 from mailer.utils import send_templated_email
+from dashboard.utils import get_site_settings
 
 
 class ContactView(TemplateView):
@@ -12,7 +12,7 @@ class ContactView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        site_settings = SiteSettings.get_settings()
+        site_settings = get_site_settings()
         about_content = None
 
         context.update(
@@ -1,6 +1,6 @@
 from django.views.generic import TemplateView
 from django.shortcuts import redirect
-from dashboard.models import SiteSettings
+from dashboard.utils import get_site_settings
 
 
 class PrivacyPolicyView(TemplateView):
@@ -8,7 +8,7 @@ class PrivacyPolicyView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        site_settings = SiteSettings.get_settings()
+        site_settings = get_site_settings()
         if (
             not site_settings.enable_privacy_policy_page
             and not self.request.user.is_staff
@@ -19,7 +19,7 @@ class PrivacyPolicyView(TemplateView):
         return context
 
     def dispatch(self, request, *args, **kwargs):
-        site_settings = SiteSettings.get_settings()
+        site_settings = get_site_settings()
         if not site_settings.enable_privacy_policy_page and not request.user.is_staff:
             return redirect("core:index")
         return super().dispatch(request, *args, **kwargs)
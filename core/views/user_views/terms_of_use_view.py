@@ -1,5 +1,5 @@
 from django.views.generic import TemplateView
-from dashboard.models import SiteSettings
+from dashboard.utils import get_site_settings
 
 
 class TermsOfUseView(TemplateView):
@@ -7,10 +7,10 @@ class TermsOfUseView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        site_settings = SiteSettings.get_settings()
+        site_settings = get_site_settings()
         context["settings"] = site_settings
         return context
 
     def dispatch(self, request, *args, **kwargs):
-        site_settings = SiteSettings.get_settings()
+        site_settings = get_site_settings()
         return super().dispatch(request, *args, **kwargs)
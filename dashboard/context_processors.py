@@ -1,6 +1,9 @@
-from .models import SiteSettings
 from django.conf import settings
-from service.models import ServiceType
+from dashboard.utils import (
+    get_site_settings,
+    get_service_types,
+    unread_notification_count,
+)
 
 
 def site_settings(request):
@@ -8,9 +11,9 @@ def site_settings(request):
     service_types_list = []
 
     try:
-        settings_object = SiteSettings.get_settings()
+        settings_object = get_site_settings()
         if settings_object:
-            service_types_list = ServiceType.objects.all()
+            service_types_list = get_service_types()
     except Exception:
         pass
 
@@ -20,3 +23,14 @@ def site_settings(request):
         "SITE_DOMAIN": settings.SITE_DOMAIN,
         "SITE_SCHEME": settings.SITE_SCHEME,
     }
+
+
+def notification_badge(request):
+    # Only staff see the dashboard, so nobody else pays for the lookup.
+    user = getattr(request, "user", None)
+    if not (user and user.is_authenticated and user.is_staff):
+        return {}
+    try:
+        return {"unread_notification_count": unread_notification_count()}
+    except Exception:
+        return {}
@@ -0,0 +1,68 @@
+import datetime
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from dashboard.utils import refresh_daily_kpis
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the daily KPI rollups from the bookings, payments, refunds "
+        "and enquiries tables. The rollups are kept up to date as records are "
+        "saved; run this to backfill history, and nightly over the last few "
+        "days to pick up changes made by bulk updates, which skip the signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=2,
+            help="Number of days up to and including today to rebuild (default: 2).",
+        )
+        parser.add_argument(
+            "--since",
+            help="Rebuild every day from this date (YYYY-MM-DD) to today instead.",
+        )
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=0,
+            help="Also rebuild this many days after today, for upcoming workshop slot use (default: 0).",
+        )
+        parser.add_argument(
+            "--chunk-days",
+            type=int,
+            default=31,
+            help="Number of days to rebuild per batch of queries (default: 31).",
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        if options["since"]:
+            try:
+                start = datetime.date.fromisoformat(options["since"])
+            except ValueError:
+                raise CommandError("--since must be a date in YYYY-MM-DD format.")
+        else:
+            start = today - datetime.timedelta(days=max(1, options["days"]) - 1)
+        if start > today:
+            raise CommandError("--since cannot be in the future.")
+        last = today + datetime.timedelta(days=max(0, options["ahead"]))
+
+        chunk_days = max(1, options["chunk_days"])
+        refreshed = 0
+        day = start
+        while day <= last:
+            end = min(day + datetime.timedelta(days=chunk_days - 1), last)
+            refreshed += refresh_daily_kpis(
+                day + datetime.timedelta(days=offset)
+                for offset in range((end - day).days + 1)
+            )
+            day = end + datetime.timedelta(days=1)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt daily KPIs for {refreshed} days from {start} to {last}."
+            )
+        )
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboard.utils import (
+    PlacesClientError,
+    get_places_client,
+    get_site_settings,
+    sync_google_reviews,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Fetches the storefront's Google Places reviews and upserts them into "
+        "the displayed reviews. If Google cannot be reached the stored reviews "
+        "are left as they are."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--client",
+            help=(
+                "Dotted path of the Places client class to use "
+                "(default: the GOOGLE_PLACES_CLIENT setting)."
+            ),
+        )
+        parser.add_argument(
+            "--place-id",
+            help="Place ID to fetch reviews for (default: the one in the site settings).",
+        )
+
+    def handle(self, *args, **options):
+        site_settings = get_site_settings()
+        place_id = options["place_id"] or site_settings.google_places_place_id
+        if not options["place_id"] and not site_settings.enable_google_places_reviews:
+            self.stdout.write("Google Places reviews are disabled in the site settings.")
+            return
+        if not place_id:
+            raise CommandError("No Google Places Place ID is set.")
+
+        try:
+            created, updated = sync_google_reviews(
+                get_places_client(options["client"]), place_id
+            )
+        except PlacesClientError as e:
+            raise CommandError(f"{e} The stored reviews were left unchanged.")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synced Google reviews: {created} added, {updated} updated."
+            )
+        )
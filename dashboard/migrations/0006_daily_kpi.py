@@ -0,0 +1,38 @@
+# Generated by Django 5.2 on 2026-10-19 05:39
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0005_notification_unread_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyKPI',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('service_bookings', models.PositiveIntegerField(default=0, help_text='Service bookings created on this day.')),
+                ('service_bookings_by_status', models.JSONField(blank=True, default=dict, help_text='Service bookings created on this day, by current booking status.')),
+                ('sales_bookings', models.PositiveIntegerField(default=0, help_text='Sales bookings created on this day.')),
+                ('sales_bookings_by_status', models.JSONField(blank=True, default=dict, help_text='Sales bookings created on this day, by current booking status.')),
+                ('revenue', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Total of the succeeded payments created on this day.', max_digits=12)),
+                ('deposits', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Amount paid on bookings created on this day that only paid a deposit.', max_digits=12)),
+                ('refunds', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Total refunded by refund requests processed on this day.', max_digits=12)),
+                ('refund_count', models.PositiveIntegerField(default=0, help_text='Refund requests refunded on this day.')),
+                ('slots_booked', models.PositiveIntegerField(default=0, help_text='Workshop slots taken by active service bookings dropping off on this day.')),
+                ('slots_available', models.PositiveIntegerField(default=0, help_text='Workshop slots open on this day, from the service settings when it was last rolled up.')),
+                ('enquiries', models.PositiveIntegerField(default=0, help_text='Enquiries received on this day.')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Daily KPI',
+                'verbose_name_plural': 'Daily KPIs',
+                'ordering': ['-date'],
+            },
+        ),
+    ]
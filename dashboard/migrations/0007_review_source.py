@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-19 05:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0006_daily_kpi'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='author_url',
+            field=models.URLField(blank=True, help_text="Link to the author's profile at the review's source.", max_length=500, null=True),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='external_id',
+            field=models.CharField(blank=True, help_text="The review's id at its source, for reviews synced from Google Places.", max_length=255, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='published_at',
+            field=models.DateTimeField(blank=True, help_text='When the review was published at its source.', null=True),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='source',
+            field=models.CharField(choices=[('manual', 'Added by Staff'), ('google', 'Google Places')], default='manual', help_text='Where the review came from.', max_length=20),
+        ),
+    ]
@@ -1,3 +1,4 @@
 from .site_settings import SiteSettings
 from .notification import Notification
 from .review import Review
+from .daily_kpi import DailyKPI
@@ -0,0 +1,75 @@
+from decimal import Decimal
+from django.db import models
+
+
+class DailyKPI(models.Model):
+    """
+    One day of business figures for the dashboard, kept up to date by the
+    dashboard signals and rebuilt by the rollup_daily_kpis command.
+    """
+
+    date = models.DateField(unique=True)
+    service_bookings = models.PositiveIntegerField(
+        default=0, help_text="Service bookings created on this day."
+    )
+    service_bookings_by_status = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Service bookings created on this day, by current booking status.",
+    )
+    sales_bookings = models.PositiveIntegerField(
+        default=0, help_text="Sales bookings created on this day."
+    )
+    sales_bookings_by_status = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Sales bookings created on this day, by current booking status.",
+    )
+    revenue = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        help_text="Total of the succeeded payments created on this day.",
+    )
+    deposits = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        help_text="Amount paid on bookings created on this day that only paid a deposit.",
+    )
+    refunds = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        help_text="Total refunded by refund requests processed on this day.",
+    )
+    refund_count = models.PositiveIntegerField(
+        default=0, help_text="Refund requests refunded on this day."
+    )
+    slots_booked = models.PositiveIntegerField(
+        default=0,
+        help_text="Workshop slots taken by active service bookings dropping off on this day.",
+    )
+    slots_available = models.PositiveIntegerField(
+        default=0,
+        help_text="Workshop slots open on this day, from the service settings when it was last rolled up.",
+    )
+    enquiries = models.PositiveIntegerField(
+        default=0, help_text="Enquiries received on this day."
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-date"]
+        verbose_name = "Daily KPI"
+        verbose_name_plural = "Daily KPIs"
+
+    def __str__(self):
+        return f"KPIs for {self.date}"
+
+    @property
+    def slot_utilisation(self):
+        """Percentage of the day's workshop slots taken, or None if unknown."""
+        if not self.slots_available:
+            return None
+        return round(self.slots_booked * 100 / self.slots_available, 1)
@@ -29,3 +29,13 @@ class Notification(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
+        indexes = [
+            models.Index(
+                fields=["is_cleared", "created_at"],
+                name="notification_unread_idx",
+            ),
+            models.Index(
+                fields=["is_cleared", "content_type", "created_at"],
+                name="notification_unread_type_idx",
+            ),
+        ]
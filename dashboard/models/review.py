@@ -3,6 +3,11 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 
 
 class Review(models.Model):
+    SOURCE_CHOICES = [
+        ("manual", "Added by Staff"),
+        ("google", "Google Places"),
+    ]
+
     author_name = models.CharField(
         max_length=255, help_text="The name of the person who wrote the review."
     )
@@ -25,6 +30,30 @@ class Review(models.Model):
     is_active = models.BooleanField(
         default=True, help_text="Only active reviews will be displayed on the site."
     )
+    source = models.CharField(
+        max_length=20,
+        choices=SOURCE_CHOICES,
+        default="manual",
+        help_text="Where the review came from.",
+    )
+    external_id = models.CharField(
+        max_length=255,
+        unique=True,
+        blank=True,
+        null=True,
+        help_text="The review's id at its source, for reviews synced from Google Places.",
+    )
+    author_url = models.URLField(
+        max_length=500,
+        blank=True,
+        null=True,
+        help_text="Link to the author's profile at the review's source.",
+    )
+    published_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the review was published at its source.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
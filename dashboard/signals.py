@@ -1,10 +1,21 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from inventory.models import SalesBooking
 from service.models import ServiceBooking
 from core.models import Enquiry
 from refunds.models import RefundRequest, RefundSettings
-from dashboard.models import Notification
+from payments.models import Payment
+from dashboard.models import Notification, Review
+from dashboard.utils import (
+    reset_unread_notification_count,
+    invalidate_reviews,
+    bump_settings_version,
+    is_registered_settings_model,
+    kpi_dates_for,
+    stored_kpi_dates_for,
+    schedule_kpi_refresh,
+)
 
 
 @receiver(post_save, sender=SalesBooking)
@@ -50,3 +61,58 @@ def create_refund_settings_notification(sender, instance, created, **kwargs):
     else:
         message = "Refund settings have been updated. Please review the refund policy text to ensure it reflects the changes."
         Notification.objects.create(content_object=instance, message=message)
+
+
+@receiver(post_save, sender=Notification)
+def count_new_notification(sender, instance, created, **kwargs):
+    if created and not instance.is_cleared:
+        reset_unread_notification_count()
+
+
+@receiver(post_delete, sender=Notification)
+def uncount_deleted_notification(sender, instance, **kwargs):
+    if not instance.is_cleared:
+        reset_unread_notification_count()
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_cached_reviews(sender, **kwargs):
+    invalidate_reviews()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_cached_settings_version(sender, **kwargs):
+    # Bumped once the change commits, so no process reloads the snapshot
+    # from the database before the new row is visible.
+    if is_registered_settings_model(sender):
+        model_label = sender._meta.label
+        transaction.on_commit(lambda: bump_settings_version(model_label))
+
+
+@receiver(pre_save, sender=ServiceBooking)
+@receiver(pre_save, sender=SalesBooking)
+@receiver(pre_save, sender=Payment)
+@receiver(pre_save, sender=RefundRequest)
+@receiver(pre_save, sender=Enquiry)
+def remember_kpi_dates(sender, instance, update_fields=None, **kwargs):
+    # The days the saved row counted towards, so a change that moves it to
+    # another day refreshes both.
+    instance._kpi_dates = stored_kpi_dates_for(instance, update_fields)
+
+
+@receiver(post_save, sender=ServiceBooking)
+@receiver(post_save, sender=SalesBooking)
+@receiver(post_save, sender=Payment)
+@receiver(post_save, sender=RefundRequest)
+@receiver(post_save, sender=Enquiry)
+@receiver(post_delete, sender=ServiceBooking)
+@receiver(post_delete, sender=SalesBooking)
+@receiver(post_delete, sender=Payment)
+@receiver(post_delete, sender=RefundRequest)
+@receiver(post_delete, sender=Enquiry)
+def refresh_kpi_rollups(sender, instance, **kwargs):
+    schedule_kpi_refresh(
+        kpi_dates_for(instance) | getattr(instance, "_kpi_dates", set())
+    )
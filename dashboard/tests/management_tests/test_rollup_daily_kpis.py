@@ -0,0 +1,44 @@
+import datetime
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.tests.test_helpers.model_factories import EnquiryFactory
+from dashboard.models import DailyKPI
+
+
+class RollupDailyKPIsCommandTest(TestCase):
+    def test_rebuilds_recent_days_by_default(self):
+        EnquiryFactory()
+        out = StringIO()
+
+        call_command("rollup_daily_kpis", stdout=out)
+
+        today = timezone.localdate()
+        self.assertEqual(
+            set(DailyKPI.objects.values_list("date", flat=True)),
+            {today, today - datetime.timedelta(days=1)},
+        )
+        self.assertEqual(DailyKPI.objects.get(date=today).enquiries, 1)
+        self.assertIn("Rebuilt daily KPIs for 2 days", out.getvalue())
+
+    def test_backfills_since_a_date_in_chunks(self):
+        today = timezone.localdate()
+        since = today - datetime.timedelta(days=99)
+
+        call_command(
+            "rollup_daily_kpis",
+            since=since.isoformat(),
+            ahead=5,
+            chunk_days=7,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(DailyKPI.objects.count(), 105)
+        self.assertEqual(DailyKPI.objects.order_by("date").first().date, since)
+
+    def test_rejects_bad_since(self):
+        with self.assertRaises(CommandError):
+            call_command("rollup_daily_kpis", since="yesterday", stdout=StringIO())
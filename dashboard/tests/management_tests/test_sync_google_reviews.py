@@ -0,0 +1,40 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from dashboard.models import Review, SiteSettings
+
+STUB_CLIENT = "dashboard.utils.StubPlacesClient"
+FAILING_CLIENT = "dashboard.tests.util_tests.test_google_places.FailingPlacesClient"
+
+
+class SyncGoogleReviewsCommandTest(TestCase):
+    def setUp(self):
+        self.site_settings = SiteSettings.get_settings()
+
+    def test_syncs_with_the_given_client(self):
+        out = StringIO()
+
+        call_command("sync_google_reviews", client=STUB_CLIENT, stdout=out)
+
+        self.assertEqual(Review.objects.filter(source="google").count(), 2)
+        self.assertIn("2 added, 0 updated", out.getvalue())
+
+    def test_does_nothing_when_disabled(self):
+        self.site_settings.enable_google_places_reviews = False
+        self.site_settings.save()
+        out = StringIO()
+
+        call_command("sync_google_reviews", client=STUB_CLIENT, stdout=out)
+
+        self.assertFalse(Review.objects.exists())
+        self.assertIn("disabled", out.getvalue())
+
+    def test_failed_fetch_raises_and_keeps_reviews(self):
+        call_command("sync_google_reviews", client=STUB_CLIENT, stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command("sync_google_reviews", client=FAILING_CLIENT, stdout=StringIO())
+
+        self.assertEqual(Review.objects.count(), 2)
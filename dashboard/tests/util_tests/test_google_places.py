@@ -0,0 +1,168 @@
+from unittest import mock
+
+import requests
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+
+from core.utils import get_homepage_payload
+from dashboard.models import Review
+from dashboard.tests.test_helpers.model_factories import ReviewFactory
+from dashboard.utils import (
+    GooglePlacesClient,
+    PlaceReview,
+    PlacesClientError,
+    StubPlacesClient,
+    get_reviews,
+    sync_google_reviews,
+)
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "review-tests",
+    },
+    "versions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "review-tests-versions",
+    }
+}
+
+PLACES_RESPONSE = {
+    "reviews": [
+        {
+            "name": "places/abc/reviews/1",
+            "rating": 5,
+            "text": {"text": "Translated", "languageCode": "en"},
+            "originalText": {"text": "Great service", "languageCode": "en"},
+            "authorAttribution": {
+                "displayName": "Jo Rider",
+                "uri": "https://www.google.com/maps/contrib/1",
+                "photoUri": "https://example.com/jo.jpg",
+            },
+            "publishTime": "2026-09-01T02:30:00Z",
+        }
+    ]
+}
+
+
+class FailingPlacesClient:
+    def fetch_reviews(self, place_id):
+        raise PlacesClientError("Places is down.")
+
+
+class GooglePlacesClientTest(TestCase):
+    @mock.patch("dashboard.utils.google_places.requests.get")
+    def test_fetch_parses_reviews(self, mock_get):
+        mock_get.return_value.json.return_value = PLACES_RESPONSE
+
+        reviews = GooglePlacesClient(api_key="key").fetch_reviews("abc")
+
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["X-Goog-Api-Key"], "key")
+        self.assertEqual(len(reviews), 1)
+        review = reviews[0]
+        self.assertEqual(review.external_id, "places/abc/reviews/1")
+        self.assertEqual(review.author_name, "Jo Rider")
+        self.assertEqual(review.text, "Great service")
+        self.assertEqual(review.profile_photo_url, "https://example.com/jo.jpg")
+        self.assertEqual(review.published_at.isoformat(), "2026-09-01T02:30:00+00:00")
+
+    @mock.patch("dashboard.utils.google_places.requests.get")
+    def test_fetch_wraps_request_errors(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError("no route")
+
+        with self.assertRaises(PlacesClientError):
+            GooglePlacesClient(api_key="key").fetch_reviews("abc")
+
+    @override_settings(GOOGLE_API_KEY=None)
+    def test_fetch_needs_an_api_key(self):
+        with self.assertRaises(PlacesClientError):
+            GooglePlacesClient().fetch_reviews("abc")
+
+
+class SyncGoogleReviewsTest(TestCase):
+    def test_creates_then_updates_synced_reviews(self):
+        manual = ReviewFactory()
+
+        created, updated = sync_google_reviews(StubPlacesClient(), "abc")
+
+        self.assertEqual((created, updated), (2, 0))
+        self.assertEqual(Review.objects.filter(source="google").count(), 2)
+
+        hidden = Review.objects.get(external_id="places/stub/reviews/1")
+        hidden.is_active = False
+        hidden.save()
+        client = StubPlacesClient(
+            [
+                PlaceReview("places/stub/reviews/1", "Sam Rider", 3, "Edited review"),
+                PlaceReview("places/stub/reviews/3", "Rating Only", 5, ""),
+            ]
+        )
+
+        created, updated = sync_google_reviews(client, "abc")
+
+        self.assertEqual((created, updated), (0, 1))
+        hidden.refresh_from_db()
+        self.assertEqual(hidden.text, "Edited review")
+        self.assertEqual(hidden.rating, 3)
+        self.assertFalse(hidden.is_active)
+        self.assertEqual(Review.objects.count(), 3)
+        self.assertTrue(Review.objects.filter(pk=manual.pk, source="manual").exists())
+
+    def test_reviews_without_a_valid_rating_are_skipped(self):
+        client = StubPlacesClient(
+            [
+                PlaceReview("places/stub/reviews/1", "No Rating", 0, "Fine"),
+                PlaceReview("places/stub/reviews/2", "Too High", 6, "Great"),
+                PlaceReview("places/stub/reviews/3", "Missing", None, "Okay"),
+                PlaceReview("places/stub/reviews/4", "Jo Rider", 4, "Good"),
+            ]
+        )
+
+        created, updated = sync_google_reviews(client, "abc")
+
+        self.assertEqual((created, updated), (1, 0))
+        self.assertEqual(
+            list(Review.objects.values_list("external_id", "rating")),
+            [("places/stub/reviews/4", 4)],
+        )
+
+    def test_failed_fetch_keeps_stored_reviews(self):
+        sync_google_reviews(StubPlacesClient(), "abc")
+
+        with self.assertRaises(PlacesClientError):
+            sync_google_reviews(FailingPlacesClient(), "abc")
+
+        self.assertEqual(Review.objects.filter(source="google").count(), 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedReviewsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["versions"].clear()
+        self.review = ReviewFactory()
+        ReviewFactory(is_active=False)
+
+    def test_active_reviews_are_cached_until_a_review_changes(self):
+        self.assertEqual(get_reviews(), [self.review])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_reviews(), [self.review])
+
+        self.review.is_active = False
+        self.review.save()
+
+        self.assertEqual(get_reviews(), [])
+
+    def test_sync_refreshes_cached_reviews(self):
+        get_reviews()
+
+        sync_google_reviews(StubPlacesClient(), "abc")
+
+        self.assertEqual(len(get_reviews()), 3)
+
+    def test_sync_refreshes_the_cached_homepage_payload(self):
+        self.assertEqual(len(get_homepage_payload()["reviews"]), 1)
+
+        sync_google_reviews(StubPlacesClient(), "abc")
+
+        self.assertEqual(len(get_homepage_payload()["reviews"]), 3)
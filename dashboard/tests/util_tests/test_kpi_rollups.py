@@ -0,0 +1,247 @@
+import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models import Enquiry
+from core.tests.test_helpers.model_factories import EnquiryFactory
+from dashboard.models import DailyKPI
+from dashboard.utils import (
+    kpi_totals,
+    kpi_totals_by_month,
+    refresh_daily_kpis,
+)
+from inventory.tests.test_helpers.model_factories import SalesBookingFactory
+from payments.tests.test_helpers.model_factories import PaymentFactory
+from refunds.tests.test_helpers.model_factories import RefundRequestFactory
+from service.models import ServiceBooking
+from service.tests.test_helpers.model_factories import (
+    ServiceBookingFactory,
+    ServiceSettingsFactory,
+    ServiceTypeFactory,
+)
+
+MONDAY = datetime.date(2025, 10, 20)
+SATURDAY = MONDAY + datetime.timedelta(days=5)
+
+
+def at_noon(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time(12, 0)))
+
+
+class RefreshDailyKPIsTest(TestCase):
+    def setUp(self):
+        ServiceSettingsFactory(daily_service_slots=8, booking_open_days="Mon,Tue,Wed,Thu,Fri")
+        self.service_type = ServiceTypeFactory(slots_required=3)
+
+    def service_booking(self, created, **kwargs):
+        booking = ServiceBookingFactory(service_type=self.service_type, **kwargs)
+        type(booking).objects.filter(pk=booking.pk).update(created_at=at_noon(created))
+        return booking
+
+    def sales_booking(self, created, **kwargs):
+        booking = SalesBookingFactory(**kwargs)
+        type(booking).objects.filter(pk=booking.pk).update(created_at=at_noon(created))
+        return booking
+
+    def test_rolls_up_a_day(self):
+        self.service_booking(
+            MONDAY,
+            booking_status="confirmed",
+            payment_status="deposit_paid",
+            amount_paid=Decimal("50.00"),
+            dropoff_date=MONDAY,
+        )
+        self.service_booking(
+            MONDAY,
+            booking_status="cancelled",
+            payment_status="paid",
+            amount_paid=Decimal("200.00"),
+            dropoff_date=MONDAY,
+        )
+        self.sales_booking(
+            MONDAY,
+            booking_status="confirmed",
+            payment_status="deposit_paid",
+            amount_paid=Decimal("100.00"),
+        )
+        for status, amount in (("succeeded", "150.00"), ("succeeded", "50.00"), ("canceled", "999.00")):
+            payment = PaymentFactory(status=status, amount=Decimal(amount))
+            type(payment).objects.filter(pk=payment.pk).update(created_at=at_noon(MONDAY))
+        RefundRequestFactory(
+            status="refunded", amount_to_refund=Decimal("40.00"), processed_at=at_noon(MONDAY)
+        )
+        RefundRequestFactory(
+            status="rejected", amount_to_refund=Decimal("70.00"), processed_at=at_noon(MONDAY)
+        )
+        enquiry = EnquiryFactory()
+        type(enquiry).objects.filter(pk=enquiry.pk).update(created_at=at_noon(MONDAY))
+
+        self.assertEqual(refresh_daily_kpis([MONDAY]), 1)
+
+        kpi = DailyKPI.objects.get(date=MONDAY)
+        self.assertEqual(kpi.service_bookings, 2)
+        self.assertEqual(kpi.service_bookings_by_status, {"confirmed": 1, "cancelled": 1})
+        self.assertEqual(kpi.sales_bookings, 1)
+        self.assertEqual(kpi.sales_bookings_by_status, {"confirmed": 1})
+        self.assertEqual(kpi.deposits, Decimal("150.00"))
+        self.assertEqual(kpi.revenue, Decimal("200.00"))
+        self.assertEqual(kpi.refunds, Decimal("40.00"))
+        self.assertEqual(kpi.refund_count, 1)
+        self.assertEqual(kpi.slots_booked, 3)
+        self.assertEqual(kpi.slots_available, 8)
+        self.assertEqual(kpi.slot_utilisation, 37.5)
+        self.assertEqual(kpi.enquiries, 1)
+
+    def test_refunded_payments_still_count_toward_their_days_revenue(self):
+        for status, amount in (("refunded", "80.00"), ("partially_refunded", "20.00")):
+            payment = PaymentFactory(status=status, amount=Decimal(amount))
+            type(payment).objects.filter(pk=payment.pk).update(created_at=at_noon(MONDAY))
+
+        refresh_daily_kpis([MONDAY])
+
+        self.assertEqual(DailyKPI.objects.get(date=MONDAY).revenue, Decimal("100.00"))
+
+    def test_closed_days_have_no_slots(self):
+        refresh_daily_kpis([SATURDAY])
+
+        kpi = DailyKPI.objects.get(date=SATURDAY)
+        self.assertEqual(kpi.slots_available, 0)
+        self.assertIsNone(kpi.slot_utilisation)
+
+    def test_refresh_replaces_existing_rows(self):
+        booking = self.service_booking(MONDAY, booking_status="pending", dropoff_date=MONDAY)
+        refresh_daily_kpis([MONDAY])
+
+        booking.delete()
+        refresh_daily_kpis([MONDAY])
+
+        kpi = DailyKPI.objects.get(date=MONDAY)
+        self.assertEqual(kpi.service_bookings, 0)
+        self.assertEqual(kpi.service_bookings_by_status, {})
+        self.assertEqual(kpi.slots_booked, 0)
+        self.assertEqual(DailyKPI.objects.count(), 1)
+
+    def test_query_count_does_not_grow_with_days(self):
+        for offset in range(0, 30, 3):
+            self.service_booking(MONDAY + datetime.timedelta(days=offset))
+
+        with CaptureQueriesContext(connection) as one_day:
+            refresh_daily_kpis([MONDAY])
+        with CaptureQueriesContext(connection) as month:
+            refresh_daily_kpis(MONDAY + datetime.timedelta(days=n) for n in range(31))
+
+        self.assertEqual(len(one_day), len(month))
+        self.assertEqual(DailyKPI.objects.count(), 31)
+        self.assertEqual(
+            sum(DailyKPI.objects.values_list("service_bookings", flat=True)), 10
+        )
+
+
+class KPISignalsTest(TestCase):
+    def setUp(self):
+        ServiceSettingsFactory()
+
+    def test_saving_a_booking_refreshes_its_days(self):
+        dropoff = timezone.localdate() + datetime.timedelta(days=10)
+        with self.captureOnCommitCallbacks(execute=True):
+            booking = ServiceBookingFactory(booking_status="pending", dropoff_date=dropoff)
+
+        self.assertEqual(
+            DailyKPI.objects.get(date=timezone.localdate()).service_bookings, 1
+        )
+        self.assertEqual(
+            DailyKPI.objects.get(date=dropoff).slots_booked,
+            booking.service_type.slots_required,
+        )
+
+        moved = dropoff + datetime.timedelta(days=1)
+        booking.dropoff_date = moved
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.save()
+
+        self.assertEqual(DailyKPI.objects.get(date=dropoff).slots_booked, 0)
+        self.assertEqual(
+            DailyKPI.objects.get(date=moved).slots_booked,
+            booking.service_type.slots_required,
+        )
+
+    def test_deleting_an_enquiry_refreshes_its_day(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enquiry = EnquiryFactory()
+        self.assertEqual(DailyKPI.objects.get(date=timezone.localdate()).enquiries, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enquiry.delete()
+
+        self.assertEqual(DailyKPI.objects.get(date=timezone.localdate()).enquiries, 0)
+
+
+    def test_loading_instances_does_not_compute_their_days(self):
+        EnquiryFactory.create_batch(3)
+
+        with patch("dashboard.signals.kpi_dates_for") as kpi_dates_for:
+            list(Enquiry.objects.all())
+
+        kpi_dates_for.assert_not_called()
+
+    def test_save_reads_the_stored_days_in_one_query(self):
+        dropoff = timezone.localdate() + datetime.timedelta(days=10)
+        with self.captureOnCommitCallbacks(execute=True):
+            booking = ServiceBookingFactory(booking_status="pending", dropoff_date=dropoff)
+
+        # Loaded fresh, so only the stored row knows the old drop-off day.
+        booking = ServiceBooking.objects.get(pk=booking.pk)
+        booking.dropoff_date = dropoff + datetime.timedelta(days=1)
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks() as callbacks:
+                booking.save()
+        self.assertEqual(len(queries), 2)
+
+        with patch("dashboard.utils.kpi_rollups.refresh_daily_kpis") as refresh:
+            for callback in callbacks:
+                callback()
+        self.assertIn(dropoff, refresh.call_args.args[0])
+
+    def test_save_without_date_fields_skips_the_lookup(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enquiry = EnquiryFactory()
+
+        enquiry.message = "Updated"
+        with self.assertNumQueries(1):
+            enquiry.save(update_fields=["message"])
+
+    def test_failed_refresh_does_not_break_the_commit(self):
+        with patch(
+            "dashboard.utils.kpi_rollups.refresh_daily_kpis",
+            side_effect=RuntimeError("rollup failed"),
+        ), self.assertLogs("django", "ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                EnquiryFactory()
+
+        self.assertEqual(Enquiry.objects.count(), 1)
+
+
+class KPITotalsTest(TestCase):
+    def test_totals_and_months(self):
+        kpis = [
+            DailyKPI(date=datetime.date(2026, 9, 30), revenue=Decimal("100.00"), refunds=Decimal("10.00"), slots_booked=4, slots_available=8),
+            DailyKPI(date=datetime.date(2026, 10, 1), revenue=Decimal("50.00"), slots_booked=2, slots_available=8),
+            DailyKPI(date=datetime.date(2026, 10, 3), service_bookings=2, enquiries=1),
+        ]
+
+        totals = kpi_totals(kpis)
+
+        self.assertEqual(totals["revenue"], Decimal("150.00"))
+        self.assertEqual(totals["net_revenue"], Decimal("140.00"))
+        self.assertEqual(totals["slot_utilisation"], 37.5)
+
+        months = kpi_totals_by_month(kpis)
+
+        self.assertEqual([month["month"] for month in months], [datetime.date(2026, 9, 1), datetime.date(2026, 10, 1)])
+        self.assertEqual(months[1]["revenue"], Decimal("50.00"))
+        self.assertEqual(months[1]["service_bookings"], 2)
@@ -0,0 +1,85 @@
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+
+from core.tests.test_helpers.model_factories import EnquiryFactory
+from dashboard.models import Notification
+from dashboard.utils import (
+    reset_unread_notification_count,
+    unread_notification_count,
+    unread_notification_groups,
+    unread_notifications_page,
+)
+from inventory.tests.test_helpers.model_factories import SalesBookingFactory
+from service.tests.test_helpers.model_factories import ServiceBookingFactory
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "notification-tests",
+    },
+    "versions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "notification-tests-versions",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NotificationUtilsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["versions"].clear()
+        # Each of these saves a notification through the dashboard signals.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sales_bookings = SalesBookingFactory.create_batch(3)
+            self.service_booking = ServiceBookingFactory()
+            self.enquiry = EnquiryFactory()
+
+    def test_unread_count_is_cached_and_recounted_after_a_change(self):
+        self.assertEqual(unread_notification_count(), 5)
+        with self.assertNumQueries(0):
+            self.assertEqual(unread_notification_count(), 5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            EnquiryFactory()
+        self.assertEqual(unread_notification_count(), 6)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Notification.objects.filter(content_type__model="salesbooking").first().delete()
+        with self.assertNumQueries(1):
+            self.assertEqual(unread_notification_count(), 5)
+
+    def test_reset_recounts_on_next_read(self):
+        unread_notification_count()
+        Notification.objects.update(is_cleared=True)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            reset_unread_notification_count()
+
+        self.assertEqual(unread_notification_count(), 0)
+
+    def test_groups_by_content_type(self):
+        groups = {
+            group["content_type"].model: group["count"]
+            for group in unread_notification_groups()
+        }
+
+        self.assertEqual(groups, {"salesbooking": 3, "servicebooking": 1, "enquiry": 1})
+
+    def test_page_prefetches_targets_per_model(self):
+        # The page slice, the count, and one query per target model present.
+        with self.assertNumQueries(5):
+            page = unread_notifications_page(1)
+            targets = [notification.content_object for notification in page]
+
+        self.assertIn(self.enquiry, targets)
+        self.assertIn(self.service_booking, targets)
+
+    def test_page_filters_by_content_type(self):
+        sales_type = Notification.objects.filter(
+            content_type__model="salesbooking"
+        ).first().content_type_id
+
+        page = unread_notifications_page(1, sales_type)
+
+        self.assertEqual(len(page.object_list), 3)
@@ -0,0 +1,92 @@
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from dashboard.models import SiteSettings
+from dashboard.utils import (
+    get_site_settings,
+    get_service_settings,
+    get_refund_settings,
+    get_service_types,
+)
+from dashboard.utils.settings_registry import _process_cache
+from service.tests.test_helpers.model_factories import (
+    ServiceSettingsFactory,
+    ServiceTypeFactory,
+)
+from refunds.tests.test_helpers.model_factories import RefundSettingsFactory
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "settings-registry-tests",
+    },
+    "versions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "settings-registry-tests-versions",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SettingsRegistryTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["versions"].clear()
+        _process_cache.clear()
+        self.addCleanup(_process_cache.clear)
+
+    def test_site_settings_loaded_once(self):
+        SiteSettings.get_settings()
+        first = get_site_settings()
+        with self.assertNumQueries(0):
+            second = get_site_settings()
+        self.assertIs(first, second)
+
+    def test_site_settings_created_when_missing(self):
+        self.assertFalse(SiteSettings.objects.exists())
+        self.assertIsNotNone(get_site_settings())
+        self.assertTrue(SiteSettings.objects.exists())
+
+    def test_save_bumps_version_and_reloads(self):
+        service_settings = ServiceSettingsFactory(daily_service_slots=4)
+        self.assertEqual(get_service_settings().daily_service_slots, 4)
+
+        service_settings.daily_service_slots = 9
+        with self.captureOnCommitCallbacks(execute=True):
+            service_settings.save()
+
+        self.assertEqual(get_service_settings().daily_service_slots, 9)
+
+    def test_version_is_bumped_only_on_commit(self):
+        service_settings = ServiceSettingsFactory(daily_service_slots=4)
+        get_service_settings()
+
+        service_settings.daily_service_slots = 9
+        with self.captureOnCommitCallbacks() as callbacks:
+            service_settings.save()
+            self.assertEqual(get_service_settings().daily_service_slots, 4)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(get_service_settings().daily_service_slots, 9)
+
+    def test_delete_bumps_version(self):
+        refund_settings = RefundSettingsFactory()
+        self.assertEqual(get_refund_settings(), refund_settings)
+        with self.captureOnCommitCallbacks(execute=True):
+            refund_settings.delete()
+        self.assertIsNone(get_refund_settings())
+
+    def test_version_lost_from_shared_cache_forces_reload(self):
+        ServiceTypeFactory()
+        get_service_types()
+        cache.clear()
+        caches["versions"].clear()
+        ServiceTypeFactory()
+        self.assertEqual(len(get_service_types()), 2)
+
+
+class SettingsRegistryWithoutCacheTest(TestCase):
+    def test_dummy_cache_always_reloads(self):
+        get_site_settings()
+        with self.assertNumQueries(1):
+            get_site_settings()
@@ -20,6 +20,23 @@ class DashboardIndexViewTest(TestCase):
         self.assertEqual(response.context["page_title"], "Admin Dashboard")
         self.assertIn("notifications", response.context)
         self.assertEqual(len(response.context["notifications"]), 1)
+        self.assertEqual(response.context["notification_groups"][0]["count"], 1)
+        self.assertContains(
+            response,
+            reverse("inventory:sales_booking_details", kwargs={"pk": self.sales_booking.pk}),
+        )
+
+    def test_notifications_are_paginated(self):
+        SalesBookingFactory.create_batch(30)
+
+        response = self.client.get(reverse("dashboard:dashboard_index"))
+
+        self.assertEqual(len(response.context["notifications"]), 25)
+        self.assertEqual(response.context["page_obj"].paginator.count, 31)
+
+        response = self.client.get(reverse("dashboard:dashboard_index"), {"page": 2})
+
+        self.assertEqual(len(response.context["notifications"]), 6)
 
 
 class ClearNotificationsViewTest(TestCase):
@@ -0,0 +1,49 @@
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from dashboard.models import DailyKPI
+from users.tests.test_helpers.model_factories import UserFactory
+
+
+class KPIOverviewViewTest(TestCase):
+    def setUp(self):
+        self.client.force_login(UserFactory(is_staff=True))
+        today = timezone.localdate()
+        DailyKPI.objects.create(date=today, revenue=Decimal("120.00"), service_bookings=3)
+        DailyKPI.objects.create(
+            date=today - datetime.timedelta(days=200), revenue=Decimal("80.00")
+        )
+
+    def test_totals_for_window(self):
+        response = self.client.get(reverse("dashboard:kpi_overview"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "dashboard/kpi_overview.html")
+        self.assertEqual(response.context["window_days"], 90)
+        self.assertEqual(response.context["totals"]["revenue"], Decimal("120.00"))
+
+        response = self.client.get(reverse("dashboard:kpi_overview"), {"days": 365})
+
+        self.assertEqual(response.context["totals"]["revenue"], Decimal("200.00"))
+        self.assertEqual(len(response.context["months"]), 2)
+
+    def test_json_series(self):
+        response = self.client.get(
+            reverse("dashboard:kpi_overview"), {"days": 30, "format": "json"}
+        )
+
+        data = response.json()
+        self.assertEqual(data["days"], 30)
+        self.assertEqual(len(data["series"]), 1)
+        self.assertEqual(data["series"][0]["service_bookings"], 3)
+
+    def test_requires_staff(self):
+        self.client.force_login(UserFactory(is_staff=False))
+
+        response = self.client.get(reverse("dashboard:kpi_overview"))
+
+        self.assertEqual(response.status_code, 302)
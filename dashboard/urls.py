@@ -8,6 +8,7 @@ from dashboard.views import (
     ReviewCreateUpdateView,
     ReviewDetailsView,
     ReviewDeleteView,
+    KPIOverviewView,
 )
 
 app_name = "dashboard"
@@ -19,6 +20,7 @@ urlpatterns = [
         ClearNotificationsView.as_view(),
         name="clear_notifications",
     ),
+    path("kpis/", KPIOverviewView.as_view(), name="kpi_overview"),
     path(
         "settings/business-info/",
         SettingsBusinessInfoView.as_view(),
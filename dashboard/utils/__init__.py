@@ -1 +1,5 @@
-from .get_reviews import *
\ No newline at end of file
+from .get_reviews import *
+from .settings_registry import *
+from .notifications import *
+from .kpi_rollups import *
+from .google_places import *
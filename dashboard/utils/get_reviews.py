@@ -1,5 +1,35 @@
+from django.core.cache import cache, caches
 from dashboard.models import Review
 
+REVIEWS_CACHE_VERSION_KEY = "dashboard:reviews:version"
+REVIEWS_CACHE_TIMEOUT = 60 * 60
+
+
+def _reviews_cache_key():
+    versions = caches["versions"]
+    version = versions.get(REVIEWS_CACHE_VERSION_KEY)
+    if version is None:
+        version = 1
+        versions.add(REVIEWS_CACHE_VERSION_KEY, version, None)
+    return f"dashboard:reviews:active:{version}"
+
+
 def get_reviews():
-    return Review.objects.filter(is_active=True)
+    """
+    The active reviews, manual and synced, in display order. The list is
+    cached until a review changes, so rendering it does not query Review.
+    """
+    key = _reviews_cache_key()
+    reviews = cache.get(key)
+    if reviews is None:
+        reviews = list(Review.objects.filter(is_active=True))
+        cache.set(key, reviews, REVIEWS_CACHE_TIMEOUT)
+    return reviews
+
 
+def invalidate_reviews():
+    versions = caches["versions"]
+    try:
+        versions.incr(REVIEWS_CACHE_VERSION_KEY)
+    except ValueError:
+        versions.set(REVIEWS_CACHE_VERSION_KEY, 2, None)
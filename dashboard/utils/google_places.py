@@ -0,0 +1,186 @@
+from dataclasses import dataclass
+import datetime
+
+import requests
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.module_loading import import_string
+
+from core.external_calls import external_call
+from dashboard.models import Review
+from .get_reviews import invalidate_reviews
+
+PLACES_API_URL = "https://places.googleapis.com/v1/places/{place_id}"
+
+# Synced rows take these from Google on every sync. Whether a review is
+# shown, and where, stays under the staff's control.
+SYNCED_REVIEW_FIELDS = (
+    "author_name",
+    "rating",
+    "text",
+    "profile_photo_url",
+    "author_url",
+    "published_at",
+    "updated_at",
+)
+
+
+class PlacesClientError(Exception):
+    """Raised when reviews could not be fetched from Google Places."""
+
+
+@dataclass
+class PlaceReview:
+    external_id: str
+    author_name: str
+    rating: int
+    text: str
+    profile_photo_url: str = None
+    author_url: str = None
+    published_at: datetime.datetime = None
+
+
+class GooglePlacesClient:
+    """
+    Fetches a place's reviews from the Places API Place Details endpoint.
+    Google returns at most five reviews per place.
+    """
+
+    def __init__(self, api_key=None, timeout=None):
+        self.api_key = api_key or settings.GOOGLE_API_KEY
+        self.timeout = timeout or settings.GOOGLE_PLACES_TIMEOUT
+
+    def fetch_reviews(self, place_id):
+        if not self.api_key:
+            raise PlacesClientError("GOOGLE_API_KEY is not set.")
+        try:
+            with external_call():
+                response = requests.get(
+                    PLACES_API_URL.format(place_id=place_id),
+                    headers={
+                        "X-Goog-Api-Key": self.api_key,
+                        "X-Goog-FieldMask": "reviews",
+                    },
+                    timeout=self.timeout,
+                )
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise PlacesClientError(f"Could not fetch reviews for {place_id}: {e}")
+        return [self.parse_review(review) for review in data.get("reviews", [])]
+
+    @staticmethod
+    def parse_review(review):
+        author = review.get("authorAttribution") or {}
+        text = review.get("originalText") or review.get("text") or {}
+        return PlaceReview(
+            external_id=review.get("name", ""),
+            author_name=author.get("displayName") or "Google user",
+            rating=review.get("rating") or 0,
+            text=text.get("text", ""),
+            profile_photo_url=author.get("photoUri"),
+            author_url=author.get("uri"),
+            published_at=parse_datetime(review.get("publishTime") or ""),
+        )
+
+
+class StubPlacesClient:
+    """
+    Returns canned reviews without any network access. Set
+    GOOGLE_PLACES_CLIENT to this class to run the sync offline.
+    """
+
+    DEFAULT_REVIEWS = (
+        PlaceReview(
+            external_id="places/stub/reviews/1",
+            author_name="Sam Rider",
+            rating=5,
+            text="Quick turnaround on my scooter service and friendly staff.",
+        ),
+        PlaceReview(
+            external_id="places/stub/reviews/2",
+            author_name="Alex Vespa",
+            rating=4,
+            text="Good range of bikes and an easy test ride booking.",
+        ),
+    )
+
+    def __init__(self, reviews=None):
+        self.reviews = list(self.DEFAULT_REVIEWS if reviews is None else reviews)
+
+    def fetch_reviews(self, place_id):
+        return list(self.reviews)
+
+
+def get_places_client(path=None):
+    return import_string(path or settings.GOOGLE_PLACES_CLIENT)()
+
+
+def _valid_rating(rating):
+    """rating as a whole number of stars, or None if it is not 1-5."""
+    try:
+        stars = int(rating)
+    except (TypeError, ValueError):
+        return None
+    return stars if 1 <= stars <= 5 and stars == rating else None
+
+
+def sync_google_reviews(client, place_id):
+    """
+    Fetches place_id's reviews with client and upserts them into Review in
+    one statement, keyed on the Google review id. Reviews with no text or
+    no 1-5 star rating are skipped, and reviews Google no longer returns
+    are kept. If the fetch
+    fails, PlacesClientError is raised and the stored reviews are left as
+    they are, so the site keeps showing them.
+
+    bulk_create sends no signals, so the cached reviews and homepage
+    payload are invalidated here.
+
+    Returns (created, updated) counts.
+    """
+    # core.utils imports dashboard.utils, so it is imported here.
+    from core.utils import invalidate_homepage_payload
+
+    fetched = {}
+    for review in client.fetch_reviews(place_id):
+        if (
+            review.external_id
+            and review.text.strip()
+            and _valid_rating(review.rating) is not None
+        ):
+            fetched[review.external_id] = review
+    if not fetched:
+        return 0, 0
+
+    existing = set(
+        Review.objects.filter(external_id__in=fetched).values_list(
+            "external_id", flat=True
+        )
+    )
+    now = timezone.now()
+    rows = [
+        Review(
+            source="google",
+            external_id=review.external_id,
+            author_name=review.author_name[:255],
+            rating=_valid_rating(review.rating),
+            text=review.text,
+            profile_photo_url=review.profile_photo_url,
+            author_url=review.author_url,
+            published_at=review.published_at,
+            created_at=now,
+            updated_at=now,
+        )
+        for review in fetched.values()
+    ]
+    Review.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["external_id"],
+        update_fields=SYNCED_REVIEW_FIELDS,
+    )
+    invalidate_reviews()
+    invalidate_homepage_payload()
+    return len(fetched) - len(existing), len(existing)
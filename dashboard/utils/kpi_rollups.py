@@ -0,0 +1,298 @@
+import datetime
+from decimal import Decimal
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .settings_registry import get_service_settings
+
+# Service bookings in these states take up their workshop slots, matching the
+# availability check used when booking.
+SLOT_BOOKING_STATUSES = ("pending", "confirmed", "in_progress")
+REFUNDED_STATUSES = ("refunded", "partially_refunded")
+# A refund moves its payment out of 'succeeded', but the money was still
+# taken on the payment's day. Refunds are counted on the day they are made.
+REVENUE_PAYMENT_STATUSES = ("succeeded", "refunded", "partially_refunded")
+WEEKDAY_ABBREVIATIONS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# For each model the rollups read, the fields whose days a change to an
+# instance can affect.
+KPI_DATE_FIELDS = {
+    "service.ServiceBooking": ("created_at", "dropoff_date"),
+    "inventory.SalesBooking": ("created_at",),
+    "payments.Payment": ("created_at",),
+    "refunds.RefundRequest": ("processed_at",),
+    "core.Enquiry": ("created_at",),
+}
+
+KPI_ROLLUP_FIELDS = (
+    "service_bookings",
+    "service_bookings_by_status",
+    "sales_bookings",
+    "sales_bookings_by_status",
+    "revenue",
+    "deposits",
+    "refunds",
+    "refund_count",
+    "slots_booked",
+    "slots_available",
+    "enquiries",
+    "updated_at",
+)
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def _runs(dates):
+    """Splits dates into (first, last) runs of consecutive days."""
+    runs = []
+    for day in sorted(set(dates)):
+        if runs and day == runs[-1][1] + datetime.timedelta(days=1):
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return runs
+
+
+def _within_days(field, dates, is_date=False):
+    """
+    A filter matching rows whose field falls on one of dates. Consecutive
+    days become one range, so a backfill chunk is a single range scan.
+    """
+    condition = Q()
+    for first, last in _runs(dates):
+        if is_date:
+            condition |= Q(**{f"{field}__range": (first, last)})
+        else:
+            condition |= Q(
+                **{
+                    f"{field}__gte": _day_start(first),
+                    f"{field}__lt": _day_start(last + datetime.timedelta(days=1)),
+                }
+            )
+    return condition
+
+
+def _workshop_capacity(service_settings):
+    """
+    A function giving the workshop slots for a day: the daily slots on the
+    days bookings are open, and none on the others.
+    """
+    if not service_settings:
+        return lambda day: 0
+    open_days = {
+        abbreviation.strip()
+        for abbreviation in (service_settings.booking_open_days or "").split(",")
+    } - {""}
+    return lambda day: (
+        service_settings.daily_service_slots
+        if not open_days or WEEKDAY_ABBREVIATIONS[day.weekday()] in open_days
+        else 0
+    )
+
+
+def _local_date(value):
+    if isinstance(value, datetime.datetime):
+        return timezone.localdate(value)
+    return value
+
+
+def kpi_dates_for(instance):
+    """
+    The days whose rollups depend on instance. Fields that are deferred on
+    the instance are skipped rather than loaded.
+    """
+    fields = KPI_DATE_FIELDS.get(instance._meta.label, ())
+    return _kpi_dates_from(instance.__dict__, fields)
+
+
+def stored_kpi_dates_for(instance, update_fields=None):
+    """
+    The days the saved copy of instance counts towards, read in one query
+    before a save overwrites it. No query is run for a new instance or for
+    a save whose update_fields leave the date fields alone.
+    """
+    fields = KPI_DATE_FIELDS.get(instance._meta.label, ())
+    if update_fields is not None:
+        fields = tuple(field for field in fields if field in update_fields)
+    if not fields or instance._state.adding or instance.pk is None:
+        return set()
+    stored = (
+        type(instance)
+        ._base_manager.filter(pk=instance.pk)
+        .values(*fields)
+        .first()
+    )
+    return _kpi_dates_from(stored or {}, fields)
+
+
+def _kpi_dates_from(values, fields):
+    dates = set()
+    for field in fields:
+        value = values.get(field)
+        if value is not None:
+            dates.add(_local_date(value))
+    return dates
+
+
+def _booking_rollups(model, dates):
+    rows = (
+        model.objects.filter(_within_days("created_at", dates))
+        .annotate(day=TruncDate("created_at"))
+        .values("day", "booking_status")
+        .annotate(
+            count=Count("pk"),
+            deposits=Sum("amount_paid", filter=Q(payment_status="deposit_paid")),
+        )
+        .order_by()
+    )
+    return [row for row in rows if row["day"] in dates]
+
+
+def refresh_daily_kpis(dates):
+    """
+    Recomputes the DailyKPI rows for dates from the source tables and saves
+    them in one upsert. Each figure is one grouped query over all the dates,
+    so refreshing a day and refreshing a month cost the same number of
+    queries.
+
+    Returns the number of days refreshed.
+    """
+    dates = {_local_date(day) for day in dates if day is not None}
+    if not dates:
+        return 0
+
+    DailyKPI = apps.get_model("dashboard", "DailyKPI")
+    ServiceBooking = apps.get_model("service", "ServiceBooking")
+    SalesBooking = apps.get_model("inventory", "SalesBooking")
+    Payment = apps.get_model("payments", "Payment")
+    RefundRequest = apps.get_model("refunds", "RefundRequest")
+    Enquiry = apps.get_model("core", "Enquiry")
+
+    capacity = _workshop_capacity(get_service_settings())
+    kpis = {day: DailyKPI(date=day, slots_available=capacity(day)) for day in dates}
+
+    for prefix, model in (("service", ServiceBooking), ("sales", SalesBooking)):
+        for row in _booking_rollups(model, dates):
+            kpi = kpis[row["day"]]
+            count_field = f"{prefix}_bookings"
+            setattr(kpi, count_field, getattr(kpi, count_field) + row["count"])
+            getattr(kpi, f"{count_field}_by_status")[row["booking_status"]] = row["count"]
+            kpi.deposits += row["deposits"] or Decimal("0.00")
+
+    payments = (
+        Payment.objects.filter(
+            _within_days("created_at", dates), status__in=REVENUE_PAYMENT_STATUSES
+        )
+        .annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+    for row in payments:
+        if row["day"] in kpis:
+            kpis[row["day"]].revenue = row["total"] or Decimal("0.00")
+
+    refunds = (
+        RefundRequest.objects.filter(
+            _within_days("processed_at", dates), status__in=REFUNDED_STATUSES
+        )
+        .annotate(day=TruncDate("processed_at"))
+        .values("day")
+        .annotate(total=Sum("amount_to_refund"), count=Count("pk"))
+        .order_by()
+    )
+    for row in refunds:
+        if row["day"] in kpis:
+            kpis[row["day"]].refunds = row["total"] or Decimal("0.00")
+            kpis[row["day"]].refund_count = row["count"]
+
+    slots = (
+        ServiceBooking.objects.filter(
+            _within_days("dropoff_date", dates, is_date=True),
+            booking_status__in=SLOT_BOOKING_STATUSES,
+        )
+        .values("dropoff_date")
+        .annotate(slots=Sum("service_type__slots_required"))
+        .order_by()
+    )
+    for row in slots:
+        kpis[row["dropoff_date"]].slots_booked = row["slots"] or 0
+
+    enquiries = (
+        Enquiry.objects.filter(_within_days("created_at", dates))
+        .annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    for row in enquiries:
+        if row["day"] in kpis:
+            kpis[row["day"]].enquiries = row["count"]
+
+    DailyKPI.objects.bulk_create(
+        kpis.values(),
+        update_conflicts=True,
+        unique_fields=["date"],
+        update_fields=KPI_ROLLUP_FIELDS,
+    )
+    return len(kpis)
+
+
+def schedule_kpi_refresh(dates):
+    """
+    Refreshes the rollups for dates once the current transaction commits,
+    so they are computed from what was actually saved. The refresh is
+    robust: if it fails the error is logged and the rest of the commit
+    callbacks still run, since the nightly rollup repairs the days.
+    """
+    dates = {day for day in dates if day is not None}
+    if dates:
+        transaction.on_commit(lambda: refresh_daily_kpis(dates), robust=True)
+
+
+def daily_kpis(days=365, today=None):
+    """The DailyKPI rows for the last days days, oldest first."""
+    if today is None:
+        today = timezone.localdate()
+    since = today - datetime.timedelta(days=days - 1)
+    DailyKPI = apps.get_model("dashboard", "DailyKPI")
+    return list(DailyKPI.objects.filter(date__range=(since, today)).order_by("date"))
+
+
+def kpi_totals(kpis):
+    """Sums a list of DailyKPI rows into one set of figures for the period."""
+    totals = {
+        "service_bookings": 0,
+        "sales_bookings": 0,
+        "revenue": Decimal("0.00"),
+        "deposits": Decimal("0.00"),
+        "refunds": Decimal("0.00"),
+        "refund_count": 0,
+        "slots_booked": 0,
+        "slots_available": 0,
+        "enquiries": 0,
+    }
+    for kpi in kpis:
+        for field in totals:
+            totals[field] += getattr(kpi, field)
+    totals["net_revenue"] = totals["revenue"] - totals["refunds"]
+    totals["slot_utilisation"] = (
+        round(totals["slots_booked"] * 100 / totals["slots_available"], 1)
+        if totals["slots_available"]
+        else None
+    )
+    return totals
+
+
+def kpi_totals_by_month(kpis):
+    """Groups a list of DailyKPI rows, oldest first, into monthly totals."""
+    months = {}
+    for kpi in kpis:
+        months.setdefault(kpi.date.replace(day=1), []).append(kpi)
+    return [{"month": month, **kpi_totals(rows)} for month, rows in months.items()]
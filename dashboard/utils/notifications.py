@@ -0,0 +1,98 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Count, Max
+
+UNREAD_NOTIFICATIONS_CACHE_KEY = "dashboard:notifications:unread"
+# The count is dropped whenever notifications change, so this only bounds
+# how long a change made without the signals, such as a bulk update, shows.
+UNREAD_NOTIFICATIONS_CACHE_TIMEOUT = 300
+NOTIFICATIONS_PER_PAGE = 25
+
+# The models a notification can point at. Each is loaded with one query per
+# page when the page's notifications are prefetched.
+NOTIFICATION_TARGETS = (
+    "inventory.SalesBooking",
+    "service.ServiceBooking",
+    "core.Enquiry",
+    "refunds.RefundRequest",
+    "refunds.RefundSettings",
+)
+
+
+def _notification_model():
+    return apps.get_model("dashboard", "Notification")
+
+
+def unread_notification_count():
+    """
+    The number of uncleared notifications, for the dashboard badge. It is
+    counted once and cached until notifications are created, cleared or
+    deleted, which drop it through reset_unread_notification_count.
+    """
+    count = cache.get(UNREAD_NOTIFICATIONS_CACHE_KEY)
+    if count is None:
+        count = _notification_model().objects.filter(is_cleared=False).count()
+        cache.add(UNREAD_NOTIFICATIONS_CACHE_KEY, count, UNREAD_NOTIFICATIONS_CACHE_TIMEOUT)
+    return count
+
+
+def reset_unread_notification_count():
+    """
+    Drops the cached unread count once the current transaction commits, so
+    the next read counts from scratch. A delete is safe for any number of
+    concurrent writers, unlike moving the count with incr and decr.
+    """
+    transaction.on_commit(lambda: cache.delete(UNREAD_NOTIFICATIONS_CACHE_KEY))
+
+
+def unread_notification_groups():
+    """
+    Uncleared notifications grouped by what they are about, most recent
+    group first. Each group has content_type, label, count and latest.
+    """
+    rows = (
+        _notification_model()
+        .objects.filter(is_cleared=False)
+        .values("content_type")
+        .annotate(count=Count("pk"), latest=Max("created_at"))
+        .order_by("-latest")
+    )
+    groups = []
+    for row in rows:
+        content_type = ContentType.objects.get_for_id(row["content_type"])
+        groups.append(
+            {
+                "content_type": content_type,
+                "label": content_type.model_class()._meta.verbose_name_plural.title(),
+                "count": row["count"],
+                "latest": row["latest"],
+            }
+        )
+    return groups
+
+
+def unread_notifications_page(page_number=1, content_type_id=None):
+    """
+    One page of uncleared notifications, newest first, optionally only those
+    of one content type. The objects they point at are fetched with one
+    query per model rather than one per notification.
+    """
+    queryset = (
+        _notification_model()
+        .objects.filter(is_cleared=False)
+        .select_related("content_type")
+        .prefetch_related(
+            GenericPrefetch(
+                "content_object",
+                [apps.get_model(label).objects.all() for label in NOTIFICATION_TARGETS],
+            )
+        )
+        .order_by("-created_at", "-pk")
+    )
+    if content_type_id:
+        queryset = queryset.filter(content_type_id=content_type_id)
+    return Paginator(queryset, NOTIFICATIONS_PER_PAGE).get_page(page_number)
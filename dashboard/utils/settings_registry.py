@@ -0,0 +1,80 @@
+import uuid
+from django.apps import apps
+from django.core.cache import caches
+
+# Each entry maps a registry name to the model it snapshots and how to load it.
+# Loaders go through the existing model entry points so behaviour (such as
+# SiteSettings creating its row on first access) is unchanged.
+SETTINGS_REGISTRY = {
+    "site_settings": ("dashboard.SiteSettings", lambda model: model.get_settings()),
+    "service_settings": ("service.ServiceSettings", lambda model: model.objects.first()),
+    "inventory_settings": (
+        "inventory.InventorySettings",
+        lambda model: model.objects.first(),
+    ),
+    "refund_settings": ("refunds.RefundSettings", lambda model: model.objects.first()),
+    "service_types": ("service.ServiceType", lambda model: list(model.objects.all())),
+}
+
+_process_cache = {}
+
+
+def _version_key(model_label):
+    return f"settings_registry:version:{model_label.lower()}"
+
+
+def _current_version(model_label):
+    key = _version_key(model_label)
+    versions = caches["versions"]
+    version = versions.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not versions.add(key, version, None):
+            version = versions.get(key, version)
+    return version
+
+
+def get_cached_settings(name):
+    model_label, loader = SETTINGS_REGISTRY[name]
+    version = _current_version(model_label)
+
+    cached = _process_cache.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    value = loader(apps.get_model(model_label))
+    _process_cache[name] = (version, value)
+    return value
+
+
+def bump_settings_version(model_label):
+    # A new random stamp, rather than an increment, so a process holding a
+    # snapshot can never mistake a recreated key for the version it loaded.
+    caches["versions"].set(_version_key(model_label), uuid.uuid4().hex, None)
+
+
+def is_registered_settings_model(model):
+    return any(
+        model._meta.label_lower == model_label.lower()
+        for model_label, _ in SETTINGS_REGISTRY.values()
+    )
+
+
+def get_site_settings():
+    return get_cached_settings("site_settings")
+
+
+def get_service_settings():
+    return get_cached_settings("service_settings")
+
+
+def get_inventory_settings():
+    return get_cached_settings("inventory_settings")
+
+
+def get_refund_settings():
+    return get_cached_settings("refund_settings")
+
+
+def get_service_types():
+    return get_cached_settings("service_types")
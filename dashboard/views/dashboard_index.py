@@ -3,6 +3,11 @@ from django.shortcuts import redirect
 from django.views import View
 from core.mixins import AdminRequiredMixin
 from ..models import Notification
+from ..utils import (
+    reset_unread_notification_count,
+    unread_notification_groups,
+    unread_notifications_page,
+)
 
 
 class DashboardIndexView(AdminRequiredMixin, TemplateView):
@@ -10,12 +15,21 @@ class DashboardIndexView(AdminRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        content_type_id = self.request.GET.get("type")
+        if not (content_type_id and content_type_id.isdigit()):
+            content_type_id = None
+
+        page = unread_notifications_page(self.request.GET.get("page"), content_type_id)
         context["page_title"] = "Admin Dashboard"
-        context["notifications"] = Notification.objects.filter(is_cleared=False)
+        context["notifications"] = page.object_list
+        context["page_obj"] = page
+        context["notification_groups"] = unread_notification_groups()
+        context["current_type"] = int(content_type_id) if content_type_id else None
         return context
 
 
 class ClearNotificationsView(AdminRequiredMixin, View):
     def post(self, request, *args, **kwargs):
         Notification.objects.filter(is_cleared=False).update(is_cleared=True)
+        reset_unread_notification_count()
         return redirect("dashboard:dashboard_index")
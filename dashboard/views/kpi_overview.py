@@ -0,0 +1,42 @@
+from django.http import JsonResponse
+from django.views.generic import TemplateView
+from core.mixins import AdminRequiredMixin
+from ..utils import KPI_ROLLUP_FIELDS, daily_kpis, kpi_totals, kpi_totals_by_month
+
+WINDOW_CHOICES = (30, 90, 365)
+
+
+class KPIOverviewView(AdminRequiredMixin, TemplateView):
+    template_name = "dashboard/kpi_overview.html"
+
+    def get_window_days(self):
+        try:
+            days = int(self.request.GET.get("days", 90))
+        except ValueError:
+            return 90
+        return days if days in WINDOW_CHOICES else 90
+
+    def get(self, request, *args, **kwargs):
+        if request.GET.get("format") == "json":
+            fields = [field for field in KPI_ROLLUP_FIELDS if field != "updated_at"]
+            series = [
+                {
+                    "date": kpi.date,
+                    **{field: getattr(kpi, field) for field in fields},
+                    "slot_utilisation": kpi.slot_utilisation,
+                }
+                for kpi in daily_kpis(self.get_window_days())
+            ]
+            return JsonResponse({"days": self.get_window_days(), "series": series})
+        return super().get(request, *args, **kwargs)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        days = self.get_window_days()
+        kpis = daily_kpis(days)
+        context["page_title"] = "Business KPIs"
+        context["window_days"] = days
+        context["window_choices"] = WINDOW_CHOICES
+        context["totals"] = kpi_totals(kpis)
+        context["months"] = list(reversed(kpi_totals_by_month(kpis)))
+        return context
@@ -2,10 +2,10 @@ import datetime
 from django.http import JsonResponse
 from django.views.decorators.http import require_GET
 
-from inventory.models import InventorySettings
 from inventory.utils.get_available_appointment_times import (
     get_available_appointment_times,
 )
+from dashboard.utils import get_inventory_settings
 
 
 @require_GET
@@ -24,7 +24,7 @@ def get_available_appointment_times_for_date(request):
             {"error": "Invalid date format. Use YYYY-MM-DD."}, status=400
         )
 
-    inventory_settings = InventorySettings.objects.first()
+    inventory_settings = get_inventory_settings()
     if not inventory_settings:
         return JsonResponse({"error": "Inventory settings not found."}, status=500)
 
@@ -2,6 +2,7 @@ from django.views import View
 from django.http import JsonResponse
 from inventory.models import SalesBooking
 from payments.models import Payment
+from payments.utils.payment_status_channel import wait_for_payment_processed
 
 
 class GetPaymentStatusView(View):
@@ -15,9 +16,32 @@ class GetPaymentStatusView(View):
             )
 
         try:
-            sales_booking = SalesBooking.objects.get(
-                stripe_payment_intent_id=payment_intent_id
-            )
+            sales_booking = self.find_booking(payment_intent_id)
+            if sales_booking is None:
+                if not Payment.objects.filter(
+                    stripe_payment_intent_id=payment_intent_id
+                ).exists():
+                    return JsonResponse(
+                        {
+                            "status": "error",
+                            "message": "Booking finalization failed. Please contact support for assistance.",
+                        },
+                        status=500,
+                    )
+                # With ?wait=1 the request is held until the webhook worker
+                # reports the payment processed (or the long-poll timeout
+                # passes), but only while the payment exists and its booking
+                # does not yet. The wait only reads the cache.
+                if request.GET.get("wait"):
+                    wait_for_payment_processed(payment_intent_id)
+                    sales_booking = self.find_booking(payment_intent_id)
+                if sales_booking is None:
+                    return JsonResponse(
+                        {
+                            "status": "processing",
+                            "message": "Booking finalization is still in progress.",
+                        }
+                    )
 
             response_data = {
                 "status": "ready",
@@ -49,23 +73,6 @@ class GetPaymentStatusView(View):
 
             return JsonResponse(response_data)
 
-        except SalesBooking.DoesNotExist:
-            try:
-                Payment.objects.get(stripe_payment_intent_id=payment_intent_id)
-                return JsonResponse(
-                    {
-                        "status": "processing",
-                        "message": "Booking finalization is still in progress.",
-                    }
-                )
-            except Payment.DoesNotExist:
-                return JsonResponse(
-                    {
-                        "status": "error",
-                        "message": "Booking finalization failed. Please contact support for assistance.",
-                    },
-                    status=500,
-                )
         except Exception as e:
             return JsonResponse(
                 {
@@ -74,3 +81,11 @@ class GetPaymentStatusView(View):
                 },
                 status=500,
             )
+
+    @staticmethod
+    def find_booking(payment_intent_id):
+        return (
+            SalesBooking.objects.select_related("motorcycle", "sales_profile")
+            .filter(stripe_payment_intent_id=payment_intent_id)
+            .first()
+        )
@@ -6,6 +6,7 @@ import json
 
 from inventory.models import TempSalesBooking, Motorcycle
 from django.db import transaction
+from inventory.utils.temp_sales_booking_store import temp_sales_booking_store
 
 
 @csrf_exempt
@@ -23,10 +24,8 @@ def check_motorcycle_availability(request):
 
         with transaction.atomic():
             try:
-                temp_booking = get_object_or_404(
-                    TempSalesBooking, session_uuid=temp_booking_uuid
-                )
-            except Http404:
+                temp_booking = temp_sales_booking_store.load(temp_booking_uuid)
+            except TempSalesBooking.DoesNotExist:
                 return JsonResponse(
                     {"available": False, "message": "Temporary booking not found."},
                     status=404,
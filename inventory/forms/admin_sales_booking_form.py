@@ -1,9 +1,10 @@
 from django import forms
-from inventory.models import SalesBooking, Motorcycle, SalesProfile, InventorySettings
+from inventory.models import SalesBooking, Motorcycle, SalesProfile
 from django.utils.translation import gettext_lazy as _
 from datetime import date
 from django.utils import timezone
 from decimal import Decimal
+from dashboard.utils import get_inventory_settings
 
 
 class AdminSalesBookingForm(forms.ModelForm):
@@ -137,7 +138,7 @@ class AdminSalesBookingForm(forms.ModelForm):
         booking_status = cleaned_data.get("booking_status")
         payment_status = cleaned_data.get("payment_status")
         amount_paid = cleaned_data.get("amount_paid")
-        inventory_settings = InventorySettings.objects.first()
+        inventory_settings = get_inventory_settings()
 
         if appointment_date and appointment_date < date.today():
             self._warnings.append(_("Warning: Appointment date is in the past."))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_remove_motorcycle_warranty_years_and_more'),
+        ('payments', '0007_webhookevent_metrics'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='salesbooking',
+            index=models.Index(fields=['created_at'], name='salesbooking_created_idx'),
+        ),
+    ]
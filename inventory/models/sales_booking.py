@@ -117,6 +117,9 @@ class SalesBooking(models.Model):
         verbose_name = "Sales Booking"
         verbose_name_plural = "Sales Bookings"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="salesbooking_created_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.sales_booking_reference:
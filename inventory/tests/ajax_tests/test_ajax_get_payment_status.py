@@ -1,4 +1,5 @@
 from django.test import TestCase, Client
+from unittest.mock import patch
 from django.urls import reverse
 from decimal import Decimal
 import datetime
@@ -89,6 +90,53 @@ class AjaxGetPaymentStatusTest(TestCase):
         self.assertEqual(data["status"], "processing")
         self.assertIn("Booking finalization is still in progress.", data["message"])
 
+    @patch("inventory.ajax.ajax_get_payment_status.wait_for_payment_processed")
+    def test_wait_parameter_long_polls_while_booking_pending(self, mock_wait):
+        response = self.client.get(
+            reverse("inventory:ajax_sales_payment_status_check"),
+            {
+                "payment_intent_id": self.processing_payment.stripe_payment_intent_id,
+                "wait": "1",
+            },
+        )
+
+        mock_wait.assert_called_once_with(
+            self.processing_payment.stripe_payment_intent_id
+        )
+        self.assertEqual(response.json()["status"], "processing")
+
+    @patch("inventory.ajax.ajax_get_payment_status.wait_for_payment_processed")
+    def test_no_wait_without_parameter(self, mock_wait):
+        self.client.get(
+            reverse("inventory:ajax_sales_payment_status_check"),
+            {"payment_intent_id": self.processing_payment.stripe_payment_intent_id},
+        )
+
+        mock_wait.assert_not_called()
+
+    @patch("inventory.ajax.ajax_get_payment_status.wait_for_payment_processed")
+    def test_wait_parameter_skipped_when_booking_exists(self, mock_wait):
+        response = self.client.get(
+            reverse("inventory:ajax_sales_payment_status_check"),
+            {
+                "payment_intent_id": self.successful_booking.stripe_payment_intent_id,
+                "wait": "1",
+            },
+        )
+
+        mock_wait.assert_not_called()
+        self.assertEqual(response.json()["status"], "ready")
+
+    @patch("inventory.ajax.ajax_get_payment_status.wait_for_payment_processed")
+    def test_wait_parameter_skipped_for_unknown_payment_intent(self, mock_wait):
+        response = self.client.get(
+            reverse("inventory:ajax_sales_payment_status_check"),
+            {"payment_intent_id": self.non_existent_payment_intent_id, "wait": "1"},
+        )
+
+        mock_wait.assert_not_called()
+        self.assertEqual(response.status_code, 500)
+
     def test_payment_intent_not_found(self):
         response = self.client.get(
             reverse("inventory:ajax_sales_payment_status_check"),
@@ -1,5 +1,7 @@
+from io import StringIO
 from django.test import TestCase
 from django.core import mail
+from django.core.management import call_command
 from inventory.utils.sell_and_notify import sell_and_notify
 from inventory.tests.test_helpers.model_factories import (
     MotorcycleFactory,
@@ -42,8 +44,12 @@ class SellAndNotifyTests(TestCase):
         self.motorcycle.refresh_from_db()
         self.assertEqual(self.motorcycle.status, "sold")
 
+    def send_queued_emails(self):
+        call_command("process_email_queue", once=True, stdout=StringIO())
+
     def test_emails_sent_only_to_non_deposit_bookings(self):
         sell_and_notify(self.motorcycle)
+        self.send_queued_emails()
         self.assertEqual(len(mail.outbox), 2)
 
         recipient_emails = sorted([email.to[0] for email in mail.outbox])
@@ -52,6 +58,7 @@ class SellAndNotifyTests(TestCase):
 
     def test_email_content(self):
         sell_and_notify(self.motorcycle)
+        self.send_queued_emails()
         self.assertEqual(len(mail.outbox), 2)
 
         email = mail.outbox[0]
@@ -1,6 +1,6 @@
 from django.test import TestCase, Client
 from django.urls import reverse
-from inventory.models import TempSalesBooking
+from inventory.utils import temp_sales_booking_store
 
 
 from inventory.tests.test_helpers.model_factories import (
@@ -23,77 +23,62 @@ class InitiateBookingProcessViewTest(TestCase):
         )
 
     def test_post_request_creates_temp_booking_deposit_flow(self):
-        initial_temp_booking_count = TempSalesBooking.objects.count()
-
         data = {
             "deposit_required_for_flow": "true",
         }
         response = self.client.post(self.initiate_booking_url, data)
 
-        self.assertEqual(
-            TempSalesBooking.objects.count(), initial_temp_booking_count + 1
+        # The new booking is a draft held in the booking_drafts cache.
+        temp_booking = temp_sales_booking_store.load(
+            self.client.session["temp_sales_booking_uuid"]
         )
 
-        temp_booking = TempSalesBooking.objects.latest("created_at")
-
         self.assertEqual(temp_booking.motorcycle, self.motorcycle)
         self.assertTrue(temp_booking.deposit_required_for_flow)
         self.assertEqual(temp_booking.booking_status, "pending_details")
 
         self.assertRedirects(response, reverse("inventory:step1_sales_profile"))
 
-        self.assertIn("temp_sales_booking_uuid", self.client.session)
-
         self.assertEqual(
             self.client.session["temp_sales_booking_uuid"],
             str(temp_booking.session_uuid),
         )
 
     def test_post_request_creates_temp_booking_enquiry_flow(self):
-        initial_temp_booking_count = TempSalesBooking.objects.count()
-
         data = {
             "deposit_required_for_flow": "false",
         }
         response = self.client.post(self.initiate_booking_url, data)
 
-        self.assertEqual(
-            TempSalesBooking.objects.count(), initial_temp_booking_count + 1
+        # The new booking is a draft held in the booking_drafts cache.
+        temp_booking = temp_sales_booking_store.load(
+            self.client.session["temp_sales_booking_uuid"]
         )
-
-        temp_booking = TempSalesBooking.objects.latest("created_at")
         self.assertEqual(temp_booking.motorcycle, self.motorcycle)
         self.assertFalse(temp_booking.deposit_required_for_flow)
         self.assertEqual(temp_booking.booking_status, "pending_details")
 
         self.assertRedirects(response, reverse("inventory:step1_sales_profile"))
-        self.assertIn("temp_sales_booking_uuid", self.client.session)
-
         self.assertEqual(
             self.client.session["temp_sales_booking_uuid"],
             str(temp_booking.session_uuid),
         )
 
     def test_post_request_creates_temp_booking_with_viewing_request(self):
-        initial_temp_booking_count = TempSalesBooking.objects.count()
-
         data = {
             "deposit_required_for_flow": "false",
         }
         response = self.client.post(self.initiate_booking_url, data)
 
-        self.assertEqual(
-            TempSalesBooking.objects.count(), initial_temp_booking_count + 1
+        # The new booking is a draft held in the booking_drafts cache.
+        temp_booking = temp_sales_booking_store.load(
+            self.client.session["temp_sales_booking_uuid"]
         )
-
-        temp_booking = TempSalesBooking.objects.latest("created_at")
         self.assertEqual(temp_booking.motorcycle, self.motorcycle)
         self.assertFalse(temp_booking.deposit_required_for_flow)
         self.assertEqual(temp_booking.booking_status, "pending_details")
 
         self.assertRedirects(response, reverse("inventory:step1_sales_profile"))
-        self.assertIn("temp_sales_booking_uuid", self.client.session)
-
         self.assertEqual(
             self.client.session["temp_sales_booking_uuid"],
             str(temp_booking.session_uuid),
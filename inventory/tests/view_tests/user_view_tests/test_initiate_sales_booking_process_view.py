@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.urls import reverse
-from inventory.models import TempSalesBooking, InventorySettings
+from inventory.models import InventorySettings
+from inventory.utils import temp_sales_booking_store
 from inventory.tests.test_helpers.model_factories import (
     MotorcycleFactory,
     InventorySettingsFactory,
@@ -22,8 +23,8 @@ class InitiateBookingProcessViewTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertRedirects(response, reverse("inventory:step1_sales_profile"))
         self.assertIn("temp_sales_booking_uuid", self.client.session)
-        temp_booking = TempSalesBooking.objects.get(
-            session_uuid=self.client.session["temp_sales_booking_uuid"]
+        temp_booking = temp_sales_booking_store.load(
+            self.client.session["temp_sales_booking_uuid"]
         )
         self.assertEqual(temp_booking.motorcycle, self.motorcycle)
         self.assertTrue(temp_booking.deposit_required_for_flow)
@@ -38,8 +39,8 @@ class InitiateBookingProcessViewTest(TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertIn("temp_sales_booking_uuid", self.client.session)
-        temp_booking = TempSalesBooking.objects.get(
-            session_uuid=self.client.session["temp_sales_booking_uuid"]
+        temp_booking = temp_sales_booking_store.load(
+            self.client.session["temp_sales_booking_uuid"]
         )
         self.assertEqual(temp_booking.motorcycle, self.motorcycle)
         self.assertFalse(temp_booking.deposit_required_for_flow)
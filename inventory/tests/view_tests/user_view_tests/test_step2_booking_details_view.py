@@ -192,8 +192,7 @@ class Step2BookingDetailsViewTest(TestCase):
         mock_convert_temp_sales_booking,
         mock_create_payment_intent,
     ):
-        mock_intent = mock.Mock()
-        mock_intent.client_secret = "test_client_secret"
+        mock_intent = mock.Mock(id="pi_test_step2", client_secret="test_client_secret")
         mock_payment_obj = mock.Mock()
         mock_create_payment_intent.return_value = (mock_intent, mock_payment_obj)
         temp_booking = self._create_temp_booking_in_session(
@@ -12,3 +12,4 @@ from .get_sales_faqs import *
 from .get_featured_motorcycles import *
 from .has_available_date import *
 from .sell_and_notify import *
+from .temp_sales_booking_store import *
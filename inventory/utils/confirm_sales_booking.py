@@ -2,8 +2,8 @@ from django.db import transaction
 from django.conf import settings
 from inventory.models import SalesBooking
 from mailer.utils import send_templated_email
-from dashboard.models import SiteSettings
 import logging
+from dashboard.utils import get_site_settings
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +43,7 @@ def confirm_sales_booking(sales_booking_id, message=None, send_notification=True
                 }
 
             if send_notification:
-                site_settings = SiteSettings.get_settings()
+                site_settings = get_site_settings()
                 email_context = {
                     "booking": booking,
                     "sales_profile": booking.sales_profile,
@@ -1,8 +1,10 @@
 from django.db import transaction
-from inventory.models import SalesBooking, InventorySettings
+from inventory.models import SalesBooking
 from inventory.utils.send_sales_booking_to_mechanicdesk import (
     send_sales_booking_to_mechanicdesk,
 )
+from dashboard.utils import get_inventory_settings
+from inventory.utils.temp_sales_booking_store import temp_sales_booking_store
 
 
 def convert_temp_sales_booking(
@@ -14,7 +16,7 @@ def convert_temp_sales_booking(
 ):
     try:
         with transaction.atomic():
-            inventory_settings = InventorySettings.objects.first()
+            inventory_settings = get_inventory_settings()
 
             currency_code = "AUD"
             if inventory_settings:
@@ -51,7 +53,7 @@ def convert_temp_sales_booking(
 
                 payment_obj.save()
 
-            temp_booking.delete()
+            temp_sales_booking_store.discard(temp_booking)
 
             if (
                 inventory_settings
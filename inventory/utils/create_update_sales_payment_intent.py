@@ -2,6 +2,12 @@ import stripe
 from decimal import Decimal
 
 from payments.models import Payment
+from payments.utils.stripe_gateway import (
+    create_payment_intent,
+    modify_payment_intent,
+    payment_intent_create_key,
+    retrieve_payment_intent,
+)
 from inventory.models import TempSalesBooking, SalesProfile
 
 
@@ -24,7 +30,7 @@ def create_or_update_sales_payment_intent(
 
     if existing_payment_obj and existing_payment_obj.stripe_payment_intent_id:
         try:
-            retrieved_intent = stripe.PaymentIntent.retrieve(
+            retrieved_intent = retrieve_payment_intent(
                 existing_payment_obj.stripe_payment_intent_id
             )
 
@@ -42,7 +48,7 @@ def create_or_update_sales_payment_intent(
                 if (
                     amount_changed or currency_changed
                 ) and is_modifiable_or_in_progress:
-                    stripe_intent = stripe.PaymentIntent.modify(
+                    stripe_intent = modify_payment_intent(
                         existing_payment_obj.stripe_payment_intent_id,
                         amount=amount_in_cents,
                         currency=currency,
@@ -85,15 +91,28 @@ def create_or_update_sales_payment_intent(
             django_payment_obj = None
 
     if not stripe_intent:
-        stripe_intent = stripe.PaymentIntent.create(
-            amount=amount_in_cents,
-            currency=currency,
-            metadata={
+        intent_params = {
+            "amount": amount_in_cents,
+            "currency": currency,
+            "metadata": {
                 "temp_sales_booking_uuid": str(temp_booking.session_uuid),
                 "sales_profile_id": str(sales_profile.id) if sales_profile else "guest",
                 "booking_type": "sales_booking",
             },
-            description=payment_description,
+            "description": payment_description,
+        }
+        stripe_intent = create_payment_intent(
+            payment_intent_create_key(
+                "sales_booking",
+                temp_booking.session_uuid,
+                intent_params,
+                replaces=(
+                    existing_payment_obj.stripe_payment_intent_id
+                    if existing_payment_obj
+                    else None
+                ),
+            ),
+            **intent_params,
         )
         django_payment_obj = Payment.objects.create(
             temp_sales_booking=temp_booking,
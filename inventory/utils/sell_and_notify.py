@@ -1,5 +1,5 @@
 from inventory.models import SalesBooking
-from mailer.utils.send_templated_email import send_templated_email
+from mailer.utils.send_templated_email import send_templated_emails
 from django.conf import settings
 
 
@@ -10,30 +10,32 @@ def sell_and_notify(motorcycle):
         motorcycle=motorcycle, payment_status="unpaid"
     )
 
-    for booking in bookings_to_notify:
+    messages = []
+    for booking in bookings_to_notify.select_related("sales_profile__user"):
         booking.booking_status = "cancelled"
         booking.save()
         user = booking.sales_profile.user
-        recipient_email = user.email
-        subject = f"Update on your interest in the {motorcycle.title}"
-        context = {
-            "user": user,
-            "motorcycle": motorcycle,
-            "booking": booking,
-            "profile": booking.sales_profile,
-            "SITE_DOMAIN": settings.SITE_DOMAIN,
-            "SITE_SCHEME": settings.SITE_SCHEME,
-        }
-        try:
-            success = send_templated_email(
-                recipient_list=[recipient_email],
-                subject=subject,
-                template_name="user_notify_sold.html",
-                context=context,
-                booking=booking,
-                profile=booking.sales_profile,
-            )
-            if success:
-                pass
-        except Exception as e:
-            pass
+        messages.append(
+            {
+                "recipient_list": [user.email],
+                "context": {
+                    "user": user,
+                    "motorcycle": motorcycle,
+                    "booking": booking,
+                    "profile": booking.sales_profile,
+                    "SITE_DOMAIN": settings.SITE_DOMAIN,
+                    "SITE_SCHEME": settings.SITE_SCHEME,
+                },
+                "booking": booking,
+                "profile": booking.sales_profile,
+            }
+        )
+
+    try:
+        send_templated_emails(
+            subject=f"Update on your interest in the {motorcycle.title}",
+            template_name="user_notify_sold.html",
+            messages=messages,
+        )
+    except Exception:
+        pass
@@ -5,6 +5,8 @@ import datetime
 from django.utils import timezone
 import pytz
 
+from core.external_calls import external_call
+
 
 def send_sales_booking_to_mechanicdesk(sales_booking_instance):
     mechanicdesk_token = getattr(settings, "MECHANICDESK_BOOKING_TOKEN", None)
@@ -120,12 +122,11 @@ def send_sales_booking_to_mechanicdesk(sales_booking_instance):
         "courtesy_vehicle_requested": "false",
     }
 
-    mechanicdesk_api_url = (
-        "https://www.mechanicdesk.com.au/booking_requests/create_booking"
-    )
+    mechanicdesk_api_url = settings.MECHANICDESK_BOOKING_URL
 
     try:
-        response = requests.post(mechanicdesk_api_url, data=payload, timeout=10)
+        with external_call():
+            response = requests.post(mechanicdesk_api_url, data=payload, timeout=10)
         response.raise_for_status()
         return True
     except requests.exceptions.Timeout:
@@ -0,0 +1,4 @@
+from core.booking_drafts import DraftBookingStore
+from inventory.models import TempSalesBooking
+
+temp_sales_booking_store = DraftBookingStore(TempSalesBooking)
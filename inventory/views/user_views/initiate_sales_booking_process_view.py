@@ -1,10 +1,11 @@
 from django.shortcuts import redirect, get_object_or_404
 from django.views import View
 from django.urls import reverse
-from django.db import transaction
-from inventory.models import Motorcycle, TempSalesBooking, InventorySettings
+from inventory.models import Motorcycle
 from decimal import Decimal
 from django.contrib import messages
+from dashboard.utils import get_inventory_settings
+from inventory.utils.temp_sales_booking_store import temp_sales_booking_store
 
 
 class InitiateBookingProcessView(View):
@@ -25,7 +26,7 @@ class InitiateBookingProcessView(View):
         )
         deposit_required_for_flow = deposit_required_for_flow_str.lower() == "true"
 
-        inventory_settings = InventorySettings.objects.first()
+        inventory_settings = get_inventory_settings()
         if not inventory_settings:
             messages.error(
                 request,
@@ -33,14 +34,12 @@ class InitiateBookingProcessView(View):
             )
             return redirect(reverse("inventory:all"))
 
-        with transaction.atomic():
-            temp_booking = TempSalesBooking(
-                motorcycle=motorcycle,
-                deposit_required_for_flow=deposit_required_for_flow,
-                booking_status="pending_details",
-            )
-            temp_booking.amount_paid = Decimal("0.00")
-            temp_booking.save()
+        temp_booking = temp_sales_booking_store.create(
+            motorcycle=motorcycle,
+            deposit_required_for_flow=deposit_required_for_flow,
+            booking_status="pending_details",
+            amount_paid=Decimal("0.00"),
+        )
 
         request.session["temp_sales_booking_uuid"] = str(temp_booking.session_uuid)
         if "current_sales_booking_reference" in request.session:
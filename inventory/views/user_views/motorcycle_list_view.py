@@ -2,8 +2,8 @@ from django.views.generic import ListView
 from inventory.models import Motorcycle
 from inventory.utils.get_unique_makes_for_filter import get_unique_makes_for_filter
 from inventory.utils.get_sales_faqs import get_faqs_for_step
-from dashboard.models import SiteSettings  # FIX: Import SiteSettings
 import datetime
+from dashboard.utils import get_site_settings
 
 
 class MotorcycleListView(ListView):
@@ -49,6 +49,6 @@ class MotorcycleListView(ListView):
         context["faq_title"] = "Frequently Asked Questions"
 
         # FIX: Get site settings and add them to the context
-        context["settings"] = SiteSettings.get_settings()
+        context["settings"] = get_site_settings()
 
         return context
@@ -1,4 +1,4 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 import logging
 
 logger = logging.getLogger(__name__)
@@ -6,10 +6,11 @@ from django.views import View
 from django.urls import reverse
 from django.db import transaction
 from django.contrib import messages
-from inventory.models import TempSalesBooking, InventorySettings
 from inventory.forms import SalesProfileForm
 from inventory.utils.booking_protection import check_and_manage_recent_booking_flag
 from inventory.utils.get_sales_faqs import get_faqs_for_step
+from dashboard.utils import get_inventory_settings
+from inventory.utils.temp_sales_booking_store import temp_sales_booking_store
 
 
 class Step1SalesProfileView(View):
@@ -30,9 +31,7 @@ class Step1SalesProfileView(View):
             return redirect(reverse("inventory:all"))
 
         try:
-            temp_booking = get_object_or_404(
-                TempSalesBooking, session_uuid=temp_booking_uuid
-            )
+            temp_booking = temp_sales_booking_store.load(temp_booking_uuid)
         except Exception as e:
             logger.error(
                 f"Step1 GET: Failed to retrieve TempSalesBooking with uuid {temp_booking_uuid}. Error: {e}"
@@ -43,7 +42,7 @@ class Step1SalesProfileView(View):
             )
             return redirect(reverse("inventory:all"))
 
-        inventory_settings = InventorySettings.objects.first()
+        inventory_settings = get_inventory_settings()
         if not inventory_settings:
             logger.error("Step1 POST: InventorySettings not configured.")
             messages.error(
@@ -84,9 +83,7 @@ class Step1SalesProfileView(View):
             return redirect(reverse("inventory:all"))
 
         try:
-            temp_booking = get_object_or_404(
-                TempSalesBooking, session_uuid=temp_booking_uuid
-            )
+            temp_booking = temp_sales_booking_store.load(temp_booking_uuid)
         except Exception as e:
             logger.error(
                 f"Step1 GET: Failed to retrieve TempSalesBooking with uuid {temp_booking_uuid}. Error: {e}"
@@ -97,7 +94,7 @@ class Step1SalesProfileView(View):
             )
             return redirect(reverse("inventory:all"))
 
-        inventory_settings = InventorySettings.objects.first()
+        inventory_settings = get_inventory_settings()
         if not inventory_settings:
             logger.error("Step1 POST: InventorySettings not configured.")
             messages.error(
@@ -128,7 +125,7 @@ class Step1SalesProfileView(View):
                 sales_profile.save()
 
                 temp_booking.sales_profile = sales_profile
-                temp_booking.save()
+                temp_sales_booking_store.save(temp_booking)
 
                 messages.success(
                     request,
@@ -1,4 +1,4 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,7 +10,7 @@ from django.conf import settings
 from decimal import Decimal
 import json
 from inventory.utils.booking_protection import set_recent_booking_flag
-from inventory.models import TempSalesBooking, InventorySettings, SalesTerms
+from inventory.models import SalesTerms
 from inventory.forms.sales_booking_appointment_form import BookingAppointmentForm
 from inventory.utils.get_sales_appointment_date_info import (
     get_sales_appointment_date_info,
@@ -18,6 +18,8 @@ from inventory.utils.get_sales_appointment_date_info import (
 from inventory.utils.convert_temp_sales_booking import convert_temp_sales_booking
 from inventory.utils.get_sales_faqs import get_faqs_for_step
 from mailer.utils import send_templated_email
+from dashboard.utils import get_inventory_settings
+from inventory.utils.temp_sales_booking_store import temp_sales_booking_store
 
 
 class Step2BookingDetailsView(View):
@@ -34,9 +36,7 @@ class Step2BookingDetailsView(View):
             return redirect(reverse("core:index"))
 
         try:
-            temp_booking = get_object_or_404(
-                TempSalesBooking, session_uuid=temp_booking_uuid
-            )
+            temp_booking = temp_sales_booking_store.load(temp_booking_uuid)
         except Exception as e:
             logger.error(
                 f"Step2 GET: Failed to retrieve TempSalesBooking with uuid {temp_booking_uuid}. Error: {e}"
@@ -47,7 +47,7 @@ class Step2BookingDetailsView(View):
             )
             return redirect(reverse("core:index"))
 
-        inventory_settings = InventorySettings.objects.first()
+        inventory_settings = get_inventory_settings()
         if not inventory_settings:
             logger.error("Step2 GET: InventorySettings not configured.")
             messages.error(
@@ -103,9 +103,7 @@ class Step2BookingDetailsView(View):
             return redirect(reverse("core:index"))
 
         try:
-            temp_booking = get_object_or_404(
-                TempSalesBooking, session_uuid=temp_booking_uuid
-            )
+            temp_booking = temp_sales_booking_store.load(temp_booking_uuid)
         except Exception as e:
             logger.error(
                 f"Step2 GET: Failed to retrieve TempSalesBooking with uuid {temp_booking_uuid}. Error: {e}"
@@ -116,7 +114,7 @@ class Step2BookingDetailsView(View):
             )
             return redirect(reverse("core:index"))
 
-        inventory_settings = InventorySettings.objects.first()
+        inventory_settings = get_inventory_settings()
         if not inventory_settings:
             logger.error("Step2 GET: InventorySettings not configured.")
             messages.error(
@@ -154,7 +152,7 @@ class Step2BookingDetailsView(View):
                 temp_booking.terms_accepted = terms_accepted
                 temp_booking.sales_terms_version = active_terms
                 temp_booking.request_viewing = True  # Always true for this flow
-                temp_booking.save()
+                temp_sales_booking_store.save(temp_booking)
 
                 if temp_booking.deposit_required_for_flow:
                     logger.info(f'Deposit required for flow: {temp_booking.deposit_required_for_flow}')
@@ -1,9 +1,9 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 import logging
 
 logger = logging.getLogger(__name__)
 from django.views import View
-from django.http import JsonResponse, Http404
+from django.http import JsonResponse
 from django.conf import settings
 from django.urls import reverse
 from django.contrib import messages
@@ -15,8 +15,11 @@ from inventory.utils.create_update_sales_payment_intent import (
     create_or_update_sales_payment_intent,
 )
 from decimal import Decimal
-
-stripe.api_key = settings.STRIPE_SECRET_KEY
+from inventory.utils.temp_sales_booking_store import temp_sales_booking_store
+from payments.utils.stripe_gateway import (
+    payment_intent_client_secret,
+    retrieve_payment_intent,
+)
 
 
 class Step3PaymentView(View):
@@ -28,10 +31,8 @@ class Step3PaymentView(View):
             return redirect("inventory:used")
 
         try:
-            temp_booking = get_object_or_404(
-                TempSalesBooking, session_uuid=temp_booking_uuid
-            )
-        except Http404:
+            temp_booking = temp_sales_booking_store.load(temp_booking_uuid)
+        except TempSalesBooking.DoesNotExist:
             logger.warning(
                 f"Step3 GET: TempSalesBooking not found for uuid {temp_booking_uuid}."
             )
@@ -99,6 +100,8 @@ class Step3PaymentView(View):
             return redirect("inventory:step2_booking_details_and_appointment")
 
         sales_customer_profile = temp_booking.sales_profile
+        # The payment links to the temporary booking, so it needs its row now.
+        temp_sales_booking_store.materialise(temp_booking)
         payment_obj = Payment.objects.filter(temp_sales_booking=temp_booking).first()
 
         try:
@@ -112,7 +115,7 @@ class Step3PaymentView(View):
 
         except stripe.error.StripeError as e:
             logger.error(
-                f"Step3 GET: Stripe error for temp_booking {temp_booking.id}. Error: {e}"
+                f"Step3 GET: Stripe error for temp_booking {temp_booking.session_uuid}. Error: {e}"
             )
             messages.error(
                 request, f"Payment system error: {e}. Please try again later."
@@ -120,7 +123,7 @@ class Step3PaymentView(View):
             return redirect("inventory:step2_booking_details_and_appointment")
         except Exception as e:
             logger.error(
-                f"Step3 GET: Unexpected error during payment setup for temp_booking {temp_booking.id}. Error: {e}"
+                f"Step3 GET: Unexpected error during payment setup for temp_booking {temp_booking.session_uuid}. Error: {e}"
             )
             messages.error(
                 request,
@@ -137,7 +140,7 @@ class Step3PaymentView(View):
             amount_remaining = temp_booking.motorcycle.price - amount_to_pay
 
         context = {
-            "client_secret": intent.client_secret,
+            "client_secret": payment_intent_client_secret(request, intent),
             "amount": amount_to_pay,
             "currency": currency.upper(),
             "temp_booking": temp_booking,
@@ -162,7 +165,7 @@ class Step3PaymentView(View):
             )
 
         try:
-            intent = stripe.PaymentIntent.retrieve(payment_intent_id)
+            intent = retrieve_payment_intent(payment_intent_id, refresh=True)
 
             if intent.status == "succeeded":
                 return JsonResponse(
@@ -1,6 +1,6 @@
 from django.views.generic import DetailView
 from django.http import Http404
-from inventory.models import Motorcycle, InventorySettings
+from inventory.models import Motorcycle
 from inventory.utils.get_motorcycle_details import get_motorcycle_details
 from inventory.utils.get_sales_faqs import get_faqs_for_step
 from inventory.utils import get_featured_motorcycles
@@ -8,6 +8,7 @@ from inventory.utils.has_available_date import (
     has_available_date_for_deposit_flow,
     has_available_date_for_viewing_flow,
 )
+from dashboard.utils import get_inventory_settings
 
 
 class UserMotorcycleDetailsView(DetailView):
@@ -27,7 +28,7 @@ class UserMotorcycleDetailsView(DetailView):
         context = super().get_context_data(**kwargs)
         motorcycle = self.object
 
-        inventory_settings = InventorySettings.objects.first()
+        inventory_settings = get_inventory_settings()
         context["inventory_settings"] = inventory_settings
 
         # Check availability for each flow type separately
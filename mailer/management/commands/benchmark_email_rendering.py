@@ -0,0 +1,74 @@
+import re
+import time
+
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.utils.html import strip_tags
+
+from mailer.utils.email_rendering import render_email, render_emails
+
+
+def _render_uncached(template_name, context):
+    # The rendering send_templated_email did before mailer.utils.email_rendering
+    # existed, kept here as the baseline.
+    html_content = render_to_string(template_name, context)
+    text_content_prep = re.sub(r"<br\s*?>", "\n", html_content)
+    text_content_prep = re.sub(r"</p>", "\n\n", text_content_prep)
+    text_content_prep = re.sub(r"</(div|h[1-6]|ul|ol|li)>", "\n", text_content_prep)
+    text_content_prep = re.sub(r"<(p|div|h[1-6]|ul|ol|li)[^>]*?>", "", text_content_prep)
+    return html_content, strip_tags(text_content_prep).strip()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the per-message cost of rendering an email template, "
+        "comparing the uncached path with render_email and render_emails."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--template",
+            default="user_notify_sold.html",
+            help="Email template to render (default: user_notify_sold.html).",
+        )
+        parser.add_argument(
+            "--messages",
+            type=int,
+            default=200,
+            help="Number of messages to render per run (default: 200).",
+        )
+
+    def handle(self, *args, **options):
+        template_name = options["template"]
+        count = max(1, options["messages"])
+        contexts = [
+            {
+                "user": {"first_name": f"Customer {n}"},
+                "motorcycle": {"title": "2024 Example Scooter"},
+                "SITE_SCHEME": "https",
+                "SITE_DOMAIN": "example.com",
+            }
+            for n in range(count)
+        ]
+
+        # Warm up the template loaders so every run sees a parsed template.
+        render_email(template_name, dict(contexts[0]))
+        _render_uncached(template_name, dict(contexts[0]))
+
+        results = [
+            ("uncached", self.time_run(lambda: [_render_uncached(template_name, c) for c in contexts])),
+            ("render_email", self.time_run(lambda: [render_email(template_name, c) for c in contexts])),
+            ("render_emails", self.time_run(lambda: render_emails(template_name, contexts))),
+        ]
+
+        self.stdout.write(f"Rendering {template_name} {count} times:")
+        for label, seconds in results:
+            self.stdout.write(
+                f"  {label:<14} {seconds * 1000 / count:8.3f} ms per message"
+            )
+
+    @staticmethod
+    def time_run(run):
+        started = time.perf_counter()
+        run()
+        return time.perf_counter() - started
@@ -0,0 +1,74 @@
+import time
+from django.core.management.base import BaseCommand
+
+from mailer.utils.email_queue import (
+    EMAIL_LEASE_SECONDS,
+    EMAIL_MAX_ATTEMPTS,
+    claim_email_logs,
+    deliver_email_logs,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Sends queued emails in batches over one SMTP connection per batch. "
+        "Runs until stopped unless --once is given, in which case it exits "
+        "when the queue is empty."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Send the emails that are currently due, then exit.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of emails to send per SMTP connection (default: 50).",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait when the queue is empty (default: 5).",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=EMAIL_MAX_ATTEMPTS,
+            help=f"Attempts before an email is marked failed (default: {EMAIL_MAX_ATTEMPTS}).",
+        )
+        parser.add_argument(
+            "--lease-seconds",
+            type=int,
+            default=EMAIL_LEASE_SECONDS,
+            help=f"How long a claimed email is reserved for this worker (default: {EMAIL_LEASE_SECONDS}).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        sent = failed = 0
+
+        try:
+            while True:
+                email_logs = claim_email_logs(batch_size, options["lease_seconds"])
+                if not email_logs:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                batch_sent = deliver_email_logs(email_logs, options["max_attempts"])
+                sent += batch_sent
+                failed += len(email_logs) - batch_sent
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {sent + failed} emails: "
+                f"{sent} sent, {failed} failed or rescheduled."
+            )
+        )
@@ -0,0 +1,106 @@
+import datetime
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min, ProtectedError
+from django.utils import timezone
+
+from mailer.models import EmailBody, EmailLog
+
+DEFAULT_RETENTION_DAYS = {"SENT": 90, "FAILED": 90}
+
+# Bodies newer than this are left alone even when unused, as a body is stored
+# just before the email log that points at it.
+ORPHAN_BODY_GRACE = datetime.timedelta(days=1)
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes email logs past their retention period, in small primary key "
+        "range batches so the table is never locked for long, then deletes "
+        "email bodies no log uses any more. Queued and sending emails are "
+        "never deleted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sent-days",
+            type=int,
+            default=None,
+            help="Keep sent emails for this many days (default: EMAIL_LOG_RETENTION_DAYS['SENT']).",
+        )
+        parser.add_argument(
+            "--failed-days",
+            type=int,
+            default=None,
+            help="Keep failed emails for this many days (default: EMAIL_LOG_RETENTION_DAYS['FAILED']).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Width of the primary key range deleted per query (default: 500).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many emails would be deleted without deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        batch_size = max(1, options["batch_size"])
+
+        retention_days = {
+            **DEFAULT_RETENTION_DAYS,
+            **getattr(settings, "EMAIL_LOG_RETENTION_DAYS", {}),
+        }
+        if options["sent_days"] is not None:
+            retention_days["SENT"] = options["sent_days"]
+        if options["failed_days"] is not None:
+            retention_days["FAILED"] = options["failed_days"]
+
+        totals = {}
+        for status in ("SENT", "FAILED"):
+            cutoff = now - datetime.timedelta(days=retention_days[status])
+            queryset = EmailLog.objects.filter(status=status, timestamp__lt=cutoff)
+            if options["dry_run"]:
+                totals[status] = queryset.count()
+            else:
+                totals[status] = self.delete_in_pk_ranges(queryset, batch_size)
+
+        orphans = EmailBody.objects.filter(
+            email_logs__isnull=True, created_at__lt=now - ORPHAN_BODY_GRACE
+        )
+        if options["dry_run"]:
+            totals["bodies"] = orphans.count()
+        else:
+            totals["bodies"] = self.delete_in_pk_ranges(orphans, batch_size)
+
+        prefix = "[dry run] would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {totals['SENT']} sent and {totals['FAILED']} failed "
+                f"email logs, and {totals['bodies']} unused email bodies."
+            )
+        )
+
+    @staticmethod
+    def delete_in_pk_ranges(queryset, batch_size):
+        """
+        Deletes the rows of queryset one primary key range at a time, walking
+        from the lowest to the highest matching key. Each query only touches
+        batch_size keys, so writers are never blocked for long.
+        """
+        bounds = queryset.aggregate(low=Min("pk"), high=Max("pk"))
+        if bounds["low"] is None:
+            return 0
+
+        deleted = 0
+        for start in range(bounds["low"], bounds["high"] + 1, batch_size):
+            batch = queryset.filter(pk__gte=start, pk__lt=start + batch_size)
+            try:
+                deleted += batch.delete()[0]
+            except ProtectedError:
+                # An email body was reused while this ran; it is kept.
+                continue
+        return deleted
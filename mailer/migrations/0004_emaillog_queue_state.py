@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-19 04:28
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fail_existing_pending_emails(apps, schema_editor):
+    # Before the queue existed an email was sent before its log was saved, so
+    # a PENDING log was never sent and the worker must not send it now.
+    EmailLog = apps.get_model("mailer", "EmailLog")
+    EmailLog.objects.filter(status="PENDING").update(status="FAILED")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_remove_motorcycle_warranty_years_and_more'),
+        ('mailer', '0003_initial'),
+        ('service', '0004_remove_servicetype_estimated_duration_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emaillog',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='How many times the email queue worker has tried to send the email.'),
+        ),
+        migrations.AddField(
+            model_name='emaillog',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='When the email queue worker may next pick the email up. Also acts as the lease expiry while it is sending.'),
+        ),
+        migrations.AddField(
+            model_name='emaillog',
+            name='text_content',
+            field=models.TextField(blank=True, help_text='The plain text alternative of the email.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='emaillog',
+            name='status',
+            field=models.CharField(choices=[('SENT', 'Sent'), ('FAILED', 'Failed'), ('PENDING', 'Pending'), ('SENDING', 'Sending')], default='PENDING', help_text='The sending status of the email (e.g., Sent, Failed, Pending).', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='emaillog_queue_idx'),
+        ),
+        migrations.RunPython(fail_existing_pending_emails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2 on 2026-10-19 04:57
+
+import hashlib
+import zlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def move_content_to_bodies(apps, schema_editor):
+    EmailLog = apps.get_model("mailer", "EmailLog")
+    EmailBody = apps.get_model("mailer", "EmailBody")
+    body_ids = {}
+    logs = (
+        EmailLog.objects.exclude(html_content__isnull=True)
+        .exclude(html_content="")
+        .only("pk", "html_content", "text_content")
+        .order_by("pk")
+    )
+    for log in logs.iterator(chunk_size=500):
+        encoded = log.html_content.encode("utf-8")
+        digest = hashlib.sha256(encoded).hexdigest()
+        if digest not in body_ids:
+            body = EmailBody.objects.create(
+                digest=digest,
+                html_compressed=zlib.compress(encoded, 6),
+                text_compressed=(
+                    zlib.compress(log.text_content.encode("utf-8"), 6)
+                    if log.text_content is not None
+                    else None
+                ),
+                size=len(encoded),
+            )
+            body_ids[digest] = body.pk
+        EmailLog.objects.filter(pk=log.pk).update(body_id=body_ids[digest])
+
+
+def move_bodies_to_content(apps, schema_editor):
+    EmailLog = apps.get_model("mailer", "EmailLog")
+    for log in EmailLog.objects.exclude(body__isnull=True).select_related("body").iterator(chunk_size=500):
+        body = log.body
+        EmailLog.objects.filter(pk=log.pk).update(
+            html_content=zlib.decompress(bytes(body.html_compressed)).decode("utf-8"),
+            text_content=(
+                zlib.decompress(bytes(body.text_compressed)).decode("utf-8")
+                if body.text_compressed is not None
+                else None
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0004_emaillog_queue_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailBody',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(help_text='SHA-256 of the HTML content, used to share identical bodies.', max_length=64, unique=True)),
+                ('html_compressed', models.BinaryField(help_text='The zlib-compressed HTML content of the email.')),
+                ('text_compressed', models.BinaryField(blank=True, help_text='The zlib-compressed plain text alternative of the email.', null=True)),
+                ('size', models.PositiveIntegerField(default=0, help_text='Size of the uncompressed HTML content, in bytes.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Email Body',
+                'verbose_name_plural': 'Email Bodies',
+            },
+        ),
+        migrations.AddField(
+            model_name='emaillog',
+            name='body',
+            field=models.ForeignKey(blank=True, help_text='The rendered content of the email, shared with identical emails.', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='email_logs', to='mailer.emailbody'),
+        ),
+        migrations.RunPython(move_content_to_bodies, move_bodies_to_content),
+        migrations.RemoveField(
+            model_name='emaillog',
+            name='html_content',
+        ),
+        migrations.RemoveField(
+            model_name='emaillog',
+            name='text_content',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-19 05:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_remove_motorcycle_warranty_years_and_more'),
+        ('mailer', '0005_emailbody'),
+        ('service', '0004_remove_servicetype_estimated_duration_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['status', 'timestamp'], name='emaillog_retention_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-19 05:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_remove_motorcycle_warranty_years_and_more'),
+        ('mailer', '0006_emaillog_retention_idx'),
+        ('service', '0004_remove_servicetype_estimated_duration_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['timestamp'], name='emaillog_timestamp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['recipient'], name='emaillog_recipient_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 06:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0007_emaillog_browser_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emaillog',
+            name='claim_token',
+            field=models.UUIDField(blank=True, help_text='Set by the worker that last claimed the email, so it only sends the emails it actually won.', null=True),
+        ),
+    ]
@@ -0,0 +1,89 @@
+import hashlib
+import zlib
+
+from django.db import models
+
+
+def email_body_digest(html_content):
+    return hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+
+
+class EmailBody(models.Model):
+    """
+    A rendered email body, stored once per distinct HTML and compressed.
+    EmailLog rows point at it, so identical emails share one row and the log
+    table itself stays small.
+    """
+
+    digest = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="SHA-256 of the HTML content, used to share identical bodies.",
+    )
+    html_compressed = models.BinaryField(
+        help_text="The zlib-compressed HTML content of the email.",
+    )
+    text_compressed = models.BinaryField(
+        blank=True,
+        null=True,
+        help_text="The zlib-compressed plain text alternative of the email.",
+    )
+    size = models.PositiveIntegerField(
+        default=0,
+        help_text="Size of the uncompressed HTML content, in bytes.",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Email Body"
+        verbose_name_plural = "Email Bodies"
+
+    def __str__(self):
+        return f"Email body {self.digest[:12]} ({self.size} bytes)"
+
+    @property
+    def html(self):
+        return zlib.decompress(bytes(self.html_compressed)).decode("utf-8")
+
+    @property
+    def text(self):
+        if self.text_compressed is None:
+            return None
+        return zlib.decompress(bytes(self.text_compressed)).decode("utf-8")
+
+    @classmethod
+    def build(cls, html_content, text_content=None):
+        encoded = html_content.encode("utf-8")
+        return cls(
+            digest=hashlib.sha256(encoded).hexdigest(),
+            html_compressed=zlib.compress(encoded, 6),
+            text_compressed=(
+                zlib.compress(text_content.encode("utf-8"), 6)
+                if text_content is not None
+                else None
+            ),
+            size=len(encoded),
+        )
+
+    @classmethod
+    def store_many(cls, contents):
+        """
+        Returns an EmailBody for each (html_content, text_content) pair, in
+        order, creating only the ones not already stored. Takes two queries
+        however many pairs there are, plus one insert if any are new.
+        """
+        digests = [email_body_digest(html_content) for html_content, _ in contents]
+        existing = cls.objects.in_bulk(digests, field_name="digest")
+        missing = {}
+        for digest, (html_content, text_content) in zip(digests, contents):
+            if digest not in existing and digest not in missing:
+                missing[digest] = cls.build(html_content, text_content)
+        if missing:
+            # Another process may store the same body in the meantime.
+            cls.objects.bulk_create(missing.values(), ignore_conflicts=True)
+            existing.update(cls.objects.in_bulk(list(missing), field_name="digest"))
+        return [existing[digest] for digest in digests]
+
+    @classmethod
+    def store(cls, html_content, text_content=None):
+        return cls.store_many([(html_content, text_content)])[0]
@@ -10,6 +10,7 @@ class EmailLog(models.Model):
         ("SENT", "Sent"),
         ("FAILED", "Failed"),
         ("PENDING", "Pending"),
+        ("SENDING", "Sending"),
     )
 
     timestamp = models.DateTimeField(
@@ -25,8 +26,13 @@ class EmailLog(models.Model):
     subject = models.CharField(
         max_length=255, help_text="The subject line of the email."
     )
-    html_content = models.TextField(
-        help_text="The HTML content of the email.", blank=True, null=True
+    body = models.ForeignKey(
+        "mailer.EmailBody",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="email_logs",
+        help_text="The rendered content of the email, shared with identical emails.",
     )
     status = models.CharField(
         max_length=10,
@@ -39,6 +45,19 @@ class EmailLog(models.Model):
         null=True,
         help_text="Any error message if the email sending failed.",
     )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="How many times the email queue worker has tried to send the email.",
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="When the email queue worker may next pick the email up. Also acts as the lease expiry while it is sending.",
+    )
+    claim_token = models.UUIDField(
+        blank=True,
+        null=True,
+        help_text="Set by the worker that last claimed the email, so it only sends the emails it actually won.",
+    )
 
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -89,6 +108,26 @@ class EmailLog(models.Model):
         verbose_name = "Email Log"
         verbose_name_plural = "Email Logs"
         ordering = ["-timestamp"]
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="emaillog_queue_idx",
+            ),
+            models.Index(
+                fields=["status", "timestamp"],
+                name="emaillog_retention_idx",
+            ),
+            models.Index(fields=["timestamp"], name="emaillog_timestamp_idx"),
+            models.Index(fields=["recipient"], name="emaillog_recipient_idx"),
+        ]
+
+    @property
+    def html_content(self):
+        return self.body.html if self.body_id else None
+
+    @property
+    def text_content(self):
+        return self.body.text if self.body_id else None
 
     def __str__(self):
         return f"Email to {self.recipient} - Subject: '{self.subject}' ({self.status})"
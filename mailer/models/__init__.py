@@ -1 +1,2 @@
+from .EmailBody_model import *
 from .EmailLog_model import *
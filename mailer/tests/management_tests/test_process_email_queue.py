@@ -0,0 +1,26 @@
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+
+from mailer.models import EmailBody, EmailLog
+
+
+class ProcessEmailQueueCommandTest(TestCase):
+    def test_once_drains_the_queue(self):
+        for n in range(3):
+            EmailLog.objects.create(
+                sender="shop@example.com",
+                recipient=f"customer{n}@example.com",
+                subject="Your booking",
+                body=EmailBody.store("<p>Hello</p>", "Hello"),
+                status="PENDING",
+            )
+        out = StringIO()
+
+        call_command("process_email_queue", once=True, batch_size=2, stdout=out)
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(EmailLog.objects.filter(status="SENT").count(), 3)
+        self.assertIn("3 sent", out.getvalue())
@@ -0,0 +1,92 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from mailer.models import EmailBody, EmailLog
+
+
+class PruneEmailLogsCommandTest(TestCase):
+    def make_email(self, status, days_old, html="<p>Hello</p>"):
+        email_log = EmailLog.objects.create(
+            sender="shop@example.com",
+            recipient="customer@example.com",
+            subject="Your booking",
+            body=EmailBody.store(html, "Hello"),
+            status=status,
+        )
+        EmailLog.objects.filter(pk=email_log.pk).update(
+            timestamp=timezone.now() - datetime.timedelta(days=days_old)
+        )
+        return email_log
+
+    def age_bodies(self, days_old):
+        EmailBody.objects.update(
+            created_at=timezone.now() - datetime.timedelta(days=days_old)
+        )
+
+    @override_settings(EMAIL_LOG_RETENTION_DAYS={"SENT": 90, "FAILED": 365})
+    def test_deletes_only_emails_past_retention(self):
+        old_sent = self.make_email("SENT", 100)
+        recent_sent = self.make_email("SENT", 10)
+        old_failed = self.make_email("FAILED", 100)
+        very_old_failed = self.make_email("FAILED", 400)
+        old_pending = self.make_email("PENDING", 400)
+        old_sending = self.make_email("SENDING", 400)
+
+        out = StringIO()
+        call_command("prune_email_logs", batch_size=1, stdout=out)
+
+        remaining = set(EmailLog.objects.values_list("pk", flat=True))
+        self.assertEqual(
+            remaining,
+            {recent_sent.pk, old_failed.pk, old_pending.pk, old_sending.pk},
+        )
+        self.assertNotIn(old_sent.pk, remaining)
+        self.assertNotIn(very_old_failed.pk, remaining)
+        self.assertIn("Deleted 1 sent and 1 failed email logs", out.getvalue())
+
+    def test_options_override_settings(self):
+        self.make_email("SENT", 20)
+        self.make_email("FAILED", 20)
+
+        call_command(
+            "prune_email_logs", sent_days=30, failed_days=10, stdout=StringIO()
+        )
+
+        self.assertEqual(
+            list(EmailLog.objects.values_list("status", flat=True)), ["SENT"]
+        )
+
+    def test_deletes_bodies_no_longer_used(self):
+        self.make_email("SENT", 100, html="<p>Old</p>")
+        kept = self.make_email("SENT", 10, html="<p>Recent</p>")
+        self.age_bodies(100)
+
+        out = StringIO()
+        call_command("prune_email_logs", stdout=out)
+
+        self.assertEqual(
+            list(EmailBody.objects.values_list("pk", flat=True)), [kept.body_id]
+        )
+        self.assertIn("1 unused email bodies", out.getvalue())
+
+    def test_keeps_recently_stored_bodies(self):
+        EmailBody.store("<p>About to be queued</p>")
+
+        call_command("prune_email_logs", stdout=StringIO())
+
+        self.assertEqual(EmailBody.objects.count(), 1)
+
+    def test_dry_run_deletes_nothing(self):
+        self.make_email("SENT", 100)
+        self.age_bodies(100)
+
+        out = StringIO()
+        call_command("prune_email_logs", dry_run=True, stdout=out)
+
+        self.assertEqual(EmailLog.objects.count(), 1)
+        self.assertEqual(EmailBody.objects.count(), 1)
+        self.assertIn("[dry run] would delete 1 sent", out.getvalue())
@@ -0,0 +1,44 @@
+from django.test import TestCase
+
+from mailer.models import EmailBody
+from mailer.tests.test_helpers.model_factories import EmailLogFactory
+
+
+class EmailBodyModelTest(TestCase):
+    def test_store_round_trips_and_compresses(self):
+        html = "<p>" + "Your service booking is confirmed. " * 200 + "</p>"
+
+        body = EmailBody.store(html, "Your service booking is confirmed.")
+        body.refresh_from_db()
+
+        self.assertEqual(body.html, html)
+        self.assertEqual(body.text, "Your service booking is confirmed.")
+        self.assertEqual(body.size, len(html.encode("utf-8")))
+        self.assertLess(len(bytes(body.html_compressed)), body.size / 10)
+
+    def test_identical_bodies_are_stored_once(self):
+        first = EmailBody.store("<p>Same</p>", "Same")
+        second = EmailBody.store("<p>Same</p>", "Same")
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(EmailBody.objects.count(), 1)
+
+    def test_store_many_keeps_order_and_deduplicates(self):
+        existing = EmailBody.store("<p>B</p>")
+
+        with self.assertNumQueries(3):
+            bodies = EmailBody.store_many(
+                [("<p>A</p>", "A"), ("<p>B</p>", "B"), ("<p>A</p>", "A")]
+            )
+
+        self.assertEqual([body.html for body in bodies], ["<p>A</p>", "<p>B</p>", "<p>A</p>"])
+        self.assertEqual(bodies[1].pk, existing.pk)
+        self.assertEqual(bodies[0].pk, bodies[2].pk)
+        self.assertEqual(EmailBody.objects.count(), 2)
+
+    def test_email_log_reads_content_through_its_body(self):
+        email_log = EmailLogFactory(body=EmailBody.store("<p>Hi</p>", "Hi"))
+
+        self.assertEqual(email_log.html_content, "<p>Hi</p>")
+        self.assertEqual(email_log.text_content, "Hi")
+        self.assertIsNone(EmailLogFactory().html_content)
@@ -0,0 +1,93 @@
+import datetime
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from mailer.models import EmailLog
+from mailer.utils.email_log_browser import (
+    clean_email_log_filters,
+    decode_cursor,
+    email_log_page,
+    encode_cursor,
+    filter_email_logs,
+)
+
+
+@override_settings(ADMIN_EMAIL="admin@example.com")
+class EmailLogBrowserTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.emails = [
+            EmailLog.objects.create(
+                sender="shop@example.com",
+                recipient=f"customer{n}@example.com",
+                subject=f"Email {n}",
+                status="SENT" if n % 2 else "FAILED",
+                timestamp=now - datetime.timedelta(minutes=n),
+            )
+            for n in range(7)
+        ]
+        # Two emails sharing a timestamp must still page in a stable order.
+        EmailLog.objects.filter(pk=self.emails[4].pk).update(
+            timestamp=self.emails[3].timestamp
+        )
+        for email in self.emails:
+            email.refresh_from_db()
+
+    def subjects(self, emails):
+        return [email.subject for email in emails]
+
+    def test_pages_forward_and_back(self):
+        queryset = filter_email_logs({})
+        ordered = self.subjects(queryset)
+
+        first = email_log_page(queryset, page_size=3)
+        second = email_log_page(queryset, after=first["next_cursor"], page_size=3)
+        third = email_log_page(queryset, after=second["next_cursor"], page_size=3)
+
+        self.assertIsNone(first["previous_cursor"])
+        self.assertEqual(
+            self.subjects(first["emails"] + second["emails"] + third["emails"]),
+            ordered,
+        )
+        self.assertIsNone(third["next_cursor"])
+
+        back = email_log_page(queryset, before=second["previous_cursor"], page_size=3)
+        self.assertEqual(self.subjects(back["emails"]), self.subjects(first["emails"]))
+        self.assertIsNone(back["previous_cursor"])
+        self.assertIsNotNone(back["next_cursor"])
+
+    def test_page_reads_a_bounded_number_of_rows(self):
+        queryset = filter_email_logs({})
+        first = email_log_page(queryset, page_size=3)
+
+        with self.assertNumQueries(1):
+            email_log_page(queryset, after=first["next_cursor"], page_size=3)
+
+    def test_filters_and_admin_copies(self):
+        EmailLog.objects.create(
+            sender="shop@example.com",
+            recipient="admin@example.com",
+            subject="Admin copy",
+            status="SENT",
+        )
+
+        filters = clean_email_log_filters(
+            {"status": "FAILED", "service_booking": "abc", "sales_profile": ""}
+        )
+
+        self.assertEqual(filters, {"status": "FAILED"})
+        self.assertEqual(
+            set(filter_email_logs(filters).values_list("status", flat=True)),
+            {"FAILED"},
+        )
+        self.assertNotIn("Admin copy", self.subjects(filter_email_logs({})))
+
+    def test_unknown_status_is_ignored(self):
+        self.assertEqual(clean_email_log_filters({"status": "BOUNCED"}), {})
+
+    def test_cursor_round_trip(self):
+        email = self.emails[2]
+
+        self.assertEqual(decode_cursor(encode_cursor(email)), (email.timestamp, email.pk))
+        self.assertIsNone(decode_cursor("not-a-cursor"))
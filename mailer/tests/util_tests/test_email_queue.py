@@ -0,0 +1,144 @@
+import datetime
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.core import mail
+from django.db.models.query import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from mailer.models import EmailBody, EmailLog
+from mailer.utils.email_queue import (
+    claim_email_logs,
+    deliver_email_logs,
+    email_retry_delay,
+)
+
+
+class EmailQueueTest(TestCase):
+    def queue_email(self, recipient="customer@example.com", **kwargs):
+        return EmailLog.objects.create(
+            sender="shop@example.com",
+            recipient=recipient,
+            subject=kwargs.pop("subject", "Your booking"),
+            body=EmailBody.store("<p>Hello</p>", "Hello"),
+            status="PENDING",
+            **kwargs,
+        )
+
+    def test_claim_takes_due_emails_and_leases_them(self):
+        due = self.queue_email()
+        self.queue_email(next_attempt_at=timezone.now() + datetime.timedelta(hours=1))
+        EmailLog.objects.create(
+            sender="shop@example.com",
+            recipient="done@example.com",
+            subject="Sent",
+            status="SENT",
+        )
+
+        claimed = claim_email_logs(batch_size=10)
+
+        self.assertEqual([email_log.pk for email_log in claimed], [due.pk])
+        self.assertEqual(claimed[0].status, "SENDING")
+        self.assertEqual(claimed[0].attempts, 1)
+        self.assertEqual(claim_email_logs(batch_size=10), [])
+
+    def test_concurrent_claims_of_the_same_batch_do_not_overlap(self):
+        email_log = self.queue_email()
+        original_update = QuerySet.update
+        rival_claims = []
+
+        def update_after_rival_claim(queryset, **kwargs):
+            # Another worker picked the same candidates and claims them
+            # between this worker's SELECT and its UPDATE.
+            with patch.object(QuerySet, "update", original_update):
+                rival_claims.append(claim_email_logs(batch_size=10))
+            return original_update(queryset, **kwargs)
+
+        with patch.object(QuerySet, "update", update_after_rival_claim):
+            claimed = claim_email_logs(batch_size=10)
+
+        self.assertEqual([e.pk for e in rival_claims[0]], [email_log.pk])
+        self.assertEqual(claimed, [])
+        email_log.refresh_from_db()
+        self.assertEqual(email_log.attempts, 1)
+
+    def test_batch_is_sent_over_one_connection(self):
+        for n in range(3):
+            self.queue_email(recipient=f"customer{n}@example.com")
+        connection = MagicMock()
+
+        with patch("mailer.utils.email_queue.get_connection", return_value=connection):
+            sent = deliver_email_logs(claim_email_logs(batch_size=10))
+
+        self.assertEqual(sent, 3)
+        connection.open.assert_called_once()
+        self.assertEqual(connection.send_messages.call_count, 3)
+        connection.close.assert_called_once()
+        self.assertEqual(EmailLog.objects.filter(status="SENT").count(), 3)
+
+    def test_sends_html_and_text_alternatives(self):
+        self.queue_email(recipient="a@example.com, b@example.com")
+
+        deliver_email_logs(claim_email_logs(batch_size=10))
+
+        self.assertEqual(len(mail.outbox), 1)
+        message = mail.outbox[0]
+        self.assertEqual(message.to, ["a@example.com", "b@example.com"])
+        self.assertEqual(message.body, "Hello")
+        self.assertEqual(message.alternatives[0][0], "<p>Hello</p>")
+
+    def test_failed_send_is_rescheduled_and_the_rest_of_the_batch_still_goes(self):
+        failing = self.queue_email(subject="first")
+        self.queue_email(subject="second")
+        connection = MagicMock()
+        connection.send_messages.side_effect = [Exception("421 try later"), 1]
+
+        before = timezone.now()
+        with patch("mailer.utils.email_queue.get_connection", return_value=connection):
+            sent = deliver_email_logs(claim_email_logs(batch_size=10))
+
+        self.assertEqual(sent, 1)
+        failing.refresh_from_db()
+        self.assertEqual(failing.status, "PENDING")
+        self.assertIn("421 try later", failing.error_message)
+        self.assertGreaterEqual(failing.next_attempt_at, before + email_retry_delay(1))
+        self.assertEqual(EmailLog.objects.get(subject="second").status, "SENT")
+
+    def test_connection_failure_reschedules_the_whole_batch(self):
+        self.queue_email()
+        self.queue_email()
+        connection = MagicMock()
+        connection.open.side_effect = OSError("connection refused")
+
+        with patch("mailer.utils.email_queue.get_connection", return_value=connection):
+            sent = deliver_email_logs(claim_email_logs(batch_size=10))
+
+        self.assertEqual(sent, 0)
+        connection.send_messages.assert_not_called()
+        self.assertEqual(EmailLog.objects.filter(status="PENDING").count(), 2)
+
+    def test_email_is_dead_lettered_after_max_attempts(self):
+        email_log = self.queue_email(attempts=2)
+        connection = MagicMock()
+        connection.send_messages.side_effect = Exception("550 mailbox unavailable")
+
+        with patch("mailer.utils.email_queue.get_connection", return_value=connection):
+            deliver_email_logs(claim_email_logs(batch_size=10), max_attempts=3)
+
+        email_log.refresh_from_db()
+        self.assertEqual(email_log.status, "FAILED")
+        self.assertEqual(email_log.attempts, 3)
+        self.assertEqual(claim_email_logs(batch_size=10), [])
+
+    def test_admin_copies_are_removed_once_sent(self):
+        self.queue_email(recipient=settings.ADMIN_EMAIL)
+
+        deliver_email_logs(claim_email_logs(batch_size=10))
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(EmailLog.objects.exists())
+
+    def test_retry_delay_grows_and_is_capped(self):
+        self.assertLess(email_retry_delay(1), email_retry_delay(2))
+        self.assertEqual(email_retry_delay(50), email_retry_delay(60))
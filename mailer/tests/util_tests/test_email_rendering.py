@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from mailer.utils import email_rendering
+from mailer.utils.email_rendering import (
+    get_email_template,
+    html_to_text,
+    render_email,
+    render_emails,
+)
+
+
+class EmailRenderingTest(SimpleTestCase):
+    def setUp(self):
+        email_rendering._template_cache.clear()
+        html_to_text.cache_clear()
+
+    def test_html_to_text_keeps_block_structure(self):
+        html = "<div><h1>Hi</h1><p>First<br>line</p><ul><li>One</li><li>Two</li></ul></div>"
+
+        self.assertEqual(html_to_text(html), "Hi\nFirst\nline\n\nOne\nTwo")
+
+    @override_settings(DEBUG=False)
+    def test_template_is_loaded_once(self):
+        with patch(
+            "mailer.utils.email_rendering.get_template",
+            wraps=email_rendering.get_template,
+        ) as mock_get_template:
+            first = get_email_template("test_template.html")
+            second = get_email_template("test_template.html")
+
+        self.assertIs(first, second)
+        mock_get_template.assert_called_once_with("test_template.html")
+
+    @override_settings(DEBUG=True)
+    def test_template_is_reloaded_in_debug(self):
+        with patch(
+            "mailer.utils.email_rendering.get_template",
+            wraps=email_rendering.get_template,
+        ) as mock_get_template:
+            get_email_template("test_template.html")
+            get_email_template("test_template.html")
+
+        self.assertEqual(mock_get_template.call_count, 2)
+
+    def test_render_emails_matches_render_email(self):
+        contexts = [{"name": "Alice"}, {"name": "Bob"}]
+
+        rendered = render_emails("test_template.html", contexts)
+
+        self.assertEqual(
+            rendered, [render_email("test_template.html", c) for c in contexts]
+        )
+        self.assertIn("Test Email Content", rendered[0][0])
+        self.assertNotIn("<td", rendered[1][1])
@@ -1,7 +1,10 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from unittest.mock import patch, MagicMock
 from django.conf import settings
-from mailer.utils.send_templated_email import send_templated_email
+from mailer.utils.send_templated_email import (
+    send_templated_email,
+    send_templated_emails,
+)
 from mailer.models import EmailLog
 from users.tests.test_helpers.model_factories import UserFactory
 from service.tests.test_helpers.model_factories import (
@@ -33,7 +36,31 @@ class SendTemplatedEmailTest(TestCase):
 
         settings.DEFAULT_FROM_EMAIL = "default@example.com"
 
-    @patch("mailer.utils.send_templated_email.EmailMultiAlternatives")
+    @patch("mailer.utils.email_queue.EmailMultiAlternatives")
+    def test_send_templated_email_queues_log(self, mock_email_multi_alternatives):
+        # Act
+        success = send_templated_email(
+            self.recipient_list,
+            self.subject,
+            self.template_name,
+            self.context,
+            booking=self.service_booking,
+            profile=self.service_profile,
+        )
+
+        # Assert
+        self.assertTrue(success)
+        self.assertEqual(EmailLog.objects.count(), 1)
+        email_log = EmailLog.objects.first()
+        self.assertEqual(email_log.status, "PENDING")
+        self.assertEqual(email_log.attempts, 0)
+        self.assertTrue(email_log.html_content)
+        self.assertTrue(email_log.text_content)
+        self.assertNotIn("<p>", email_log.text_content)
+        mock_email_multi_alternatives.assert_not_called()
+
+    @override_settings(EMAIL_QUEUE_ENABLED=False)
+    @patch("mailer.utils.email_queue.EmailMultiAlternatives")
     def test_send_templated_email_success_creates_log(
         self, mock_email_multi_alternatives
     ):
@@ -60,14 +87,14 @@ class SendTemplatedEmailTest(TestCase):
         self.assertEqual(email_log.recipient, ", ".join(self.recipient_list))
         self.assertEqual(email_log.service_booking, self.service_booking)
         self.assertEqual(email_log.service_profile, self.service_profile)
-        mock_email_instance.send.assert_called_once()
+        mock_email_multi_alternatives.assert_called_once()
 
     @patch(
-        "mailer.utils.send_templated_email.render_to_string",
+        "mailer.utils.send_templated_email.render_email",
         side_effect=Exception("Template Error"),
     )
     def test_send_templated_email_template_error_creates_log(
-        self, mock_render_to_string
+        self, mock_render_email
     ):
         # Act
         success = send_templated_email(
@@ -88,8 +115,9 @@ class SendTemplatedEmailTest(TestCase):
         self.assertEqual(email_log.sales_booking, self.sales_booking)
         self.assertEqual(email_log.sales_profile, self.sales_profile)
 
+    @override_settings(EMAIL_QUEUE_ENABLED=False)
     @patch(
-        "mailer.utils.send_templated_email.EmailMultiAlternatives",
+        "mailer.utils.email_queue.EmailMultiAlternatives",
         side_effect=Exception("SMTP Error"),
     )
     def test_send_templated_email_send_error_creates_log(
@@ -111,3 +139,49 @@ class SendTemplatedEmailTest(TestCase):
         email_log = EmailLog.objects.first()
         self.assertEqual(email_log.status, "FAILED")
         self.assertIn("SMTP Error", email_log.error_message)
+
+
+class SendTemplatedEmailsTest(TestCase):
+    def setUp(self):
+        self.profiles = [SalesProfileFactory(user=UserFactory()) for _ in range(3)]
+
+    def messages(self):
+        return [
+            {
+                "recipient_list": [profile.user.email],
+                "context": {"name": profile.name},
+                "booking": None,
+                "profile": profile,
+            }
+            for profile in self.profiles
+        ]
+
+    def test_queues_one_log_per_message_in_one_insert(self):
+        # Look up, store and re-read the shared body, then insert every log.
+        with self.assertNumQueries(4):
+            queued = send_templated_emails(
+                "Bulk Subject", "test_template.html", self.messages()
+            )
+
+        self.assertEqual(queued, 3)
+        logs = EmailLog.objects.order_by("pk")
+        self.assertEqual(
+            [log.recipient for log in logs],
+            [profile.user.email for profile in self.profiles],
+        )
+        self.assertTrue(all(log.status == "PENDING" for log in logs))
+        self.assertTrue(all(log.text_content for log in logs))
+        self.assertEqual(len({log.body_id for log in logs}), 1)
+        self.assertEqual(logs[0].sales_profile, self.profiles[0])
+
+    @patch(
+        "mailer.utils.send_templated_email.render_emails",
+        side_effect=Exception("Template Error"),
+    )
+    def test_template_error_logs_every_message_as_failed(self, mock_render_emails):
+        queued = send_templated_emails(
+            "Bulk Subject", "test_template.html", self.messages()
+        )
+
+        self.assertEqual(queued, 0)
+        self.assertEqual(EmailLog.objects.filter(status="FAILED").count(), 3)
@@ -0,0 +1,57 @@
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from mailer.models import EmailLog
+from users.tests.test_helpers.model_factories import UserFactory
+
+
+class EmailManagementViewTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("mailer:email_management")
+        for n in range(25):
+            EmailLog.objects.create(
+                sender="shop@example.com",
+                recipient=f"customer{n}@example.com",
+                subject=f"Email {n}",
+                status="FAILED" if n == 0 else "SENT",
+            )
+
+    def test_staff_page_through_emails(self):
+        self.client.force_login(UserFactory(is_staff=True))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["emails"]), 20)
+        self.assertEqual(response.context["email_count"], 25)
+        self.assertIsNone(response.context["previous_query"])
+
+        response = self.client.get(f"{self.url}?{response.context['next_query']}")
+
+        self.assertEqual(len(response.context["emails"]), 5)
+        self.assertIsNone(response.context["next_query"])
+        self.assertIsNotNone(response.context["previous_query"])
+
+    def test_status_filter_is_kept_across_pages(self):
+        self.client.force_login(UserFactory(is_staff=True))
+
+        response = self.client.get(self.url, {"status": "SENT"})
+
+        self.assertEqual(response.context["email_count"], 24)
+        self.assertTrue(response.context["next_query"].startswith("status=SENT&after="))
+
+    def test_viewing_does_not_delete_emails(self):
+        self.client.force_login(UserFactory(is_staff=True))
+        EmailLog.objects.update(timestamp="2000-01-01T00:00:00Z")
+
+        self.client.get(self.url)
+
+        self.assertEqual(EmailLog.objects.count(), 25)
+
+    def test_non_staff_are_redirected(self):
+        self.client.force_login(UserFactory())
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
@@ -1 +1,3 @@
 from .send_templated_email import *
+from .email_queue import *
+from .email_log_browser import *
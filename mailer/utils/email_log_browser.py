@@ -0,0 +1,128 @@
+import datetime
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.http import urlencode
+
+from mailer.models import EmailLog
+
+EMAIL_LOG_FILTERS = (
+    "status",
+    "recipient",
+    "service_booking",
+    "sales_booking",
+    "service_profile",
+    "sales_profile",
+)
+EMAIL_LOG_COUNT_CACHE_TIMEOUT = 300
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_ID_FILTERS = {"service_booking", "sales_booking", "service_profile", "sales_profile"}
+
+
+def clean_email_log_filters(params):
+    """
+    Picks the supported filters out of params (e.g. request.GET), dropping
+    empty values, unknown statuses and ids that are not numbers.
+    """
+    statuses = {value for value, _ in EmailLog.STATUS_CHOICES}
+    filters = {}
+    for name in EMAIL_LOG_FILTERS:
+        value = (params.get(name) or "").strip()
+        if not value:
+            continue
+        if name == "status" and value not in statuses:
+            continue
+        if name in _ID_FILTERS and not value.isdigit():
+            continue
+        filters[name] = value
+    return filters
+
+
+def filter_email_logs(filters):
+    """
+    The email logs matching filters, newest first. Each filter is an equality
+    match on an indexed column, so the newest rows are found without scanning
+    the table.
+    """
+    queryset = EmailLog.objects.all()
+    for name, value in filters.items():
+        field = f"{name}_id" if name in _ID_FILTERS else name
+        queryset = queryset.filter(**{field: value})
+    if settings.ADMIN_EMAIL:
+        queryset = queryset.exclude(recipient=settings.ADMIN_EMAIL)
+    return queryset.order_by("-timestamp", "-pk")
+
+
+def encode_cursor(email_log):
+    microseconds = (email_log.timestamp - _EPOCH) // datetime.timedelta(microseconds=1)
+    return f"{microseconds}-{email_log.pk}"
+
+
+def decode_cursor(cursor):
+    """Returns (timestamp, pk) for a cursor, or None if it is malformed."""
+    try:
+        microseconds, pk = cursor.split("-")
+        return (
+            _EPOCH + datetime.timedelta(microseconds=int(microseconds)),
+            int(pk),
+        )
+    except (AttributeError, ValueError, OverflowError):
+        return None
+
+
+def email_log_page(queryset, after=None, before=None, page_size=20):
+    """
+    Returns one page of queryset (ordered newest first) using keyset
+    pagination: the page starts just past the row named by the after cursor,
+    or ends just before the row named by the before cursor. Only page_size + 1
+    rows are read, however deep into the history the page is.
+
+    Returns a dict with emails, next_cursor and previous_cursor; a cursor is
+    None when there is no page in that direction.
+    """
+    after = decode_cursor(after) if after else None
+    before = decode_cursor(before) if before else None
+
+    if before:
+        timestamp, pk = before
+        rows = list(
+            queryset.filter(
+                Q(timestamp__gt=timestamp) | Q(timestamp=timestamp, pk__gt=pk)
+            ).order_by("timestamp", "pk")[: page_size + 1]
+        )
+        has_previous = len(rows) > page_size
+        emails = rows[:page_size][::-1]
+        has_next = True
+    else:
+        if after:
+            timestamp, pk = after
+            queryset = queryset.filter(
+                Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, pk__lt=pk)
+            )
+        rows = list(queryset[: page_size + 1])
+        has_next = len(rows) > page_size
+        emails = rows[:page_size]
+        has_previous = after is not None
+
+    return {
+        "emails": emails,
+        "next_cursor": encode_cursor(emails[-1]) if emails and has_next else None,
+        "previous_cursor": encode_cursor(emails[0]) if emails and has_previous else None,
+    }
+
+
+def cached_email_log_count(filters, queryset):
+    """
+    The number of rows in queryset, cached per set of filters for a few
+    minutes so paging through the history does not recount the table.
+    """
+    digest = hashlib.sha256(urlencode(sorted(filters.items())).encode()).hexdigest()
+    key = f"mailer:email_log_count:{digest}"
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, EMAIL_LOG_COUNT_CACHE_TIMEOUT)
+    return count
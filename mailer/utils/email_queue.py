@@ -0,0 +1,160 @@
+import datetime
+import logging
+import uuid
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.external_calls import external_call
+from mailer.models import EmailLog
+
+logger = logging.getLogger(__name__)
+
+EMAIL_LEASE_SECONDS = 300
+EMAIL_MAX_ATTEMPTS = 5
+EMAIL_BACKOFF_BASE_SECONDS = 60
+EMAIL_BACKOFF_MAX_SECONDS = 3600
+
+
+def claim_email_logs(batch_size, lease_seconds=EMAIL_LEASE_SECONDS):
+    """
+    Claims up to batch_size queued emails for this worker.
+
+    Claimed emails are moved to 'SENDING', leased until now + lease_seconds
+    and stamped with a fresh claim token. An email whose worker died mid-way
+    becomes claimable again once its lease runs out.
+
+    The UPDATE re-checks the status and lease of each email, so when two
+    workers pick the same candidates only one of them wins each row, and
+    only the emails carrying this worker's token are returned to be sent.
+    """
+    now = timezone.now()
+    due = Q(status="PENDING") | Q(status="SENDING")
+    email_ids = list(
+        EmailLog.objects.filter(due, next_attempt_at__lte=now)
+        .order_by("next_attempt_at", "pk")
+        .values_list("pk", flat=True)[:batch_size]
+    )
+    if not email_ids:
+        return []
+    claim_token = uuid.uuid4()
+    claimed = EmailLog.objects.filter(
+        due, pk__in=email_ids, next_attempt_at__lte=now
+    ).update(
+        status="SENDING",
+        attempts=F("attempts") + 1,
+        next_attempt_at=now + datetime.timedelta(seconds=lease_seconds),
+        claim_token=claim_token,
+    )
+    if not claimed:
+        return []
+    return list(
+        EmailLog.objects.filter(claim_token=claim_token)
+        .select_related("body")
+        .order_by("next_attempt_at", "pk")
+    )
+
+
+def email_retry_delay(attempts):
+    delay = EMAIL_BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return datetime.timedelta(seconds=min(delay, EMAIL_BACKOFF_MAX_SECONDS))
+
+
+def _recipients(email_log):
+    return [address for address in email_log.recipient.split(", ") if address]
+
+
+def _build_message(email_log, connection):
+    html_content = email_log.html_content
+    msg = EmailMultiAlternatives(
+        email_log.subject,
+        email_log.text_content or "",
+        email_log.sender,
+        _recipients(email_log),
+        connection=connection,
+    )
+    if html_content:
+        msg.attach_alternative(html_content, "text/html")
+    return msg
+
+
+def _record_sent(email_log):
+    if settings.ADMIN_EMAIL in _recipients(email_log):
+        # Copies sent to the shop itself are not kept in the email log.
+        email_log.delete()
+        return
+    email_log.status = "SENT"
+    email_log.timestamp = timezone.now()
+    email_log.error_message = None
+    email_log.save(update_fields=["status", "timestamp", "error_message"])
+
+
+def _record_failure(email_log, error, max_attempts):
+    now = timezone.now()
+    email_log.error_message = str(error)
+    email_log.timestamp = now
+    if email_log.attempts >= max_attempts:
+        # Dead letter: left in the log as FAILED for staff to look at.
+        email_log.status = "FAILED"
+        email_log.next_attempt_at = now
+        logger.error(
+            f"Email Error: Giving up on email {email_log.pk} to {email_log.recipient} after {email_log.attempts} attempts."
+        )
+    else:
+        email_log.status = "PENDING"
+        email_log.next_attempt_at = now + email_retry_delay(email_log.attempts)
+    email_log.save(
+        update_fields=["status", "timestamp", "error_message", "next_attempt_at"]
+    )
+
+
+def _reopen(connection):
+    # After an SMTP error the session may be unusable, so the rest of the
+    # batch gets a fresh one. If that fails too, each send retries the open.
+    try:
+        connection.close()
+        connection.open()
+    except Exception:
+        pass
+
+
+def deliver_email_logs(email_logs, max_attempts=EMAIL_MAX_ATTEMPTS):
+    """
+    Sends claimed emails over a single mail connection and records the
+    outcome on each. A failed email is rescheduled with exponential backoff
+    until max_attempts is reached, after which it is marked 'FAILED'.
+
+    Returns the number of emails sent.
+    """
+    if not email_logs:
+        return 0
+
+    connection = get_connection()
+    try:
+        with external_call():
+            connection.open()
+    except Exception as e:
+        for email_log in email_logs:
+            _record_failure(email_log, e, max_attempts)
+        return 0
+
+    sent = 0
+    try:
+        for email_log in email_logs:
+            try:
+                with external_call():
+                    connection.send_messages([_build_message(email_log, connection)])
+            except Exception as e:
+                _record_failure(email_log, e, max_attempts)
+                _reopen(connection)
+            else:
+                _record_sent(email_log)
+                sent += 1
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+    return sent
@@ -0,0 +1,60 @@
+from functools import lru_cache
+import re
+
+from django.conf import settings
+from django.template.loader import get_template
+from django.utils.html import strip_tags
+
+# HTML -> plain text conversion, compiled once per process.
+_LINE_BREAK_RE = re.compile(r"<br\s*?>")
+_PARAGRAPH_END_RE = re.compile(r"</p>")
+_BLOCK_END_RE = re.compile(r"</(div|h[1-6]|ul|ol|li)>")
+_BLOCK_START_RE = re.compile(r"<(p|div|h[1-6]|ul|ol|li)[^>]*?>")
+
+_template_cache = {}
+
+
+def get_email_template(template_name):
+    """
+    Returns the parsed template for template_name, loading it only once per
+    process. With DEBUG on the template is looked up every time so edits show
+    up without a restart.
+    """
+    if settings.DEBUG:
+        return get_template(template_name)
+    template = _template_cache.get(template_name)
+    if template is None:
+        template = _template_cache[template_name] = get_template(template_name)
+    return template
+
+
+@lru_cache(maxsize=256)
+def html_to_text(html_content):
+    """
+    The plain text alternative for an email body. Cached, as bulk
+    notifications often render identical bodies.
+    """
+    text = _LINE_BREAK_RE.sub("\n", html_content)
+    text = _PARAGRAPH_END_RE.sub("\n\n", text)
+    text = _BLOCK_END_RE.sub("\n", text)
+    text = _BLOCK_START_RE.sub("", text)
+    return strip_tags(text).strip()
+
+
+def render_email(template_name, context):
+    """Returns (html_content, text_content) for one email."""
+    html_content = get_email_template(template_name).render(context)
+    return html_content, html_to_text(html_content)
+
+
+def render_emails(template_name, contexts):
+    """
+    Renders one template over many contexts, e.g. one per recipient of a
+    bulk notification. Returns a list of (html_content, text_content).
+    """
+    template = get_email_template(template_name)
+    rendered = []
+    for context in contexts:
+        html_content = template.render(context)
+        rendered.append((html_content, html_to_text(html_content)))
+    return rendered
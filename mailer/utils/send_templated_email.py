@@ -1,15 +1,37 @@
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
 from django.db import transaction
-import re
-from django.utils import timezone
-from mailer.models.EmailLog_model import EmailLog
+from mailer.models import EmailBody, EmailLog
+from mailer.utils.email_queue import deliver_email_logs
+from mailer.utils.email_rendering import render_email, render_emails
 from service.models import ServiceBooking, ServiceProfile
 from inventory.models import SalesBooking, SalesProfile
 
 
+def _prepare_email(recipient_list, subject, context, booking, profile, sender_email):
+    """
+    Adds the shared variables to the template context and returns the
+    EmailLog fields that link the email to its booking and profile.
+    """
+    user = getattr(profile, "user", None)
+
+    context["booking"] = booking
+    context["profile"] = profile
+    context["user"] = user
+    context["SITE_SCHEME"] = settings.SITE_SCHEME
+    context["SITE_DOMAIN"] = settings.SITE_DOMAIN
+
+    return {
+        "sender": sender_email,
+        "recipient": ", ".join(recipient_list),
+        "subject": subject,
+        "user": user,
+        "service_profile": profile if isinstance(profile, ServiceProfile) else None,
+        "sales_profile": profile if isinstance(profile, SalesProfile) else None,
+        "service_booking": booking if isinstance(booking, ServiceBooking) else None,
+        "sales_booking": booking if isinstance(booking, SalesBooking) else None,
+    }
+
+
 def send_templated_email(
     recipient_list,
     subject,
@@ -19,88 +41,100 @@ def send_templated_email(
     profile,
     from_email=None,
 ):
+    """
+    Renders the email and queues it in the EmailLog for the
+    process_email_queue worker, so callers never wait on SMTP. Returns True
+    once the email is queued.
+
+    With EMAIL_QUEUE_ENABLED = False the email is sent straight away instead.
+    """
     if not recipient_list:
         return False
 
     sender_email = from_email if from_email else settings.DEFAULT_FROM_EMAIL
+    log_fields = _prepare_email(
+        recipient_list, subject, context, booking, profile, sender_email
+    )
 
-    user = getattr(profile, "user", None)
-
-    service_profile = profile if isinstance(profile, ServiceProfile) else None
-    sales_profile = profile if isinstance(profile, SalesProfile) else None
-    service_booking_obj = booking if isinstance(booking, ServiceBooking) else None
-    sales_booking_obj = booking if isinstance(booking, SalesBooking) else None
-
-    context["booking"] = booking
-    context["profile"] = profile
-    context["user"] = user
-    context["SITE_SCHEME"] = settings.SITE_SCHEME
-    context["SITE_DOMAIN"] = settings.SITE_DOMAIN
-
-    html_content = None
-    text_content = None
     try:
-        html_content = render_to_string(template_name, context)
-        text_content_prep = re.sub(r"<br\s*?>", "\n", html_content)
-        text_content_prep = re.sub(r"</p>", "\n\n", text_content_prep)
-        text_content_prep = re.sub(r"</(div|h[1-6]|ul|ol|li)>", "\n", text_content_prep)
-        text_content_prep = re.sub(
-            r"<(p|div|h[1-6]|ul|ol|li)[^>]*?>", "", text_content_prep
-        )
-        text_content = strip_tags(text_content_prep).strip()
-
+        html_content, text_content = render_email(template_name, context)
     except Exception as e:
-        error_msg = f"Template rendering failed: {e}"
         EmailLog.objects.create(
-            sender=sender_email,
-            recipient=", ".join(recipient_list),
-            subject=subject,
             status="FAILED",
-            error_message=error_msg,
-            user=user,
-            service_profile=service_profile,
-            sales_profile=sales_profile,
-            service_booking=service_booking_obj,
-            sales_booking=sales_booking_obj,
+            error_message=f"Template rendering failed: {e}",
+            **log_fields,
         )
         return False  # Return False immediately on template rendering failure
 
-    email_status = "PENDING"
-    error_msg = None
-    success = False
+    queued = getattr(settings, "EMAIL_QUEUE_ENABLED", True)
 
     try:
-        msg = EmailMultiAlternatives(
-            subject, text_content, sender_email, recipient_list
+        with transaction.atomic():
+            email_log = EmailLog.objects.create(
+                body=EmailBody.store(html_content, text_content),
+                status="PENDING" if queued else "SENDING",
+                attempts=0 if queued else 1,
+                **log_fields,
+            )
+    except Exception:
+        return False  # Could not queue the email
+
+    if queued:
+        return True
+    return deliver_email_logs([email_log], max_attempts=1) == 1
+
+
+def send_templated_emails(subject, template_name, messages, from_email=None):
+    """
+    Queues one email per entry of messages, rendering template_name once per
+    recipient with the parsed template shared. Identical bodies are stored
+    once and the logs are saved in a single insert. Each entry is a dict
+    with recipient_list, context, booking and profile, and may override
+    subject.
+
+    Returns the number of emails queued.
+    """
+    sender_email = from_email if from_email else settings.DEFAULT_FROM_EMAIL
+    messages = [message for message in messages if message["recipient_list"]]
+    log_fields = [
+        _prepare_email(
+            message["recipient_list"],
+            message.get("subject", subject),
+            message["context"],
+            message.get("booking"),
+            message.get("profile"),
+            sender_email,
+        )
+        for message in messages
+    ]
+
+    try:
+        rendered = render_emails(
+            template_name, [message["context"] for message in messages]
         )
-        msg.attach_alternative(html_content, "text/html")
-        msg.send()
-        email_status = "SENT"
-        success = True
     except Exception as e:
-        email_status = "FAILED"
-        error_msg = str(e)
-        success = False
-
-    if settings.ADMIN_EMAIL not in recipient_list:
-        try:
-            with transaction.atomic():
-                log_entry = EmailLog(
-                    timestamp=timezone.now(),
-                    sender=sender_email,
-                    recipient=", ".join(recipient_list),
-                    subject=subject,
-                    html_content=html_content,
-                    status=email_status,
-                    error_message=error_msg,
-                    user=user,
-                    service_profile=service_profile,
-                    sales_profile=sales_profile,
-                    service_booking=service_booking_obj,
-                    sales_booking=sales_booking_obj,
-                )
-                log_entry.save()
-        except Exception as log_e:
-            pass  # Failed to create email log
-
-    return success
+        EmailLog.objects.bulk_create(
+            EmailLog(
+                status="FAILED",
+                error_message=f"Template rendering failed: {e}",
+                **fields,
+            )
+            for fields in log_fields
+        )
+        return 0
+
+    queued = getattr(settings, "EMAIL_QUEUE_ENABLED", True)
+    bodies = EmailBody.store_many(rendered)
+    email_logs = EmailLog.objects.bulk_create(
+        EmailLog(
+            body=body,
+            status="PENDING" if queued else "SENDING",
+            attempts=0 if queued else 1,
+            **fields,
+        )
+        for fields, body in zip(log_fields, bodies)
+    )
+
+    if queued:
+        return len(email_logs)
+    return deliver_email_logs(email_logs, max_attempts=1)
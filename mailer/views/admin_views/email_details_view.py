@@ -12,13 +12,15 @@ class EmailDetailView(AdminRequiredMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["page_title"] = "Email Details"
-        email_log = self.get_object()
+        # The body is only loaded and decompressed here, for the one email
+        # being viewed.
+        html_content = self.object.html_content
 
         # Encode the HTML content in base64 to use in a data URL
-        if email_log.html_content:
-            encoded_html = base64.b64encode(
-                email_log.html_content.encode("utf-8")
-            ).decode("utf-8")
+        if html_content:
+            encoded_html = base64.b64encode(html_content.encode("utf-8")).decode(
+                "utf-8"
+            )
             context["encoded_html_content"] = encoded_html
         else:
             context["encoded_html_content"] = base64.b64encode(
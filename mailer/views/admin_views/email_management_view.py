@@ -1,31 +1,53 @@
-from django.views.generic import ListView, View
-from django.shortcuts import redirect
-from django.contrib import messages
+from django.views.generic import ListView
+from django.utils.http import urlencode
 from mailer.models import EmailLog
+from mailer.utils.email_log_browser import (
+    cached_email_log_count,
+    clean_email_log_filters,
+    email_log_page,
+    filter_email_logs,
+)
 from core.mixins import AdminRequiredMixin
-from django.conf import settings
-from django.utils import timezone
-from datetime import timedelta
 
 class EmailManagementView(AdminRequiredMixin, ListView):
     model = EmailLog
     template_name = "admin_email_management_view.html"
     context_object_name = "emails"
-    paginate_by = 20
+    page_size = 20
 
     def get_queryset(self):
-        three_months_ago = timezone.now() - timedelta(days=90)
-        EmailLog.objects.filter(timestamp__lt=three_months_ago).delete()
-
-        admin_email = settings.ADMIN_EMAIL
-        queryset = EmailLog.objects.all()
-        if admin_email:
-            queryset = queryset.exclude(recipient=admin_email)
-        return queryset.order_by("-timestamp")
+        # Old emails are removed by the prune_email_logs command.
+        self.filters = clean_email_log_filters(self.request.GET)
+        return filter_email_logs(self.filters)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["page_title"] = "Email Management"
+        page = email_log_page(
+            self.object_list,
+            after=self.request.GET.get("after"),
+            before=self.request.GET.get("before"),
+            page_size=self.page_size,
+        )
+        filter_query = urlencode(self.filters)
+        context.update(
+            {
+                "page_title": "Email Management",
+                "emails": page["emails"],
+                "next_query": self._page_query(filter_query, "after", page["next_cursor"]),
+                "previous_query": self._page_query(
+                    filter_query, "before", page["previous_cursor"]
+                ),
+                "email_count": cached_email_log_count(self.filters, self.object_list),
+                "filters": self.filters,
+                "filter_query": filter_query,
+                "status_choices": EmailLog.STATUS_CHOICES,
+            }
+        )
         return context
 
-
+    @staticmethod
+    def _page_query(filter_query, direction, cursor):
+        if cursor is None:
+            return None
+        cursor_query = urlencode({direction: cursor})
+        return f"{filter_query}&{cursor_query}" if filter_query else cursor_query
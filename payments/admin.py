@@ -35,7 +35,7 @@ class PaymentAdmin(ImportExportModelAdmin):
         "service_booking",
         "sales_booking",
     )
-    list_filter = ("status", "created_at")
+    list_filter = ("status", "booking_type", "created_at")
     search_fields = (
         "stripe_payment_intent_id",
         "service_booking__service_booking_reference",
@@ -46,6 +46,16 @@ class PaymentAdmin(ImportExportModelAdmin):
 
 @admin.register(WebhookEvent)
 class WebhookEventAdmin(admin.ModelAdmin):
-    list_display = ("event_type", "received_at")
-    list_filter = ("event_type",)
+    list_display = (
+        "event_type",
+        "status",
+        "attempts",
+        "received_at",
+        "processed_at",
+        "handler_name",
+        "processing_duration_ms",
+        "query_count",
+        "external_call_ms",
+    )
+    list_filter = ("event_type", "status", "handler_name")
     search_fields = ("event_id",)
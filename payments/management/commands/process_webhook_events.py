@@ -0,0 +1,85 @@
+import time
+from django.core.management.base import BaseCommand
+
+from payments.utils.webhook_queue import (
+    WEBHOOK_LEASE_SECONDS,
+    WEBHOOK_MAX_ATTEMPTS,
+    claim_webhook_events,
+    run_webhook_event,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Processes queued Stripe webhook events. Runs until stopped unless "
+        "--once is given, in which case it exits when the queue is empty."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the events that are currently due, then exit.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10,
+            help="Number of events to claim at a time (default: 10).",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait when the queue is empty (default: 2).",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=WEBHOOK_MAX_ATTEMPTS,
+            help=f"Attempts before an event is marked failed (default: {WEBHOOK_MAX_ATTEMPTS}).",
+        )
+        parser.add_argument(
+            "--lease-seconds",
+            type=int,
+            default=WEBHOOK_LEASE_SECONDS,
+            help=f"How long a claimed event is reserved for this worker (default: {WEBHOOK_LEASE_SECONDS}).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        succeeded = failed = 0
+
+        try:
+            while True:
+                events = claim_webhook_events(batch_size, options["lease_seconds"])
+                if not events:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                for webhook_event in events:
+                    outcome = run_webhook_event(
+                        webhook_event, options["max_attempts"], options["lease_seconds"]
+                    )
+                    if outcome is None:
+                        # Another worker reclaimed it after our lease ran out.
+                        continue
+                    if outcome:
+                        succeeded += 1
+                    else:
+                        failed += 1
+                        self.stderr.write(
+                            f"Event {webhook_event.stripe_event_id} ({webhook_event.event_type}) "
+                            f"failed on attempt {webhook_event.attempts}: {webhook_event.last_error}"
+                        )
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {succeeded + failed} webhook events: "
+                f"{succeeded} succeeded, {failed} failed or rescheduled."
+            )
+        )
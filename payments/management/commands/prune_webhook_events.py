@@ -0,0 +1,69 @@
+import datetime
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from payments.models import WebhookEvent
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes processed Stripe webhook events past their retention period. "
+        "Events still waiting to be processed are never deleted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=90,
+            help="Keep successfully processed events for this many days (default: 90).",
+        )
+        parser.add_argument(
+            "--failed-days",
+            type=int,
+            default=365,
+            help="Keep events that failed processing for this many days (default: 365).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of events to delete per query (default: 1000).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many events would be deleted without deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        batch_size = max(1, options["batch_size"])
+
+        retention = {
+            "succeeded": now - datetime.timedelta(days=options["days"]),
+            "failed": now - datetime.timedelta(days=options["failed_days"]),
+        }
+
+        totals = {}
+        for status, cutoff in retention.items():
+            queryset = WebhookEvent.objects.filter(status=status, received_at__lt=cutoff)
+            if options["dry_run"]:
+                totals[status] = queryset.count()
+                continue
+
+            deleted = 0
+            while True:
+                ids = list(queryset.values_list("id", flat=True)[:batch_size])
+                if not ids:
+                    break
+                deleted += WebhookEvent.objects.filter(id__in=ids).delete()[0]
+            totals[status] = deleted
+
+        prefix = "[dry run] would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {totals['succeeded']} processed and "
+                f"{totals['failed']} failed webhook events."
+            )
+        )
@@ -0,0 +1,285 @@
+import datetime
+import json
+from collections import defaultdict
+from decimal import Decimal
+
+import stripe
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from dashboard.utils import kpi_dates_for, refresh_daily_kpis
+from payments.models import Payment
+from payments.utils.stripe_gateway import (
+    list_payment_intents,
+    list_refunds,
+    refresh_cached_payment_intent,
+)
+from refunds.models import RefundRequest
+
+REFUNDED_STATUSES = ("refunded", "partially_refunded")
+
+
+def _to_decimal(cents):
+    return Decimal(cents or 0) / Decimal("100")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares Payments and Refund Requests against the PaymentIntents and "
+        "Refunds Stripe holds for a date window, corrects any drift in bulk and "
+        "writes a drift report."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Reconcile intents created in the last N days (default: 7). Ignored when --start is given.",
+        )
+        parser.add_argument(
+            "--start",
+            type=datetime.date.fromisoformat,
+            help="First day of the window (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--end",
+            type=datetime.date.fromisoformat,
+            help="Last day of the window (YYYY-MM-DD, default: today).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of intents compared and updated per query (default: 500).",
+        )
+        parser.add_argument(
+            "--report",
+            help="Write the drift report to this path as JSON.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drift without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        start, end = self.get_window(options)
+        batch_size = max(1, options["batch_size"])
+        dry_run = options["dry_run"]
+        created_gte = int(start.timestamp())
+        created_lte = int(end.timestamp())
+
+        self.drift = []
+        try:
+            # Refunds are always created after their intent, so listing them
+            # from the window start onwards covers every refund of every
+            # intent in the window.
+            refunds = [
+                {
+                    "id": refund.id,
+                    "payment_intent": refund.payment_intent,
+                    "amount": refund.amount,
+                    "status": refund.status,
+                }
+                for refund in list_refunds(created_gte)
+            ]
+            refunded_cents = defaultdict(int)
+            for refund in refunds:
+                if refund["status"] == "succeeded" and refund["payment_intent"]:
+                    refunded_cents[refund["payment_intent"]] += refund["amount"]
+
+            payments_checked = payments_updated = 0
+            batch = []
+            for intent in list_payment_intents(created_gte, created_lte):
+                batch.append(intent)
+                if len(batch) >= batch_size:
+                    checked, updated = self.reconcile_payments(batch, refunded_cents, dry_run)
+                    payments_checked += checked
+                    payments_updated += updated
+                    batch = []
+            if batch:
+                checked, updated = self.reconcile_payments(batch, refunded_cents, dry_run)
+                payments_checked += checked
+                payments_updated += updated
+        except stripe.error.StripeError as e:
+            raise CommandError(f"Could not list Stripe objects: {e}")
+
+        refunds_checked = refunds_updated = 0
+        for offset in range(0, len(refunds), batch_size):
+            checked, updated = self.reconcile_refund_requests(
+                refunds[offset : offset + batch_size], refunded_cents, dry_run
+            )
+            refunds_checked += checked
+            refunds_updated += updated
+
+        if options["report"]:
+            self.write_report(options["report"], start, end, dry_run)
+
+        prefix = "[dry run] would update" if dry_run else "Updated"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {payments_checked} payments and {refunds_checked} refund "
+                f"requests between {start:%Y-%m-%d} and {end:%Y-%m-%d}. "
+                f"{prefix} {payments_updated} payments and {refunds_updated} refund "
+                f"requests; {len(self.drift)} differences found."
+            )
+        )
+
+    def get_window(self, options):
+        now = timezone.now()
+        tz = timezone.get_current_timezone()
+        if options["end"]:
+            end = datetime.datetime.combine(options["end"], datetime.time.max, tzinfo=tz)
+        else:
+            end = now
+        if options["start"]:
+            start = datetime.datetime.combine(options["start"], datetime.time.min, tzinfo=tz)
+        else:
+            start = end - datetime.timedelta(days=options["days"])
+        if start > end:
+            raise CommandError("--start must not be after --end.")
+        return start, end
+
+    def record(self, kind, local_id, stripe_id, field, local_value, stripe_value):
+        self.drift.append(
+            {
+                "object": kind,
+                "id": str(local_id) if local_id is not None else None,
+                "stripe_id": stripe_id,
+                "field": field,
+                "local": str(local_value) if local_value is not None else None,
+                "stripe": str(stripe_value) if stripe_value is not None else None,
+            }
+        )
+
+    def expected_payment_values(self, intent, refunded_cents):
+        amount = _to_decimal(intent.amount)
+        refunded_amount = _to_decimal(refunded_cents.get(intent.id, 0))
+        status = intent.status
+        # A refunded payment keeps 'succeeded' on Stripe; locally the refund
+        # handlers record it as refunded or partially refunded.
+        if status == "succeeded" and refunded_amount > 0:
+            status = "refunded" if refunded_amount >= amount else "partially_refunded"
+        return {
+            "status": status,
+            "amount": amount,
+            "currency": intent.currency.upper(),
+            "refunded_amount": refunded_amount,
+        }
+
+    def reconcile_payments(self, intents, refunded_cents, dry_run):
+        payments = Payment.objects.filter(
+            stripe_payment_intent_id__in=[intent.id for intent in intents]
+        ).only(
+            "id",
+            "stripe_payment_intent_id",
+            "status",
+            "amount",
+            "currency",
+            "refunded_amount",
+            "created_at",
+        )
+        by_intent_id = {payment.stripe_payment_intent_id: payment for payment in payments}
+
+        now = timezone.now()
+        changed = []
+        for intent in intents:
+            payment = by_intent_id.get(intent.id)
+            if payment is None:
+                self.record("payment", None, intent.id, "missing", None, intent.status)
+                continue
+
+            differs = False
+            for field, expected in self.expected_payment_values(intent, refunded_cents).items():
+                current = getattr(payment, field)
+                if field == "refunded_amount":
+                    current = current or Decimal("0.00")
+                if current != expected:
+                    self.record("payment", payment.id, intent.id, field, current, expected)
+                    setattr(payment, field, expected)
+                    differs = True
+            if differs:
+                payment.updated_at = now
+                changed.append(payment)
+                if not dry_run:
+                    refresh_cached_payment_intent(
+                        {"id": intent.id, "status": intent.status, "amount": intent.amount}
+                    )
+
+        if changed and not dry_run:
+            Payment.objects.bulk_update(
+                changed,
+                ["status", "amount", "currency", "refunded_amount", "updated_at"],
+            )
+            # bulk_update sends no signals, so the KPI days are refreshed here,
+            # once for the whole batch. The reconciled fields leave created_at
+            # alone, so each payment still counts towards the same day.
+            refresh_daily_kpis(
+                set().union(*(kpi_dates_for(payment) for payment in changed))
+            )
+        return len(by_intent_id), len(changed)
+
+    def reconcile_refund_requests(self, refunds, refunded_cents, dry_run):
+        refund_requests = RefundRequest.objects.filter(
+            stripe_refund_id__in=[refund["id"] for refund in refunds]
+        ).select_related("payment")
+        by_refund_id = {
+            refund_request.stripe_refund_id: refund_request
+            for refund_request in refund_requests
+        }
+
+        now = timezone.now()
+        changed = []
+        kpi_dates = set()
+        for refund in refunds:
+            refund_request = by_refund_id.get(refund["id"])
+            if refund_request is None:
+                if refund["status"] == "succeeded":
+                    self.record(
+                        "refund_request", None, refund["id"], "missing", None, refund["status"]
+                    )
+                continue
+
+            expected = refund_request.status
+            if refund["status"] == "succeeded" and refund_request.status not in REFUNDED_STATUSES:
+                payment = refund_request.payment
+                fully_refunded = payment is not None and _to_decimal(
+                    refunded_cents.get(refund["payment_intent"], 0)
+                ) >= payment.amount
+                expected = "refunded" if fully_refunded else "partially_refunded"
+            elif refund["status"] in ("failed", "canceled") and refund_request.status in REFUNDED_STATUSES:
+                expected = "failed"
+
+            if expected != refund_request.status:
+                self.record(
+                    "refund_request",
+                    refund_request.pk,
+                    refund["id"],
+                    "status",
+                    refund_request.status,
+                    expected,
+                )
+                kpi_dates |= kpi_dates_for(refund_request)
+                refund_request.status = expected
+                if refund_request.processed_at is None:
+                    refund_request.processed_at = now
+                kpi_dates |= kpi_dates_for(refund_request)
+                changed.append(refund_request)
+
+        if changed and not dry_run:
+            RefundRequest.objects.bulk_update(changed, ["status", "processed_at"])
+            # bulk_update sends no signals; refresh the days each request
+            # counted towards before and after the change, once per batch.
+            refresh_daily_kpis(kpi_dates)
+        return len(by_refund_id), len(changed)
+
+    def write_report(self, path, start, end, dry_run):
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "window": {"start": start.isoformat(), "end": end.isoformat()},
+            "dry_run": dry_run,
+            "drift": self.drift,
+        }
+        with open(path, "w") as report_file:
+            json.dump(report, report_file, indent=2)
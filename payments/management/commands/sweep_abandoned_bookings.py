@@ -0,0 +1,174 @@
+import datetime
+import stripe
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from inventory.models import TempSalesBooking
+from payments.models import Payment
+from payments.utils.stripe_gateway import cancel_payment_intent
+from service.models import TempServiceBooking
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes abandoned temporary bookings and Payments stuck in "
+        "'requires_payment_method', cancelling their Stripe Payment Intents. "
+        "Safe to run repeatedly from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--temp-booking-age-hours",
+            type=int,
+            default=24,
+            help="Delete temporary bookings not updated for this many hours (default: 24).",
+        )
+        parser.add_argument(
+            "--payment-age-hours",
+            type=int,
+            default=24,
+            help="Delete unpaid Payments not updated for this many hours (default: 24).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows to delete per query (default: 500).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be deleted without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        batch_size = max(1, options["batch_size"])
+        dry_run = options["dry_run"]
+
+        payment_cutoff = now - datetime.timedelta(hours=options["payment_age_hours"])
+        temp_booking_cutoff = now - datetime.timedelta(
+            hours=options["temp_booking_age_hours"]
+        )
+
+        # Payments go first so the temporary bookings they pointed at become
+        # eligible in the same run.
+        payments_deleted, intents_cancelled, payments_kept = self.sweep_payments(
+            payment_cutoff, batch_size, dry_run
+        )
+        service_deleted = self.sweep_temp_bookings(
+            TempServiceBooking,
+            "payment_for_temp_service",
+            temp_booking_cutoff,
+            batch_size,
+            dry_run,
+        )
+        sales_deleted = self.sweep_temp_bookings(
+            TempSalesBooking,
+            "payment_from_sales_temp_link",
+            temp_booking_cutoff,
+            batch_size,
+            dry_run,
+        )
+
+        prefix = "[dry run] would delete" if dry_run else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {payments_deleted} abandoned payments "
+                f"({intents_cancelled} Stripe intents cancelled, {payments_kept} kept), "
+                f"{service_deleted} temporary service bookings and "
+                f"{sales_deleted} temporary sales bookings."
+            )
+        )
+
+    def sweep_payments(self, cutoff, batch_size, dry_run):
+        queryset = Payment.objects.filter(
+            status="requires_payment_method",
+            updated_at__lt=cutoff,
+            service_booking__isnull=True,
+            sales_booking__isnull=True,
+        ).order_by("pk")
+
+        if dry_run:
+            return queryset.count(), 0, 0
+
+        deleted = cancelled = kept = 0
+        last_pk = None
+        while True:
+            batch_queryset = queryset
+            if last_pk is not None:
+                batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+            batch = list(
+                batch_queryset.values_list("pk", "stripe_payment_intent_id")[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1][0]
+
+            deletable = []
+            for pk, intent_id in batch:
+                outcome = self.cancel_intent(pk, intent_id)
+                if outcome == "cancelled":
+                    cancelled += 1
+                if outcome == "kept":
+                    kept += 1
+                else:
+                    deletable.append(pk)
+
+            if deletable:
+                # Re-check the status so a payment that moved on while Stripe
+                # was being called is left alone.
+                deleted += queryset.filter(pk__in=deletable).delete()[1].get(
+                    Payment._meta.label, 0
+                )
+
+        return deleted, cancelled, kept
+
+    def cancel_intent(self, payment_pk, intent_id):
+        """
+        Returns "cancelled", "gone" (nothing to cancel) or "kept" (the intent
+        could still be paid, so the Payment must stay).
+        """
+        if not intent_id:
+            return "gone"
+
+        try:
+            cancel_payment_intent(intent_id)
+            return "cancelled"
+        except stripe.error.InvalidRequestError as e:
+            if getattr(e, "code", None) == "resource_missing":
+                return "gone"
+            # Usually the intent is already cancelled or has moved on; ask
+            # Stripe which, and record anything other than a cancellation.
+            try:
+                intent = stripe.PaymentIntent.retrieve(intent_id)
+            except stripe.error.StripeError as retrieve_error:
+                self.stderr.write(
+                    f"Could not check Payment Intent {intent_id}: {retrieve_error}"
+                )
+                return "kept"
+            if intent.status == "canceled":
+                return "gone"
+            Payment.objects.filter(pk=payment_pk).update(status=intent.status)
+            return "kept"
+        except stripe.error.StripeError as e:
+            self.stderr.write(f"Could not cancel Payment Intent {intent_id}: {e}")
+            return "kept"
+
+    def sweep_temp_bookings(self, model, payment_relation, cutoff, batch_size, dry_run):
+        queryset = model.objects.filter(
+            updated_at__lt=cutoff, **{f"{payment_relation}__isnull": True}
+        )
+
+        if dry_run:
+            return queryset.count()
+
+        deleted = 0
+        while True:
+            pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            deleted += model.objects.filter(pk__in=pks).delete()[1].get(
+                model._meta.label, 0
+            )
+        return deleted
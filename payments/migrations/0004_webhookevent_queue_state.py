@@ -0,0 +1,58 @@
+# Generated by Django 5.2 on 2026-10-19 03:26
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def mark_existing_events_processed(apps, schema_editor):
+    # Events recorded before the queue existed were handled inside the
+    # webhook request, so the worker must not pick them up again.
+    WebhookEvent = apps.get_model("payments", "WebhookEvent")
+    WebhookEvent.objects.update(status="succeeded", processed_at=models.F("received_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhookevent',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='How many times a worker has tried to process the event.'),
+        ),
+        migrations.AddField(
+            model_name='webhookevent',
+            name='last_error',
+            field=models.TextField(blank=True, default='', help_text='The error raised by the last failed processing attempt.'),
+        ),
+        migrations.AddField(
+            model_name='webhookevent',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='When a worker may next claim the event. Also acts as the lease expiry while it is processing.'),
+        ),
+        migrations.AddField(
+            model_name='webhookevent',
+            name='processed_at',
+            field=models.DateTimeField(blank=True, help_text='When processing last finished, successfully or not.', null=True),
+        ),
+        migrations.AddField(
+            model_name='webhookevent',
+            name='processing_duration_ms',
+            field=models.PositiveIntegerField(blank=True, help_text='How long the last processing attempt took, in milliseconds.', null=True),
+        ),
+        migrations.AddField(
+            model_name='webhookevent',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='pending', help_text='Where the event is in the webhook processing queue.', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='webhookevent',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='webhook_queue_idx'),
+        ),
+        migrations.RunPython(
+            mark_existing_events_processed, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_webhookevent_queue_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhookevent',
+            name='raw_body',
+            field=models.BinaryField(blank=True, help_text='The zlib-compressed request body, kept only when STRIPE_WEBHOOK_STORE_RAW_BODY is enabled.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='webhookevent',
+            name='payload',
+            field=models.JSONField(blank=True, help_text='The Stripe event, pruned to the fields the webhook handlers use.', null=True),
+        ),
+    ]
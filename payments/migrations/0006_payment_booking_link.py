@@ -0,0 +1,46 @@
+# Generated by Django 5.2 on 2026-10-19 03:32
+
+from django.db import migrations, models
+
+
+def backfill_booking_link(apps, schema_editor):
+    Payment = apps.get_model("payments", "Payment")
+    # Service links are applied last so they win, matching Payment.sync_booking_link.
+    for booking_type, booking_field, temp_field in (
+        ("sales_booking", "sales_booking", "temp_sales_booking"),
+        ("service_booking", "service_booking", "temp_service_booking"),
+    ):
+        Payment.objects.filter(**{f"{temp_field}__isnull": False}).update(
+            booking_type=booking_type, booking_id=None
+        )
+        Payment.objects.filter(**{f"{booking_field}__isnull": False}).update(
+            booking_type=booking_type, booking_id=models.F(f"{booking_field}_id")
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_remove_motorcycle_warranty_years_and_more'),
+        ('payments', '0005_webhookevent_raw_body'),
+        ('refunds', '0002_initial'),
+        ('service', '0004_remove_servicetype_estimated_duration_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='booking_id',
+            field=models.BigIntegerField(blank=True, help_text='The primary key of the permanent booking, once the payment is linked to one.', null=True),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='booking_type',
+            field=models.CharField(blank=True, choices=[('service_booking', 'Service booking'), ('sales_booking', 'Sales booking')], help_text='Which kind of booking this payment belongs to. Kept in step with the booking links on save.', max_length=20, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['booking_type', 'booking_id'], name='payment_booking_idx'),
+        ),
+        migrations.RunPython(backfill_booking_link, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-19 04:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0006_payment_booking_link'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhookevent',
+            name='external_call_ms',
+            field=models.PositiveIntegerField(blank=True, help_text='How much of the last processing attempt was spent calling Stripe, SMTP or MechanicDesk, in milliseconds.', null=True),
+        ),
+        migrations.AddField(
+            model_name='webhookevent',
+            name='handler_name',
+            field=models.CharField(blank=True, default='', help_text='The WEBHOOK_HANDLERS function the event was dispatched to, if any.', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='webhookevent',
+            name='query_count',
+            field=models.PositiveIntegerField(blank=True, help_text='How many database queries the last processing attempt ran.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='webhookevent',
+            index=models.Index(fields=['processed_at'], name='webhook_processed_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-19 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0011_kpi_date_indexes'),
+        ('payments', '0007_webhookevent_metrics'),
+        ('refunds', '0004_refundrequest_queue_state'),
+        ('service', '0004_remove_servicetype_estimated_duration_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['created_at'], name='payment_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 06:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_kpi_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhookevent',
+            name='claim_token',
+            field=models.UUIDField(blank=True, help_text='Set by the worker that last claimed the event, so it only processes the events it actually won.', null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 06:37
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0009_webhookevent_claim_token'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='payment_booking_idx',
+        ),
+    ]
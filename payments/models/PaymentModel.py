@@ -3,6 +3,17 @@ import uuid
 
 
 class Payment(models.Model):
+    BOOKING_TYPE_CHOICES = [
+        ("service_booking", "Service booking"),
+        ("sales_booking", "Sales booking"),
+    ]
+
+    # booking_type -> (permanent booking field, temporary booking field)
+    BOOKING_RELATIONS = {
+        "service_booking": ("service_booking", "temp_service_booking"),
+        "sales_booking": ("sales_booking", "temp_sales_booking"),
+    }
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     temp_service_booking = models.OneToOneField(
@@ -59,6 +70,20 @@ class Payment(models.Model):
         help_text="The sales customer profile associated with this payment.",
     )
 
+    booking_type = models.CharField(
+        max_length=20,
+        choices=BOOKING_TYPE_CHOICES,
+        null=True,
+        blank=True,
+        help_text="Which kind of booking this payment belongs to. Kept in step with the booking links on save.",
+    )
+
+    booking_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="The primary key of the permanent booking, once the payment is linked to one.",
+    )
+
     stripe_payment_intent_id = models.CharField(
         max_length=100,
         unique=True,
@@ -127,9 +152,29 @@ class Payment(models.Model):
         verbose_name = "Payment"
         verbose_name_plural = "Payments"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="payment_created_idx"),
+        ]
 
     def __str__(self):
         return f"Payment {self.id} - {self.amount} {self.currency} - {self.status}"
 
+    def sync_booking_link(self):
+        """
+        Sets booking_type and booking_id from the booking foreign key ids,
+        which are already on the instance, so no related rows are loaded.
+        """
+        for booking_type, (booking_field, temp_field) in self.BOOKING_RELATIONS.items():
+            booking_id = getattr(self, f"{booking_field}_id")
+            if booking_id is not None or getattr(self, f"{temp_field}_id") is not None:
+                self.booking_type = booking_type
+                self.booking_id = booking_id
+                return
+        self.booking_id = None
+
     def save(self, *args, **kwargs):
+        self.sync_booking_link()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = set(update_fields) | {"booking_type", "booking_id"}
         super().save(*args, **kwargs)
@@ -1,8 +1,17 @@
 from django.db import models
+from django.utils import timezone
 import uuid
+import zlib
 
 
 class WebhookEvent(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("processing", "Processing"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     stripe_event_id = models.CharField(
         max_length=100,
@@ -20,13 +29,84 @@ class WebhookEvent(models.Model):
     payload = models.JSONField(
         blank=True,
         null=True,
-        help_text="The full JSON payload of the Stripe webhook event.",
+        help_text="The Stripe event, pruned to the fields the webhook handlers use.",
+    )
+    raw_body = models.BinaryField(
+        blank=True,
+        null=True,
+        help_text="The zlib-compressed request body, kept only when STRIPE_WEBHOOK_STORE_RAW_BODY is enabled.",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default="pending",
+        help_text="Where the event is in the webhook processing queue.",
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="How many times a worker has tried to process the event.",
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="When a worker may next claim the event. Also acts as the lease expiry while it is processing.",
+    )
+    claim_token = models.UUIDField(
+        blank=True,
+        null=True,
+        help_text="Set by the worker that last claimed the event, so it only processes the events it actually won.",
+    )
+    processed_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When processing last finished, successfully or not.",
+    )
+    processing_duration_ms = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        help_text="How long the last processing attempt took, in milliseconds.",
+    )
+    handler_name = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        help_text="The WEBHOOK_HANDLERS function the event was dispatched to, if any.",
+    )
+    query_count = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        help_text="How many database queries the last processing attempt ran.",
+    )
+    external_call_ms = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        help_text="How much of the last processing attempt was spent calling Stripe, SMTP or MechanicDesk, in milliseconds.",
+    )
+    last_error = models.TextField(
+        blank=True,
+        default="",
+        help_text="The error raised by the last failed processing attempt.",
     )
 
     class Meta:
         verbose_name = "Stripe Webhook Event"
         verbose_name_plural = "Stripe Webhook Events"
         ordering = ["-received_at"]
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="webhook_queue_idx",
+            ),
+            models.Index(
+                fields=["processed_at"],
+                name="webhook_processed_idx",
+            ),
+        ]
+
+    @property
+    def raw_body_text(self):
+        if self.raw_body is None:
+            return None
+        return zlib.decompress(bytes(self.raw_body)).decode("utf-8")
 
     def __str__(self):
         return f"Event: {self.stripe_event_id} ({self.event_type}) received at {self.received_at}"
@@ -0,0 +1,43 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from payments.models import WebhookEvent
+from payments.tests.test_helpers.model_factories import WebhookEventFactory
+
+
+class PruneWebhookEventsCommandTest(TestCase):
+    def make_event(self, status, days_old):
+        webhook_event = WebhookEventFactory(status=status)
+        WebhookEvent.objects.filter(pk=webhook_event.pk).update(
+            received_at=timezone.now() - datetime.timedelta(days=days_old)
+        )
+        return webhook_event
+
+    def test_deletes_only_events_past_retention(self):
+        old_succeeded = self.make_event("succeeded", 100)
+        recent_succeeded = self.make_event("succeeded", 10)
+        old_failed = self.make_event("failed", 100)
+        very_old_failed = self.make_event("failed", 400)
+        old_pending = self.make_event("pending", 400)
+
+        out = StringIO()
+        call_command("prune_webhook_events", batch_size=1, stdout=out)
+
+        remaining = set(WebhookEvent.objects.values_list("pk", flat=True))
+        self.assertEqual(remaining, {recent_succeeded.pk, old_failed.pk, old_pending.pk})
+        self.assertNotIn(old_succeeded.pk, remaining)
+        self.assertNotIn(very_old_failed.pk, remaining)
+        self.assertIn("Deleted 1 processed and 1 failed webhook events.", out.getvalue())
+
+    def test_dry_run_deletes_nothing(self):
+        self.make_event("succeeded", 100)
+
+        out = StringIO()
+        call_command("prune_webhook_events", dry_run=True, stdout=out)
+
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+        self.assertIn("[dry run] would delete 1 processed", out.getvalue())
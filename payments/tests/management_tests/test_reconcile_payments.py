@@ -0,0 +1,198 @@
+import json
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+import stripe
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.standin_servers import running_standin_servers
+from dashboard.models import DailyKPI
+from payments.models import Payment
+from payments.tests.test_helpers.model_factories import PaymentFactory
+from payments.utils.stripe_gateway import configure_stripe
+from refunds.models import RefundRequest
+from refunds.tests.test_helpers.model_factories import RefundRequestFactory
+
+
+class ReconcilePaymentsCommandTest(TestCase):
+    def setUp(self):
+        servers_context = running_standin_servers()
+        self.servers = servers_context.__enter__()
+        self.addCleanup(servers_context.__exit__, None, None, None)
+
+        overrides = override_settings(
+            STRIPE_API_BASE=self.servers.stripe_url,
+            STRIPE_SECRET_KEY="sk_test_standin",
+            STRIPE_MAX_NETWORK_RETRIES=0,
+        )
+        overrides.enable()
+        self.addCleanup(configure_stripe)
+        self.addCleanup(overrides.disable)
+        configure_stripe()
+
+    def run_command(self, **options):
+        out = StringIO()
+        call_command("reconcile_payments", stdout=out, **options)
+        return out.getvalue()
+
+    def paid_intent(self, amount):
+        intent = stripe.PaymentIntent.create(amount=amount, currency="aud")
+        return stripe.PaymentIntent.confirm(intent.id)
+
+    def test_corrects_payment_status_and_amount(self):
+        intent = self.paid_intent(5000)
+        payment = PaymentFactory(
+            stripe_payment_intent_id=intent.id,
+            status="requires_payment_method",
+            amount=Decimal("40.00"),
+            refunded_amount=Decimal("0.00"),
+        )
+
+        output = self.run_command()
+
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, "succeeded")
+        self.assertEqual(payment.amount, Decimal("50.00"))
+        self.assertIn("Updated 1 payments", output)
+
+    def test_applies_refunds_to_payments_and_refund_requests(self):
+        full = self.paid_intent(5000)
+        partial = self.paid_intent(8000)
+        full_refund = stripe.Refund.create(payment_intent=full.id)
+        partial_refund = stripe.Refund.create(payment_intent=partial.id, amount=2000)
+
+        full_payment = PaymentFactory(
+            stripe_payment_intent_id=full.id,
+            status="succeeded",
+            amount=Decimal("50.00"),
+            refunded_amount=Decimal("0.00"),
+        )
+        partial_payment = PaymentFactory(
+            stripe_payment_intent_id=partial.id,
+            status="succeeded",
+            amount=Decimal("80.00"),
+            refunded_amount=Decimal("0.00"),
+        )
+        full_request = RefundRequestFactory(
+            payment=full_payment, stripe_refund_id=full_refund.id, status="approved"
+        )
+        partial_request = RefundRequestFactory(
+            payment=partial_payment, stripe_refund_id=partial_refund.id, status="approved"
+        )
+
+        self.run_command(batch_size=1)
+
+        full_payment.refresh_from_db()
+        partial_payment.refresh_from_db()
+        self.assertEqual(full_payment.status, "refunded")
+        self.assertEqual(full_payment.refunded_amount, Decimal("50.00"))
+        self.assertEqual(partial_payment.status, "partially_refunded")
+        self.assertEqual(partial_payment.refunded_amount, Decimal("20.00"))
+        self.assertEqual(
+            RefundRequest.objects.get(pk=full_request.pk).status, "refunded"
+        )
+        self.assertEqual(
+            RefundRequest.objects.get(pk=partial_request.pk).status,
+            "partially_refunded",
+        )
+
+    def test_loads_local_rows_in_bulk(self):
+        for _ in range(3):
+            intent = self.paid_intent(1000)
+            PaymentFactory(
+                stripe_payment_intent_id=intent.id,
+                status="processing",
+                amount=Decimal("10.00"),
+                refunded_amount=Decimal("0.00"),
+            )
+
+        # One query loads the payments and one bulk update writes them. There
+        # are no refunds, so no refund requests are loaded.
+        with patch(
+            "payments.management.commands.reconcile_payments.refresh_daily_kpis"
+        ) as refresh, self.assertNumQueries(2):
+            self.run_command()
+
+        self.assertEqual(Payment.objects.filter(status="succeeded").count(), 3)
+        refresh.assert_called_once_with({timezone.localdate()})
+
+    def test_refreshes_kpis_for_reconciled_rows(self):
+        intent = self.paid_intent(5000)
+        refund = stripe.Refund.create(payment_intent=intent.id, amount=2000)
+        payment = PaymentFactory(
+            stripe_payment_intent_id=intent.id,
+            status="processing",
+            amount=Decimal("50.00"),
+            refunded_amount=Decimal("0.00"),
+        )
+        RefundRequestFactory(
+            payment=payment,
+            stripe_refund_id=refund.id,
+            status="approved",
+            amount_to_refund=Decimal("20.00"),
+            processed_at=None,
+        )
+        DailyKPI.objects.all().delete()
+
+        self.run_command()
+
+        kpi = DailyKPI.objects.get(date=timezone.localdate())
+        self.assertEqual(kpi.revenue, Decimal("50.00"))
+        self.assertEqual(kpi.refunds, Decimal("20.00"))
+        self.assertEqual(kpi.refund_count, 1)
+
+    def test_dry_run_writes_report_without_changes(self):
+        intent = self.paid_intent(5000)
+        payment = PaymentFactory(
+            stripe_payment_intent_id=intent.id,
+            status="processing",
+            amount=Decimal("50.00"),
+            refunded_amount=Decimal("0.00"),
+        )
+        orphan = stripe.PaymentIntent.create(amount=100, currency="aud")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            report_path = os.path.join(tmp, "drift.json")
+            output = self.run_command(dry_run=True, report=report_path)
+            with open(report_path) as report_file:
+                report = json.load(report_file)
+
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, "processing")
+        self.assertIn("[dry run] would update 1 payments", output)
+        self.assertTrue(report["dry_run"])
+        self.assertIn(
+            {
+                "object": "payment",
+                "id": str(payment.id),
+                "stripe_id": intent.id,
+                "field": "status",
+                "local": "processing",
+                "stripe": "succeeded",
+            },
+            report["drift"],
+        )
+        self.assertIn(
+            orphan.id,
+            [entry["stripe_id"] for entry in report["drift"] if entry["field"] == "missing"],
+        )
+
+    def test_matching_rows_are_left_alone(self):
+        intent = self.paid_intent(5000)
+        PaymentFactory(
+            stripe_payment_intent_id=intent.id,
+            status="succeeded",
+            amount=Decimal("50.00"),
+            currency="AUD",
+            refunded_amount=Decimal("0.00"),
+        )
+
+        output = self.run_command()
+
+        self.assertIn("Updated 0 payments", output)
+        self.assertIn("0 differences found", output)
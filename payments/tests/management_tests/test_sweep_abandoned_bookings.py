@@ -0,0 +1,150 @@
+import datetime
+from io import StringIO
+from unittest.mock import patch
+
+import stripe
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from inventory.models import TempSalesBooking
+from inventory.tests.test_helpers.model_factories import TempSalesBookingFactory
+from payments.models import Payment
+from payments.tests.test_helpers.model_factories import PaymentFactory
+from service.models import TempServiceBooking
+from service.tests.test_helpers.model_factories import (
+    ServiceBookingFactory,
+    TempServiceBookingFactory,
+)
+
+COMMAND_STRIPE = "payments.management.commands.sweep_abandoned_bookings.stripe.PaymentIntent"
+
+
+class SweepAbandonedBookingsCommandTest(TestCase):
+    def age(self, obj, hours):
+        obj.__class__.objects.filter(pk=obj.pk).update(
+            updated_at=timezone.now() - datetime.timedelta(hours=hours)
+        )
+
+    def run_command(self, **options):
+        out = StringIO()
+        call_command("sweep_abandoned_bookings", stdout=out, stderr=StringIO(), **options)
+        return out.getvalue()
+
+    @patch(COMMAND_STRIPE)
+    def test_deletes_only_stale_unlinked_temp_bookings(self, mock_intent):
+        stale_service = TempServiceBookingFactory()
+        fresh_service = TempServiceBookingFactory()
+        stale_sales = TempSalesBookingFactory()
+        self.age(stale_service, 48)
+        self.age(stale_sales, 48)
+
+        paid_service = TempServiceBookingFactory()
+        self.age(paid_service, 48)
+        PaymentFactory(temp_service_booking=paid_service, status="succeeded")
+
+        output = self.run_command(batch_size=1)
+
+        self.assertFalse(TempServiceBooking.objects.filter(pk=stale_service.pk).exists())
+        self.assertFalse(TempSalesBooking.objects.filter(pk=stale_sales.pk).exists())
+        self.assertTrue(TempServiceBooking.objects.filter(pk=fresh_service.pk).exists())
+        self.assertTrue(TempServiceBooking.objects.filter(pk=paid_service.pk).exists())
+        self.assertIn("1 temporary service bookings", output)
+        self.assertIn("1 temporary sales bookings", output)
+        mock_intent.cancel.assert_not_called()
+
+    @patch(COMMAND_STRIPE)
+    def test_cancels_intent_and_deletes_abandoned_payment_and_its_temp_booking(self, mock_intent):
+        temp_booking = TempServiceBookingFactory()
+        payment = PaymentFactory(
+            temp_service_booking=temp_booking, status="requires_payment_method"
+        )
+        self.age(payment, 48)
+        self.age(temp_booking, 48)
+
+        output = self.run_command()
+
+        mock_intent.cancel.assert_called_once_with(payment.stripe_payment_intent_id)
+        self.assertFalse(Payment.objects.filter(pk=payment.pk).exists())
+        self.assertFalse(TempServiceBooking.objects.filter(pk=temp_booking.pk).exists())
+        self.assertIn("1 abandoned payments (1 Stripe intents cancelled, 0 kept)", output)
+
+    @patch(COMMAND_STRIPE)
+    def test_leaves_recent_linked_and_progressed_payments(self, mock_intent):
+        recent = PaymentFactory(status="requires_payment_method")
+        succeeded = PaymentFactory(status="succeeded")
+        linked = PaymentFactory(
+            status="requires_payment_method", service_booking=ServiceBookingFactory()
+        )
+        self.age(succeeded, 48)
+        self.age(linked, 48)
+
+        self.run_command()
+
+        self.assertEqual(
+            Payment.objects.filter(pk__in=[recent.pk, succeeded.pk, linked.pk]).count(), 3
+        )
+        mock_intent.cancel.assert_not_called()
+
+    @patch(COMMAND_STRIPE)
+    def test_keeps_payment_when_intent_has_moved_on(self, mock_intent):
+        payment = PaymentFactory(status="requires_payment_method")
+        self.age(payment, 48)
+        mock_intent.cancel.side_effect = stripe.error.InvalidRequestError(
+            "unexpected state", None, code="payment_intent_unexpected_state"
+        )
+        mock_intent.retrieve.return_value.status = "succeeded"
+
+        output = self.run_command()
+
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, "succeeded")
+        self.assertIn("0 abandoned payments (0 Stripe intents cancelled, 1 kept)", output)
+
+    @patch(COMMAND_STRIPE)
+    def test_deletes_payment_when_intent_already_cancelled(self, mock_intent):
+        payment = PaymentFactory(status="requires_payment_method")
+        self.age(payment, 48)
+        mock_intent.cancel.side_effect = stripe.error.InvalidRequestError(
+            "unexpected state", None, code="payment_intent_unexpected_state"
+        )
+        mock_intent.retrieve.return_value.status = "canceled"
+
+        self.run_command()
+
+        self.assertFalse(Payment.objects.filter(pk=payment.pk).exists())
+
+    @patch(COMMAND_STRIPE)
+    def test_keeps_payment_when_stripe_unreachable(self, mock_intent):
+        payment = PaymentFactory(status="requires_payment_method")
+        self.age(payment, 48)
+        mock_intent.cancel.side_effect = stripe.error.APIConnectionError("down")
+
+        self.run_command()
+
+        self.assertTrue(Payment.objects.filter(pk=payment.pk).exists())
+
+    @patch(COMMAND_STRIPE)
+    def test_dry_run_changes_nothing(self, mock_intent):
+        payment = PaymentFactory(status="requires_payment_method")
+        temp_booking = TempSalesBookingFactory()
+        self.age(payment, 48)
+        self.age(temp_booking, 48)
+
+        output = self.run_command(dry_run=True)
+
+        self.assertTrue(Payment.objects.filter(pk=payment.pk).exists())
+        self.assertTrue(TempSalesBooking.objects.filter(pk=temp_booking.pk).exists())
+        self.assertIn("[dry run] would delete 1 abandoned payments", output)
+        mock_intent.cancel.assert_not_called()
+
+    @patch(COMMAND_STRIPE)
+    def test_age_thresholds_are_configurable(self, mock_intent):
+        temp_booking = TempServiceBookingFactory()
+        self.age(temp_booking, 3)
+
+        self.run_command()
+        self.assertTrue(TempServiceBooking.objects.filter(pk=temp_booking.pk).exists())
+
+        self.run_command(temp_booking_age_hours=2)
+        self.assertFalse(TempServiceBooking.objects.filter(pk=temp_booking.pk).exists())
@@ -4,6 +4,7 @@ from payments.tests.test_helpers.model_factories import PaymentFactory
 from service.tests.test_helpers.model_factories import (
     ServiceBookingFactory,
     ServiceProfileFactory,
+    TempServiceBookingFactory,
 )
 from inventory.tests.test_helpers.model_factories import (
     SalesBookingFactory,
@@ -139,3 +140,31 @@ class PaymentModelTest(TestCase):
         self.assertEqual(ordered_payments[0].id, payment2.id)
         self.assertEqual(ordered_payments[1].id, payment3.id)
         self.assertEqual(ordered_payments[2].id, payment1.id)
+
+    def test_booking_link_follows_temp_and_permanent_bookings(self):
+        temp_booking = TempServiceBookingFactory()
+        payment = PaymentFactory(temp_service_booking=temp_booking)
+        self.assertEqual(payment.booking_type, "service_booking")
+        self.assertIsNone(payment.booking_id)
+
+        service_booking = ServiceBookingFactory()
+        payment.service_booking = service_booking
+        payment.temp_service_booking = None
+        payment.save(update_fields=["service_booking", "temp_service_booking"])
+
+        payment.refresh_from_db()
+        self.assertEqual(payment.booking_type, "service_booking")
+        self.assertEqual(payment.booking_id, service_booking.pk)
+
+    def test_booking_link_for_sales_booking(self):
+        sales_booking = SalesBookingFactory()
+        payment = PaymentFactory(sales_booking=sales_booking)
+
+        self.assertEqual(payment.booking_type, "sales_booking")
+        self.assertEqual(payment.booking_id, sales_booking.pk)
+
+    def test_booking_link_empty_without_bookings(self):
+        payment = PaymentFactory()
+
+        self.assertIsNone(payment.booking_type)
+        self.assertIsNone(payment.booking_id)
@@ -57,3 +57,13 @@ class GetBookingFromPaymentTest(TestCase):
         # Current implementation prioritizes service_booking if both are present
         self.assertEqual(booking, service_booking)
         self.assertEqual(booking_type, "service_booking")
+
+    def test_only_the_booking_relation_is_loaded(self):
+        sales_booking = SalesBookingFactory()
+        payment = Payment.objects.get(pk=PaymentFactory(sales_booking=sales_booking).pk)
+
+        with self.assertNumQueries(1):
+            booking, booking_type = get_booking_from_payment(payment)
+
+        self.assertEqual(booking, sales_booking)
+        self.assertEqual(booking_type, "sales_booking")
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from payments.tests.test_helpers.model_factories import (
+    PaymentFactory,
+    WebhookEventFactory,
+)
+from payments.utils.payment_status_channel import (
+    publish_payment_processed,
+    wait_for_payment_processed,
+)
+from payments.utils.webhook_queue import process_webhook_event
+from payments.webhook_handlers import WEBHOOK_HANDLERS
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "versions": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    }
+)
+class PaymentStatusChannelTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_wait_returns_immediately_once_published(self):
+        publish_payment_processed("pi_ready")
+
+        self.assertTrue(wait_for_payment_processed("pi_ready", timeout=5))
+
+    def test_wait_times_out_without_message(self):
+        self.assertFalse(wait_for_payment_processed("pi_waiting", timeout=0.3))
+
+    def test_worker_publishes_after_handler_commits(self):
+        original_handlers = WEBHOOK_HANDLERS.copy()
+        self.addCleanup(WEBHOOK_HANDLERS.update, original_handlers)
+        WEBHOOK_HANDLERS["service_booking"] = {"payment_intent.succeeded": MagicMock()}
+
+        PaymentFactory(
+            stripe_payment_intent_id="pi_worker",
+            status="requires_confirmation",
+            service_booking=None,
+            temp_service_booking=None,
+        )
+        webhook_event = WebhookEventFactory(
+            event_type="payment_intent.succeeded",
+            payload={
+                "data": {
+                    "object": {
+                        "id": "pi_worker",
+                        "status": "succeeded",
+                        "metadata": {"booking_type": "service_booking"},
+                    }
+                }
+            },
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            process_webhook_event(webhook_event)
+            self.assertFalse(wait_for_payment_processed("pi_worker", timeout=0))
+
+        self.assertTrue(wait_for_payment_processed("pi_worker", timeout=0))
@@ -0,0 +1,177 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import stripe
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from payments.utils.stripe_gateway import (
+    cancel_payment_intent,
+    configure_stripe,
+    create_payment_intent,
+    modify_payment_intent,
+    payment_intent_client_secret,
+    payment_intent_create_key,
+    refresh_cached_payment_intent,
+    retrieve_payment_intent,
+)
+
+
+def make_intent(intent_id="pi_gateway", status="requires_payment_method", amount=5000):
+    return MagicMock(
+        id=intent_id,
+        status=status,
+        amount=amount,
+        currency="aud",
+        client_secret=f"{intent_id}_secret",
+    )
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "versions": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    }
+)
+class StripeGatewayTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("stripe.PaymentIntent.retrieve")
+    def test_retrieve_is_served_from_cache_after_first_call(self, mock_retrieve):
+        mock_retrieve.return_value = make_intent()
+
+        first = retrieve_payment_intent("pi_gateway")
+        second = retrieve_payment_intent("pi_gateway")
+
+        mock_retrieve.assert_called_once_with("pi_gateway")
+        self.assertEqual(first.status, "requires_payment_method")
+        self.assertEqual(second.amount, 5000)
+
+    @patch("stripe.PaymentIntent.retrieve")
+    def test_client_secret_is_kept_in_the_session_not_the_cache(self, mock_retrieve):
+        mock_retrieve.return_value = make_intent()
+        request = SimpleNamespace(session={})
+        live = retrieve_payment_intent("pi_gateway")
+
+        self.assertNotIn("client_secret", cache.get("payments:intent:pi_gateway"))
+        self.assertEqual(payment_intent_client_secret(request, live), "pi_gateway_secret")
+        cached = retrieve_payment_intent("pi_gateway")
+        self.assertEqual(
+            payment_intent_client_secret(request, cached), "pi_gateway_secret"
+        )
+        mock_retrieve.assert_called_once()
+
+    @patch("stripe.PaymentIntent.retrieve")
+    def test_client_secret_missing_from_the_session_is_fetched(self, mock_retrieve):
+        mock_retrieve.return_value = make_intent()
+        retrieve_payment_intent("pi_gateway")
+        request = SimpleNamespace(session={})
+
+        cached = retrieve_payment_intent("pi_gateway")
+        self.assertEqual(
+            payment_intent_client_secret(request, cached), "pi_gateway_secret"
+        )
+        self.assertEqual(mock_retrieve.call_count, 2)
+
+    @patch("stripe.PaymentIntent.retrieve")
+    def test_refresh_bypasses_cache(self, mock_retrieve):
+        mock_retrieve.return_value = make_intent()
+        retrieve_payment_intent("pi_gateway")
+        mock_retrieve.return_value = make_intent(status="succeeded")
+
+        intent = retrieve_payment_intent("pi_gateway", refresh=True)
+
+        self.assertEqual(mock_retrieve.call_count, 2)
+        self.assertEqual(intent.status, "succeeded")
+        self.assertEqual(retrieve_payment_intent("pi_gateway").status, "succeeded")
+
+    @patch("stripe.PaymentIntent.retrieve")
+    @patch("stripe.PaymentIntent.create")
+    def test_create_passes_idempotency_key_and_caches(self, mock_create, mock_retrieve):
+        mock_create.return_value = make_intent("pi_created")
+
+        create_payment_intent("key-1", amount=5000, currency="aud")
+
+        mock_create.assert_called_once_with(
+            idempotency_key="key-1", amount=5000, currency="aud"
+        )
+        self.assertEqual(retrieve_payment_intent("pi_created").amount, 5000)
+        mock_retrieve.assert_not_called()
+
+    @patch("stripe.PaymentIntent.modify")
+    def test_modify_uses_a_fresh_idempotency_key_per_call(self, mock_modify):
+        mock_modify.return_value = make_intent(amount=7000)
+
+        modify_payment_intent("pi_gateway", amount=7000)
+        modify_payment_intent("pi_gateway", amount=7000)
+
+        keys = [c.kwargs["idempotency_key"] for c in mock_modify.call_args_list]
+        self.assertNotEqual(keys[0], keys[1])
+        self.assertEqual(retrieve_payment_intent("pi_gateway").amount, 7000)
+
+    @patch("stripe.PaymentIntent.retrieve")
+    def test_webhook_refreshes_cached_state(self, mock_retrieve):
+        mock_retrieve.return_value = make_intent()
+        retrieve_payment_intent("pi_gateway")
+
+        refresh_cached_payment_intent({"id": "pi_gateway", "status": "succeeded"})
+
+        intent = retrieve_payment_intent("pi_gateway")
+        self.assertEqual(intent.status, "succeeded")
+        mock_retrieve.assert_called_once()
+
+    def test_webhook_for_uncached_intent_caches_nothing(self):
+        refresh_cached_payment_intent({"id": "pi_unknown", "status": "succeeded"})
+
+        self.assertIsNone(cache.get("payments:intent:pi_unknown"))
+
+    @patch("stripe.PaymentIntent.cancel")
+    @patch("stripe.PaymentIntent.retrieve")
+    def test_cancel_drops_cached_intent(self, mock_retrieve, mock_cancel):
+        mock_retrieve.return_value = make_intent()
+        retrieve_payment_intent("pi_gateway")
+
+        cancel_payment_intent("pi_gateway")
+        retrieve_payment_intent("pi_gateway")
+
+        mock_cancel.assert_called_once_with("pi_gateway")
+        self.assertEqual(mock_retrieve.call_count, 2)
+
+    def test_create_key_changes_with_any_param_and_replaced_intent(self):
+        params = {
+            "amount": 5000,
+            "currency": "AUD",
+            "metadata": {"booking_type": "service_booking"},
+            "description": "Service",
+        }
+        base = payment_intent_create_key("service_booking", "abc", params)
+
+        self.assertEqual(
+            base, payment_intent_create_key("service_booking", "abc", dict(params))
+        )
+        for change in (
+            {"amount": 6000},
+            {"description": "Service and tyres"},
+            {"metadata": {"booking_type": "service_booking", "service_profile_id": "7"}},
+        ):
+            self.assertNotEqual(
+                base,
+                payment_intent_create_key("service_booking", "abc", {**params, **change}),
+            )
+        self.assertNotEqual(
+            base,
+            payment_intent_create_key("service_booking", "abc", params, replaces="pi_old"),
+        )
+
+    @override_settings(STRIPE_TIMEOUT=7, STRIPE_MAX_NETWORK_RETRIES=3)
+    def test_configure_installs_shared_client(self):
+        self.addCleanup(configure_stripe)
+        configure_stripe()
+        client = stripe.default_http_client
+
+        configure_stripe()
+
+        self.assertIs(stripe.default_http_client, client)
+        self.assertIsInstance(client, stripe.RequestsClient)
+        self.assertEqual(stripe.max_network_retries, 3)
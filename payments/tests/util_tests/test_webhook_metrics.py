@@ -0,0 +1,61 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from payments.tests.test_helpers.model_factories import WebhookEventFactory
+from payments.utils.webhook_metrics import webhook_handler_metrics
+
+
+class WebhookHandlerMetricsTest(TestCase):
+    def processed_event(self, duration_ms, status="succeeded", hours_ago=1, **kwargs):
+        return WebhookEventFactory(
+            event_type=kwargs.pop("event_type", "payment_intent.succeeded"),
+            handler_name=kwargs.pop("handler_name", "handle_service_booking_succeeded"),
+            status=status,
+            processed_at=timezone.now() - datetime.timedelta(hours=hours_ago),
+            processing_duration_ms=duration_ms,
+            query_count=kwargs.pop("query_count", 10),
+            external_call_ms=kwargs.pop("external_call_ms", 0),
+            **kwargs,
+        )
+
+    def test_groups_by_event_type_and_handler(self):
+        self.processed_event(40)
+        self.processed_event(300, query_count=20, external_call_ms=200)
+        self.processed_event(7000, status="failed")
+        self.processed_event(
+            20, event_type="charge.refunded", handler_name="handle_booking_refunded"
+        )
+
+        metrics = webhook_handler_metrics(hours=24)
+
+        self.assertEqual(len(metrics["handlers"]), 2)
+        slowest = metrics["handlers"][0]
+        self.assertEqual(slowest["handler_name"], "handle_service_booking_succeeded")
+        self.assertEqual(slowest["events"], 3)
+        self.assertEqual(slowest["succeeded"], 2)
+        self.assertEqual(slowest["failed"], 1)
+        self.assertEqual(slowest["total_duration_ms"], 7340)
+        self.assertEqual(slowest["max_duration_ms"], 7000)
+        self.assertEqual(slowest["max_query_count"], 20)
+        self.assertEqual(slowest["max_external_call_ms"], 200)
+        self.assertEqual(slowest["p50_duration_ms"], 500)
+        self.assertEqual(slowest["p95_duration_ms"], 10000)
+
+        histogram = {bucket["le"]: bucket["count"] for bucket in slowest["histogram"]}
+        self.assertEqual(histogram[50], 1)
+        self.assertEqual(histogram[250], 1)
+        self.assertEqual(histogram[500], 2)
+        self.assertEqual(histogram[10000], 3)
+
+    def test_only_counts_events_in_the_window(self):
+        self.processed_event(40, hours_ago=2)
+        self.processed_event(40, hours_ago=30)
+        WebhookEventFactory(status="pending", processed_at=None)
+
+        metrics = webhook_handler_metrics(hours=24)
+
+        self.assertEqual(len(metrics["handlers"]), 1)
+        self.assertEqual(metrics["handlers"][0]["events"], 1)
+        self.assertEqual(webhook_handler_metrics(hours=1)["handlers"], [])
@@ -0,0 +1,67 @@
+import json
+
+from django.test import SimpleTestCase
+
+from payments.utils.webhook_payload import compress_webhook_body, prune_webhook_payload
+from payments.models import WebhookEvent
+
+
+class PruneWebhookPayloadTest(SimpleTestCase):
+    def test_keeps_only_fields_handlers_use(self):
+        event = {
+            "id": "evt_1",
+            "type": "charge.refunded",
+            "api_version": "2020-08-27",
+            "request": {"id": "req_1"},
+            "data": {
+                "object": {
+                    "id": "ch_1",
+                    "object": "charge",
+                    "amount_refunded": 500,
+                    "payment_intent": "pi_1",
+                    "metadata": {"booking_type": "service_booking"},
+                    "billing_details": {"name": "Someone", "address": {}},
+                    "refunds": {
+                        "object": "list",
+                        "data": [
+                            {"id": "re_1", "status": "succeeded", "created": 1, "balance_transaction": "txn_1"}
+                        ],
+                    },
+                }
+            },
+        }
+
+        pruned = prune_webhook_payload(event)
+
+        self.assertEqual(
+            pruned,
+            {
+                "id": "evt_1",
+                "type": "charge.refunded",
+                "data": {
+                    "object": {
+                        "id": "ch_1",
+                        "object": "charge",
+                        "amount_refunded": 500,
+                        "payment_intent": "pi_1",
+                        "metadata": {"booking_type": "service_booking"},
+                        "refunds": {
+                            "data": [{"id": "re_1", "status": "succeeded", "created": 1}]
+                        },
+                    }
+                },
+            },
+        )
+        json.dumps(pruned)
+
+    def test_missing_metadata_becomes_empty_dict(self):
+        event = {"id": "evt_2", "type": "payment_intent.succeeded", "data": {"object": {"id": "pi_2"}}}
+
+        self.assertEqual(prune_webhook_payload(event)["data"]["object"]["metadata"], {})
+
+    def test_raw_body_round_trip(self):
+        body = json.dumps({"id": "evt_3", "padding": "x" * 1000}).encode("utf-8")
+        compressed = compress_webhook_body(body)
+
+        self.assertLess(len(compressed), len(body))
+        self.assertEqual(WebhookEvent(raw_body=compressed).raw_body_text, body.decode("utf-8"))
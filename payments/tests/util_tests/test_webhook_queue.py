@@ -0,0 +1,248 @@
+import datetime
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+from django.db.models.query import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from core.external_calls import external_call
+from payments.models import WebhookEvent
+from payments.tests.test_helpers.model_factories import (
+    PaymentFactory,
+    WebhookEventFactory,
+)
+from payments.utils.webhook_queue import (
+    claim_webhook_events,
+    run_webhook_event,
+    webhook_retry_delay,
+)
+from payments.webhook_handlers import WEBHOOK_HANDLERS
+
+
+def intent_payload(intent_id, status="succeeded", metadata=None):
+    return {
+        "data": {
+            "object": {
+                "id": intent_id,
+                "status": status,
+                "amount": 10000,
+                "currency": "aud",
+                "metadata": metadata or {},
+            }
+        }
+    }
+
+
+class WebhookQueueTest(TestCase):
+    def setUp(self):
+        self._original_webhook_handlers = WEBHOOK_HANDLERS.copy()
+        WEBHOOK_HANDLERS.clear()
+        self.handler = MagicMock()
+        self.handler.__name__ = "handle_test_booking"
+        WEBHOOK_HANDLERS["service_booking"] = {
+            "payment_intent.succeeded": self.handler
+        }
+
+    def tearDown(self):
+        WEBHOOK_HANDLERS.clear()
+        WEBHOOK_HANDLERS.update(self._original_webhook_handlers)
+
+    def make_event(self, intent_id="pi_queue", **kwargs):
+        PaymentFactory(
+            stripe_payment_intent_id=intent_id,
+            status="requires_confirmation",
+            service_booking=None,
+            temp_service_booking=None,
+        )
+        return WebhookEventFactory(
+            event_type="payment_intent.succeeded",
+            payload=intent_payload(intent_id, metadata={"booking_type": "service_booking"}),
+            **kwargs,
+        )
+
+    def test_claim_takes_due_events_in_order_and_leases_them(self):
+        now = timezone.now()
+        later = self.make_event("pi_later")
+        earlier = self.make_event("pi_earlier")
+        # received_at is auto_now_add, so backdate it after creation.
+        WebhookEvent.objects.filter(pk=earlier.pk).update(
+            received_at=now - datetime.timedelta(minutes=1)
+        )
+        self.make_event(
+            "pi_future", next_attempt_at=now + datetime.timedelta(minutes=5)
+        )
+        self.make_event("pi_done", status="succeeded")
+
+        claimed = claim_webhook_events(batch_size=10)
+
+        self.assertEqual([e.pk for e in claimed], [earlier.pk, later.pk])
+        for webhook_event in claimed:
+            self.assertEqual(webhook_event.status, "processing")
+            self.assertEqual(webhook_event.attempts, 1)
+            self.assertGreater(webhook_event.next_attempt_at, now)
+
+        self.assertEqual(claim_webhook_events(batch_size=10), [])
+
+    def test_concurrent_claims_of_the_same_batch_do_not_overlap(self):
+        webhook_event = self.make_event()
+        original_update = QuerySet.update
+        rival_claims = []
+
+        def update_after_rival_claim(queryset, **kwargs):
+            # Another worker picked the same candidates and claims them
+            # between this worker's SELECT and its UPDATE.
+            with patch.object(QuerySet, "update", original_update):
+                rival_claims.append(claim_webhook_events(batch_size=10))
+            return original_update(queryset, **kwargs)
+
+        with patch.object(QuerySet, "update", update_after_rival_claim):
+            claimed = claim_webhook_events(batch_size=10)
+
+        self.assertEqual([e.pk for e in rival_claims[0]], [webhook_event.pk])
+        self.assertEqual(claimed, [])
+        webhook_event.refresh_from_db()
+        self.assertEqual(webhook_event.attempts, 1)
+        self.assertEqual(webhook_event.claim_token, rival_claims[0][0].claim_token)
+
+    def test_expired_lease_can_be_reclaimed(self):
+        webhook_event = self.make_event(
+            status="processing",
+            attempts=1,
+            next_attempt_at=timezone.now() - datetime.timedelta(seconds=1),
+        )
+
+        claimed = claim_webhook_events(batch_size=10)
+
+        self.assertEqual([e.pk for e in claimed], [webhook_event.pk])
+        self.assertEqual(claimed[0].attempts, 2)
+
+    def test_lease_is_renewed_before_each_event_is_processed(self):
+        self.make_event("pi_first")
+        self.make_event("pi_second")
+        first, second = claim_webhook_events(batch_size=10, lease_seconds=60)
+        leases = []
+
+        def handler(payment_obj, event_data):
+            leases.append(WebhookEvent.objects.get(pk=second.pk).next_attempt_at)
+
+        self.handler.side_effect = handler
+        run_webhook_event(first)
+        before = timezone.now()
+        run_webhook_event(second, lease_seconds=600)
+
+        self.assertGreaterEqual(
+            leases[1], before + datetime.timedelta(seconds=600)
+        )
+        self.assertGreater(leases[1], leases[0])
+
+    def test_reclaimed_event_is_skipped(self):
+        self.make_event()
+        webhook_event = claim_webhook_events(batch_size=1)[0]
+        WebhookEvent.objects.filter(pk=webhook_event.pk).update(
+            next_attempt_at=timezone.now() - datetime.timedelta(seconds=1)
+        )
+        rival = claim_webhook_events(batch_size=1)[0]
+
+        self.assertIsNone(run_webhook_event(webhook_event))
+
+        self.handler.assert_not_called()
+        rival.refresh_from_db()
+        self.assertEqual(rival.status, "processing")
+        self.assertEqual(rival.attempts, 2)
+
+    def test_outcome_is_not_recorded_once_the_event_is_reclaimed(self):
+        self.make_event()
+        webhook_event = claim_webhook_events(batch_size=1)[0]
+        rival_token = uuid.uuid4()
+
+        def handler(payment_obj, event_data):
+            # The lease runs out mid-way and another worker claims the event.
+            WebhookEvent.objects.filter(pk=webhook_event.pk).update(
+                claim_token=rival_token
+            )
+
+        self.handler.side_effect = handler
+
+        self.assertTrue(run_webhook_event(webhook_event))
+
+        stored = WebhookEvent.objects.get(pk=webhook_event.pk)
+        self.assertEqual(stored.status, "processing")
+        self.assertIsNone(stored.processed_at)
+        self.assertEqual(stored.claim_token, rival_token)
+
+    def test_success_records_state_and_duration(self):
+        self.make_event()
+        webhook_event = claim_webhook_events(batch_size=1)[0]
+
+        self.assertTrue(run_webhook_event(webhook_event))
+
+        webhook_event.refresh_from_db()
+        self.assertEqual(webhook_event.status, "succeeded")
+        self.assertIsNotNone(webhook_event.processed_at)
+        self.assertIsNotNone(webhook_event.processing_duration_ms)
+        self.handler.assert_called_once()
+
+    def test_records_handler_queries_and_external_call_time(self):
+        def handler(payment_obj, event_data):
+            WebhookEvent.objects.count()
+            with external_call():
+                time.sleep(0.02)
+
+        self.handler.side_effect = handler
+        self.make_event()
+        webhook_event = claim_webhook_events(batch_size=1)[0]
+
+        run_webhook_event(webhook_event)
+
+        webhook_event.refresh_from_db()
+        self.assertEqual(webhook_event.handler_name, "handle_test_booking")
+        # The payment lock, the payment save and the handler's own query.
+        self.assertGreaterEqual(webhook_event.query_count, 3)
+        self.assertGreaterEqual(webhook_event.external_call_ms, 20)
+        self.assertGreaterEqual(
+            webhook_event.processing_duration_ms, webhook_event.external_call_ms
+        )
+
+    def test_failure_is_rescheduled_with_backoff(self):
+        self.handler.side_effect = RuntimeError("MechanicDesk down")
+        self.make_event()
+        webhook_event = claim_webhook_events(batch_size=1)[0]
+
+        before = timezone.now()
+        self.assertFalse(run_webhook_event(webhook_event, max_attempts=3))
+
+        webhook_event.refresh_from_db()
+        self.assertEqual(webhook_event.status, "pending")
+        self.assertIn("MechanicDesk down", webhook_event.last_error)
+        self.assertGreaterEqual(
+            webhook_event.next_attempt_at, before + webhook_retry_delay(1)
+        )
+
+    def test_failure_after_max_attempts_is_final(self):
+        self.handler.side_effect = RuntimeError("still down")
+        self.make_event(attempts=2)
+        webhook_event = claim_webhook_events(batch_size=1)[0]
+
+        run_webhook_event(webhook_event, max_attempts=3)
+
+        webhook_event.refresh_from_db()
+        self.assertEqual(webhook_event.status, "failed")
+        self.assertEqual(webhook_event.attempts, 3)
+        self.assertEqual(claim_webhook_events(batch_size=1), [])
+
+    def test_retry_delay_grows_and_is_capped(self):
+        self.assertLess(webhook_retry_delay(1), webhook_retry_delay(2))
+        self.assertEqual(webhook_retry_delay(50), webhook_retry_delay(60))
+
+    def test_unknown_payment_is_treated_as_done(self):
+        webhook_event = WebhookEventFactory(
+            event_type="payment_intent.succeeded", payload=intent_payload("pi_missing")
+        )
+        webhook_event = claim_webhook_events(batch_size=1)[0]
+
+        self.assertTrue(run_webhook_event(webhook_event))
+        self.assertEqual(
+            WebhookEvent.objects.get(pk=webhook_event.pk).status, "succeeded"
+        )
@@ -0,0 +1,48 @@
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+
+from payments.tests.test_helpers.model_factories import WebhookEventFactory
+from users.tests.test_helpers.model_factories import UserFactory
+
+
+class WebhookMetricsViewTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("payments:webhook_metrics")
+        WebhookEventFactory(
+            event_type="charge.refunded",
+            handler_name="handle_booking_refunded",
+            status="succeeded",
+            processed_at=timezone.now(),
+            processing_duration_ms=120,
+            query_count=14,
+            external_call_ms=80,
+        )
+
+    def test_staff_see_the_metrics_page(self):
+        self.client.force_login(UserFactory(is_staff=True))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "payments/admin_webhook_metrics.html")
+        self.assertContains(response, "handle_booking_refunded")
+
+    def test_json_export(self):
+        self.client.force_login(UserFactory(is_staff=True))
+
+        response = self.client.get(self.url, {"hours": "6", "format": "json"})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["window_hours"], 6)
+        self.assertEqual(data["handlers"][0]["event_type"], "charge.refunded")
+        self.assertEqual(data["handlers"][0]["max_query_count"], 14)
+
+    def test_non_staff_are_redirected(self):
+        self.client.force_login(UserFactory())
+
+        response = self.client.get(self.url, {"format": "json"})
+
+        self.assertEqual(response.status_code, 302)
@@ -1,4 +1,6 @@
 from django.test import TestCase, Client
+from django.core.management import call_command
+from io import StringIO
 from django.urls import reverse
 from django.conf import settings
 from django.utils import timezone
@@ -172,6 +174,13 @@ class StripeWebhookViewTest(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(WebhookEvent.objects.count(), 1)
+        self.assertEqual(WebhookEvent.objects.first().status, "pending")
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, "requires_confirmation")
+
+        call_command("process_webhook_events", once=True, stdout=StringIO())
+
+        self.assertEqual(WebhookEvent.objects.first().status, "succeeded")
         payment.refresh_from_db()
         self.assertEqual(payment.status, "succeeded")
 
@@ -203,3 +212,158 @@ class StripeWebhookViewTest(TestCase):
             HTTP_STRIPE_SIGNATURE="valid_sig",
         )
         self.assertEqual(response.status_code, 200)
+
+    @patch("stripe.Webhook.construct_event")
+    def test_duplicate_event_is_recorded_once(self, mock_construct_event):
+        mock_event = self._generate_mock_stripe_event(
+            "payment_intent.succeeded", "pi_duplicate", "succeeded"
+        )
+        mock_construct_event.return_value = mock_event
+
+        for _ in range(2):
+            response = self.client.post(
+                self.webhook_url,
+                json.dumps(mock_event.to_dict()),
+                content_type="application/json",
+                HTTP_STRIPE_SIGNATURE="valid_sig",
+            )
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+
+    @patch("stripe.Webhook.construct_event")
+    def test_duplicate_event_is_rejected_before_payload_is_built(self, mock_construct_event):
+        mock_event = self._generate_mock_stripe_event(
+            "payment_intent.succeeded", "pi_duplicate_fast", "succeeded"
+        )
+        mock_construct_event.return_value = mock_event
+        self.client.post(
+            self.webhook_url,
+            b"{}",
+            content_type="application/json",
+            HTTP_STRIPE_SIGNATURE="valid_sig",
+        )
+
+        with patch("payments.views.webhook_view.prune_webhook_payload") as mock_prune:
+            with self.assertNumQueries(1):
+                response = self.client.post(
+                    self.webhook_url,
+                    b"{}",
+                    content_type="application/json",
+                    HTTP_STRIPE_SIGNATURE="valid_sig",
+                )
+
+        self.assertEqual(response.status_code, 200)
+        mock_prune.assert_not_called()
+
+    @patch("stripe.Webhook.construct_event")
+    def test_concurrent_duplicate_is_acknowledged(self, mock_construct_event):
+        mock_event = self._generate_mock_stripe_event(
+            "payment_intent.succeeded", "pi_concurrent", "succeeded"
+        )
+        mock_construct_event.return_value = mock_event
+        WebhookEvent.objects.create(
+            stripe_event_id=mock_event["id"], event_type=mock_event["type"]
+        )
+
+        # The other delivery is stored after this one's duplicate check, so
+        # the insert hits the unique constraint.
+        with patch("django.db.models.query.QuerySet.exists", side_effect=[False, True]):
+            response = self.client.post(
+                self.webhook_url,
+                b"{}",
+                content_type="application/json",
+                HTTP_STRIPE_SIGNATURE="valid_sig",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+
+    @patch("stripe.Webhook.construct_event")
+    def test_event_that_cannot_be_stored_is_redelivered(self, mock_construct_event):
+        mock_construct_event.return_value = self._generate_mock_stripe_event(
+            "payment_intent.succeeded", "pi_unstored", "succeeded"
+        )
+
+        with patch(
+            "payments.views.webhook_view.prune_webhook_payload",
+            side_effect=ValueError("bad payload"),
+        ):
+            response = self.client.post(
+                self.webhook_url,
+                b"{}",
+                content_type="application/json",
+                HTTP_STRIPE_SIGNATURE="valid_sig",
+            )
+
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    @patch("stripe.Webhook.construct_event")
+    def test_stored_payload_is_pruned(self, mock_construct_event):
+        mock_construct_event.return_value = self._generate_mock_stripe_event(
+            "payment_intent.succeeded", "pi_pruned", "succeeded"
+        )
+
+        self.client.post(
+            self.webhook_url,
+            b"{}",
+            content_type="application/json",
+            HTTP_STRIPE_SIGNATURE="valid_sig",
+        )
+
+        webhook_event = WebhookEvent.objects.get()
+        self.assertNotIn("request", webhook_event.payload)
+        self.assertNotIn("description", webhook_event.payload["data"]["object"])
+        self.assertEqual(webhook_event.payload["data"]["object"]["id"], "pi_pruned")
+        self.assertIsNone(webhook_event.raw_body)
+
+    @patch("stripe.Webhook.construct_event")
+    def test_raw_body_is_compressed_when_enabled(self, mock_construct_event):
+        mock_construct_event.return_value = self._generate_mock_stripe_event(
+            "payment_intent.succeeded", "pi_raw", "succeeded"
+        )
+        body = json.dumps({"id": "evt_raw", "padding": "x" * 500})
+
+        with self.settings(STRIPE_WEBHOOK_STORE_RAW_BODY=True):
+            self.client.post(
+                self.webhook_url,
+                body,
+                content_type="application/json",
+                HTTP_STRIPE_SIGNATURE="valid_sig",
+            )
+
+        webhook_event = WebhookEvent.objects.get()
+        self.assertEqual(webhook_event.raw_body_text, body)
+
+    @patch("stripe.Webhook.construct_event")
+    def test_handler_is_not_run_inside_the_request(self, mock_construct_event):
+        payment = PaymentFactory.create(
+            stripe_payment_intent_id="pi_queued",
+            status="requires_confirmation",
+            service_booking=None,
+            temp_service_booking=None,
+        )
+        handler = MagicMock()
+        WEBHOOK_HANDLERS["service_booking"] = {"payment_intent.succeeded": handler}
+        mock_construct_event.return_value = self._generate_mock_stripe_event(
+            "payment_intent.succeeded",
+            "pi_queued",
+            "succeeded",
+            metadata={"booking_type": "service_booking"},
+        )
+
+        response = self.client.post(
+            self.webhook_url,
+            b"{}",
+            content_type="application/json",
+            HTTP_STRIPE_SIGNATURE="valid_sig",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        handler.assert_not_called()
+
+        call_command("process_webhook_events", once=True, stdout=StringIO())
+
+        handler.assert_called_once()
+        self.assertEqual(handler.call_args[0][0].pk, payment.pk)
@@ -5,4 +5,9 @@ app_name = "payments"
 
 urlpatterns = [
     path("stripe-webhook/", views.stripe_webhook, name="stripe_webhook"),
+    path(
+        "dashboard/webhook-metrics/",
+        views.WebhookMetricsView.as_view(),
+        name="webhook_metrics",
+    ),
 ]
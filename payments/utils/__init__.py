@@ -1,2 +1,5 @@
 from .get_booking_from_payment import *
 from .update_associated_bookings_and_payments import *
+from .webhook_payload import *
+from .payment_status_channel import *
+from .webhook_metrics import *
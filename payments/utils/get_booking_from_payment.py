@@ -2,10 +2,13 @@ from payments.models import Payment
 
 
 def get_booking_from_payment(payment_obj: Payment):
-    if payment_obj.service_booking:
-        return payment_obj.service_booking, "service_booking"
-
-    elif payment_obj.sales_booking:
-        return payment_obj.sales_booking, "sales_booking"
-
-    return None, None
+    # booking_type says which relation holds the booking, so only that one
+    # foreign key is followed.
+    relations = Payment.BOOKING_RELATIONS.get(payment_obj.booking_type)
+    if relations is None or payment_obj.booking_id is None:
+        return None, None
+
+    booking = getattr(payment_obj, relations[0])
+    if booking is None:
+        return None, None
+    return booking, payment_obj.booking_type
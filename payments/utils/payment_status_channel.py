@@ -0,0 +1,40 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+PAYMENT_STATUS_CHANNEL_TIMEOUT = 60 * 30
+PAYMENT_STATUS_POLL_INTERVAL = 0.25
+
+
+def _payment_status_key(payment_intent_id):
+    return f"payments:status:{payment_intent_id}"
+
+
+def publish_payment_processed(payment_intent_id):
+    """
+    Tells any waiting confirmation page that the webhook worker has finished
+    with this Payment Intent. The shared cache carries the message, so the
+    worker and web processes do not need to share memory.
+    """
+    cache.set(_payment_status_key(payment_intent_id), True, PAYMENT_STATUS_CHANNEL_TIMEOUT)
+
+
+def wait_for_payment_processed(payment_intent_id, timeout=None):
+    """
+    Blocks for up to timeout seconds until publish_payment_processed() has
+    been called for the Payment Intent. Only the cache is checked while
+    waiting. Returns True if the message arrived.
+    """
+    if timeout is None:
+        timeout = getattr(settings, "PAYMENT_STATUS_LONG_POLL_TIMEOUT", 20)
+
+    key = _payment_status_key(payment_intent_id)
+    deadline = time.monotonic() + timeout
+    while True:
+        if cache.get(key):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(PAYMENT_STATUS_POLL_INTERVAL, remaining))
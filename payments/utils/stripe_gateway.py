@@ -0,0 +1,160 @@
+import hashlib
+import json
+import uuid
+from types import SimpleNamespace
+
+import stripe
+from django.conf import settings
+from django.core.cache import cache
+
+# The fields the payment pages read from a PaymentIntent. Only these are kept
+# in the local cache. The client_secret is left out so it never sits in a
+# shared cache; payment_intent_client_secret keeps it in the session instead.
+CACHED_INTENT_FIELDS = ("id", "status", "amount", "currency")
+CLIENT_SECRETS_SESSION_KEY = "payment_intent_client_secrets"
+
+_http_client = None
+
+
+def configure_stripe():
+    """
+    Points the Stripe library at one shared HTTP client per process. The
+    client keeps its connections open between requests, has an explicit
+    timeout, and retries network failures.
+
+    Called once from PaymentsConfig.ready().
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = stripe.RequestsClient(
+            timeout=getattr(settings, "STRIPE_TIMEOUT", 10)
+        )
+    stripe.default_http_client = _http_client
+    stripe.max_network_retries = getattr(settings, "STRIPE_MAX_NETWORK_RETRIES", 2)
+    stripe.api_key = settings.STRIPE_SECRET_KEY
+    stripe.api_base = getattr(settings, "STRIPE_API_BASE", None) or "https://api.stripe.com"
+
+
+def _intent_cache_key(intent_id):
+    return f"payments:intent:{intent_id}"
+
+
+def _cache_intent(intent):
+    snapshot = {field: getattr(intent, field, None) for field in CACHED_INTENT_FIELDS}
+    cache.set(
+        _intent_cache_key(snapshot["id"]),
+        snapshot,
+        getattr(settings, "STRIPE_INTENT_CACHE_TIMEOUT", 60 * 30),
+    )
+    return intent
+
+
+def retrieve_payment_intent(intent_id, refresh=False):
+    """
+    Returns the PaymentIntent, from the local cache when possible.
+
+    A cached intent is returned as a SimpleNamespace of CACHED_INTENT_FIELDS.
+    Pass refresh=True when the live state matters, e.g. straight after the
+    customer has confirmed a payment.
+    """
+    if not refresh:
+        snapshot = cache.get(_intent_cache_key(intent_id))
+        if snapshot is not None:
+            return SimpleNamespace(**snapshot)
+    return _cache_intent(stripe.PaymentIntent.retrieve(intent_id))
+
+
+def create_payment_intent(idempotency_key, **params):
+    return _cache_intent(
+        stripe.PaymentIntent.create(idempotency_key=idempotency_key, **params)
+    )
+
+
+def payment_intent_client_secret(request, intent):
+    """
+    The intent's client_secret, for the customer's payment page.
+
+    An intent just created, modified or retrieved from Stripe carries its
+    secret, which is then kept in the customer's session, where only their
+    browser can use it. An intent served from the cache takes it from
+    there, and is fetched live only if the session does not have it.
+    """
+    client_secrets = request.session.get(CLIENT_SECRETS_SESSION_KEY, {})
+    client_secret = getattr(intent, "client_secret", None) or client_secrets.get(
+        intent.id
+    )
+    if client_secret is None:
+        client_secret = retrieve_payment_intent(intent.id, refresh=True).client_secret
+    if client_secrets.get(intent.id) != client_secret:
+        request.session[CLIENT_SECRETS_SESSION_KEY] = {
+            **client_secrets,
+            intent.id: client_secret,
+        }
+    return client_secret
+
+
+def modify_payment_intent(intent_id, **params):
+    # The key only has to cover this call's network retries; reusing one
+    # across separate edits would replay an earlier amount.
+    return _cache_intent(
+        stripe.PaymentIntent.modify(
+            intent_id, idempotency_key=f"pi-modify-{uuid.uuid4()}", **params
+        )
+    )
+
+
+def cancel_payment_intent(intent_id):
+    cache.delete(_intent_cache_key(intent_id))
+    return stripe.PaymentIntent.cancel(intent_id)
+
+
+def create_refund(idempotency_key, **params):
+    return stripe.Refund.create(idempotency_key=idempotency_key, **params)
+
+
+def list_payment_intents(created_gte, created_lte=None, page_size=100):
+    """
+    Yields every PaymentIntent created in the window, newest first, fetching
+    page_size intents per request.
+    """
+    created = {"gte": created_gte}
+    if created_lte is not None:
+        created["lte"] = created_lte
+    return stripe.PaymentIntent.list(created=created, limit=page_size).auto_paging_iter()
+
+
+def list_refunds(created_gte, created_lte=None, page_size=100):
+    """Yields every Refund created in the window, newest first."""
+    created = {"gte": created_gte}
+    if created_lte is not None:
+        created["lte"] = created_lte
+    return stripe.Refund.list(created=created, limit=page_size).auto_paging_iter()
+
+
+def refresh_cached_payment_intent(intent_data):
+    """
+    Applies the state from a payment_intent.* webhook to a cached intent, so
+    the payment pages see the change without asking Stripe.
+    """
+    key = _intent_cache_key(intent_data.get("id"))
+    snapshot = cache.get(key)
+    if snapshot is None:
+        return
+    for field in ("status", "amount", "currency"):
+        if field in intent_data:
+            snapshot[field] = intent_data[field]
+    cache.set(key, snapshot, getattr(settings, "STRIPE_INTENT_CACHE_TIMEOUT", 60 * 30))
+
+
+def payment_intent_create_key(booking_type, session_uuid, params, replaces=None):
+    """
+    Idempotency key for creating a booking's PaymentIntent with params. A
+    double-submitted page gets the same intent back. Any change to the
+    params, such as a new amount or description, or a replacement for a
+    failed intent, gets a new one, since Stripe rejects a key reused with
+    different params.
+    """
+    digest = hashlib.sha256(
+        json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:32]
+    return f"pi-create-{booking_type}-{session_uuid}-{replaces or 'new'}-{digest}"
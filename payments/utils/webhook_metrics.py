@@ -0,0 +1,83 @@
+import datetime
+
+from django.db.models import Avg, Count, Max, Q, Sum
+from django.utils import timezone
+
+from payments.models import WebhookEvent
+
+# Upper bounds of the processing time histogram, in milliseconds. Each bucket
+# counts the events that took at most that long; slower events only appear in
+# the total.
+DURATION_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _bucket_key(upper):
+    return f"le_{upper}"
+
+
+def _estimate_percentile(histogram, total, fraction):
+    """The smallest bucket bound that covers the fraction of events."""
+    if not total:
+        return None
+    for bucket in histogram:
+        if bucket["count"] >= total * fraction:
+            return bucket["le"]
+    return None
+
+
+def _round(value):
+    return round(value, 1) if value is not None else None
+
+
+def webhook_handler_metrics(hours=24):
+    """
+    Aggregates the processing stats recorded on WebhookEvent over the last
+    `hours` hours, one row per event type and handler, slowest in total first.
+
+    Everything is computed in a single grouped query over the processed_at
+    index.
+    """
+    since = timezone.now() - datetime.timedelta(hours=hours)
+    buckets = {
+        _bucket_key(upper): Count("id", filter=Q(processing_duration_ms__lte=upper))
+        for upper in DURATION_BUCKETS_MS
+    }
+    rows = (
+        WebhookEvent.objects.filter(processed_at__gte=since)
+        .values("event_type", "handler_name")
+        .annotate(
+            events=Count("id"),
+            succeeded=Count("id", filter=Q(status="succeeded")),
+            retrying=Count("id", filter=Q(status="pending")),
+            failed=Count("id", filter=Q(status="failed")),
+            total_duration_ms=Sum("processing_duration_ms"),
+            avg_duration_ms=Avg("processing_duration_ms"),
+            max_duration_ms=Max("processing_duration_ms"),
+            avg_query_count=Avg("query_count"),
+            max_query_count=Max("query_count"),
+            avg_external_call_ms=Avg("external_call_ms"),
+            max_external_call_ms=Max("external_call_ms"),
+            **buckets,
+        )
+        .order_by("-total_duration_ms", "event_type", "handler_name")
+    )
+
+    handlers = []
+    for row in rows:
+        histogram = [
+            {"le": upper, "count": row.pop(_bucket_key(upper))}
+            for upper in DURATION_BUCKETS_MS
+        ]
+        row["histogram"] = histogram
+        row["p50_duration_ms"] = _estimate_percentile(histogram, row["events"], 0.5)
+        row["p95_duration_ms"] = _estimate_percentile(histogram, row["events"], 0.95)
+        for field in ("avg_duration_ms", "avg_query_count", "avg_external_call_ms"):
+            row[field] = _round(row[field])
+        handlers.append(row)
+
+    return {
+        "window_hours": hours,
+        "since": since.isoformat(),
+        "buckets_ms": list(DURATION_BUCKETS_MS),
+        "handlers": handlers,
+    }
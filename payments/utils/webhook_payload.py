@@ -0,0 +1,54 @@
+import zlib
+
+# The parts of event["data"]["object"] read by process_webhook_event and the
+# handlers in WEBHOOK_HANDLERS (including extract_stripe_refund_data). Anything
+# else Stripe sends is dropped before the event is stored.
+WEBHOOK_OBJECT_FIELDS = (
+    "id",
+    "object",
+    "status",
+    "amount",
+    "amount_received",
+    "amount_refunded",
+    "currency",
+    "created",
+    "payment_intent",
+    "charge",
+)
+WEBHOOK_REFUND_FIELDS = ("id", "object", "status", "amount", "created", "charge")
+
+
+def _pick(source, fields):
+    return {field: source[field] for field in fields if field in source}
+
+
+def prune_webhook_payload(event):
+    """
+    Builds the compact payload stored on WebhookEvent straight from the
+    verified Stripe event, without serialising the whole event first.
+    """
+    event_object = event["data"]["object"]
+    pruned_object = _pick(event_object, WEBHOOK_OBJECT_FIELDS)
+
+    if "metadata" in event_object and event_object["metadata"]:
+        pruned_object["metadata"] = dict(event_object["metadata"])
+    else:
+        pruned_object["metadata"] = {}
+
+    refunds = event_object["refunds"] if "refunds" in event_object else None
+    if refunds and "data" in refunds:
+        pruned_object["refunds"] = {
+            "data": [_pick(refund, WEBHOOK_REFUND_FIELDS) for refund in refunds["data"]]
+        }
+
+    return {
+        "id": event["id"],
+        "type": event["type"],
+        "data": {"object": pruned_object},
+    }
+
+
+def compress_webhook_body(body):
+    """Compresses a raw request body for WebhookEvent.raw_body."""
+    return zlib.compress(body, 6)
+
@@ -0,0 +1,237 @@
+import datetime
+import logging
+import time
+import uuid
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.external_calls import track_external_calls
+from payments.models import Payment, WebhookEvent
+from payments.utils.payment_status_channel import publish_payment_processed
+from payments.utils.stripe_gateway import refresh_cached_payment_intent
+from payments.webhook_handlers import WEBHOOK_HANDLERS
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_LEASE_SECONDS = 300
+WEBHOOK_MAX_ATTEMPTS = 5
+WEBHOOK_BACKOFF_BASE_SECONDS = 30
+WEBHOOK_BACKOFF_MAX_SECONDS = 3600
+
+
+def claim_webhook_events(batch_size, lease_seconds=WEBHOOK_LEASE_SECONDS):
+    """
+    Claims up to batch_size due events for this worker.
+
+    Claimed events are moved to 'processing', leased until now +
+    lease_seconds and stamped with a fresh claim token. An event whose worker
+    died mid-way becomes claimable again once its lease runs out.
+
+    The claim is a compare-and-set: the UPDATE re-checks that each event is
+    still due, so when two workers pick the same candidates only one of them
+    wins each row. Only the events carrying this worker's token are returned.
+    """
+    now = timezone.now()
+    due = Q(status="pending") | Q(status="processing")
+    event_ids = list(
+        WebhookEvent.objects.filter(due, next_attempt_at__lte=now)
+        .order_by("received_at")
+        .values_list("id", flat=True)[:batch_size]
+    )
+    if not event_ids:
+        return []
+    claim_token = uuid.uuid4()
+    claimed = WebhookEvent.objects.filter(
+        due, id__in=event_ids, next_attempt_at__lte=now
+    ).update(
+        status="processing",
+        attempts=F("attempts") + 1,
+        next_attempt_at=now + datetime.timedelta(seconds=lease_seconds),
+        claim_token=claim_token,
+    )
+    if not claimed:
+        return []
+    return list(
+        WebhookEvent.objects.filter(claim_token=claim_token).order_by("received_at")
+    )
+
+
+def process_webhook_event(webhook_event):
+    """
+    Applies a stored Stripe event to its Payment and dispatches it to the
+    matching handler in WEBHOOK_HANDLERS. Raises if the handler fails.
+    """
+    event_type = webhook_event.event_type
+    event_data = (webhook_event.payload or {}).get("data", {}).get("object", {})
+
+    if event_type.startswith("payment_intent."):
+        lookup_id = event_data.get("id")
+    elif event_type.startswith("charge."):
+        lookup_id = event_data.get("payment_intent")
+    else:
+        return
+
+    if not lookup_id:
+        return
+
+    if event_type.startswith("payment_intent."):
+        refresh_cached_payment_intent(event_data)
+
+    try:
+        with transaction.atomic():
+            payment_obj = Payment.objects.select_for_update().get(
+                stripe_payment_intent_id=lookup_id
+            )
+
+            if (
+                event_type.startswith("payment_intent.")
+                and payment_obj.status != event_data["status"]
+            ):
+                payment_obj.status = event_data["status"]
+                if "amount" in event_data:
+                    payment_obj.amount = Decimal(event_data["amount"]) / Decimal("100")
+                if "currency" in event_data:
+                    payment_obj.currency = event_data["currency"].upper()
+                payment_obj.save()
+
+            # booking_type is denormalised onto the Payment, so resolving it
+            # does not load any of the booking relations.
+            booking_type = payment_obj.booking_type
+
+            if booking_type is None and "booking_type" in event_data.get("metadata", {}):
+                booking_type = event_data["metadata"]["booking_type"]
+            elif booking_type is None:
+                logger.error(
+                    f"Webhook Error: Could not determine booking_type for payment {payment_obj.id} from payment object or event metadata."
+                )
+
+            if booking_type and booking_type in WEBHOOK_HANDLERS:
+                handler = WEBHOOK_HANDLERS[booking_type].get(event_type)
+                if handler:
+                    webhook_event.handler_name = getattr(
+                        handler, "__name__", type(handler).__name__
+                    )
+                    try:
+                        handler(payment_obj, event_data)
+                    except Exception as e:
+                        logger.error(
+                            f"Webhook Error: Handler for {booking_type} and {event_type} failed. Error: {e}"
+                        )
+                        raise
+                    # Wake any confirmation page waiting on this payment once
+                    # the booking changes are committed.
+                    transaction.on_commit(
+                        lambda: publish_payment_processed(lookup_id)
+                    )
+            elif booking_type:
+                logger.error(
+                    f"Webhook Error: No webhook handler configuration for booking_type '{booking_type}' on payment {payment_obj.id}."
+                )
+    except Payment.DoesNotExist:
+        logger.warning(
+            f"Webhook Info: Payment with stripe_payment_intent_id={lookup_id} not found."
+        )
+
+
+def webhook_retry_delay(attempts):
+    delay = WEBHOOK_BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return datetime.timedelta(seconds=min(delay, WEBHOOK_BACKOFF_MAX_SECONDS))
+
+
+def renew_webhook_lease(webhook_event, lease_seconds=WEBHOOK_LEASE_SECONDS):
+    """
+    Extends the lease on a claimed event to now + lease_seconds, so events
+    late in a batch are not reclaimed while earlier ones are processed.
+
+    Returns False if the event no longer carries this worker's claim token,
+    i.e. its lease ran out and another worker has claimed it since.
+    """
+    return bool(
+        WebhookEvent.objects.filter(
+            pk=webhook_event.pk,
+            status="processing",
+            claim_token=webhook_event.claim_token,
+        ).update(
+            next_attempt_at=timezone.now()
+            + datetime.timedelta(seconds=lease_seconds)
+        )
+    )
+
+
+def run_webhook_event(
+    webhook_event,
+    max_attempts=WEBHOOK_MAX_ATTEMPTS,
+    lease_seconds=WEBHOOK_LEASE_SECONDS,
+):
+    """
+    Processes a claimed event and records the outcome on it, along with the
+    handler used, the time taken, the number of queries run and the time
+    spent on external calls. A failed event is rescheduled with exponential
+    backoff until max_attempts is reached, after which it is marked 'failed'.
+
+    The lease is renewed before the event is processed, and the outcome is
+    only written while the event still carries this worker's claim token.
+    Returns None without processing the event if another worker has claimed
+    it since.
+    """
+    if not renew_webhook_lease(webhook_event, lease_seconds):
+        logger.warning(
+            f"Webhook Info: Lease on event {webhook_event.stripe_event_id} was lost; leaving it to the worker that reclaimed it."
+        )
+        return None
+
+    query_count = 0
+
+    def count_query(execute, sql, params, many, context):
+        nonlocal query_count
+        query_count += 1
+        return execute(sql, params, many, context)
+
+    webhook_event.handler_name = ""
+    started = time.monotonic()
+    try:
+        with connection.execute_wrapper(count_query), track_external_calls() as external:
+            process_webhook_event(webhook_event)
+    except Exception as e:
+        finished_at = timezone.now()
+        webhook_event.last_error = f"{type(e).__name__}: {e}"
+        if webhook_event.attempts >= max_attempts:
+            webhook_event.status = "failed"
+            webhook_event.next_attempt_at = finished_at
+            logger.error(
+                f"Webhook Error: Giving up on event {webhook_event.stripe_event_id} after {webhook_event.attempts} attempts."
+            )
+        else:
+            webhook_event.status = "pending"
+            webhook_event.next_attempt_at = finished_at + webhook_retry_delay(
+                webhook_event.attempts
+            )
+    else:
+        finished_at = timezone.now()
+        webhook_event.status = "succeeded"
+        webhook_event.last_error = ""
+
+    webhook_event.processed_at = finished_at
+    webhook_event.processing_duration_ms = int((time.monotonic() - started) * 1000)
+    webhook_event.query_count = query_count
+    webhook_event.external_call_ms = int(external["seconds"] * 1000)
+    recorded = WebhookEvent.objects.filter(
+        pk=webhook_event.pk, claim_token=webhook_event.claim_token
+    ).update(
+        status=webhook_event.status,
+        next_attempt_at=webhook_event.next_attempt_at,
+        processed_at=webhook_event.processed_at,
+        processing_duration_ms=webhook_event.processing_duration_ms,
+        handler_name=webhook_event.handler_name,
+        query_count=webhook_event.query_count,
+        external_call_ms=webhook_event.external_call_ms,
+        last_error=webhook_event.last_error,
+    )
+    if not recorded:
+        logger.warning(
+            f"Webhook Info: Event {webhook_event.stripe_event_id} was reclaimed by another worker; its outcome was not recorded."
+        )
+    return webhook_event.status == "succeeded"
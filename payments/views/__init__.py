@@ -1 +1,2 @@
 from .webhook_view import *
+from .admin_views import *
@@ -0,0 +1 @@
+from .webhook_metrics_view import *
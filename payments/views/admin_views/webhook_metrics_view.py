@@ -0,0 +1,29 @@
+from django.http import JsonResponse
+from django.views.generic import TemplateView
+from core.mixins import AdminRequiredMixin
+from payments.utils.webhook_metrics import webhook_handler_metrics
+
+WINDOW_CHOICES = (1, 6, 24, 72, 168)
+
+
+class WebhookMetricsView(AdminRequiredMixin, TemplateView):
+    template_name = "payments/admin_webhook_metrics.html"
+
+    def get_window_hours(self):
+        try:
+            hours = int(self.request.GET.get("hours", 24))
+        except ValueError:
+            return 24
+        return hours if hours in WINDOW_CHOICES else 24
+
+    def get(self, request, *args, **kwargs):
+        if request.GET.get("format") == "json":
+            return JsonResponse(webhook_handler_metrics(self.get_window_hours()))
+        return super().get(request, *args, **kwargs)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["page_title"] = "Webhook Handler Metrics"
+        context["metrics"] = webhook_handler_metrics(self.get_window_hours())
+        context["window_choices"] = WINDOW_CHOICES
+        return context
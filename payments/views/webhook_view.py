@@ -4,16 +4,24 @@ import logging
 logger = logging.getLogger(__name__)
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 import stripe
-from decimal import Decimal
-from payments.models import Payment, WebhookEvent
-from payments.webhook_handlers import WEBHOOK_HANDLERS
+from payments.models import WebhookEvent
+from payments.utils.webhook_payload import (
+    compress_webhook_body,
+    prune_webhook_payload,
+)
 
 
 @csrf_exempt
 def stripe_webhook(request):
+    """
+    Verifies and records a Stripe event, then returns straight away.
+
+    The event is processed later by the process_webhook_events worker, so
+    Stripe is not kept waiting on booking conversion, MechanicDesk or emails.
+    """
     payload = request.body
     sig_header = request.META.get("HTTP_STRIPE_SIGNATURE")
     event = None
@@ -29,102 +37,38 @@ def stripe_webhook(request):
         logger.error(f"Webhook Error: Could not construct event. Error: {e}")
         return HttpResponse(status=400)
 
+    # Stripe retries deliveries, so check for a duplicate with one indexed
+    # lookup before doing any more work. The unique constraint still catches
+    # concurrent duplicates below.
+    if WebhookEvent.objects.filter(stripe_event_id=event["id"]).exists():
+        return HttpResponse(status=200)
+
     try:
         with transaction.atomic():
+            received_at = timezone.now()
             WebhookEvent.objects.create(
                 stripe_event_id=event["id"],
                 event_type=event["type"],
-                payload=event.to_dict(),
-                received_at=timezone.now(),
+                payload=prune_webhook_payload(event),
+                raw_body=(
+                    compress_webhook_body(payload)
+                    if getattr(settings, "STRIPE_WEBHOOK_STORE_RAW_BODY", False)
+                    else None
+                ),
+                received_at=received_at,
+                status="pending",
+                next_attempt_at=received_at,
             )
+    except IntegrityError as e:
+        # A concurrent delivery of the same event was recorded first.
+        if WebhookEvent.objects.filter(stripe_event_id=event["id"]).exists():
+            return HttpResponse(status=200)
+        logger.error(f"Webhook Error: Could not create WebhookEvent. Error: {e}")
+        return HttpResponse(status=500)
     except Exception as e:
+        # Anything else means the event was not stored, so ask Stripe to
+        # deliver it again.
         logger.error(f"Webhook Error: Could not create WebhookEvent. Error: {e}")
-        return HttpResponse(status=200)
-
-    event_type = event["type"]
-    event_data = event["data"]["object"]
-
-    lookup_id = None
-    lookup_field = "stripe_payment_intent_id"
-
-    if event_type.startswith("payment_intent."):
-        lookup_id = event_data.get("id")
-    elif event_type.startswith("charge."):
-        lookup_id = event_data.get("payment_intent")
-    else:
-        return HttpResponse(status=200)
-
-    if not lookup_id:
-        return HttpResponse(status=200)
-
-    if event_type.startswith("payment_intent.") or event_type.startswith("charge."):
-        try:
-            with transaction.atomic():
-                payment_obj = Payment.objects.select_for_update().get(
-                    **{lookup_field: lookup_id}
-                )
-
-                if (
-                    event_type.startswith("payment_intent.")
-                    and payment_obj.status != event_data["status"]
-                ):
-                    payment_obj.status = event_data["status"]
-                    if "amount" in event_data:
-                        payment_obj.amount = Decimal(event_data["amount"]) / Decimal(
-                            "100"
-                        )
-                    if "currency" in event_data:
-                        payment_obj.currency = event_data["currency"].upper()
-                    payment_obj.save()
-
-                booking_type = None
-
-                if payment_obj.service_booking or payment_obj.temp_service_booking:
-                    booking_type = "service_booking"
-                elif payment_obj.sales_booking or payment_obj.temp_sales_booking:
-                    booking_type = "sales_booking"
-                elif (
-                    "metadata" in event_data
-                    and "booking_type" in event_data["metadata"]
-                ):
-                    booking_type = event_data["metadata"]["booking_type"]
-                else:
-                    logger.error(
-                        f"Webhook Error: Could not determine booking_type for payment {payment_obj.id} from payment object or event metadata."
-                    )
-
-                if booking_type and booking_type in WEBHOOK_HANDLERS:
-                    handler = WEBHOOK_HANDLERS[booking_type].get(event_type)
-                    if handler:
-                        try:
-                            handler(payment_obj, event_data)
-                        except Exception as e:
-                            logger.error(
-                                f"Webhook Error: Handler for {booking_type} and {event_type} failed. Error: {e}"
-                            )
-                            raise
-                    else:
-                        # Not all events for a booking type will have a handler.
-                        pass
-                elif booking_type:
-                    logger.error(
-                        f"Webhook Error: No webhook handler configuration for booking_type '{booking_type}' on payment {payment_obj.id}."
-                    )
-                else:
-                    # booking_type is None, which was already logged above.
-                    pass
-
-        except Payment.DoesNotExist:
-            logger.warning(
-                f"Webhook Info: Payment with {lookup_field}={lookup_id} not found."
-            )
-            return HttpResponse(status=200)
-        except Exception as e:
-            logger.error(
-                f"Webhook Error: Unhandled exception in webhook processing. Error: {e}"
-            )
-            return HttpResponse(status=500)
-    else:
-        pass
+        return HttpResponse(status=500)
 
     return HttpResponse(status=200)
@@ -8,7 +8,7 @@ from inventory.models import TempSalesBooking
 from payments.models import Payment
 from inventory.utils.convert_temp_sales_booking import convert_temp_sales_booking
 from mailer.utils import send_templated_email
-from dashboard.models import SiteSettings
+from dashboard.utils import get_site_settings
 
 
 def handle_sales_booking_succeeded(payment_obj: Payment, payment_intent_data: dict):
@@ -64,7 +64,7 @@ def handle_sales_booking_succeeded(payment_obj: Payment, payment_intent_data: di
             motorcycle.save()
 
         sales_profile = sales_booking.sales_profile
-        site_settings = SiteSettings.get_settings()
+        site_settings = get_site_settings()
         email_context = {
             "booking": sales_booking,
             "user": (
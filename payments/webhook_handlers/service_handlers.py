@@ -7,7 +7,7 @@ from service.models import TempServiceBooking
 from payments.models import Payment
 from service.utils.convert_temp_service_booking import convert_temp_service_booking
 from mailer.utils import send_templated_email
-from dashboard.models import SiteSettings
+from dashboard.utils import get_site_settings
 
 
 def handle_service_booking_succeeded(payment_obj: Payment, payment_intent_data: dict):
@@ -54,7 +54,7 @@ def handle_service_booking_succeeded(payment_obj: Payment, payment_intent_data:
 
         service_profile = service_booking.service_profile
         user_email = service_profile.email
-        site_settings = SiteSettings.get_settings()
+        site_settings = get_site_settings()
 
         if user_email:
             send_templated_email(
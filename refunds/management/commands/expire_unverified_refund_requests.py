@@ -0,0 +1,131 @@
+import datetime
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from mailer.utils import send_templated_emails
+from refunds.models import RefundRequest
+from refunds.utils.refund_request_queries import UNVERIFIED_REFUND_REQUEST_HOURS
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes refund requests whose email verification link has expired "
+        "and queues an email telling each customer. Requests are handled in "
+        "batches: one bulk email insert and one delete per batch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=UNVERIFIED_REFUND_REQUEST_HOURS,
+            help=f"How long a verification link stays valid, in hours (default: {UNVERIFIED_REFUND_REQUEST_HOURS}).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of refund requests to expire per batch (default: 100).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many refund requests would be expired without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - datetime.timedelta(hours=options["hours"])
+        batch_size = max(1, options["batch_size"])
+        expired = RefundRequest.objects.filter(
+            status="unverified", token_created_at__lt=cutoff
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[dry run] would expire {expired.count()} unverified refund requests."
+                )
+            )
+            return
+
+        expired = expired.select_related(
+            "service_booking",
+            "sales_booking",
+            "service_profile__user",
+            "sales_profile__user",
+        ).order_by("pk")
+
+        deleted = emailed = 0
+        last_pk = 0
+        while True:
+            batch = list(expired.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            batch_pks = [request.pk for request in batch]
+            with transaction.atomic():
+                # Delete first, re-checking the status in case a request was
+                # verified after the batch was read, then email only the
+                # requests that are actually gone.
+                deleted += RefundRequest.objects.filter(
+                    pk__in=batch_pks, status="unverified"
+                ).delete()[0]
+                remaining = set(
+                    RefundRequest.objects.filter(pk__in=batch_pks).values_list(
+                        "pk", flat=True
+                    )
+                )
+                emailed += send_templated_emails(
+                    subject=None,
+                    template_name="user_refund_request_expired_unverified.html",
+                    messages=[
+                        self.build_message(request)
+                        for request in batch
+                        if request.pk not in remaining
+                    ],
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Expired {deleted} unverified refund requests and queued "
+                f"{emailed} notification emails."
+            )
+        )
+
+    @staticmethod
+    def build_message(refund_request):
+        recipient_email = refund_request.request_email
+        booking = None
+        profile = None
+        booking_reference = "N/A"
+
+        if refund_request.service_booking:
+            booking = refund_request.service_booking
+            profile = refund_request.service_profile
+            booking_reference = booking.service_booking_reference
+        elif refund_request.sales_booking:
+            booking = refund_request.sales_booking
+            profile = refund_request.sales_profile
+            booking_reference = booking.sales_booking_reference
+
+        if not recipient_email and profile and profile.user:
+            recipient_email = profile.user.email
+
+        return {
+            "recipient_list": [recipient_email] if recipient_email else [],
+            "subject": f"Important: Your Refund Request for Booking {booking_reference} Has Expired",
+            "context": {
+                "refund_request": refund_request,
+                "booking_reference": booking_reference,
+                "admin_email": getattr(
+                    settings, "ADMIN_EMAIL", settings.DEFAULT_FROM_EMAIL
+                ),
+                "SITE_DOMAIN": settings.SITE_DOMAIN,
+                "SITE_SCHEME": settings.SITE_SCHEME,
+            },
+            "booking": booking,
+            "profile": profile,
+        }
@@ -0,0 +1,78 @@
+import time
+from django.core.management.base import BaseCommand
+
+from refunds.utils.refund_queue import (
+    REFUND_LEASE_SECONDS,
+    REFUND_MAX_ATTEMPTS,
+    claim_refund_requests,
+    execute_refund_request,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates the Stripe refunds for approved refund requests. Runs until "
+        "stopped unless --once is given, in which case it exits when the "
+        "queue is empty."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the refunds that are currently due, then exit.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20,
+            help="Number of refund requests to claim at a time (default: 20).",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait when the queue is empty (default: 5).",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=REFUND_MAX_ATTEMPTS,
+            help=f"Attempts before a refund is marked failed (default: {REFUND_MAX_ATTEMPTS}).",
+        )
+        parser.add_argument(
+            "--lease-seconds",
+            type=int,
+            default=REFUND_LEASE_SECONDS,
+            help=f"How long a claimed refund is reserved for this worker (default: {REFUND_LEASE_SECONDS}).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        sent = failed = 0
+
+        try:
+            while True:
+                refund_requests = claim_refund_requests(
+                    batch_size, options["lease_seconds"]
+                )
+                if not refund_requests:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                for refund_request in refund_requests:
+                    if execute_refund_request(refund_request, options["max_attempts"]):
+                        sent += 1
+                    else:
+                        failed += 1
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {sent + failed} refunds: "
+                f"{sent} sent to Stripe, {failed} failed or rescheduled."
+            )
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-19 05:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_remove_motorcycle_warranty_years_and_more'),
+        ('payments', '0007_webhookevent_metrics'),
+        ('refunds', '0002_initial'),
+        ('service', '0004_remove_servicetype_estimated_duration_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='refundrequest',
+            index=models.Index(fields=['status', 'token_created_at'], name='refundrequest_expiry_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-19 05:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_remove_motorcycle_warranty_years_and_more'),
+        ('payments', '0007_webhookevent_metrics'),
+        ('refunds', '0003_refundrequest_expiry_idx'),
+        ('service', '0004_remove_servicetype_estimated_duration_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='refundrequest',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='How many times the refund queue worker has tried to create the Stripe refund.'),
+        ),
+        migrations.AddField(
+            model_name='refundrequest',
+            name='last_error',
+            field=models.TextField(blank=True, default='', help_text='The error from the last failed attempt to create the Stripe refund.'),
+        ),
+        migrations.AddField(
+            model_name='refundrequest',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, help_text='When the refund queue worker may next pick the request up. Also acts as the lease expiry while it is processing.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='refundrequest',
+            name='status',
+            field=models.CharField(choices=[('unverified', 'Unverified - Awaiting Email Confirmation'), ('pending', 'Pending Review'), ('reviewed_pending_approval', 'Reviewed - Pending Approval'), ('processing', 'Approved - Sending to Stripe'), ('approved', 'Approved - Awaiting Refund'), ('rejected', 'Rejected'), ('partially_refunded', 'Partially Refunded'), ('refunded', 'Refunded'), ('failed', 'Refund Failed')], default='unverified', help_text='Current status of the refund request.', max_length=30),
+        ),
+        migrations.AddIndex(
+            model_name='refundrequest',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='refundrequest_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-19 05:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0011_kpi_date_indexes'),
+        ('payments', '0008_kpi_date_indexes'),
+        ('refunds', '0004_refundrequest_queue_state'),
+        ('service', '0005_kpi_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='refundrequest',
+            index=models.Index(fields=['processed_at'], name='refundrequest_processed_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 07:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('refunds', '0005_kpi_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='refundrequest',
+            name='claim_token',
+            field=models.UUIDField(blank=True, help_text='Set by the admin action or worker that last queued or claimed the request, so each acts only on the requests it actually won.', null=True),
+        ),
+    ]
@@ -10,6 +10,7 @@ class RefundRequest(models.Model):
         ("unverified", "Unverified - Awaiting Email Confirmation"),
         ("pending", "Pending Review"),
         ("reviewed_pending_approval", "Reviewed - Pending Approval"),
+        ("processing", "Approved - Sending to Stripe"),
         ("approved", "Approved - Awaiting Refund"),
         ("rejected", "Rejected"),
         ("partially_refunded", "Partially Refunded"),
@@ -130,11 +131,44 @@ class RefundRequest(models.Model):
         default=timezone.now,
         help_text="Timestamp when the verification token was created.",
     )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="How many times the refund queue worker has tried to create the Stripe refund.",
+    )
+    next_attempt_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the refund queue worker may next pick the request up. Also acts as the lease expiry while it is processing.",
+    )
+    claim_token = models.UUIDField(
+        blank=True,
+        null=True,
+        help_text="Set by the admin action or worker that last queued or claimed the request, so each acts only on the requests it actually won.",
+    )
+    last_error = models.TextField(
+        blank=True,
+        default="",
+        help_text="The error from the last failed attempt to create the Stripe refund.",
+    )
 
     class Meta:
         verbose_name = "Refund Request"
         verbose_name_plural = "Refund Requests"
         ordering = ["-requested_at", "pk"]
+        indexes = [
+            models.Index(
+                fields=["status", "token_created_at"],
+                name="refundrequest_expiry_idx",
+            ),
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="refundrequest_queue_idx",
+            ),
+            models.Index(
+                fields=["processed_at"],
+                name="refundrequest_processed_idx",
+            ),
+        ]
 
     def __str__(self):
         booking_ref = "N/A"
@@ -0,0 +1,129 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db.models.query import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from inventory.tests.test_helpers.model_factories import (
+    SalesBookingFactory,
+    SalesProfileFactory,
+)
+from mailer.models import EmailLog
+from refunds.models import RefundRequest
+from refunds.tests.test_helpers.model_factories import RefundRequestFactory
+
+
+class ExpireUnverifiedRefundRequestsCommandTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.expired_time = now - timedelta(hours=24, minutes=1)
+        self.recent_time = now - timedelta(hours=23)
+
+    def test_expires_requests_and_queues_emails(self):
+        expired_requests = [
+            RefundRequestFactory(
+                status="unverified",
+                token_created_at=self.expired_time,
+                request_email=f"expired{n}@example.com",
+            )
+            for n in range(3)
+        ]
+        recent_request = RefundRequestFactory(
+            status="unverified", token_created_at=self.recent_time
+        )
+        verified_request = RefundRequestFactory(
+            status="pending", token_created_at=self.expired_time
+        )
+
+        out = StringIO()
+        call_command("expire_unverified_refund_requests", batch_size=2, stdout=out)
+
+        self.assertEqual(
+            set(RefundRequest.objects.values_list("pk", flat=True)),
+            {recent_request.pk, verified_request.pk},
+        )
+        emails = EmailLog.objects.order_by("recipient")
+        self.assertEqual(
+            [email.recipient for email in emails],
+            [request.request_email for request in expired_requests],
+        )
+        self.assertTrue(all(email.status == "PENDING" for email in emails))
+        self.assertIn("Your Refund Request for Booking", emails[0].subject)
+        self.assertIn("Expired 3 unverified refund requests", out.getvalue())
+
+    def test_request_verified_mid_batch_is_kept_and_not_emailed(self):
+        expired_request = RefundRequestFactory(
+            status="unverified",
+            token_created_at=self.expired_time,
+            request_email="expired@example.com",
+        )
+        verified_request = RefundRequestFactory(
+            status="unverified",
+            token_created_at=self.expired_time,
+            request_email="verified@example.com",
+        )
+        original_delete = QuerySet.delete
+
+        def delete_after_verification(queryset):
+            # The customer verifies after the batch was read but before the
+            # delete runs.
+            RefundRequest.objects.filter(pk=verified_request.pk).update(status="pending")
+            return original_delete(queryset)
+
+        with patch.object(QuerySet, "delete", delete_after_verification):
+            call_command("expire_unverified_refund_requests", stdout=StringIO())
+
+        self.assertEqual(
+            list(RefundRequest.objects.values_list("pk", flat=True)),
+            [verified_request.pk],
+        )
+        self.assertEqual(
+            list(EmailLog.objects.values_list("recipient", flat=True)),
+            [expired_request.request_email],
+        )
+
+    def test_falls_back_to_profile_user_email(self):
+        sales_profile = SalesProfileFactory()
+        RefundRequestFactory(
+            status="unverified",
+            token_created_at=self.expired_time,
+            request_email=None,
+            sales_booking=SalesBookingFactory(sales_profile=sales_profile),
+            sales_profile=sales_profile,
+        )
+
+        call_command("expire_unverified_refund_requests", stdout=StringIO())
+
+        self.assertEqual(RefundRequest.objects.count(), 0)
+        self.assertEqual(
+            list(EmailLog.objects.values_list("recipient", flat=True)),
+            [sales_profile.user.email],
+        )
+
+    def test_no_email_without_a_recipient(self):
+        sales_profile = SalesProfileFactory(user=None)
+        RefundRequestFactory(
+            status="unverified",
+            token_created_at=self.expired_time,
+            request_email=None,
+            sales_booking=SalesBookingFactory(sales_profile=sales_profile),
+            sales_profile=sales_profile,
+        )
+
+        call_command("expire_unverified_refund_requests", stdout=StringIO())
+
+        self.assertEqual(RefundRequest.objects.count(), 0)
+        self.assertEqual(EmailLog.objects.count(), 0)
+
+    def test_dry_run_changes_nothing(self):
+        RefundRequestFactory(status="unverified", token_created_at=self.expired_time)
+
+        out = StringIO()
+        call_command("expire_unverified_refund_requests", dry_run=True, stdout=out)
+
+        self.assertEqual(RefundRequest.objects.count(), 1)
+        self.assertEqual(EmailLog.objects.count(), 0)
+        self.assertIn("[dry run] would expire 1", out.getvalue())
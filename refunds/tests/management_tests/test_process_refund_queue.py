@@ -0,0 +1,36 @@
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch, MagicMock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from payments.tests.test_helpers.model_factories import PaymentFactory
+from refunds.models import RefundRequest
+from refunds.tests.test_helpers.model_factories import RefundRequestFactory
+from refunds.utils.refund_queue import queue_refund_requests
+from users.tests.test_helpers.model_factories import StaffUserFactory
+
+
+class ProcessRefundQueueCommandTest(TestCase):
+    @patch("payments.utils.stripe_gateway.stripe.Refund.create")
+    def test_once_drains_the_queue(self, mock_create):
+        mock_create.side_effect = [MagicMock(id=f"re_{n}") for n in range(3)]
+        refund_requests = [
+            RefundRequestFactory(
+                status="reviewed_pending_approval",
+                payment=PaymentFactory(stripe_payment_intent_id=f"pi_{n}"),
+                amount_to_refund=Decimal("10.00"),
+            )
+            for n in range(3)
+        ]
+        queue_refund_requests(refund_requests, StaffUserFactory())
+        out = StringIO()
+
+        call_command("process_refund_queue", once=True, batch_size=2, stdout=out)
+
+        self.assertEqual(mock_create.call_count, 3)
+        self.assertEqual(
+            RefundRequest.objects.filter(status="approved").count(), 3
+        )
+        self.assertIn("3 sent to Stripe", out.getvalue())
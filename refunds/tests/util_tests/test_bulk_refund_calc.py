@@ -0,0 +1,99 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from inventory.tests.test_helpers.model_factories import SalesBookingFactory
+from refunds.models import RefundSettings
+from refunds.tests.test_helpers.model_factories import RefundSettingsFactory
+from refunds.utils.bulk_refund_calc import (
+    calculate_refund_entitlements,
+    preview_refund_policy,
+)
+from service.models import ServiceBooking
+from service.tests.test_helpers.model_factories import ServiceBookingFactory
+
+
+class BulkRefundCalcTest(TestCase):
+    def setUp(self):
+        self.refund_settings = RefundSettingsFactory()
+        today = timezone.localdate()
+        self.far_service = ServiceBookingFactory(
+            dropoff_date=today + timedelta(days=20),
+            dropoff_time=None,
+            booking_status="confirmed",
+            payment_method="online_full",
+            amount_paid=Decimal("200.00"),
+        )
+        self.near_service = ServiceBookingFactory(
+            dropoff_date=today + timedelta(days=7),
+            dropoff_time=None,
+            booking_status="confirmed",
+            payment_method="online_deposit",
+            amount_paid=Decimal("100.00"),
+        )
+        self.sales = SalesBookingFactory(
+            appointment_date=today + timedelta(days=7),
+            appointment_time=None,
+            booking_status="confirmed",
+            amount_paid=Decimal("50.00"),
+        )
+        # Neither of these can be refunded any more.
+        ServiceBookingFactory(
+            dropoff_date=today + timedelta(days=20),
+            booking_status="cancelled",
+            amount_paid=Decimal("300.00"),
+        )
+        SalesBookingFactory(
+            appointment_date=today - timedelta(days=3),
+            booking_status="confirmed",
+            amount_paid=Decimal("50.00"),
+        )
+
+    def test_matches_single_booking_calculators(self):
+        results = dict(
+            calculate_refund_entitlements(
+                [self.far_service, self.near_service, self.sales],
+                self.refund_settings,
+            )
+        )
+
+        self.assertEqual(results[self.far_service]["entitled_amount"], Decimal("200.00"))
+        self.assertEqual(results[self.near_service]["entitled_amount"], Decimal("50.00"))
+        self.assertEqual(results[self.sales]["entitled_amount"], Decimal("25.00"))
+
+    def test_reads_settings_once_for_a_queryset(self):
+        ServiceBookingFactory.create_batch(
+            5,
+            dropoff_date=timezone.localdate() + timedelta(days=20),
+            amount_paid=Decimal("10.00"),
+        )
+
+        with self.assertNumQueries(1):
+            results = calculate_refund_entitlements(
+                ServiceBooking.objects.all(), self.refund_settings
+            )
+
+        self.assertEqual(len(results), ServiceBooking.objects.count())
+
+    def test_preview_compares_current_and_proposed_settings(self):
+        proposed = RefundSettings.objects.get(pk=self.refund_settings.pk)
+        proposed.deposit_partial_refund_percentage = Decimal("100.00")
+
+        preview = preview_refund_policy(proposed)
+
+        self.assertEqual(preview["service"]["current"]["bookings"], 2)
+        self.assertEqual(
+            preview["service"]["current"]["total_entitled"], Decimal("250.00")
+        )
+        self.assertEqual(
+            preview["service"]["proposed"]["total_entitled"], Decimal("300.00")
+        )
+        self.assertEqual(preview["service"]["change"], Decimal("50.00"))
+        self.assertEqual(preview["sales"]["current"]["bookings"], 1)
+        self.assertEqual(preview["sales"]["change"], Decimal("25.00"))
+        self.refund_settings.refresh_from_db()
+        self.assertEqual(
+            self.refund_settings.deposit_partial_refund_percentage, Decimal("50.00")
+        )
@@ -207,3 +207,23 @@ class ProcessRefundRequestEntryTest(TestCase):
         self.assertEqual(RefundRequest.objects.count(), 2)  # Two requests now
         self.assertEqual(refund_request.stripe_refund_id, "re_new_after_rejected")
         self.assertEqual(refund_request.amount_to_refund, Decimal("25.00"))
+
+    def test_queued_refund_is_matched_by_stripe_refund_id(self):
+        booking = ServiceBookingFactory(amount_paid=Decimal("100.00"))
+        payment = PaymentFactory(
+            service_booking=booking, amount=Decimal("100.00"), status="refunded"
+        )
+        queued_request = RefundRequestFactory(
+            payment=payment,
+            service_booking=booking,
+            status="approved",
+            stripe_refund_id="re_test_new_refund",
+        )
+        RefundRequestFactory(payment=payment, service_booking=booking, status="pending")
+
+        refund_request = process_refund_request_entry(
+            payment, booking, "service_booking", self.extracted_data
+        )
+
+        self.assertEqual(refund_request.pk, queued_request.pk)
+        self.assertEqual(refund_request.status, "refunded")
@@ -0,0 +1,162 @@
+import datetime
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+
+import stripe
+from django.db.models.query import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from payments.tests.test_helpers.model_factories import PaymentFactory
+from refunds.models import RefundRequest
+from refunds.tests.test_helpers.model_factories import RefundRequestFactory
+from refunds.utils.refund_queue import (
+    REFUND_LEASE_SECONDS,
+    claim_refund_requests,
+    execute_refund_request,
+    queue_refund_requests,
+    refund_retry_delay,
+)
+from users.tests.test_helpers.model_factories import StaffUserFactory
+
+
+@patch("payments.utils.stripe_gateway.stripe.Refund.create")
+class RefundQueueTest(TestCase):
+    def setUp(self):
+        self.admin_user = StaffUserFactory()
+        self.refund_request = RefundRequestFactory(
+            status="reviewed_pending_approval",
+            payment=PaymentFactory(stripe_payment_intent_id="pi_queue123"),
+            amount_to_refund=Decimal("40.00"),
+            stripe_refund_id=None,
+        )
+
+    def queue_and_claim(self):
+        queue_refund_requests([self.refund_request], self.admin_user)
+        return claim_refund_requests(10)
+
+    def test_queueing_does_not_call_stripe(self, mock_create):
+        queued, problems = queue_refund_requests(
+            [self.refund_request], self.admin_user
+        )
+
+        self.assertEqual(queued, [self.refund_request.pk])
+        self.assertEqual(problems, {})
+        self.refund_request.refresh_from_db()
+        self.assertEqual(self.refund_request.status, "processing")
+        self.assertEqual(self.refund_request.processed_by, self.admin_user)
+        mock_create.assert_not_called()
+
+    def test_claim_leases_due_requests(self, mock_create):
+        claimed = self.queue_and_claim()
+
+        self.assertEqual([r.pk for r in claimed], [self.refund_request.pk])
+        self.assertEqual(claimed[0].attempts, 1)
+        self.assertGreater(
+            claimed[0].next_attempt_at,
+            timezone.now() + datetime.timedelta(seconds=REFUND_LEASE_SECONDS - 10),
+        )
+        self.assertEqual(claim_refund_requests(10), [])
+
+    def test_request_queued_by_another_admin_is_not_queued_again(self, mock_create):
+        queue_refund_requests([self.refund_request], self.admin_user)
+        other_admin = StaffUserFactory()
+
+        queued, problems = queue_refund_requests([self.refund_request], other_admin)
+
+        self.assertEqual(queued, [])
+        self.refund_request.refresh_from_db()
+        self.assertEqual(self.refund_request.processed_by, self.admin_user)
+
+    def test_concurrent_claims_of_the_same_batch_do_not_overlap(self, mock_create):
+        queue_refund_requests([self.refund_request], self.admin_user)
+        original_update = QuerySet.update
+        rival_claims = []
+
+        def update_after_rival_claim(queryset, **kwargs):
+            # Another worker picked the same candidates and claims them
+            # between this worker's SELECT and its UPDATE.
+            with patch.object(QuerySet, "update", original_update):
+                rival_claims.append(claim_refund_requests(10))
+            return original_update(queryset, **kwargs)
+
+        with patch.object(QuerySet, "update", update_after_rival_claim):
+            claimed = claim_refund_requests(10)
+
+        self.assertEqual([r.pk for r in rival_claims[0]], [self.refund_request.pk])
+        self.assertEqual(claimed, [])
+        self.refund_request.refresh_from_db()
+        self.assertEqual(self.refund_request.attempts, 1)
+
+    def test_success_awaits_the_webhook(self, mock_create):
+        mock_create.return_value = MagicMock(id="re_queue123")
+        refund_request = self.queue_and_claim()[0]
+
+        self.assertTrue(execute_refund_request(refund_request))
+
+        _, kwargs = mock_create.call_args
+        self.assertEqual(kwargs["amount"], 4000)
+        self.assertEqual(kwargs["payment_intent"], "pi_queue123")
+        self.assertEqual(
+            kwargs["idempotency_key"], f"refund-request-{refund_request.pk}-4000"
+        )
+        refund_request.refresh_from_db()
+        self.assertEqual(refund_request.status, "approved")
+        self.assertEqual(refund_request.stripe_refund_id, "re_queue123")
+
+    def test_webhook_arriving_first_is_not_overwritten(self, mock_create):
+        mock_create.return_value = MagicMock(id="re_queue123")
+        refund_request = self.queue_and_claim()[0]
+        RefundRequest.objects.filter(pk=refund_request.pk).update(status="refunded")
+
+        execute_refund_request(refund_request)
+
+        refund_request.refresh_from_db()
+        self.assertEqual(refund_request.status, "refunded")
+        self.assertEqual(refund_request.stripe_refund_id, "re_queue123")
+
+    def test_connection_error_is_retried_with_backoff(self, mock_create):
+        mock_create.side_effect = stripe.error.APIConnectionError("timed out")
+        refund_request = self.queue_and_claim()[0]
+
+        self.assertFalse(execute_refund_request(refund_request))
+
+        refund_request.refresh_from_db()
+        self.assertEqual(refund_request.status, "processing")
+        self.assertIn("timed out", refund_request.last_error)
+        self.assertGreater(refund_request.next_attempt_at, timezone.now())
+
+    def test_key_in_use_is_retried(self, mock_create):
+        mock_create.side_effect = stripe.error.IdempotencyError("Key in use")
+        refund_request = self.queue_and_claim()[0]
+
+        self.assertFalse(execute_refund_request(refund_request))
+
+        refund_request.refresh_from_db()
+        self.assertEqual(refund_request.status, "processing")
+
+    def test_card_error_fails_straight_away(self, mock_create):
+        mock_create.side_effect = stripe.error.InvalidRequestError(
+            "Charge already refunded", param=None
+        )
+        refund_request = self.queue_and_claim()[0]
+
+        execute_refund_request(refund_request)
+
+        refund_request.refresh_from_db()
+        self.assertEqual(refund_request.status, "failed")
+        self.assertIn("already refunded", refund_request.last_error)
+
+    def test_retries_stop_at_max_attempts(self, mock_create):
+        mock_create.side_effect = stripe.error.APIConnectionError("timed out")
+        refund_request = self.queue_and_claim()[0]
+
+        execute_refund_request(refund_request, max_attempts=1)
+
+        refund_request.refresh_from_db()
+        self.assertEqual(refund_request.status, "failed")
+
+    def test_retry_delay_grows_and_is_capped(self, mock_create):
+        self.assertEqual(refund_retry_delay(1), datetime.timedelta(seconds=60))
+        self.assertEqual(refund_retry_delay(2), datetime.timedelta(seconds=120))
+        self.assertEqual(refund_retry_delay(20), datetime.timedelta(seconds=3600))
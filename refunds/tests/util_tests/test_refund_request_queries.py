@@ -0,0 +1,59 @@
+from django.http import Http404
+from django.test import TestCase
+
+from inventory.tests.test_helpers.model_factories import SalesBookingFactory
+from refunds.models import RefundRequest
+from refunds.tests.test_helpers.model_factories import RefundRequestFactory
+from refunds.utils.refund_request_queries import (
+    refund_request_for_detail,
+    refund_requests_for_list,
+    refund_status_counts,
+)
+from service.tests.test_helpers.model_factories import ServiceBookingFactory
+
+
+class RefundRequestQueriesTest(TestCase):
+    def setUp(self):
+        for n in range(6):
+            if n % 2:
+                booking = ServiceBookingFactory()
+                RefundRequestFactory(
+                    status="pending",
+                    service_booking=booking,
+                    service_profile=booking.service_profile,
+                )
+            else:
+                booking = SalesBookingFactory()
+                RefundRequestFactory(
+                    status="approved",
+                    sales_booking=booking,
+                    sales_profile=booking.sales_profile,
+                )
+
+    def test_list_rows_need_no_further_queries(self):
+        with self.assertNumQueries(1):
+            for refund_request in refund_requests_for_list():
+                str(refund_request)
+                refund_request.service_profile or refund_request.sales_profile
+                refund_request.payment
+
+    def test_detail_loads_booking_details_in_one_query(self):
+        pk = RefundRequest.objects.filter(service_booking__isnull=False).first().pk
+
+        with self.assertNumQueries(1):
+            refund_request = refund_request_for_detail(pk)
+            refund_request.service_booking.service_profile.name
+            refund_request.service_booking.customer_motorcycle
+
+    def test_detail_missing_request_is_404(self):
+        with self.assertRaises(Http404):
+            refund_request_for_detail(0)
+
+    def test_status_counts_in_one_query(self):
+        with self.assertNumQueries(1):
+            counts = refund_status_counts(RefundRequest.objects.all())
+
+        self.assertEqual(counts["pending"], 3)
+        self.assertEqual(counts["approved"], 3)
+        self.assertEqual(counts["refunded"], 0)
+        self.assertEqual(counts["all"], 6)
@@ -1,13 +1,12 @@
-import datetime
 from django.test import TestCase, Client
 from django.urls import reverse
-from unittest.mock import patch
 from django.utils import timezone
 from datetime import timedelta
 
 from django.apps import apps
 from refunds.tests.test_helpers.model_factories import RefundRequestFactory
-from inventory.tests.test_helpers.model_factories import SalesBookingFactory, SalesProfileFactory
+from service.tests.test_helpers.model_factories import ServiceBookingFactory
+from inventory.tests.test_helpers.model_factories import SalesBookingFactory
 from users.tests.test_helpers.model_factories import UserFactory, StaffUserFactory
 
 RefundRequest = apps.get_model('refunds', 'RefundRequest')
@@ -46,71 +45,73 @@ class AdminRefundManagementTest(TestCase):
         self.assertEqual(len(response.context["refund_requests"]), 2)
         self.assertEqual(response.context["current_status"], "approved")
 
-    @patch("refunds.views.admin_views.admin_refund_management.send_templated_email")
-    def test_clean_expired_unverified_refund_requests_deletes_and_sends_email(
-        self, mock_send_templated_email
-    ):
+    def test_expired_unverified_requests_are_hidden_not_deleted(self):
         now = timezone.now()
-        expired_time = now - timedelta(hours=24, minutes=1)
         expired_request = RefundRequestFactory(
             status="unverified",
-            token_created_at=expired_time,
-            request_email="expired@example.com",
+            token_created_at=now - timedelta(hours=24, minutes=1),
         )
-
-        non_expired_time = now - timedelta(hours=23)
         non_expired_request = RefundRequestFactory(
             status="unverified",
-            token_created_at=non_expired_time,
-            request_email="nonexpired@example.com",
+            token_created_at=now - timedelta(hours=23),
         )
-
         verified_request = RefundRequestFactory(
-            status="pending", request_email="verified@example.com"
+            status="pending", token_created_at=now - timedelta(days=3)
         )
-        with patch("django.utils.timezone.now") as mock_now:
-            mock_now.return_value = now
-            response = self.client.get(self.url)
 
-        self.assertFalse(RefundRequest.objects.filter(pk=expired_request.pk).exists())
-        self.assertTrue(
-            RefundRequest.objects.filter(pk=non_expired_request.pk).exists()
-        )
-        self.assertTrue(RefundRequest.objects.filter(pk=verified_request.pk).exists())
+        response = self.client.get(self.url)
 
-        mock_send_templated_email.assert_called_once()
-        call_args, call_kwargs = mock_send_templated_email.call_args
-        self.assertEqual(call_kwargs["recipient_list"], ["expired@example.com"])
-        self.assertIn("Your Refund Request for Booking", call_kwargs["subject"])
         self.assertEqual(
-            call_kwargs["template_name"], "user_refund_request_expired_unverified.html"
+            {request.pk for request in response.context["refund_requests"]},
+            {non_expired_request.pk, verified_request.pk},
         )
+        self.assertTrue(RefundRequest.objects.filter(pk=expired_request.pk).exists())
+
+    def make_requests_with_relations(self, count):
+        for n in range(count):
+            if n % 2:
+                booking = ServiceBookingFactory()
+                RefundRequestFactory(
+                    status="pending",
+                    service_booking=booking,
+                    service_profile=booking.service_profile,
+                )
+            else:
+                booking = SalesBookingFactory()
+                RefundRequestFactory(
+                    status="approved",
+                    sales_booking=booking,
+                    sales_profile=booking.sales_profile,
+                )
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        self.make_requests_with_relations(2)
+        # Warm up the session and user lookups. The unread notification badge
+        # is recounted on every request, as the test cache stores nothing.
+        self.client.get(self.url)
+
+        with self.assertNumQueries(8):
+            response = self.client.get(self.url)
+            str(response.context["refund_requests"][0])
 
-    # This test is failing due to the same ValueError as test_clean_expired_unverified_refund_requests_deletes_and_sends_email.
-    @patch("refunds.views.admin_views.admin_refund_management.send_templated_email")
-    def test_clean_expired_unverified_refund_requests_no_email_sent_if_no_recipient(
-        self, mock_send_templated_email
-    ):
-        now = datetime.datetime(2025, 7, 9, 10, 0, 0, tzinfo=datetime.timezone.utc)
-        expired_time = now - timedelta(hours=24, minutes=1)
-        sales_profile_no_email = SalesProfileFactory(
-            email="valid@example.com", user=None
-        )
-        sales_booking = SalesBookingFactory(sales_profile=sales_profile_no_email)
-        expired_request = RefundRequestFactory(
-            status="unverified",
-            token_created_at=expired_time,
-            request_email=None,
-            sales_booking=sales_booking,
-            sales_profile=sales_profile_no_email,
-        )
+        self.make_requests_with_relations(18)
 
-        with patch("django.utils.timezone.now") as mock_now:
-            mock_now.return_value = now
+        with self.assertNumQueries(8):
             response = self.client.get(self.url)
+        self.assertEqual(len(response.context["refund_requests"]), 20)
+
+    def test_status_counts(self):
+        RefundRequestFactory.create_batch(3, status="pending")
+        RefundRequestFactory.create_batch(2, status="approved")
+
+        response = self.client.get(self.url + "?status=pending")
 
-        self.assertFalse(RefundRequest.objects.filter(pk=expired_request.pk).exists())
-        mock_send_templated_email.assert_not_called()
+        counts = response.context["status_counts"]
+        self.assertEqual(counts["pending"], 3)
+        self.assertEqual(counts["approved"], 2)
+        self.assertEqual(counts["rejected"], 0)
+        self.assertEqual(counts["all"], 5)
+        self.assertContains(response, "Pending Review (3)")
 
     def test_admin_required_mixin(self):
         self.client.logout()
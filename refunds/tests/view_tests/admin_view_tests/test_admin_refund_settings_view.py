@@ -45,6 +45,26 @@ class AdminRefundSettingsViewTest(TestCase):
             str(messages[0]), "Refund Policy settings updated successfully!"
         )
 
+    def test_preview_shows_impact_without_saving(self):
+        data = {
+            "full_payment_full_refund_days": 10,
+            "full_payment_partial_refund_days": 5,
+            "full_payment_partial_refund_percentage": Decimal("50.00"),
+            "full_payment_no_refund_percentage": 1,
+            "deposit_full_refund_days": 30,
+            "deposit_partial_refund_days": 3,
+            "deposit_partial_refund_percentage": Decimal("25.00"),
+            "deposit_no_refund_days": 0,
+            "sales_enable_deposit_refund": True,
+            "refund_policy_preview": "",
+        }
+        response = self.client.post(reverse("refunds:admin_refund_settings"), data=data)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("refund_policy_preview", response.context)
+        self.assertContains(response, "Impact on Future Bookings")
+        self.refund_settings.refresh_from_db()
+        self.assertEqual(self.refund_settings.deposit_full_refund_days, 10)
+
     def test_post_admin_refund_settings_view_invalid(self):
         data = {
             "full_payment_full_refund_days": -1,  # Invalid data
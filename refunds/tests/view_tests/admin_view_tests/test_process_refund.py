@@ -2,7 +2,7 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib import messages
 from django.conf import settings
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from decimal import Decimal
 
 from refunds.tests.test_helpers.model_factories import RefundRequestFactory
@@ -24,11 +24,8 @@ class ProcessRefundViewTests(TestCase):
     def setUp(self):
         self.client.force_login(self.admin_user)
 
-    @patch("refunds.views.admin_views.process_refund.stripe.Refund.create")
+    @patch("payments.utils.stripe_gateway.stripe.Refund.create")
     def test_successful_service_booking_refund(self, mock_stripe_refund_create):
-        mock_stripe_refund_create.return_value = MagicMock(
-            id="re_mockedservice456", status="succeeded"
-        )
 
         service_booking = ServiceBookingFactory(
             payment=PaymentFactory(
@@ -51,14 +48,13 @@ class ProcessRefundViewTests(TestCase):
 
         self.assertEqual(response.status_code, 302)
         refund_request.refresh_from_db()
-        self.assertEqual(refund_request.status, "approved")
-        self.assertEqual(refund_request.stripe_refund_id, "re_mockedservice456")
+        self.assertEqual(refund_request.status, "processing")
+        self.assertEqual(refund_request.processed_by, self.admin_user)
+        self.assertIsNotNone(refund_request.next_attempt_at)
+        mock_stripe_refund_create.assert_not_called()
 
-    @patch("refunds.views.admin_views.process_refund.stripe.Refund.create")
+    @patch("payments.utils.stripe_gateway.stripe.Refund.create")
     def test_successful_sales_booking_refund(self, mock_stripe_refund_create):
-        mock_stripe_refund_create.return_value = MagicMock(
-            id="re_mockedsales789", status="succeeded"
-        )
 
         sales_booking = SalesBookingFactory(
             payment=PaymentFactory(
@@ -81,8 +77,8 @@ class ProcessRefundViewTests(TestCase):
 
         self.assertEqual(response.status_code, 302)
         refund_request.refresh_from_db()
-        self.assertEqual(refund_request.status, "approved")
-        self.assertEqual(refund_request.stripe_refund_id, "re_mockedsales789")
+        self.assertEqual(refund_request.status, "processing")
+        mock_stripe_refund_create.assert_not_called()
 
     def test_refund_invalid_status_rejection(self):
         # This test is correct, it specifically checks for a non-approvable status
@@ -123,16 +119,33 @@ class ProcessRefundViewTests(TestCase):
         messages_list = list(messages.get_messages(response.wsgi_request))
         self.assertIn("no Stripe Payment Intent ID", str(messages_list[0]))
 
-    @patch("refunds.views.admin_views.process_refund.stripe.Refund.create")
-    def test_generic_exception_during_refund_creation(self, mock_stripe_refund_create):
-        mock_stripe_refund_create.side_effect = ValueError(
-            "Something went wrong internally"
+    def test_bulk_approval_queues_approvable_requests(self):
+        ready = [
+            RefundRequestFactory(
+                status="reviewed_pending_approval", amount_to_refund=Decimal("10.00")
+            )
+            for _ in range(3)
+        ]
+        not_ready = RefundRequestFactory(status="pending", payment=None)
+        already_refunded = RefundRequestFactory(status="refunded")
+
+        url = reverse("refunds:bulk_process_refunds")
+        response = self.client.post(
+            url,
+            {
+                "refund_request_ids": [r.pk for r in ready]
+                + [not_ready.pk, already_refunded.pk]
+            },
         )
-        refund_request = RefundRequestFactory(status="reviewed_pending_approval")
-        url = reverse("refunds:process_refund", kwargs={"pk": refund_request.pk})
-        response = self.client.post(url)
+
         self.assertEqual(response.status_code, 302)
-        messages_list = list(messages.get_messages(response.wsgi_request))
-        self.assertIn("An unexpected error occurred", str(messages_list[0]))
-        refund_request.refresh_from_db()
-        self.assertEqual(refund_request.status, "failed")
+        for refund_request in ready:
+            refund_request.refresh_from_db()
+            self.assertEqual(refund_request.status, "processing")
+        not_ready.refresh_from_db()
+        already_refunded.refresh_from_db()
+        self.assertEqual(not_ready.status, "pending")
+        self.assertEqual(already_refunded.status, "refunded")
+        messages_list = [str(m) for m in messages.get_messages(response.wsgi_request)]
+        self.assertIn("3 refund requests approved and queued for Stripe.", messages_list)
+        self.assertEqual(len(messages_list), 3)
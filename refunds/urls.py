@@ -12,6 +12,7 @@ from .views.admin_views import (
     AdminCreateRefundRequestView,
     AdminEditRefundRequestView,
     ProcessRefundView,
+    BulkProcessRefundView,
     AdminRejectRefundView,
     admin_refund_settings_view,
     IntermediaryRefundProcessingView,
@@ -64,6 +65,11 @@ urlpatterns = [
         ProcessRefundView.as_view(),
         name="process_refund",
     ),
+    path(
+        "settings/refunds/process/bulk/",
+        BulkProcessRefundView.as_view(),
+        name="bulk_process_refunds",
+    ),
     path(
         "settings/refunds/reject/<int:pk>/",
         AdminRejectRefundView.as_view(),
@@ -4,3 +4,6 @@ from .process_refund_request_entry import *
 from .send_refund_notification import *
 from .service_refund_calc import *
 from .sales_refund_calc import *
+from .bulk_refund_calc import *
+from .refund_queue import *
+from .refund_request_queries import *
@@ -0,0 +1,125 @@
+from decimal import Decimal
+from django.utils import timezone
+from dashboard.utils import get_refund_settings
+from inventory.models import SalesBooking
+from service.models import ServiceBooking
+from refunds.utils.sales_refund_calc import calculate_sales_refund_amount
+from refunds.utils.service_refund_calc import calculate_service_refund_amount
+
+# Bookings that can still be cancelled, and so could still claim a refund.
+REFUNDABLE_SERVICE_BOOKING_STATUSES = ("pending", "confirmed")
+REFUNDABLE_SALES_BOOKING_STATUSES = ("pending_confirmation", "confirmed")
+
+
+def calculate_refund_entitlements(
+    bookings, refund_settings=None, cancellation_datetime=None
+):
+    """
+    Calculates the refund entitlement for every booking in bookings (a
+    queryset or list of ServiceBooking or SalesBooking) against one settings
+    snapshot, so the settings are read once rather than once per booking.
+    refund_settings may be an unsaved RefundSettings holding a proposed
+    policy.
+
+    Returns a list of (booking, result) pairs, where result is what
+    calculate_service_refund_amount or calculate_sales_refund_amount return.
+    """
+    if refund_settings is None:
+        refund_settings = get_refund_settings()
+    if cancellation_datetime is None:
+        cancellation_datetime = timezone.now()
+
+    if hasattr(bookings, "iterator"):
+        bookings = bookings.iterator(chunk_size=2000)
+
+    results = []
+    for booking in bookings:
+        if isinstance(booking, ServiceBooking):
+            calculate = calculate_service_refund_amount
+        else:
+            calculate = calculate_sales_refund_amount
+        results.append(
+            (
+                booking,
+                calculate(
+                    booking,
+                    cancellation_datetime=cancellation_datetime,
+                    refund_settings=refund_settings,
+                ),
+            )
+        )
+    return results
+
+
+def future_refundable_bookings(today=None):
+    """
+    The service and sales bookings still ahead of us that have money paid
+    against them, loaded with only the fields the calculators read.
+    """
+    if today is None:
+        today = timezone.localdate()
+    service_bookings = ServiceBooking.objects.filter(
+        dropoff_date__gte=today,
+        booking_status__in=REFUNDABLE_SERVICE_BOOKING_STATUSES,
+        amount_paid__gt=0,
+    ).only("pk", "dropoff_date", "dropoff_time", "amount_paid", "payment_method")
+    sales_bookings = SalesBooking.objects.filter(
+        appointment_date__gte=today,
+        booking_status__in=REFUNDABLE_SALES_BOOKING_STATUSES,
+        amount_paid__gt=0,
+    ).only("pk", "appointment_date", "appointment_time", "amount_paid")
+    return service_bookings, sales_bookings
+
+
+def _summarise(results):
+    summary = {
+        "bookings": len(results),
+        "total_paid": Decimal("0.00"),
+        "total_entitled": Decimal("0.00"),
+        "policies": {},
+    }
+    for booking, result in results:
+        summary["total_paid"] += booking.amount_paid or Decimal("0.00")
+        summary["total_entitled"] += result["entitled_amount"]
+        policy = summary["policies"].setdefault(
+            result["policy_applied"], {"bookings": 0, "entitled": Decimal("0.00")}
+        )
+        policy["bookings"] += 1
+        policy["entitled"] += result["entitled_amount"]
+    return summary
+
+
+def preview_refund_policy(proposed_settings, cancellation_datetime=None):
+    """
+    Compares the refunds every future booking would be entitled to if it
+    were cancelled now, under the current refund settings and under
+    proposed_settings (usually an unsaved RefundSettings from the settings
+    form).
+
+    Returns {"service": ..., "sales": ...}, each with "current" and
+    "proposed" summaries (booking count, total paid, total entitled and a
+    breakdown by policy) and the change in total entitlement.
+    """
+    current_settings = get_refund_settings()
+    if cancellation_datetime is None:
+        cancellation_datetime = timezone.now()
+
+    preview = {}
+    for kind, bookings in zip(("service", "sales"), future_refundable_bookings()):
+        bookings = list(bookings)
+        current = _summarise(
+            calculate_refund_entitlements(
+                bookings, current_settings, cancellation_datetime
+            )
+        )
+        proposed = _summarise(
+            calculate_refund_entitlements(
+                bookings, proposed_settings, cancellation_datetime
+            )
+        )
+        preview[kind] = {
+            "current": current,
+            "proposed": proposed,
+            "change": proposed["total_entitled"] - current["total_entitled"],
+        }
+    return preview
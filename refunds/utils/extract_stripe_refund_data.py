@@ -2,6 +2,8 @@ from django.conf import settings
 from decimal import Decimal
 import stripe
 
+from core.external_calls import external_call
+
 
 def extract_stripe_refund_data(event_object_data: dict) -> dict:
     is_charge_object = event_object_data.get("object") == "charge"
@@ -38,7 +40,8 @@ def extract_stripe_refund_data(event_object_data: dict) -> dict:
         if charge_id:
             try:
                 stripe.api_key = settings.STRIPE_SECRET_KEY
-                latest_charge = stripe.Charge.retrieve(charge_id)
+                with external_call():
+                    latest_charge = stripe.Charge.retrieve(charge_id)
                 if latest_charge and latest_charge.get("amount_refunded") is not None:
                     refunded_amount_decimal = Decimal(
                         latest_charge.get("amount_refunded")
@@ -10,11 +10,20 @@ def process_refund_request_entry(
     stripe_refund_id = extracted_data["stripe_refund_id"]
     refunded_amount_decimal = extracted_data["refunded_amount_decimal"]
 
-    refund_request = (
+    # A refund created by the refund queue carries its id, so the request it
+    # came from is found directly.
+    refund_request = None
+    if stripe_refund_id:
+        refund_request = RefundRequest.objects.filter(
+            payment=payment_obj, stripe_refund_id=stripe_refund_id
+        ).first()
+
+    refund_request = refund_request or (
         RefundRequest.objects.filter(
             payment=payment_obj,
             status__in=[
                 "pending",
+                "processing",
                 "approved",
                 "reviewed_pending_approval",
                 "partially_refunded",
@@ -50,6 +59,7 @@ def process_refund_request_entry(
             "refunded" if payment_obj.status == "refunded" else "partially_refunded"
         )
         refund_request.processed_at = timezone.now()
+        refund_request.next_attempt_at = None
         refund_request.save()
 
     return refund_request
@@ -0,0 +1,218 @@
+import datetime
+import logging
+import uuid
+from decimal import Decimal
+
+import stripe
+from django.db.models import F
+from django.utils import timezone
+
+from core.external_calls import external_call
+from payments.utils.stripe_gateway import create_refund
+from refunds.models import RefundRequest
+
+logger = logging.getLogger(__name__)
+
+REFUND_LEASE_SECONDS = 300
+REFUND_MAX_ATTEMPTS = 5
+REFUND_BACKOFF_BASE_SECONDS = 60
+REFUND_BACKOFF_MAX_SECONDS = 3600
+
+APPROVABLE_REFUND_STATUSES = (
+    "pending",
+    "reviewed_pending_approval",
+    "unverified",
+    "approved",
+)
+
+# Stripe errors worth trying again: the request may not have reached Stripe,
+# or Stripe could not handle it at the time. Anything else is final.
+RETRYABLE_STRIPE_ERRORS = (
+    stripe.error.APIConnectionError,
+    stripe.error.RateLimitError,
+    stripe.error.APIError,
+    # Another request with the same key is still in flight at Stripe.
+    stripe.error.IdempotencyError,
+)
+
+
+def refund_request_problem(refund_request):
+    """
+    Returns why refund_request cannot be sent to Stripe, or None if it can.
+    """
+    if refund_request.status not in APPROVABLE_REFUND_STATUSES:
+        return (
+            "Refund request is not in an approvable state. "
+            f"Current status: {refund_request.get_status_display()}."
+        )
+    if not refund_request.payment:
+        return "Cannot process refund: No associated payment found for this request."
+    if refund_request.amount_to_refund is None or refund_request.amount_to_refund <= 0:
+        return "Cannot process refund: No valid amount specified to refund."
+    if not refund_request.payment.stripe_payment_intent_id:
+        return "Cannot process refund: Associated payment has no Stripe Payment Intent ID."
+    return None
+
+
+def queue_refund_requests(refund_requests, user):
+    """
+    Approves refund_requests and queues them for the process_refund_queue
+    worker, which creates the Stripe refunds. Requests that cannot be
+    refunded are left as they are.
+
+    Returns (queued, problems): the ids of the queued requests, and a
+    {refund_request: reason} dict for the rest.
+    """
+    now = timezone.now()
+    ready, problems = [], {}
+    for refund_request in refund_requests:
+        problem = refund_request_problem(refund_request)
+        if problem:
+            problems[refund_request] = problem
+        else:
+            ready.append(refund_request.pk)
+
+    queued = []
+    if ready:
+        # Only requests still approvable are queued, in case another admin
+        # got to one first. The token tells this call which ones it won.
+        claim_token = uuid.uuid4()
+        RefundRequest.objects.filter(
+            pk__in=ready, status__in=APPROVABLE_REFUND_STATUSES
+        ).update(
+            status="processing",
+            processed_by=user,
+            processed_at=now,
+            attempts=0,
+            next_attempt_at=now,
+            last_error="",
+            claim_token=claim_token,
+        )
+        queued = list(
+            RefundRequest.objects.filter(pk__in=ready, claim_token=claim_token)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+    return queued, problems
+
+
+def claim_refund_requests(batch_size, lease_seconds=REFUND_LEASE_SECONDS):
+    """
+    Claims up to batch_size queued refund requests for this worker, leasing
+    them until now + lease_seconds. A request whose worker died mid-way
+    becomes claimable again once its lease runs out.
+
+    The UPDATE re-checks the status and lease of each request and stamps a
+    fresh claim token, so when two workers pick the same candidates only
+    one of them wins each row and sends its refund.
+    """
+    now = timezone.now()
+    refund_ids = list(
+        RefundRequest.objects.filter(status="processing", next_attempt_at__lte=now)
+        .order_by("next_attempt_at", "pk")
+        .values_list("pk", flat=True)[:batch_size]
+    )
+    if not refund_ids:
+        return []
+    claim_token = uuid.uuid4()
+    claimed = RefundRequest.objects.filter(
+        pk__in=refund_ids, status="processing", next_attempt_at__lte=now
+    ).update(
+        attempts=F("attempts") + 1,
+        next_attempt_at=now + datetime.timedelta(seconds=lease_seconds),
+        claim_token=claim_token,
+    )
+    if not claimed:
+        return []
+    return list(
+        RefundRequest.objects.filter(claim_token=claim_token)
+        .select_related("payment", "service_booking", "sales_booking")
+        .order_by("next_attempt_at", "pk")
+    )
+
+
+def refund_retry_delay(attempts):
+    delay = REFUND_BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return datetime.timedelta(seconds=min(delay, REFUND_BACKOFF_MAX_SECONDS))
+
+
+def refund_idempotency_key(refund_request, amount_in_cents):
+    # Stable across retries, so a retry after a lost response can never
+    # refund twice. A changed amount is a different refund.
+    return f"refund-request-{refund_request.pk}-{amount_in_cents}"
+
+
+def _refund_metadata(refund_request):
+    booking_reference = "N/A"
+    booking_type = "unknown"
+    if refund_request.service_booking:
+        booking_reference = refund_request.service_booking.service_booking_reference
+        booking_type = "service"
+    elif refund_request.sales_booking:
+        booking_reference = refund_request.sales_booking.sales_booking_reference
+        booking_type = "sales"
+    return {
+        "refund_request_id": str(refund_request.pk),
+        "admin_user_id": str(refund_request.processed_by_id),
+        "booking_reference": booking_reference,
+        "booking_type": booking_type,
+    }
+
+
+def _record_failure(refund_request, error, max_attempts, retry):
+    now = timezone.now()
+    if retry and refund_request.attempts < max_attempts:
+        updates = {"next_attempt_at": now + refund_retry_delay(refund_request.attempts)}
+    else:
+        updates = {"status": "failed", "next_attempt_at": None}
+        logger.error(
+            f"Refund Error: Giving up on refund request {refund_request.pk} after "
+            f"{refund_request.attempts} attempts: {error}"
+        )
+    RefundRequest.objects.filter(
+        pk=refund_request.pk,
+        status="processing",
+        claim_token=refund_request.claim_token,
+    ).update(last_error=str(error), **updates)
+
+
+def execute_refund_request(refund_request, max_attempts=REFUND_MAX_ATTEMPTS):
+    """
+    Creates the Stripe refund for a claimed refund request. Stripe is called
+    outside any database transaction. On success the request moves to
+    'approved' and waits for the refund webhook, which marks it refunded.
+
+    Returns True if Stripe accepted the refund.
+    """
+    amount_in_cents = int(refund_request.amount_to_refund * Decimal("100"))
+    try:
+        with external_call():
+            stripe_refund = create_refund(
+                refund_idempotency_key(refund_request, amount_in_cents),
+                payment_intent=refund_request.payment.stripe_payment_intent_id,
+                amount=amount_in_cents,
+                reason="requested_by_customer",
+                metadata=_refund_metadata(refund_request),
+            )
+    except RETRYABLE_STRIPE_ERRORS as e:
+        _record_failure(refund_request, e, max_attempts, retry=True)
+        return False
+    except Exception as e:
+        _record_failure(refund_request, e, max_attempts, retry=False)
+        return False
+
+    # The webhook may already have marked the request refunded; only the
+    # Stripe refund id is filled in then.
+    updated = RefundRequest.objects.filter(
+        pk=refund_request.pk, status="processing"
+    ).update(
+        status="approved",
+        stripe_refund_id=stripe_refund.id,
+        next_attempt_at=None,
+        last_error="",
+    )
+    if not updated:
+        RefundRequest.objects.filter(
+            pk=refund_request.pk, stripe_refund_id__isnull=True
+        ).update(stripe_refund_id=stripe_refund.id)
+    return True
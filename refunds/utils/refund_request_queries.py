@@ -0,0 +1,57 @@
+from django.db.models import Count
+from django.shortcuts import get_object_or_404
+
+from refunds.models import RefundRequest
+
+# How long a refund request's email verification link stays valid. Past
+# this, an unverified request is hidden from the admin list and deleted by
+# the expire_unverified_refund_requests command.
+UNVERIFIED_REFUND_REQUEST_HOURS = 24
+
+# Everything the refund list and RefundRequest.__str__ read for each row.
+REFUND_LIST_RELATIONS = (
+    "service_booking",
+    "sales_booking",
+    "service_profile",
+    "sales_profile",
+    "payment",
+)
+
+# The list relations plus what the edit and reject pages show about the
+# booking.
+REFUND_DETAIL_RELATIONS = REFUND_LIST_RELATIONS + (
+    "service_booking__service_profile",
+    "service_booking__customer_motorcycle",
+    "sales_booking__sales_profile",
+    "sales_booking__motorcycle",
+)
+
+
+def refund_requests_for_list():
+    """
+    Refund requests with their bookings, profiles and payment joined in, so
+    a page of them is one query however many rows it has.
+    """
+    return RefundRequest.objects.select_related(*REFUND_LIST_RELATIONS)
+
+
+def refund_request_for_detail(pk):
+    """The refund request with pk and everything its admin pages show, or 404."""
+    return get_object_or_404(
+        RefundRequest.objects.select_related(*REFUND_DETAIL_RELATIONS), pk=pk
+    )
+
+
+def refund_status_counts(queryset):
+    """
+    The number of requests in queryset per status, from one aggregate query.
+    Every status is present, with 0 when it has no requests, and 'all' holds
+    the total.
+    """
+    counts = {status: 0 for status, _ in RefundRequest.STATUS_CHOICES}
+    for row in (
+        queryset.order_by().values("status").annotate(count=Count("pk"))
+    ):
+        counts[row["status"]] = row["count"]
+    counts["all"] = sum(counts.values())
+    return counts
@@ -1,16 +1,17 @@
 from decimal import Decimal
 from datetime import datetime, time
 from django.utils import timezone
-from refunds.models import RefundSettings
+from dashboard.utils import get_refund_settings
 
 
 def calculate_sales_refund_amount(
-    booking, cancellation_datetime: datetime = None
+    booking, cancellation_datetime: datetime = None, refund_settings=None
 ) -> dict:
     if not cancellation_datetime:
         cancellation_datetime = timezone.now()
 
-    refund_settings = RefundSettings.objects.first()
+    if refund_settings is None:
+        refund_settings = get_refund_settings()
 
     if not refund_settings:
         return {
@@ -1,18 +1,18 @@
 from django.urls import reverse
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.views import View
 from django.contrib import messages
 from django.utils import timezone
 from core.mixins import AdminRequiredMixin
 from refunds.forms.admin_refund_request_form import AdminRefundRequestForm
-from refunds.models.RefundRequest import RefundRequest
+from refunds.utils.refund_request_queries import refund_request_for_detail
 
 
 class AdminEditRefundRequestView(AdminRequiredMixin, View):
     template_name = "refunds/admin_edit_refund_form.html"
 
     def get(self, request, pk, *args, **kwargs):
-        refund_request = get_object_or_404(RefundRequest, pk=pk)
+        refund_request = refund_request_for_detail(pk)
         form = AdminRefundRequestForm(instance=refund_request)
 
         booking_reference = "N/A"
@@ -44,7 +44,7 @@ class AdminEditRefundRequestView(AdminRequiredMixin, View):
         return render(request, self.template_name, context)
 
     def post(self, request, pk, *args, **kwargs):
-        refund_request_instance = get_object_or_404(RefundRequest, pk=pk)
+        refund_request_instance = refund_request_for_detail(pk)
         form = AdminRefundRequestForm(request.POST, instance=refund_request_instance)
 
         if form.is_valid():
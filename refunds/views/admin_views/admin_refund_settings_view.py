@@ -5,6 +5,7 @@ from django.forms import ValidationError
 from core.mixins import AdminRequiredMixin
 from refunds.models import RefundSettings
 from refunds.forms.refund_settings_form import RefundSettingsForm
+from refunds.utils.bulk_refund_calc import preview_refund_policy
 
 
 class AdminRefundSettingsView(AdminRequiredMixin, UpdateView):
@@ -36,7 +37,23 @@ class AdminRefundSettingsView(AdminRequiredMixin, UpdateView):
         )
         return super().form_invalid(form)
 
+    def preview(self, form):
+        # The form's instance is updated in memory only; nothing is saved.
+        proposed_settings = form.save(commit=False)
+        return self.render_to_response(
+            self.get_context_data(
+                form=form,
+                refund_policy_preview=preview_refund_policy(proposed_settings),
+            )
+        )
+
     def post(self, request, *args, **kwargs):
+        if "refund_policy_preview" in request.POST:
+            self.object = self.get_object()
+            form = self.get_form()
+            if form.is_valid():
+                return self.preview(form)
+            return self.form_invalid(form)
         if "refund_policy_settings_submit" in request.POST:
             self.object = self.get_object()
             form = self.get_form()
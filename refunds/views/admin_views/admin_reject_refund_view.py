@@ -1,4 +1,4 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.views import View
 from django.contrib import messages
 from django.utils import timezone
@@ -6,7 +6,7 @@ from django.conf import settings
 from django.urls import reverse
 from core.mixins import AdminRequiredMixin
 from refunds.forms.admin_reject_refund_form import AdminRejectRefundForm
-from refunds.models.RefundRequest import RefundRequest
+from refunds.utils.refund_request_queries import refund_request_for_detail
 from mailer.utils import send_templated_email
 from service.models import ServiceProfile
 from inventory.models import SalesProfile
@@ -16,7 +16,7 @@ class AdminRejectRefundView(AdminRequiredMixin, View):
     template_name = "refunds/admin_reject_refund_form.html"
 
     def get(self, request, pk, *args, **kwargs):
-        refund_request = get_object_or_404(RefundRequest, pk=pk)
+        refund_request = refund_request_for_detail(pk)
 
         booking_reference = "N/A"
         if refund_request.service_booking:
@@ -34,7 +34,7 @@ class AdminRejectRefundView(AdminRequiredMixin, View):
         return render(request, self.template_name, context)
 
     def post(self, request, pk, *args, **kwargs):
-        refund_request_instance = get_object_or_404(RefundRequest, pk=pk)
+        refund_request_instance = refund_request_for_detail(pk)
         form = AdminRejectRefundForm(request.POST, instance=refund_request_instance)
 
         booking_reference_for_email = "N/A"
@@ -9,6 +9,7 @@ from decimal import Decimal
 from django.conf import settings
 from django.http import Http404
 from refunds.models.RefundRequest import RefundRequest
+from refunds.utils.refund_request_queries import UNVERIFIED_REFUND_REQUEST_HOURS
 from refunds.utils.service_refund_calc import calculate_service_refund_amount
 from refunds.utils.sales_refund_calc import calculate_sales_refund_amount
 from mailer.utils import send_templated_email
@@ -51,9 +52,8 @@ class UserVerifyRefundView(View):
                 )
                 return redirect(reverse("refunds:user_verified_refund"))
 
-            token_validity_hours = 24
             if (timezone.now() - refund_request.token_created_at) > timedelta(
-                hours=token_validity_hours
+                hours=UNVERIFIED_REFUND_REQUEST_HOURS
             ):
                 messages.error(
                     request,
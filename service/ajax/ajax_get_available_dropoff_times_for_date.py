@@ -5,6 +5,7 @@ from service.utils.get_available_service_dropoff_times import (
     get_available_dropoff_times,
 )
 from service.models import TempServiceBooking
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 @require_GET
@@ -26,7 +27,7 @@ def get_available_dropoff_times_for_date(request):
         return JsonResponse({"error": "Your booking session has expired. Please start over."}, status=400)
 
     try:
-        temp_booking = TempServiceBooking.objects.get(session_uuid=temp_service_booking_uuid)
+        temp_booking = temp_service_booking_store.load(temp_service_booking_uuid)
     except TempServiceBooking.DoesNotExist:
         return JsonResponse({"error": "Your booking session could not be found. Please start over."}, status=400)
 
@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-19 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_kpi_date_indexes'),
+        ('service', '0004_remove_servicetype_estimated_duration_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='servicebooking',
+            index=models.Index(fields=['created_at'], name='servicebooking_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicebooking',
+            index=models.Index(fields=['dropoff_date', 'booking_status'], name='servicebooking_dropoff_idx'),
+        ),
+    ]
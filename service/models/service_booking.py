@@ -138,3 +138,10 @@ class ServiceBooking(models.Model):
         verbose_name = "Service Booking"
         verbose_name_plural = "Service Bookings"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="servicebooking_created_idx"),
+            models.Index(
+                fields=["dropoff_date", "booking_status"],
+                name="servicebooking_dropoff_idx",
+            ),
+        ]
@@ -5,10 +5,8 @@ from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
-from service.models import (
-    TempServiceBooking,
-    ServiceBooking,
-)
+from service.models import ServiceBooking
+from service.utils import temp_service_booking_store
 from dashboard.models import SiteSettings
 from users.tests.test_helpers.model_factories import UserFactory
 from service.tests.test_helpers.model_factories import (
@@ -95,8 +93,8 @@ class TestLoggedInUserInStorePaymentFlow(TestCase):
         response = self.client.post(step4_url, step4_data)
         self.assertRedirects(response, step5_url)
 
-        temp_booking = TempServiceBooking.objects.get(
-            session_uuid=self.client.session["temp_service_booking_uuid"]
+        temp_booking = temp_service_booking_store.load(
+            self.client.session["temp_service_booking_uuid"]
         )
         self.assertEqual(temp_booking.service_profile, self.service_profile)
         self.assertEqual(temp_booking.customer_motorcycle, self.motorcycle)
@@ -8,6 +8,7 @@ from unittest.mock import patch, Mock
 
 
 from service.views.user_views.step1_service_details_view import Step1ServiceDetailsView
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 from service.models import (
@@ -202,7 +203,9 @@ class Step1ServiceDetailsViewTest(TestCase):
             str(messages[0]), "Service details selected. Please choose your motorcycle."
         )
 
-        temp_booking = TempServiceBooking.objects.get()
+        temp_booking = temp_service_booking_store.load(
+            self.request.session["temp_service_booking_uuid"]
+        )
         self.assertEqual(temp_booking.service_type, self.service_type)
         self.assertEqual(
             temp_booking.service_date, mock_form_instance.cleaned_data["service_date"]
@@ -249,7 +252,9 @@ class Step1ServiceDetailsViewTest(TestCase):
             str(messages[0]), "Service details selected. Please choose your motorcycle."
         )
 
-        temp_booking = TempServiceBooking.objects.get()
+        temp_booking = temp_service_booking_store.load(
+            self.request.session["temp_service_booking_uuid"]
+        )
         self.assertEqual(temp_booking.service_type, self.service_type)
         self.assertEqual(
             temp_booking.service_date, mock_form_instance.cleaned_data["service_date"]
@@ -298,7 +303,9 @@ class Step1ServiceDetailsViewTest(TestCase):
             str(messages[0]), "Service details selected. Please choose your motorcycle."
         )
 
-        temp_booking = TempServiceBooking.objects.get()
+        temp_booking = temp_service_booking_store.load(
+            self.request.session["temp_service_booking_uuid"]
+        )
         self.assertEqual(temp_booking.service_type, self.service_type)
         self.assertEqual(
             temp_booking.service_date, mock_form_instance.cleaned_data["service_date"]
@@ -374,7 +381,7 @@ class Step1ServiceDetailsViewTest(TestCase):
         }
 
         with patch(
-            "service.views.user_views.step1_service_details_view.TempServiceBooking.objects.create",
+            "service.views.user_views.step1_service_details_view.temp_service_booking_store.create",
             side_effect=Exception("Database error!"),
         ):
             self.request.session = {}
@@ -5,7 +5,7 @@ from django.contrib.auth import get_user_model
 import datetime
 import uuid
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 from decimal import Decimal
 import stripe
 from payments.models import Payment
@@ -23,6 +23,7 @@ from service.tests.test_helpers.model_factories import (
     CustomerMotorcycleFactory,
 )
 from payments.tests.test_helpers.model_factories import PaymentFactory
+from payments.utils.stripe_gateway import payment_intent_create_key
 
 User = get_user_model()
 
@@ -205,15 +206,21 @@ class Step6PaymentViewTest(TestCase):
         self.assertEqual(response.context["currency"], "AUD")
         self.assertTemplateUsed(response, "service/step6_payment.html")
 
-        mock_create.assert_called_once_with(
-            amount=int(self.service_type.base_price * 100),
-            currency="AUD",
-            metadata={
+        expected_params = {
+            "amount": int(self.service_type.base_price * 100),
+            "currency": "AUD",
+            "metadata": {
                 "temp_service_booking_uuid": str(self.temp_booking.session_uuid),
                 "service_profile_id": str(self.service_profile.id),
                 "booking_type": "service_booking",
             },
-            description=f"Motorcycle service booking for {self.customer_motorcycle.year} {self.customer_motorcycle.brand} {self.customer_motorcycle.model} ({self.service_type.name})",
+            "description": f"Motorcycle service booking for {self.customer_motorcycle.year} {self.customer_motorcycle.brand} {self.customer_motorcycle.model} ({self.service_type.name})",
+        }
+        mock_create.assert_called_once_with(
+            idempotency_key=payment_intent_create_key(
+                "service_booking", self.temp_booking.session_uuid, expected_params
+            ),
+            **expected_params,
         )
 
         payment = Payment.objects.get(temp_service_booking=self.temp_booking)
@@ -251,15 +258,21 @@ class Step6PaymentViewTest(TestCase):
         )
         self.assertEqual(response.context["currency"], "AUD")
 
-        mock_create.assert_called_once_with(
-            amount=int(self.temp_booking.calculated_deposit_amount * 100),
-            currency="AUD",
-            metadata={
+        expected_params = {
+            "amount": int(self.temp_booking.calculated_deposit_amount * 100),
+            "currency": "AUD",
+            "metadata": {
                 "temp_service_booking_uuid": str(self.temp_booking.session_uuid),
                 "service_profile_id": str(self.service_profile.id),
                 "booking_type": "service_booking",
             },
-            description=f"Motorcycle service booking for {self.customer_motorcycle.year} {self.customer_motorcycle.brand} {self.customer_motorcycle.model} ({self.service_type.name})",
+            "description": f"Motorcycle service booking for {self.customer_motorcycle.year} {self.customer_motorcycle.brand} {self.customer_motorcycle.model} ({self.service_type.name})",
+        }
+        mock_create.assert_called_once_with(
+            idempotency_key=payment_intent_create_key(
+                "service_booking", self.temp_booking.session_uuid, expected_params
+            ),
+            **expected_params,
         )
 
         payment = Payment.objects.get(temp_service_booking=self.temp_booking)
@@ -315,6 +328,7 @@ class Step6PaymentViewTest(TestCase):
         mock_retrieve.assert_called_once_with("pi_existing_123")
         mock_modify.assert_called_once_with(
             "pi_existing_123",
+            idempotency_key=ANY,
             amount=int(new_amount * 100),
             currency="AUD",
             description=f"Motorcycle service booking for {self.customer_motorcycle.year} {self.customer_motorcycle.brand} {self.customer_motorcycle.model} ({self.service_type.name})",
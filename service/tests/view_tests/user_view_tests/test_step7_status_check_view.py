@@ -69,6 +69,47 @@ class Step7StatusCheckViewTest(TestCase):
             "Booking finalization failed. Please contact support for assistance.",
         )
 
+    @patch(
+        "service.views.user_views.step7_status_check_view.wait_for_payment_processed"
+    )
+    def test_wait_parameter_long_polls_while_booking_pending(self, mock_wait):
+        payment_intent_id = f"pi_{uuid.uuid4().hex}"
+        PaymentFactory(stripe_payment_intent_id=payment_intent_id)
+
+        response = self.client.get(
+            self.base_url, {"payment_intent_id": payment_intent_id, "wait": "1"}
+        )
+
+        mock_wait.assert_called_once_with(payment_intent_id)
+        self.assertEqual(response.json()["status"], "processing")
+
+    @patch(
+        "service.views.user_views.step7_status_check_view.wait_for_payment_processed"
+    )
+    def test_wait_parameter_skipped_when_booking_exists(self, mock_wait):
+        payment_intent_id = f"pi_{uuid.uuid4().hex}"
+        ServiceBookingFactory(stripe_payment_intent_id=payment_intent_id)
+
+        response = self.client.get(
+            self.base_url, {"payment_intent_id": payment_intent_id, "wait": "1"}
+        )
+
+        mock_wait.assert_not_called()
+        self.assertEqual(response.json()["status"], "ready")
+
+    @patch(
+        "service.views.user_views.step7_status_check_view.wait_for_payment_processed"
+    )
+    def test_wait_parameter_skipped_for_unknown_payment_intent(self, mock_wait):
+        payment_intent_id = f"pi_{uuid.uuid4().hex}"
+
+        response = self.client.get(
+            self.base_url, {"payment_intent_id": payment_intent_id, "wait": "1"}
+        )
+
+        mock_wait.assert_not_called()
+        self.assertEqual(response.status_code, 500)
+
     def test_get_missing_payment_intent_id(self):
         response = self.client.get(self.base_url)
 
@@ -79,7 +120,7 @@ class Step7StatusCheckViewTest(TestCase):
         self.assertEqual(data["message"], "Payment Intent ID is required.")
 
     @patch(
-        "service.views.user_views.step7_status_check_view.ServiceBooking.objects.get"
+        "service.views.user_views.step7_status_check_view.Step7StatusCheckView.find_booking"
     )
     def test_get_generic_exception_returns_500(self, mock_get):
         payment_intent_id = f"pi_{uuid.uuid4().hex}"
@@ -10,3 +10,4 @@ from .calculate_service_total import *
 from .calulcate_service_deposit import *
 from .send_booking_to_mechanicdesk import *
 from .booking_protection import *
+from .temp_service_booking_store import *
@@ -25,6 +25,8 @@ def calculate_estimated_pickup_date(booking_instance):
 
     booking_instance.estimated_pickup_date = estimated_pickup_date
 
-    booking_instance.save(update_fields=["estimated_pickup_date"])
+    # Unsaved booking drafts are persisted by the caller.
+    if getattr(booking_instance, "pk", True) is not None:
+        booking_instance.save(update_fields=["estimated_pickup_date"])
 
     return estimated_pickup_date
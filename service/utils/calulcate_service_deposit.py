@@ -1,9 +1,9 @@
 import decimal
-from service.models import ServiceSettings
+from dashboard.utils import get_service_settings
 
 
 def calculate_service_deposit(temp_booking):
-    service_settings = ServiceSettings.objects.first()
+    service_settings = get_service_settings()
 
     if not service_settings or not service_settings.enable_online_deposit:
         return decimal.Decimal("0.00")
@@ -2,7 +2,7 @@ from django.db import transaction
 from django.conf import settings
 from service.models import ServiceBooking
 from mailer.utils import send_templated_email
-from dashboard.models import SiteSettings
+from dashboard.utils import get_site_settings
 
 
 def confirm_service_booking(service_booking_id, message=None, send_notification=True):
@@ -22,7 +22,7 @@ def confirm_service_booking(service_booking_id, message=None, send_notification=
                 }
 
             if send_notification:
-                site_settings = SiteSettings.get_settings()
+                site_settings = get_site_settings()
                 email_context = {
                     "booking": booking,
                     "service_profile": booking.service_profile,
@@ -1,7 +1,9 @@
 from django.db import transaction
 from decimal import Decimal
 from service.utils.send_booking_to_mechanicdesk import send_booking_to_mechanicdesk
-from service.models import ServiceBooking, ServiceSettings
+from service.models import ServiceBooking
+from dashboard.utils import get_service_settings
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 def convert_temp_service_booking(
@@ -16,7 +18,7 @@ def convert_temp_service_booking(
 ):
     try:
         with transaction.atomic():
-            service_settings = ServiceSettings.objects.first()
+            service_settings = get_service_settings()
 
             currency_code = "AUD"
             if service_settings:
@@ -70,7 +72,7 @@ def convert_temp_service_booking(
             except OSError as e:
                 logger.error(f"OSError sending booking to MechanicDesk: {e}")
 
-            temp_booking.delete()
+            temp_service_booking_store.discard(temp_booking)
 
             return service_booking
 
@@ -1,10 +1,11 @@
 import datetime
 from django.utils import timezone
-from service.models import ServiceSettings, ServiceBooking
+from service.models import ServiceBooking
+from dashboard.utils import get_service_settings
 
 
 def get_available_dropoff_times(selected_date, is_service_date=False):
-    service_settings = ServiceSettings.objects.first()
+    service_settings = get_service_settings()
     if not service_settings:
         return []
 
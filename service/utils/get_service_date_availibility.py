@@ -2,12 +2,13 @@ import datetime
 from django.utils import timezone
 import json
 from django.db import models
-from service.models import ServiceSettings, BlockedServiceDate
+from service.models import BlockedServiceDate
 from service.models import ServiceBooking
+from dashboard.utils import get_service_settings
 
 
 def get_service_date_availability(service_type=None):
-    service_settings = ServiceSettings.objects.first()
+    service_settings = get_service_settings()
 
     now_in_perth = timezone.localtime(timezone.now()).date()
 
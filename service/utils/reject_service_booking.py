@@ -3,7 +3,7 @@ from django.conf import settings
 from service.models import ServiceBooking
 from mailer.utils import send_templated_email
 from refunds.utils.create_refund_request import create_refund_request
-from dashboard.models import SiteSettings
+from dashboard.utils import get_site_settings
 
 
 def reject_service_booking(
@@ -80,7 +80,7 @@ def reject_service_booking(
                 }
 
             if send_notification and not refund_request_created:
-                site_settings = SiteSettings.get_settings()
+                site_settings = get_site_settings()
                 email_context = {
                     "booking": booking,
                     "service_profile": booking.service_profile,
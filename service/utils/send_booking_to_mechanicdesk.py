@@ -3,6 +3,8 @@ from django.conf import settings
 from django.db.models import ObjectDoesNotExist
 import datetime
 
+from core.external_calls import external_call
+
 
 def send_booking_to_mechanicdesk(service_booking_instance):
     mechanicdesk_token = getattr(settings, "MECHANICDESK_BOOKING_TOKEN", None)
@@ -111,12 +113,11 @@ def send_booking_to_mechanicdesk(service_booking_instance):
             }
         )
 
-    mechanicdesk_api_url = (
-        "https://www.mechanicdesk.com.au/booking_requests/create_booking"
-    )
+    mechanicdesk_api_url = settings.MECHANICDESK_BOOKING_URL
 
     try:
-        response = requests.post(mechanicdesk_api_url, data=payload, timeout=10)
+        with external_call():
+            response = requests.post(mechanicdesk_api_url, data=payload, timeout=10)
         response.raise_for_status()
         return True
     except requests.exceptions.Timeout:
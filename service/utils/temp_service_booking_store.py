@@ -0,0 +1,4 @@
+from core.booking_drafts import DraftBookingStore
+from service.models import TempServiceBooking
+
+temp_service_booking_store = DraftBookingStore(TempServiceBooking)
@@ -3,18 +3,18 @@ from django.contrib import messages
 from service.models import (
     ServiceType,
     TempServiceBooking,
-    ServiceSettings,
     Servicefaq,
     ServiceBrand,
 )
-from dashboard.models import SiteSettings
 from service.forms import ServiceDetailsForm
 from service.utils import get_service_date_availability
+from dashboard.utils import get_site_settings, get_service_settings
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 def service(request):
-    service_settings = ServiceSettings.objects.first()
-    settings = SiteSettings.get_settings()
+    service_settings = get_service_settings()
+    settings = get_site_settings()
 
     if not settings.enable_service_booking:
         messages.error(request, "Service information is currently disabled.")
@@ -47,8 +47,8 @@ def service(request):
 
     if temp_service_booking_uuid:
         try:
-            temp_service_booking = TempServiceBooking.objects.get(
-                session_uuid=temp_service_booking_uuid
+            temp_service_booking = temp_service_booking_store.load(
+                temp_service_booking_uuid
             )
             service_form = ServiceDetailsForm(
                 initial={
@@ -1,7 +1,7 @@
 from django.views.generic import TemplateView
 from service.models import ServiceTerms
 from refunds.models import RefundTerms
-from dashboard.models import SiteSettings
+from dashboard.utils import get_site_settings
 
 
 class ServiceTermsView(TemplateView):
@@ -13,7 +13,7 @@ class ServiceTermsView(TemplateView):
         context["page_title"] = "Service Booking Terms & Conditions"
         context["terms"] = active_terms
 
-        settings = SiteSettings.get_settings()
+        settings = get_site_settings()
         if settings.enable_refunds:
             refund_terms = RefundTerms.objects.filter(is_active=True).first()
             context["refund_terms"] = refund_terms
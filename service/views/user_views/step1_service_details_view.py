@@ -12,10 +12,11 @@ from service.forms import ServiceDetailsForm
 from service.models import (
     TempServiceBooking,
     ServiceProfile,
-    ServiceSettings,
     BlockedServiceDate,
 )
 from service.utils.booking_protection import check_and_manage_recent_booking_flag
+from dashboard.utils import get_service_settings
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 class Step1ServiceDetailsView(View):
@@ -30,7 +31,7 @@ class Step1ServiceDetailsView(View):
             del request.session["service_booking_reference"]
 
         form = ServiceDetailsForm(request.POST)
-        service_settings = ServiceSettings.objects.first()
+        service_settings = get_service_settings()
 
         errors_exist = False
 
@@ -104,8 +105,8 @@ class Step1ServiceDetailsView(View):
 
             if temp_booking_uuid_from_session:
                 try:
-                    temp_booking = TempServiceBooking.objects.get(
-                        session_uuid=temp_booking_uuid_from_session
+                    temp_booking = temp_service_booking_store.load(
+                        temp_booking_uuid_from_session
                     )
                 except TempServiceBooking.DoesNotExist:
                     temp_booking = None
@@ -129,13 +130,13 @@ class Step1ServiceDetailsView(View):
                         temp_booking.service_profile = service_profile_for_temp_booking
                     else:
                         temp_booking.service_profile = None
-                    temp_booking.save()
+                    temp_service_booking_store.save(temp_booking)
                     messages.success(
                         request,
                         "Service details updated. Please choose your motorcycle.",
                     )
                 else:
-                    temp_booking = TempServiceBooking.objects.create(
+                    temp_booking = temp_service_booking_store.create(
                         session_uuid=uuid.uuid4(),
                         service_type=service_type,
                         service_date=service_date,
@@ -11,6 +11,7 @@ from service.models import (
     CustomerMotorcycle,
     Servicefaq,
 )
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 class Step2MotorcycleSelectionView(LoginRequiredMixin, View):
@@ -23,9 +24,7 @@ class Step2MotorcycleSelectionView(LoginRequiredMixin, View):
             return redirect(reverse("service:service"))
 
         try:
-            self.temp_booking = TempServiceBooking.objects.get(
-                session_uuid=session_uuid
-            )
+            self.temp_booking = temp_service_booking_store.load(session_uuid)
         except TempServiceBooking.DoesNotExist:
             request.session.pop("temp_service_booking_uuid", None)
             return redirect(reverse("service:service"))
@@ -71,7 +70,7 @@ class Step2MotorcycleSelectionView(LoginRequiredMixin, View):
                         service_profile=self.service_profile,
                     )
                     self.temp_booking.customer_motorcycle = motorcycle
-                    self.temp_booking.save()
+                    temp_service_booking_store.save(self.temp_booking)
                     return redirect(reverse("service:service_book_step4"))
                 except (ValueError, CustomerMotorcycle.DoesNotExist) as e:
                     logger.error(
@@ -6,8 +6,10 @@ from django.views import View
 from django.urls import reverse
 from django.contrib import messages
 
-from service.models import TempServiceBooking, ServiceSettings, Servicefaq
+from service.models import TempServiceBooking, Servicefaq
 from service.forms.step3_customer_motorcycle_form import CustomerMotorcycleForm
+from dashboard.utils import get_service_settings
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 class Step3CustomerMotorcycleView(View):
@@ -20,14 +22,12 @@ class Step3CustomerMotorcycleView(View):
             return redirect(reverse("service:service"))
 
         try:
-            self.temp_booking = TempServiceBooking.objects.get(
-                session_uuid=temp_booking_uuid
-            )
+            self.temp_booking = temp_service_booking_store.load(temp_booking_uuid)
         except TempServiceBooking.DoesNotExist:
             request.session.pop("temp_service_booking_uuid", None)
             return redirect(reverse("service:service"))
 
-        self.service_settings = ServiceSettings.objects.first()
+        self.service_settings = get_service_settings()
         if not self.service_settings:
             logger.error("Step3 Dispatch: ServiceSettings not configured.")
             messages.error(
@@ -77,7 +77,7 @@ class Step3CustomerMotorcycleView(View):
             customer_motorcycle.save()
 
             self.temp_booking.customer_motorcycle = customer_motorcycle
-            self.temp_booking.save()
+            temp_service_booking_store.save(self.temp_booking)
 
             return redirect(reverse("service:service_book_step4"))
         else:
@@ -7,6 +7,7 @@ from django.urls import reverse
 from django.contrib import messages
 from service.models import TempServiceBooking, ServiceProfile, Servicefaq
 from service.forms.step4_service_profile_form import ServiceBookingUserForm
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 class Step4ServiceProfileView(View):
@@ -23,9 +24,10 @@ class Step4ServiceProfileView(View):
             return None, redirect(reverse("service:service"))
 
         try:
-            temp_booking = TempServiceBooking.objects.select_related(
-                "customer_motorcycle", "service_profile"
-            ).get(session_uuid=temp_booking_uuid)
+            temp_booking = temp_service_booking_store.load(
+                temp_booking_uuid,
+                select_related=("customer_motorcycle", "service_profile"),
+            )
             return temp_booking, None
         except TempServiceBooking.DoesNotExist:
             logger.error(
@@ -115,7 +117,9 @@ class Step4ServiceProfileView(View):
                     motorcycle.service_profile = service_profile
                     motorcycle.save(update_fields=["service_profile"])
 
-            self.temp_booking.save(update_fields=["service_profile"])
+            temp_service_booking_store.save(
+                self.temp_booking, update_fields=["service_profile"]
+            )
 
             messages.success(request, "Your details have been saved successfully.")
             return redirect(reverse("service:service_book_step5"))
@@ -9,7 +9,7 @@ from decimal import Decimal
 from django.conf import settings
 import json
 from service.forms.step5_payment_choice_and_terms_form import PaymentOptionForm
-from service.models import TempServiceBooking, ServiceSettings, Servicefaq, ServiceTerms
+from service.models import TempServiceBooking, Servicefaq, ServiceTerms
 from service.utils.convert_temp_service_booking import convert_temp_service_booking
 from service.utils.get_drop_off_date_availability import get_drop_off_date_availability
 from service.utils.calculate_service_total import calculate_service_total
@@ -18,6 +18,8 @@ from service.utils.calculate_estimated_pickup_date import (
     calculate_estimated_pickup_date,
 )
 from mailer.utils import send_templated_email
+from dashboard.utils import get_service_settings
+from service.utils.temp_service_booking_store import temp_service_booking_store
 
 
 class Step5PaymentDropoffAndTermsView(View):
@@ -33,9 +35,10 @@ class Step5PaymentDropoffAndTermsView(View):
             return None, redirect(reverse("service:service"))
 
         try:
-            temp_booking = TempServiceBooking.objects.select_related(
-                "service_type", "customer_motorcycle", "service_profile"
-            ).get(session_uuid=temp_service_booking_uuid)
+            temp_booking = temp_service_booking_store.load(
+                temp_service_booking_uuid,
+                select_related=("service_type", "customer_motorcycle", "service_profile"),
+            )
             return temp_booking, None
         except TempServiceBooking.DoesNotExist:
             logger.error(
@@ -58,7 +61,7 @@ class Step5PaymentDropoffAndTermsView(View):
             )
             return redirect(reverse("service:service_book_step4"))
 
-        self.service_settings = ServiceSettings.objects.first()
+        self.service_settings = get_service_settings()
         if not self.service_settings:
             logger.error("Step5 Dispatch: ServiceSettings not configured.")
             messages.error(
@@ -129,7 +132,8 @@ class Step5PaymentDropoffAndTermsView(View):
             )
             self.temp_booking.customer_notes = form.cleaned_data.get("customer_notes")
             self.temp_booking.service_terms_version = active_terms
-            self.temp_booking.save(
+            temp_service_booking_store.save(
+                self.temp_booking,
                 update_fields=[
                     "dropoff_date",
                     "dropoff_time",
@@ -147,7 +151,8 @@ class Step5PaymentDropoffAndTermsView(View):
                 self.temp_booking
             )
             calculate_estimated_pickup_date(self.temp_booking)
-            self.temp_booking.save(
+            temp_service_booking_store.save(
+                self.temp_booking,
                 update_fields=[
                     "calculated_total",
                     "calculated_deposit_amount",
@@ -226,7 +231,7 @@ class Step5PaymentDropoffAndTermsView(View):
 
                 except Exception as e:
                     logger.error(
-                        f"Step5 POST: Error finalizing in-store payment booking for temp_booking {self.temp_booking.id}. Error: {e}"
+                        f"Step5 POST: Error finalizing in-store payment booking for temp_booking {self.temp_booking.session_uuid}. Error: {e}"
                     )
                     messages.error(
                         request,
@@ -1,9 +1,9 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 import logging
 
 logger = logging.getLogger(__name__)
 from django.views import View
-from django.http import JsonResponse, Http404
+from django.http import JsonResponse
 from django.conf import settings
 from django.urls import reverse
 from django.contrib import messages
@@ -17,10 +17,16 @@ from service.models import (
 )
 from service.utils.get_service_date_availibility import get_service_date_availability
 from service.utils.booking_protection import check_and_manage_recent_booking_flag
+from service.utils.temp_service_booking_store import temp_service_booking_store
+from payments.utils.stripe_gateway import (
+    create_payment_intent,
+    modify_payment_intent,
+    payment_intent_client_secret,
+    payment_intent_create_key,
+    retrieve_payment_intent,
+)
 import datetime
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
-
 
 class Step6PaymentView(View):
     def dispatch(self, request, *args, **kwargs):
@@ -31,11 +37,9 @@ class Step6PaymentView(View):
             return redirect("service:service")
 
         try:
-            temp_booking = get_object_or_404(
-                TempServiceBooking, session_uuid=temp_booking_uuid
-            )
+            temp_booking = temp_service_booking_store.load(temp_booking_uuid)
             request.temp_booking = temp_booking
-        except Http404:
+        except TempServiceBooking.DoesNotExist:
             logger.warning(
                 f"Step6 Dispatch: TempServiceBooking not found for uuid {temp_booking_uuid}."
             )
@@ -132,6 +136,8 @@ class Step6PaymentView(View):
             f"({temp_booking.service_type.name})"
         )
 
+        # The payment links to the temporary booking, so it needs its row now.
+        temp_service_booking_store.materialise(temp_booking)
         payment_obj = Payment.objects.filter(temp_service_booking=temp_booking).first()
         intent = None
 
@@ -140,7 +146,7 @@ class Step6PaymentView(View):
         try:
             if payment_obj and payment_obj.stripe_payment_intent_id:
                 try:
-                    intent = stripe.PaymentIntent.retrieve(
+                    intent = retrieve_payment_intent(
                         payment_obj.stripe_payment_intent_id
                     )
 
@@ -159,7 +165,7 @@ class Step6PaymentView(View):
                     if (
                         amount_changed or currency_changed
                     ) and is_modifiable_or_in_progress:
-                        intent = stripe.PaymentIntent.modify(
+                        intent = modify_payment_intent(
                             payment_obj.stripe_payment_intent_id,
                             amount=amount_in_cents,
                             currency=currency,
@@ -207,10 +213,10 @@ class Step6PaymentView(View):
                     intent = None
 
             if not intent:
-                intent = stripe.PaymentIntent.create(
-                    amount=int(amount_to_pay * 100),
-                    currency=currency,
-                    metadata={
+                intent_params = {
+                    "amount": int(amount_to_pay * 100),
+                    "currency": currency,
+                    "metadata": {
                         "temp_service_booking_uuid": str(temp_booking.session_uuid),
                         "service_profile_id": (
                             str(service_customer_profile.id)
@@ -219,7 +225,16 @@ class Step6PaymentView(View):
                         ),
                         "booking_type": "service_booking",
                     },
-                    description=payment_description,
+                    "description": payment_description,
+                }
+                intent = create_payment_intent(
+                    payment_intent_create_key(
+                        "service_booking",
+                        temp_booking.session_uuid,
+                        intent_params,
+                        replaces=payment_obj.stripe_payment_intent_id if payment_obj else None,
+                    ),
+                    **intent_params,
                 )
 
                 if payment_obj:
@@ -247,7 +262,7 @@ class Step6PaymentView(View):
 
         except stripe.error.StripeError as e:
             logger.error(
-                f"Step6 GET: Stripe error during payment intent creation/modification for temp_booking {temp_booking.id}. Error: {e}"
+                f"Step6 GET: Stripe error during payment intent creation/modification for temp_booking {temp_booking.session_uuid}. Error: {e}"
             )
             messages.error(
                 request, f"Payment system error: {e}. Please try again later."
@@ -255,7 +270,7 @@ class Step6PaymentView(View):
             return redirect("service:service_book_step5")
         except Exception as e:
             logger.error(
-                f"Step6 GET: Unexpected error during payment setup for temp_booking {temp_booking.id}. Error: {e}"
+                f"Step6 GET: Unexpected error during payment setup for temp_booking {temp_booking.session_uuid}. Error: {e}"
             )
             messages.error(
                 request,
@@ -268,7 +283,7 @@ class Step6PaymentView(View):
             return redirect("service:service_book_step5")
 
         context = {
-            "client_secret": intent.client_secret,
+            "client_secret": payment_intent_client_secret(request, intent),
             "amount": amount_to_pay,
             "currency": currency.upper(),
             "temp_booking": temp_booking,
@@ -293,7 +308,7 @@ class Step6PaymentView(View):
             )
 
         try:
-            intent = stripe.PaymentIntent.retrieve(payment_intent_id)
+            intent = retrieve_payment_intent(payment_intent_id, refresh=True)
 
             if intent.status == "succeeded":
                 return JsonResponse(
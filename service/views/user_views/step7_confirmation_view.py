@@ -5,9 +5,10 @@ logger = logging.getLogger(__name__)
 from django.views import View
 from django.contrib import messages
 
-from service.models import ServiceBooking, ServiceSettings
+from service.models import ServiceBooking
 from payments.models import Payment
 from service.utils.booking_protection import set_recent_booking_flag
+from dashboard.utils import get_service_settings
 
 
 class Step7ConfirmationView(View):
@@ -68,7 +69,7 @@ class Step7ConfirmationView(View):
 
             set_recent_booking_flag(request)
 
-            settings = ServiceSettings.objects.first()
+            settings = get_service_settings()
 
             context = {
                 "service_booking": service_booking,
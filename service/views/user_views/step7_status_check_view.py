@@ -5,6 +5,7 @@ logger = logging.getLogger(__name__)
 from django.http import JsonResponse
 from service.models import ServiceBooking
 from payments.models import Payment
+from payments.utils.payment_status_channel import wait_for_payment_processed
 
 
 class Step7StatusCheckView(View):
@@ -18,9 +19,38 @@ class Step7StatusCheckView(View):
             )
 
         try:
-            service_booking = ServiceBooking.objects.get(
-                stripe_payment_intent_id=payment_intent_id
-            )
+            service_booking = self.find_booking(payment_intent_id)
+            if service_booking is None:
+                if not Payment.objects.filter(
+                    stripe_payment_intent_id=payment_intent_id
+                ).exists():
+                    logger.error(
+                        f"Step7 Status Check: Payment not found for payment_intent_id {payment_intent_id}."
+                    )
+                    return JsonResponse(
+                        {
+                            "status": "error",
+                            "message": "Booking finalization failed. Please contact support for assistance.",
+                        },
+                        status=500,
+                    )
+                # With ?wait=1 the request is held until the webhook worker
+                # reports the payment processed (or the long-poll timeout
+                # passes), but only while the payment exists and its booking
+                # does not yet. The wait only reads the cache.
+                if request.GET.get("wait"):
+                    wait_for_payment_processed(payment_intent_id)
+                    service_booking = self.find_booking(payment_intent_id)
+                if service_booking is None:
+                    logger.warning(
+                        f"Step7 Status Check: ServiceBooking not found for payment_intent_id {payment_intent_id}."
+                    )
+                    return JsonResponse(
+                        {
+                            "status": "processing",
+                            "message": "Booking finalization is still in progress.",
+                        }
+                    )
 
             if service_booking.after_hours_drop_off:
                 dropoff_datetime_str = f"{service_booking.dropoff_date.strftime('%d %b %Y')} (After-Hours Drop-off)"
@@ -54,29 +84,6 @@ class Step7StatusCheckView(View):
 
             return JsonResponse(response_data)
 
-        except ServiceBooking.DoesNotExist:
-            logger.warning(
-                f"Step7 Status Check: ServiceBooking not found for payment_intent_id {payment_intent_id}."
-            )
-            try:
-                Payment.objects.get(stripe_payment_intent_id=payment_intent_id)
-                return JsonResponse(
-                    {
-                        "status": "processing",
-                        "message": "Booking finalization is still in progress.",
-                    }
-                )
-            except Payment.DoesNotExist:
-                logger.error(
-                    f"Step7 Status Check: Payment not found for payment_intent_id {payment_intent_id}."
-                )
-                return JsonResponse(
-                    {
-                        "status": "error",
-                        "message": "Booking finalization failed. Please contact support for assistance.",
-                    },
-                    status=500,
-                )
         except Exception as e:
             logger.error(
                 f"Step7 Status Check: An internal server error occurred for payment_intent_id {payment_intent_id}. Error: {e}"
@@ -88,3 +95,13 @@ class Step7StatusCheckView(View):
                 },
                 status=500,
             )
+
+    @staticmethod
+    def find_booking(payment_intent_id):
+        return (
+            ServiceBooking.objects.select_related(
+                "service_type", "customer_motorcycle", "service_profile"
+            )
+            .filter(stripe_payment_intent_id=payment_intent_id)
+            .first()
+        )
@@ -4,7 +4,7 @@ from django.db import IntegrityError
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from dashboard.models import SiteSettings
+from dashboard.utils import get_site_settings
 
 User = get_user_model()
 
@@ -14,7 +14,7 @@ def is_admin(user):
 
 
 def login_view(request):
-    settings = SiteSettings.get_settings()
+    settings = get_site_settings()
     if request.method == "POST":
         username = request.POST["username"]
         password = request.POST["password"]
@@ -53,7 +53,7 @@ def logout_view(request):
 
 def register(request):
     # Get the current site settings
-    settings = SiteSettings.get_settings()
+    settings = get_site_settings()
 
     # If user accounts are disabled, prevent registration
     if not settings.enable_user_accounts: